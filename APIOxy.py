@@ -4,10 +4,12 @@ APIOxy - A self-improving tool to predict oxidative stability of active pharmace
 
 import logging
 import os
+import sys
 
-from apioxy.common import read_yaml_file
+from apioxy.cache import ResultCache, get_cache_path
+from apioxy.campaign import Campaign, clear_input_caches, get_campaign_inputs, is_campaign_file
 from apioxy.main import APIOxy
-from apioxy.parsing import parse_command_line_arguments
+from apioxy.parsing import load_input_file, parse_command_line_arguments
 
 
 def main() -> None:
@@ -16,33 +18,44 @@ def main() -> None:
     """
 
     args = parse_command_line_arguments()
-    input_file = args.file
-    input_file_directory = os.path.abspath(os.path.dirname(args.file))
-    input_dict = read_yaml_file(path=input_file, project_directory=input_file_directory)
-    try:
-        input_dict['project']
-    except KeyError:
-        print('A project name must be provided in the input file!')
-
-    try:
-        input_dict['apioxy']
-    except KeyError:
-        print('The "apioxy" block is missing in the input file!')
-
-    # if project directory is not given in the input file, use the directory of the input file instead
-    try:
-        apioxy_project_directory = input_dict['apioxy'].get('project_directory', str())
-    except KeyError:
-        apioxy_project_directory = False
-        apioxy_project_directory = apioxy_project_directory if apioxy_project_directory else input_file_directory
-    input_dict['project_directory'] = apioxy_project_directory
 
     verbose = logging.INFO
     if args.debug:
         verbose = logging.DEBUG
     elif args.quiet:
         verbose = logging.WARNING
-    input_dict['verbose'] = input_dict['verbose'] if 'verbose' in input_dict else verbose
+
+    if args.dry_run:
+        from apioxy.preflight import format_report, run_preflight
+        paths = [entry['path'] for entry in get_campaign_inputs(args.files)[1]]
+        reports = run_preflight(paths, max_workers=args.max_workers)
+        print('\n\n'.join(format_report(report) for report in reports))
+        sys.exit(1 if any(report['problems'] for report in reports) else 0)
+
+    if args.server:
+        # the server imports T3, ARC and RMG before forking its workers, only import it when serving
+        from apioxy.server import serve
+        serve(host=args.host, port=args.port, max_workers=args.max_workers, verbose=verbose)
+        return
+
+    if len(args.files) > 1 or os.path.isdir(args.file) or is_campaign_file(args.file):
+        settings, inputs = get_campaign_inputs(args.files)
+        if args.clear_cache:
+            clear_input_caches([entry['path'] for entry in inputs])
+        campaign = Campaign(inputs=inputs,
+                            project_directory=args.campaign_directory
+                                              or settings.get('project_directory', None)
+                                              or os.path.abspath(os.path.dirname(args.file)),
+                            max_workers=args.max_workers or settings.get('max_workers', None),
+                            verbose=verbose,
+                            )
+        campaign.execute()
+        return
+
+    input_dict = load_input_file(path=args.file, verbose=verbose)
+
+    if args.clear_cache:
+        ResultCache(path=get_cache_path(input_dict['apioxy'])).invalidate()
 
     apioxy_object = APIOxy(**input_dict)
     apioxy_object.execute()
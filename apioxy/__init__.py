@@ -1,5 +1,22 @@
-import apioxy.common
-import apioxy.levels
-import apioxy.main
-import apioxy.parsing
-from apioxy.main import APIOxy
+"""
+APIOxy package
+submodules are imported on first access, so importing apioxy (e.g., to parse the command line or validate an input file)
+does not import T3, ARC or RMG
+"""
+
+import importlib
+
+SUBMODULES = ['cache', 'campaign', 'common', 'constraints', 'database', 'escalation', 'levels', 'libraries', 'logger',
+              'main', 'manifest', 'metrics', 'parsing', 'preflight', 'prescreen', 'registry', 'runner', 'seeds',
+              'server', 'sweep', 't3_job', 'zeneth']
+
+__all__ = ['APIOxy'] + SUBMODULES
+
+
+def __getattr__(name: str):
+    if name == 'APIOxy':
+        from apioxy.main import APIOxy
+        return APIOxy
+    if name in SUBMODULES:
+        return importlib.import_module(f'apioxy.{name}')
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
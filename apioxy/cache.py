@@ -0,0 +1,330 @@
+"""
+APIOxy result cache module
+used for reusing T3 outputs of API jobs which were already executed with identical inputs
+
+Each entry is keyed by a hash of the canonicalized species (including the API), the rmg, t3, and qm dictionaries
+after default settings were applied, the versions of the RMG database and of the libraries used
+(other than the APIOxy QM library, which every API of a batch updates). Seed mechanisms injected into a job are not
+part of its key, since every completed API adds its mechanism to the seed catalog and reruns select different seeds;
+they are recorded in the entry metadata instead. Caching is opt-in, see the ``cache`` key of the APIOxy input.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import List, Optional
+
+from apioxy.common import CACHE_BASE_PATH, read_yaml_file, save_yaml_file
+from apioxy.registry import get_species_identity
+
+
+# Paths relative to the last T3 iteration folder which are stored in the cache
+CACHED_OUTPUTS = ['RMG/chemkin', 'RMG/solver', 'SA']
+ENTRY_FILE_NAME = 'entry.yml'
+
+
+def get_last_iteration_directory(project_directory: str) -> Optional[str]:
+    """
+    Get the name of the last T3 iteration folder in a T3 project directory.
+
+    Args:
+        project_directory (str): The T3 project directory.
+
+    Returns:
+        Optional[str]: The folder name, e.g., 'iteration_5'. ``None`` if no iteration folder exists.
+    """
+    if not os.path.isdir(project_directory):
+        return None
+    iterations = [name for name in os.listdir(project_directory)
+                  if name.startswith('iteration_') and name.split('_')[-1].isdigit()
+                  and os.path.isdir(os.path.join(project_directory, name))]
+    if not iterations:
+        return None
+    return max(iterations, key=lambda name: int(name.split('_')[-1]))
+
+
+def get_database_version(database: dict,
+                         exclude: Optional[List[str]] = None,
+                         ) -> dict:
+    """
+    Get a representation of the RMG database version and of the libraries used.
+    The library files are represented by their size and modification time,
+    so results are invalidated once a library was updated.
+
+    Args:
+        database (dict): The RMG database dictionary.
+        exclude (List[str], optional): Names of libraries which are not represented, e.g., the APIOxy QM library,
+                                       which every API run of a batch updates.
+
+    Returns:
+        dict: The database version representation.
+    """
+    from t3.main import RMG_THERMO_LIB_BASE_PATH
+
+    database_path = os.path.dirname(os.path.dirname(RMG_THERMO_LIB_BASE_PATH))
+    kinetics_lib_base_path = os.path.join(database_path, 'kinetics', 'libraries')
+    exclude = exclude or list()
+    paths = [os.path.join(RMG_THERMO_LIB_BASE_PATH, f'{lib}.py')
+             for lib in database.get('thermo_libraries', list()) if lib not in exclude]
+    paths += [os.path.join(kinetics_lib_base_path, lib, 'reactions.py')
+              for lib in database.get('kinetics_libraries', list()) if isinstance(lib, str) and lib not in exclude]
+    version = {'database_head': get_git_head(database_path)}
+    for path in paths:
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            version[path] = f'{stat.st_size}:{int(stat.st_mtime)}'
+    return version
+
+
+def get_git_head(path: str) -> Optional[str]:
+    """
+    Get the git HEAD commit hash of a repository without spawning git.
+
+    Args:
+        path (str): The repository path.
+
+    Returns:
+        Optional[str]: The commit hash, ``None`` if it could not be determined.
+    """
+    head_path = os.path.join(path, '.git', 'HEAD')
+    if not os.path.isfile(head_path):
+        return None
+    with open(head_path, 'r') as f:
+        head = f.read().strip()
+    if head.startswith('ref:'):
+        ref_path = os.path.join(path, '.git', head.split()[-1])
+        if not os.path.isfile(ref_path):
+            return head
+        with open(ref_path, 'r') as f:
+            head = f.read().strip()
+    return head
+
+
+def get_canonical_species(species_dict: dict) -> dict:
+    """
+    Get a canonical representation of a species dictionary,
+    where the structure is represented by its identity regardless of the way it was specified.
+
+    Args:
+        species_dict (dict): The species dictionary.
+
+    Returns:
+        dict: The canonical species dictionary.
+    """
+    from t3.common import get_rmg_species_from_a_species_dict
+    from t3.schema import RMGSpecies
+
+    canonical = {key: value for key, value in species_dict.items() if key not in ['smiles', 'inchi', 'adjlist']}
+    rmg_spc = get_rmg_species_from_a_species_dict(RMGSpecies(**species_dict).dict())
+    canonical['identity'] = get_species_identity(rmg_spc)
+    return canonical
+
+
+def get_job_key(job: dict) -> str:
+    """
+    Get the cache key of an API job.
+    The key is computed from the unseeded inputs, it does not depend on seed mechanisms injected into the job.
+
+    Args:
+        job (dict): The API job.
+
+    Returns:
+        str: The cache key.
+    """
+    rmg = {key: value for key, value in job['rmg'].items() if key != 'species'}
+    content = {'species': sorted((get_canonical_species(spc) for spc in job['rmg']['species']),
+                                 key=lambda spc: json.dumps(spc, sort_keys=True, default=str)),
+               'rmg': rmg,
+               't3': job['t3'],
+               'qm': job['qm'],
+               'database': get_database_version(job['rmg'].get('database', dict()),
+                                                exclude=[job['t3'].get('options', dict()).get('library_name')]),
+               }
+    if job.get('escalation') is not None:
+        content['escalation'] = job['escalation']
+    if job.get('adaptive_constraints') is not None:
+        content['adaptive_constraints'] = job['adaptive_constraints']
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def get_cache_path(apioxy: dict) -> Optional[str]:
+    """
+    Get the result cache directory set in the apioxy block of an input.
+
+    Args:
+        apioxy (dict): The apioxy block of the input.
+
+    Returns:
+        Optional[str]: The cache directory, ``None`` for the default directory (``CACHE_BASE_PATH``).
+    """
+    cache = apioxy.get('cache', None)
+    return cache.get('path', None) if isinstance(cache, dict) else None
+
+
+def get_directory_size(path: str) -> int:
+    """
+    Get the overall size of the files under a directory.
+
+    Args:
+        path (str): The directory path.
+
+    Returns:
+        int: The size in bytes.
+    """
+    size = 0
+    for root, _, files in os.walk(path):
+        for file_name in files:
+            size += os.path.getsize(os.path.join(root, file_name))
+    return size
+
+
+class ResultCache(object):
+    """
+    A persistent on-disk cache of API job results.
+
+    Args:
+        path (str, optional): The cache directory, ``CACHE_BASE_PATH`` by default.
+        max_size (float, optional): The maximal cache size in GB, least recently used entries are evicted beyond it.
+
+    Attributes:
+        path (str): The cache directory.
+        max_size (int): The maximal cache size in bytes.
+    """
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 max_size: float = 10.0,
+                 ):
+        self.path = path or CACHE_BASE_PATH
+        self.max_size = int(max_size * 1024 ** 3)
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    def get_entries(self) -> List[dict]:
+        """
+        Get the metadata of all cache entries.
+
+        Returns:
+            List[dict]: Entries are metadata dictionaries, each has a ``key`` key.
+        """
+        entries = list()
+        for key in os.listdir(self.path):
+            entry_path = os.path.join(self.path, key, ENTRY_FILE_NAME)
+            if os.path.isfile(entry_path):
+                entry = read_yaml_file(entry_path)
+                entry['key'] = key
+                entries.append(entry)
+        return entries
+
+    def has(self, key: str) -> bool:
+        """
+        Check whether a key is in the cache.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            bool: Whether the key is in the cache.
+        """
+        return os.path.isfile(os.path.join(self.path, key, ENTRY_FILE_NAME))
+
+    def restore(self,
+                key: str,
+                project_directory: str,
+                ) -> bool:
+        """
+        Restore the cached T3 outputs into a project directory.
+
+        Args:
+            key (str): The cache key.
+            project_directory (str): The T3 project directory to restore the outputs to.
+
+        Returns:
+            bool: Whether the outputs were restored.
+        """
+        if not self.has(key):
+            return False
+        entry_directory = os.path.join(self.path, key)
+        entry_path = os.path.join(entry_directory, ENTRY_FILE_NAME)
+        entry = read_yaml_file(entry_path)
+        for relative_path in entry['outputs']:
+            source = os.path.join(entry_directory, relative_path)
+            destination = os.path.join(project_directory, relative_path)
+            if os.path.isdir(destination):
+                shutil.rmtree(destination)
+            shutil.copytree(source, destination)
+        entry['last_used'] = time.time()
+        save_yaml_file(path=entry_path, content=entry)
+        return True
+
+    def store(self,
+              key: str,
+              project_directory: str,
+              label: Optional[str] = None,
+              seeds: Optional[List[dict]] = None,
+              ) -> bool:
+        """
+        Store the outputs of the last T3 iteration in a project directory under a key.
+
+        Args:
+            key (str): The cache key.
+            project_directory (str): The T3 project directory.
+            label (str, optional): The API label, for reference.
+            seeds (List[dict], optional): The seed mechanisms injected into the job, for reference.
+
+        Returns:
+            bool: Whether the outputs were stored.
+        """
+        iteration = get_last_iteration_directory(project_directory)
+        if iteration is None:
+            return False
+        tmp_directory = os.path.join(self.path, f'.{key}.{os.getpid()}.tmp')
+        if os.path.isdir(tmp_directory):
+            shutil.rmtree(tmp_directory)
+        outputs = list()
+        for output in CACHED_OUTPUTS:
+            relative_path = os.path.join(iteration, output)
+            if os.path.isdir(os.path.join(project_directory, relative_path)):
+                shutil.copytree(os.path.join(project_directory, relative_path),
+                                os.path.join(tmp_directory, relative_path))
+                outputs.append(relative_path)
+        if not outputs:
+            return False
+        save_yaml_file(path=os.path.join(tmp_directory, ENTRY_FILE_NAME),
+                       content={'label': label,
+                                'seeds': seeds or list(),
+                                'outputs': outputs,
+                                'size': get_directory_size(tmp_directory),
+                                'created': time.time(),
+                                'last_used': time.time(),
+                                })
+        entry_directory = os.path.join(self.path, key)
+        if os.path.isdir(entry_directory):
+            shutil.rmtree(entry_directory)
+        os.rename(tmp_directory, entry_directory)
+        self.evict()
+        return True
+
+    def evict(self):
+        """
+        Evict the least recently used entries until the cache size is within ``self.max_size``.
+        """
+        entries = sorted(self.get_entries(), key=lambda entry: entry['last_used'])
+        size = sum(entry['size'] for entry in entries)
+        while entries and size > self.max_size:
+            entry = entries.pop(0)
+            shutil.rmtree(os.path.join(self.path, entry['key']), ignore_errors=True)
+            size -= entry['size']
+
+    def invalidate(self, key: Optional[str] = None):
+        """
+        Invalidate cache entries.
+
+        Args:
+            key (str, optional): The key to invalidate. ``None`` to invalidate the entire cache.
+        """
+        keys = [key] if key is not None else os.listdir(self.path)
+        for key_ in keys:
+            shutil.rmtree(os.path.join(self.path, key_), ignore_errors=True)
@@ -0,0 +1,376 @@
+"""
+APIOxy campaign module
+used for executing the APIs of many APIOxy input files under a single bounded pool of worker processes
+
+A campaign is defined either by a list of input files and directories of input files,
+or by a campaign file which has a ``campaign`` block, e.g.::
+
+    campaign:
+      project_directory: /path/to/portfolio_1
+      max_workers: 32
+      inputs:
+        - path: /path/to/high_priority_api.yml
+          priority: 10
+        - path: /path/to/formulation_study/  # all input files in this directory
+
+Inputs which do not set ``project_directory`` in their ``apioxy`` block run in ``<campaign directory>/<project>``.
+Inputs of model level 0 have no T3 jobs, their APIs are pre-screened (see ``APIOxy.prescreen()``).
+Inputs with a ``sweep`` block are simulated at their sweep conditions once all jobs terminated
+(see ``APIOxy.run_sweep()``).
+"""
+
+import logging
+import os
+import time
+from typing import List, Optional, Tuple
+
+from apioxy.cache import ResultCache, get_cache_path
+from apioxy.common import read_yaml_file, save_yaml_file
+from apioxy.main import APIOxy
+from apioxy.parsing import load_input_file
+from apioxy.runner import run_api_jobs
+
+
+CAMPAIGN_STATUS_FILE_NAME = 'campaign_status.yml'
+INPUT_FILE_EXTENSIONS = ('.yml', '.yaml')
+
+
+def is_campaign_file(path: str) -> bool:
+    """
+    Check whether a file is a campaign file.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        bool: Whether the file has a ``campaign`` block.
+    """
+    if not os.path.isfile(path) or not path.endswith(INPUT_FILE_EXTENSIONS):
+        return False
+    content = read_yaml_file(path)
+    return isinstance(content, dict) and 'campaign' in content
+
+
+def is_input_file(path: str) -> bool:
+    """
+    Check whether a file is an APIOxy input file.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        bool: Whether the file has an ``apioxy`` block.
+    """
+    if not os.path.isfile(path) or not path.endswith(INPUT_FILE_EXTENSIONS) \
+            or os.path.basename(path).startswith('APIOxy_auto_saved_input'):
+        return False
+    content = read_yaml_file(path)
+    return isinstance(content, dict) and 'apioxy' in content
+
+
+def get_input_files(path: str) -> List[str]:
+    """
+    Get the APIOxy input files in a directory (non-recursive), or the file itself if a file path is given.
+
+    Args:
+        path (str): A file or a directory path.
+
+    Returns:
+        List[str]: The input file paths, sorted by name.
+    """
+    if os.path.isfile(path):
+        return [os.path.abspath(path)]
+    if not os.path.isdir(path):
+        raise ValueError(f'Could not find the input file or directory {path}')
+    return [os.path.abspath(os.path.join(path, name)) for name in sorted(os.listdir(path))
+            if is_input_file(os.path.join(path, name))]
+
+
+def get_input_project_directory(input_dict: dict,
+                                campaign_directory: str,
+                                used_directories: List[str],
+                                ) -> str:
+    """
+    Get the project directory of a campaign input.
+    Inputs which do not specify a project directory run in their own sub-directory of the campaign directory,
+    named after their project (and prefixed by a counter if several inputs have the same project name).
+
+    Args:
+        input_dict (dict): The APIOxy arguments, as returned by ``load_input_file()``.
+        campaign_directory (str): The campaign directory.
+        used_directories (List[str]): The project directories of the previous inputs.
+
+    Returns:
+        str: The project directory.
+    """
+    if input_dict['apioxy'].get('project_directory', None):
+        return os.path.abspath(input_dict['apioxy']['project_directory'])
+    project = input_dict.get('project', None) or input_dict['apioxy']['project']
+    project_directory = os.path.abspath(os.path.join(campaign_directory, project))
+    i = 2
+    while project_directory in used_directories:
+        project_directory = os.path.abspath(os.path.join(campaign_directory, f'{project}_{i}'))
+        i += 1
+    return project_directory
+
+
+def get_campaign_inputs(paths: List[str]) -> Tuple[dict, List[dict]]:
+    """
+    Get the campaign settings and inputs from command line paths.
+
+    Args:
+        paths (List[str]): Paths to input files, directories of input files, or campaign files.
+
+    Returns:
+        Tuple[dict, List[dict]]: The campaign settings, and the inputs (each with a ``path`` and a ``priority`` key).
+    """
+    settings, inputs = dict(), list()
+    for path in paths:
+        if is_campaign_file(path):
+            campaign = read_yaml_file(path)['campaign']
+            base_path = os.path.dirname(os.path.abspath(path))
+            settings.update({key: value for key, value in campaign.items() if key != 'inputs'})
+            settings.setdefault('project_directory', base_path)
+            for entry in campaign.get('inputs', list()):
+                entry = {'path': entry} if isinstance(entry, str) else entry
+                entry_path = entry['path'] if os.path.isabs(entry['path']) else os.path.join(base_path, entry['path'])
+                inputs.extend({'path': input_path, 'priority': entry.get('priority', 0)}
+                              for input_path in get_input_files(entry_path))
+        else:
+            inputs.extend({'path': input_path, 'priority': None} for input_path in get_input_files(path))
+    return settings, inputs
+
+
+def clear_input_caches(paths: List[str]) -> List[Optional[str]]:
+    """
+    Invalidate the result caches configured by campaign inputs, each cache once.
+    Inputs which cannot be loaded are skipped, the campaign reports them as failed.
+
+    Args:
+        paths (List[str]): The input file paths.
+
+    Returns:
+        List[Optional[str]]: The invalidated cache directories, ``None`` for the default directory.
+    """
+    cache_paths = list()
+    for path in paths:
+        try:
+            cache_path = get_cache_path(load_input_file(path)['apioxy'])
+        except Exception:
+            continue
+        if cache_path not in cache_paths:
+            cache_paths.append(cache_path)
+    for cache_path in cache_paths:
+        ResultCache(path=cache_path).invalidate()
+    return cache_paths
+
+
+class Campaign(object):
+    """
+    The APIOxy Campaign class.
+    All APIs of all inputs are scheduled in a single global job queue, ordered by priority (higher first),
+    and executed under one bounded pool of worker processes.
+    Input files which do not specify a priority may set ``priority`` in their ``apioxy`` block (default: 0).
+
+    Args:
+        inputs (List[dict]): Entries are dictionaries with a ``path`` and a ``priority`` key.
+        project_directory (str): The campaign directory, where the status file is saved.
+        max_workers (int, optional): The maximal number of worker processes, ``None`` to use all available CPUs.
+        verbose (int, optional): The logging level.
+
+    Attributes:
+        inputs (List[dict]): The campaign inputs.
+        project_directory (str): The campaign directory.
+        max_workers (Optional[int]): The maximal number of worker processes.
+        verbose (int): The logging level.
+        status_path (str): The path to the aggregated campaign status file.
+        apioxy_objects (List[Optional[APIOxy]]): The APIOxy objects, one per input, ``None`` for inputs which
+                                                 could not be loaded.
+        finished_results (List[List[dict]]): The results of APIs which need not be executed, per input.
+        project_directories (List[Optional[str]]): The project directories, one per input.
+        prescreen_rankings (dict): Keys are indices of model level 0 inputs, values are their pre-screen rankings
+                                   (``None`` until pre-screened).
+        status (dict): Keys are (input index, API index) tuples, values are the respective job status entries.
+    """
+
+    def __init__(self,
+                 inputs: List[dict],
+                 project_directory: str,
+                 max_workers: Optional[int] = None,
+                 verbose: int = logging.INFO,
+                 ):
+        self.inputs = inputs
+        self.project_directory = project_directory
+        self.max_workers = max_workers
+        self.verbose = verbose
+        if not os.path.isdir(self.project_directory):
+            os.makedirs(self.project_directory)
+        self.status_path = os.path.join(self.project_directory, CAMPAIGN_STATUS_FILE_NAME)
+        self.apioxy_objects = list()
+        self.finished_results = list()
+        self.project_directories = list()
+        self.prescreen_rankings = dict()
+        self.status = dict()
+        self.t0 = time.time()
+
+    def get_jobs(self) -> List[dict]:
+        """
+        Load all inputs and generate the global job queue.
+
+        Returns:
+            List[dict]: The API jobs to execute, ordered by priority.
+        """
+        jobs = list()
+        for i, campaign_input in enumerate(self.inputs):
+            apioxy_object, project_directory, priority = None, None, campaign_input['priority']
+            try:
+                input_dict = load_input_file(campaign_input['path'], verbose=self.verbose)
+                if priority is None:
+                    priority = input_dict['apioxy'].get('priority', 0)
+                project_directory = get_input_project_directory(input_dict=input_dict,
+                                                                campaign_directory=self.project_directory,
+                                                                used_directories=self.project_directories,
+                                                                )
+                if project_directory in self.project_directories:
+                    raise ValueError(f'The project directory {project_directory} is already used by input '
+                                     f'{self.inputs[self.project_directories.index(project_directory)]["path"]}')
+                input_dict['project_directory'] = project_directory
+                apioxy_object = APIOxy(**input_dict)
+                if apioxy_object.apioxy['model_level'] == 0:
+                    finished_results, apioxy_jobs = list(), list()
+                else:
+                    finished_results, apioxy_jobs = apioxy_object.prepare_jobs()
+            except Exception as e:
+                # report the input as failed, the other inputs are still executed
+                self.apioxy_objects.append(None)
+                self.finished_results.append(list())
+                self.project_directories.append(project_directory)
+                self.update_status({'index': None, 'label': None, 'project': None,
+                                    'project_directory': project_directory, 'status': 'failed',
+                                    'error': f'{e.__class__.__name__}: {e}', 'wall_time': None},
+                                   campaign_input=i, priority=priority, save=False)
+                continue
+            self.apioxy_objects.append(apioxy_object)
+            self.finished_results.append(finished_results)
+            self.project_directories.append(project_directory)
+            if apioxy_object.apioxy['model_level'] == 0:
+                self.prescreen_rankings[i] = None
+                self.update_status({'index': None, 'label': None, 'project': apioxy_object.project,
+                                    'project_directory': project_directory, 'status': 'queued', 'error': None,
+                                    'wall_time': None},
+                                   campaign_input=i, priority=priority, save=False)
+            for result in finished_results:
+                self.update_status(result, campaign_input=i, priority=priority, save=False)
+            for job in apioxy_jobs:
+                job['campaign_input'] = i
+                job['priority'] = priority
+                self.update_status(dict(job, status='queued', error=None, wall_time=None),
+                                   campaign_input=i, priority=priority, save=False)
+                jobs.append(job)
+        self.save_status()
+        # a stable sort keeps the order of the inputs and APIs within each priority
+        return sorted(jobs, key=lambda job: -job['priority'])
+
+    def execute(self) -> List[dict]:
+        """
+        Execute the campaign.
+
+        Returns:
+            List[dict]: The API job results.
+        """
+        jobs = self.get_jobs()
+        self.run_prescreens()
+        results = run_api_jobs(jobs=jobs,
+                               run_in_parallel=True,
+                               max_workers=self.max_workers,
+                               callback=self.process_job_result,
+                               )
+        for i, apioxy_object in enumerate(self.apioxy_objects):
+            if apioxy_object is not None and i not in self.prescreen_rankings:
+                input_results = self.finished_results[i] + [result for result in results
+                                                            if result['campaign_input'] == i]
+                if apioxy_object.apioxy['sweep']:
+                    try:
+                        with apioxy_object.metrics.phase('sweep'):
+                            apioxy_object.run_sweep(input_results)
+                    except Exception as e:
+                        # the API results are still reported, only the sweep of this input is missing
+                        apioxy_object.logger.error(f'Could not run the sweep: {e.__class__.__name__}: {e}')
+                apioxy_object.finalize(input_results)
+        self.save_status()
+        return results
+
+    def run_prescreens(self):
+        """
+        Pre-screen the APIs of the model level 0 inputs, which have no T3 jobs.
+        """
+        for i in sorted(self.prescreen_rankings):
+            apioxy_object, t0 = self.apioxy_objects[i], time.time()
+            status, error = 'completed', None
+            try:
+                self.prescreen_rankings[i] = apioxy_object.prescreen()
+            except Exception as e:
+                status, error = 'failed', f'{e.__class__.__name__}: {e}'
+            self.update_status({'index': None, 'label': None, 'project': apioxy_object.project,
+                                'project_directory': self.project_directories[i], 'status': status, 'error': error,
+                                'wall_time': time.time() - t0},
+                               campaign_input=i)
+
+    def process_job_result(self, result: dict):
+        """
+        Process the result of an API job once it terminates.
+
+        Args:
+            result (dict): The API job result.
+        """
+        self.apioxy_objects[result['campaign_input']].process_job_result(result)
+        self.update_status(result, campaign_input=result['campaign_input'])
+
+    def update_status(self,
+                      result: dict,
+                      campaign_input: int,
+                      priority: Optional[int] = None,
+                      save: bool = True,
+                      ):
+        """
+        Update the status of an API job in the aggregated campaign status file.
+
+        Args:
+            result (dict): The API job result (or the job itself if it did not run yet).
+                           An ``index`` of ``None`` refers to the whole input, e.g., if it could not be loaded.
+            campaign_input (int): The index of the campaign input of the API.
+            priority (int, optional): The API priority, kept from the previous update if not given.
+            save (bool, optional): Whether to save the status file.
+        """
+        key = (campaign_input, result['index'])
+        entry = self.status.get(key, dict())
+        entry.update({'input': self.inputs[campaign_input]['path'],
+                      'index': result['index'],
+                      'project': result['project'],
+                      'project_directory': result['project_directory'],
+                      'label': result['label'],
+                      'status': result['status'],
+                      'error': result['error'],
+                      'wall_time': result['wall_time'],
+                      })
+        if priority is not None:
+            entry['priority'] = priority
+        self.status[key] = entry
+        if save:
+            self.save_status()
+
+    def save_status(self):
+        """
+        Save the aggregated campaign status file.
+        """
+        counts = dict()
+        for entry in self.status.values():
+            counts[entry['status']] = counts.get(entry['status'], 0) + 1
+        save_yaml_file(path=self.status_path,
+                       content={'inputs': len(self.inputs),
+                                'apis': sum(index is not None for _, index in self.status),
+                                'counts': counts,
+                                'wall_time': time.time() - self.t0,
+                                'jobs': [self.status[key] for key in sorted(self.status,
+                                                                            key=lambda k: (k[0], k[1] or 0))],
+                                })
@@ -17,10 +17,6 @@ import warnings
 import yaml
 from typing import Dict, List, Optional, Tuple, Union
 
-#from arc.settings import arc_path, servers, default_job_types
-from arc.imports import settings
-from arc.common import is_str_float, is_str_int, read_yaml_file, save_yaml_file
-
 
 logger = logging.getLogger('apioxy')
 
@@ -28,6 +24,7 @@ VERSION = '0.1.0'
 
 apioxy_path = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))  # absolute path to the APIOxy folder
 PROJECTS_BASE_PATH = os.path.join(apioxy_path, 'Projects')
+CACHE_BASE_PATH = os.path.join(apioxy_path, 'Cache')
 
 
 def initialize_log(log_file: str,
@@ -167,6 +164,56 @@ def string_representer(dumper: yaml.Dumper,
     return dumper.represent_scalar(tag='tag:yaml.org,2002:str', value=data)
 
 
+# read_yaml_file(), save_yaml_file(), is_str_float() and is_str_int() are copied from ARC's arc/common.py
+# (https://github.com/ReactionMechanismGenerator/ARC), so modules needed at start-up do not import ARC.
+# Keep them in sync with ARC.
+def read_yaml_file(path: str,
+                   project_directory: Optional[str] = None,
+                   ) -> Union[dict, list]:
+    """
+    Read a YAML file (usually an input / restart file, but also conformers file)
+    and return the parameters as python variables.
+    This mirrors ``arc.common.read_yaml_file``, so ARC need not be imported for reading input files.
+
+    Args:
+        path (str): The YAML file path to read.
+        project_directory (str, optional): The current project directory to rebase upon.
+
+    Returns: Union[dict, list]
+        The content read from the file.
+    """
+    if project_directory is not None:
+        path = globalize_paths(path, project_directory)
+    if not isinstance(path, str):
+        raise ValueError(f'path must be a string, got {path} which is a {type(path)}')
+    if not os.path.isfile(path):
+        raise ValueError(f'Could not find the YAML file {path}')
+    with open(path, 'r') as f:
+        content = yaml.load(stream=f, Loader=yaml.FullLoader)
+    return content
+
+
+def save_yaml_file(path: str,
+                   content: Union[list, dict],
+                   ) -> None:
+    """
+    Save a YAML file (usually an input / restart file, but also conformers file).
+    This mirrors ``arc.common.save_yaml_file``.
+
+    Args:
+        path (str): The YAML file path to save.
+        content (list, dict): The content to save.
+    """
+    if not isinstance(path, str):
+        raise ValueError(f'path must be a string, got {path} which is a {type(path)}')
+    yaml.add_representer(str, string_representer)
+    yaml_str = yaml.dump(data=content)
+    if '/' in path and os.path.dirname(path) and not os.path.exists(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as f:
+        f.write(yaml_str)
+
+
 def globalize_paths(file_path: str,
                     project_directory: str,
                     ) -> str:
@@ -244,6 +291,42 @@ def is_notebook() -> bool:
     except NameError:
         return False  # Probably standard Python interpreter
 
+
+# copied from ARC's arc/common.py, see read_yaml_file()
+def is_str_float(value: Optional[str]) -> bool:
+    """
+    Check whether a string can be converted to a floating number.
+
+    Args:
+        value (str): The string to check.
+
+    Returns: bool
+        ``True`` if it can, ``False`` otherwise.
+    """
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def is_str_int(value: Optional[str]) -> bool:
+    """
+    Check whether a string can be converted to an integer.
+
+    Args:
+        value (str): The string to check.
+
+    Returns: bool
+        ``True`` if it can, ``False`` otherwise.
+    """
+    try:
+        int(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
 def str_to_float_fail_none(value: str) -> Union[None, float]:
     return float(value) if is_str_float(value) else None
 
@@ -0,0 +1,218 @@
+"""
+APIOxy constraints module
+used for the adaptive species constraints mode (``adaptive_constraints``)
+
+The RMG species constraints of an API start tight, just above the element counts of the API
+(and of its Zeneth degradants, if any), instead of the fixed heuristic bounds.
+After each RMG run of a T3 iteration, the species RMG moved to the core because of their flux are inspected:
+when such a species sits at the bound of an element, flux reaches the constrained region, and that bound is relaxed
+by a step for the next iteration, up to the heuristic bounds. Bounds are not relaxed while the edge grows faster
+than a limit, since the model is still expanding within the current bounds.
+Relaxed bounds only take effect in the next RMG run, so T3 runs another iteration after a relaxation
+(within ``max_T3_iterations``). If no iteration was left, the final model is reported as constraint-limited.
+"""
+
+import os
+import re
+from typing import List, Optional
+
+from apioxy.zeneth import tighten_species_constraints
+
+
+DEFAULT_ADAPTIVE_CONSTRAINTS = {'margins': {'C': 0, 'O': 2, 'N': 0, 'S': 0, 'Si': 0, 'heavy': 2},
+                                'steps': {'C': 1, 'O': 2, 'N': 1, 'S': 1, 'Si': 1, 'heavy': 2},
+                                'max_edge_growth': 3.0,
+                                }
+CORE_ADDITION_PATTERNS = [re.compile(r'Adding species (\S+) to model core'),
+                          re.compile(r'species (\S+) at .* exceeded the minimum rate for moving to model core'),
+                          ]
+
+
+def get_adaptive_constraints_settings(adaptive_constraints) -> Optional[dict]:
+    """
+    Get the adaptive constraints settings with defaults applied where not specified.
+
+    Args:
+        adaptive_constraints: The adaptive constraints settings of the input, ``True``/``False`` to use the defaults
+                              or to disable the adaptive mode.
+
+    Returns:
+        Optional[dict]: The adaptive constraints settings, ``None`` if the adaptive mode is disabled.
+    """
+    if not adaptive_constraints:
+        return None
+    settings = {key: dict(value) if isinstance(value, dict) else value
+                for key, value in DEFAULT_ADAPTIVE_CONSTRAINTS.items()}
+    if isinstance(adaptive_constraints, dict):
+        for key, value in adaptive_constraints.items():
+            if isinstance(settings.get(key, None), dict):
+                settings[key].update(value or dict())
+            elif value is not None:
+                settings[key] = value
+    return settings
+
+
+def get_core_additions(rmg_log_path: Optional[str]) -> List[str]:
+    """
+    Get the labels of the species RMG moved from the edge to the core, from its log file.
+
+    Args:
+        rmg_log_path (str, optional): The path to the RMG log file.
+
+    Returns:
+        List[str]: The species labels, in the order they were added.
+    """
+    if rmg_log_path is None or not os.path.isfile(rmg_log_path):
+        return list()
+    labels = list()
+    with open(rmg_log_path, 'r', errors='replace') as f:
+        for line in f:
+            for pattern in CORE_ADDITION_PATTERNS:
+                match = pattern.search(line)
+                if match is not None and match.group(1) not in labels:
+                    labels.append(match.group(1))
+    return labels
+
+
+def get_species_element_counts(species_dictionary_path: str, labels: List[str]) -> List[dict]:
+    """
+    Get the element counts of species of an RMG species dictionary.
+
+    Args:
+        species_dictionary_path (str): The path to the RMG species dictionary.
+        labels (List[str]): The labels of the species.
+
+    Returns:
+        List[dict]: Keys are element symbols, values are counts, for each species found in the dictionary.
+    """
+    from rmgpy.chemkin import load_species_dictionary
+
+    species_dict = load_species_dictionary(species_dictionary_path)
+    element_counts = list()
+    for label in labels:
+        if label not in species_dict:
+            continue
+        counts = dict()
+        for atom in species_dict[label].molecule[0].vertices:
+            counts[atom.element.symbol] = counts.get(atom.element.symbol, 0) + 1
+        element_counts.append(counts)
+    return element_counts
+
+
+def get_bound_elements(species_constraints: dict, element_counts: List[dict]) -> List[str]:
+    """
+    Get the elements (and 'heavy') whose bound is reached by any of the species.
+
+    Args:
+        species_constraints (dict): The RMG species constraints.
+        element_counts (List[dict]): The element counts of the species.
+
+    Returns:
+        List[str]: The element symbols, and 'heavy' for the heavy atom bound.
+    """
+    bound = list()
+    for key, value in species_constraints.items():
+        if not (key.startswith('max_') and key.endswith('_atoms')):
+            continue
+        element = key[len('max_'):-len('_atoms')]
+        for counts in element_counts:
+            count = sum(n for symbol, n in counts.items() if symbol != 'H') if element == 'heavy' \
+                else counts.get(element, 0)
+            if count >= value:
+                bound.append(element)
+                break
+    return bound
+
+
+class ConstraintTuner(object):
+    """
+    Relaxes the species constraints of an API across T3 iterations where flux shows they matter.
+
+    Args:
+        ceiling (dict): The loosest RMG species constraints allowed, e.g., the heuristic ones.
+        species_constraints (dict): The initial (tight) RMG species constraints.
+        steps (dict): Keys are element symbols or 'heavy', values are the relaxation steps.
+        max_edge_growth (float): The maximal ratio of the edge sizes of consecutive iterations at which bounds
+                                 may be relaxed.
+
+    Attributes:
+        species_constraints (dict): The current RMG species constraints.
+        edge_species (Optional[int]): The edge size of the previous iteration.
+        history (List[dict]): The ``iteration``, ``edge_species``, ``bound`` elements and ``relaxed`` bounds
+                              of each update.
+    """
+
+    def __init__(self,
+                 ceiling: dict,
+                 species_constraints: dict,
+                 steps: dict,
+                 max_edge_growth: float = 3.0,
+                 ):
+        self.ceiling = ceiling
+        self.species_constraints = dict(species_constraints)
+        self.steps = steps
+        self.max_edge_growth = max_edge_growth
+        self.edge_species = None
+        self.history = list()
+
+    def update(self,
+               iteration: Optional[int],
+               rmg_log_path: Optional[str],
+               species_dictionary_path: Optional[str],
+               edge_species: Optional[int] = None,
+               ) -> dict:
+        """
+        Update the species constraints after an RMG run.
+
+        Args:
+            iteration (int, optional): The T3 iteration number.
+            rmg_log_path (str, optional): The path to the RMG log file of the run.
+            species_dictionary_path (str, optional): The path to the RMG species dictionary of the run.
+            edge_species (int, optional): The edge size at the end of the run.
+
+        Returns:
+            dict: The RMG species constraints for the next run.
+        """
+        entry = {'iteration': iteration, 'edge_species': edge_species, 'bound': list(), 'relaxed': dict()}
+        growing = self.edge_species is not None and edge_species is not None and self.edge_species > 0 \
+            and edge_species / self.edge_species > self.max_edge_growth
+        self.edge_species = edge_species if edge_species is not None else self.edge_species
+        labels = get_core_additions(rmg_log_path)
+        if labels and species_dictionary_path is not None and os.path.isfile(species_dictionary_path):
+            entry['bound'] = get_bound_elements(self.species_constraints,
+                                                get_species_element_counts(species_dictionary_path, labels))
+        if not growing:
+            for element in entry['bound']:
+                key = f'max_{element}_atoms'
+                value = min(self.species_constraints[key] + self.steps.get(element, 1), self.ceiling.get(key, 0))
+                if value > self.species_constraints[key]:
+                    self.species_constraints[key] = entry['relaxed'][key] = value
+        self.history.append(entry)
+        return dict(self.species_constraints)
+
+    def is_pending(self) -> bool:
+        """
+        Check whether bounds were relaxed after the last RMG run, so no RMG run used them yet.
+
+        Returns:
+            bool: Whether relaxed bounds are pending.
+        """
+        return bool(self.history) and bool(self.history[-1]['relaxed'])
+
+
+def get_initial_constraints(ceiling: dict,
+                            element_counts: List[dict],
+                            margins: dict,
+                            ) -> dict:
+    """
+    Get the tight initial species constraints of the adaptive mode.
+
+    Args:
+        ceiling (dict): The loosest RMG species constraints allowed.
+        element_counts (List[dict]): The element counts of the API (and of its predicted degradants).
+        margins (dict): Keys are element symbols or 'heavy', values are the margins added to the largest counts.
+
+    Returns:
+        dict: The initial RMG species constraints.
+    """
+    return tighten_species_constraints(ceiling, element_counts, margins=margins)
@@ -0,0 +1,275 @@
+"""
+APIOxy database module
+used for loading the RMG database with the libraries and families selected for an APIOxy run
+
+A loaded database is stored as a binary snapshot keyed by the selected libraries and families
+and by the size and modification time of the respective database files,
+so later loads of the same selection by the same user only unpickle the snapshot.
+Snapshots only serve databases loaded within the APIOxy process (the model level 0 pre-screening),
+they do not shorten the cold start of T3 runs, since the RMG runs spawned by T3 load their database from the files.
+The signature of the shared database trees (families, groups, solvation, statmech) is computed once per process,
+library files are checked on every load, since runs update them (e.g., the APIOxy QM library).
+Since unpickling runs code, snapshots are written with owner-only permissions, and a snapshot is only loaded
+if it and its directory are owned by the current user and are not writable by others.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import stat
+from typing import List, Optional
+
+import rmgpy.data.rmg
+from rmgpy import settings as rmg_settings
+from rmgpy.data.rmg import RMGDatabase
+
+from t3.main import RMG_THERMO_LIB_BASE_PATH
+
+from apioxy.cache import get_git_head
+from apioxy.common import CACHE_BASE_PATH, get_logger
+from apioxy.libraries import get_library_index
+
+
+logger = get_logger()
+
+RMG_DATABASE_PATH = rmg_settings['database.directory']
+RMG_KINETICS_LIB_BASE_PATH = os.path.join(RMG_DATABASE_PATH, 'kinetics', 'libraries')
+RMG_KINETICS_FAMILIES_BASE_PATH = os.path.join(RMG_DATABASE_PATH, 'kinetics', 'families')
+DATABASE_SNAPSHOT_PATH = os.path.join(CACHE_BASE_PATH, 'database_snapshots')
+MAX_DATABASE_SNAPSHOTS = 5
+
+
+_DATABASE_TREE_SIGNATURES = dict()
+
+
+def get_existing_libraries(database: dict) -> dict:
+    """
+    Get the thermo and kinetics libraries of an RMG database dictionary which exist on disk.
+    Libraries created on the fly (e.g., the APIOxy QM library before the first QM calculation) are excluded.
+
+    Args:
+        database (dict): The RMG database dictionary.
+
+    Returns:
+        dict: The thermo and kinetics libraries, keys are 'thermo_libraries' and 'kinetics_libraries'.
+    """
+    library_index = get_library_index(RMG_THERMO_LIB_BASE_PATH, RMG_KINETICS_LIB_BASE_PATH)
+    thermo_libraries = [lib for lib in database.get('thermo_libraries', list())
+                        if library_index.has_thermo_library(lib)]
+    kinetics_libraries = list()
+    for lib in database.get('kinetics_libraries', list()):
+        name = lib[0] if isinstance(lib, (list, tuple)) else lib
+        if library_index.has_kinetics_library(name):
+            kinetics_libraries.append(name)
+    return {'thermo_libraries': thermo_libraries, 'kinetics_libraries': kinetics_libraries}
+
+
+def get_kinetics_families(database: dict) -> List[str]:
+    """
+    Get the kinetics families of an RMG database dictionary in the format RMG expects.
+
+    Args:
+        database (dict): The RMG database dictionary.
+
+    Returns:
+        List[str]: The kinetics families.
+    """
+    families = database.get('kinetics_families', 'default')
+    return [families] if isinstance(families, str) else list(families)
+
+
+def get_files_signature(paths: List[str]) -> dict:
+    """
+    Get the size and modification time of files, and of all files under directories.
+
+    Args:
+        paths (List[str]): File and directory paths.
+
+    Returns:
+        dict: Keys are file paths, values are 'size:mtime' strings.
+    """
+    signature = dict()
+    for path in paths:
+        if os.path.isfile(path):
+            file_paths = [path]
+        else:
+            file_paths = [os.path.join(root, file_name) for root, _, files in os.walk(path) for file_name in files]
+        for file_path in file_paths:
+            stat = os.stat(file_path)
+            signature[file_path] = f'{stat.st_size}:{stat.st_mtime_ns}'
+    return signature
+
+
+def get_database_tree_signature(paths: List[str]) -> dict:
+    """
+    Get the size and modification time of the files under the shared RMG database trees.
+    The signature is computed once per process and paths selection,
+    since the trees are not updated by APIOxy runs and walking the families tree is slow.
+
+    Args:
+        paths (List[str]): File and directory paths of the database trees.
+
+    Returns:
+        dict: Keys are file paths, values are 'size:mtime' strings.
+    """
+    key = tuple(paths)
+    if key not in _DATABASE_TREE_SIGNATURES:
+        _DATABASE_TREE_SIGNATURES[key] = get_files_signature(paths)
+    return _DATABASE_TREE_SIGNATURES[key]
+
+
+def get_database_snapshot_key(database: dict) -> str:
+    """
+    Get the snapshot key of an RMG database selection.
+
+    Args:
+        database (dict): The RMG database dictionary.
+
+    Returns:
+        str: The snapshot key.
+    """
+    libraries = get_existing_libraries(database)
+    families = get_kinetics_families(database)
+    paths = [lib if os.path.isfile(lib) else os.path.join(RMG_THERMO_LIB_BASE_PATH, f'{lib}.py')
+             for lib in libraries['thermo_libraries']]
+    paths += [lib if os.path.isdir(lib) else os.path.join(RMG_KINETICS_LIB_BASE_PATH, lib)
+              for lib in libraries['kinetics_libraries']]
+    if any(family in ['default', 'all', 'none'] for family in families):
+        tree_paths = [RMG_KINETICS_FAMILIES_BASE_PATH]
+    else:
+        tree_paths = [os.path.join(RMG_KINETICS_FAMILIES_BASE_PATH, 'recommended.py')]
+        tree_paths.extend(os.path.join(RMG_KINETICS_FAMILIES_BASE_PATH, family.lstrip('!')) for family in families)
+    tree_paths += [os.path.join(RMG_DATABASE_PATH, 'thermo', 'groups'),
+                   os.path.join(RMG_DATABASE_PATH, 'solvation'),
+                   os.path.join(RMG_DATABASE_PATH, 'statmech'),
+                   ]
+    files = get_files_signature([path for path in paths if os.path.exists(path)])
+    files.update(get_database_tree_signature([path for path in tree_paths if os.path.exists(path)]))
+    content = {'libraries': libraries,
+               'families': families,
+               'seed_mechanisms': database.get('seed_mechanisms', list()),
+               'database_head': get_git_head(RMG_DATABASE_PATH),
+               'files': files,
+               }
+    return hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def is_trusted_path(path: str) -> bool:
+    """
+    Check whether a file or directory is owned by the current user and is not writable by the group or by others.
+
+    Args:
+        path (str): The file or directory path.
+
+    Returns:
+        bool: Whether the path is trusted.
+    """
+    stat_result = os.stat(path)
+    return stat_result.st_uid == os.getuid() and not stat_result.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def is_trusted_snapshot(snapshot_file: str) -> bool:
+    """
+    Check whether a database snapshot can be safely loaded, i.e., whether the snapshot and its directory are trusted.
+
+    Args:
+        snapshot_file (str): The snapshot file path.
+
+    Returns:
+        bool: Whether the snapshot can be loaded.
+    """
+    return is_trusted_path(snapshot_file) and is_trusted_path(os.path.dirname(snapshot_file))
+
+
+def load_rmg_database(database: dict,
+                      use_snapshot: bool = True,
+                      snapshot_path: Optional[str] = None,
+                      ) -> RMGDatabase:
+    """
+    Load the RMG database with the libraries and families of an RMG database dictionary.
+    The loaded database is also set as RMG's global database.
+
+    Args:
+        database (dict): The RMG database dictionary.
+        use_snapshot (bool, optional): Whether to load the database from a snapshot if one exists,
+                                       and to store a snapshot otherwise.
+        snapshot_path (str, optional): The snapshot directory, ``DATABASE_SNAPSHOT_PATH`` by default.
+
+    Returns:
+        RMGDatabase: The loaded RMG database.
+    """
+    if not use_snapshot:
+        return load_rmg_database_from_files(database)
+    snapshot_path = snapshot_path or DATABASE_SNAPSHOT_PATH
+    snapshot_file = os.path.join(snapshot_path, f'{get_database_snapshot_key(database)}.pkl')
+    if os.path.isfile(snapshot_file) and not is_trusted_snapshot(snapshot_file):
+        logger.warning(f'Not loading the RMG database snapshot {snapshot_file}, it is not owned by the current user '
+                       f'or is writable by others.')
+    elif os.path.isfile(snapshot_file):
+        try:
+            with open(snapshot_file, 'rb') as f:
+                rmg_database = pickle.load(f)
+        except Exception as e:
+            logger.warning(f'Could not load the RMG database snapshot {snapshot_file}, got:\n{e}')
+        else:
+            rmgpy.data.rmg.database = rmg_database
+            return rmg_database
+    rmg_database = load_rmg_database_from_files(database)
+    if not os.path.isdir(snapshot_path) or is_trusted_path(snapshot_path):
+        save_database_snapshot(rmg_database, snapshot_file)
+    return rmg_database
+
+
+def save_database_snapshot(rmg_database: RMGDatabase,
+                           snapshot_file: str,
+                           ):
+    """
+    Atomically save a binary snapshot of a loaded RMG database, readable and writable by the owner only.
+    Only the ``MAX_DATABASE_SNAPSHOTS`` most recently used snapshots are kept,
+    since snapshots become stale whenever a library they contain (e.g., the APIOxy QM library) is updated.
+
+    Args:
+        rmg_database (RMGDatabase): The loaded RMG database.
+        snapshot_file (str): The snapshot file path.
+    """
+    if not os.path.isdir(os.path.dirname(snapshot_file)):
+        os.makedirs(os.path.dirname(snapshot_file), mode=0o700)
+    tmp_file = f'{snapshot_file}.{os.getpid()}.tmp'
+    try:
+        with os.fdopen(os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            pickle.dump(rmg_database, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, snapshot_file)
+    except Exception as e:
+        logger.warning(f'Could not save an RMG database snapshot, got:\n{e}')
+        if os.path.isfile(tmp_file):
+            os.remove(tmp_file)
+    snapshot_path = os.path.dirname(snapshot_file)
+    snapshots = sorted((os.path.join(snapshot_path, name) for name in os.listdir(snapshot_path)
+                        if name.endswith('.pkl')), key=os.path.getatime, reverse=True)
+    for path in snapshots[MAX_DATABASE_SNAPSHOTS:]:
+        os.remove(path)
+
+
+def load_rmg_database_from_files(database: dict) -> RMGDatabase:
+    """
+    Load the RMG database from the database files.
+
+    Args:
+        database (dict): The RMG database dictionary.
+
+    Returns:
+        RMGDatabase: The loaded RMG database.
+    """
+    libraries = get_existing_libraries(database)
+    rmg_database = RMGDatabase()
+    rmg_database.load(path=RMG_DATABASE_PATH,
+                      thermo_libraries=libraries['thermo_libraries'],
+                      transport_libraries=[],
+                      reaction_libraries=libraries['kinetics_libraries'],
+                      seed_mechanisms=database.get('seed_mechanisms', list()),
+                      kinetics_families=get_kinetics_families(database),
+                      kinetics_depositories=['training'],
+                      depository=False,
+                      )
+    return rmg_database
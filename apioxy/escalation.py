@@ -0,0 +1,323 @@
+"""
+APIOxy escalation module
+used for the adaptive model level (``model_level: 'adaptive'``)
+
+The whole model is first generated with the level 1 levels of theory.
+Then, at each higher level, only the species and reactions the T3 sensitivity analysis ranks as the top contributors
+to the API consumption are re-computed, the model is regenerated and the sensitivity analysis is repeated.
+Escalation stops when the predicted API degradation rate changes by less than a relative tolerance between levels,
+or when the highest level was reached.
+"""
+
+import csv
+import os
+from typing import List, Optional, Tuple
+
+from apioxy.common import read_yaml_file
+
+
+DEFAULT_ESCALATION = {'levels': [1, 2, 3],
+                      'top_species': 10,
+                      'top_reactions': 10,
+                      'tolerance': 0.05,
+                      }
+OBSERVABLE = 'API'
+
+
+def get_escalation_settings(escalation: Optional[dict]) -> dict:
+    """
+    Get the escalation settings with defaults applied where not specified.
+
+    Args:
+        escalation (dict, optional): The escalation settings of the input.
+
+    Returns:
+        dict: The escalation settings.
+    """
+    settings = dict(DEFAULT_ESCALATION)
+    settings.update({key: value for key, value in (escalation or dict()).items() if value is not None})
+    settings['levels'] = list(settings['levels'])
+    return settings
+
+
+def get_sa_dict(t3_object) -> Optional[dict]:
+    """
+    Get the latest sensitivity analysis results of a T3 object, from memory or from the SA output file.
+
+    Args:
+        t3_object (T3): The T3 object.
+
+    Returns:
+        Optional[dict]: The SA dictionary with the 'kinetics' and 'thermo' keys, ``None`` if not available.
+    """
+    sa_dict = getattr(t3_object, 'sa_dict', None)
+    if sa_dict is None:
+        path = getattr(t3_object, 'paths', dict()).get('SA dict', None)
+        if path is not None and os.path.isfile(path):
+            sa_dict = read_yaml_file(path)
+    return sa_dict
+
+
+def get_observable_key(coefficients: dict, observable: str = OBSERVABLE) -> Optional[str]:
+    """
+    Get the key of an observable in an SA coefficient dictionary, which may carry an RMG index (e.g., 'API(1)').
+
+    Args:
+        coefficients (dict): Keys are observable labels.
+        observable (str, optional): The observable label.
+
+    Returns:
+        Optional[str]: The matching key, ``None`` if the observable was not analyzed.
+    """
+    for key in coefficients.keys():
+        if key == observable or str(key).split('(')[0] == observable:
+            return key
+    return None
+
+
+def get_max_sensitivity(values) -> float:
+    """
+    Get the maximal absolute value of a sensitivity coefficient profile (or a single coefficient).
+
+    Args:
+        values: The sensitivity coefficients over time, or a single coefficient.
+
+    Returns:
+        float: The maximal absolute sensitivity coefficient.
+    """
+    if isinstance(values, (int, float)):
+        return abs(values)
+    return max((abs(value) for value in values), default=0.0)
+
+
+def get_top_contributors(sa_dict: dict,
+                         top_species: int,
+                         top_reactions: int,
+                         observable: str = OBSERVABLE,
+                         ) -> Tuple[List[str], List[int]]:
+    """
+    Get the species and reactions with the highest sensitivity coefficients of the API concentration.
+
+    Args:
+        sa_dict (dict): The SA dictionary.
+        top_species (int): The number of species to return.
+        top_reactions (int): The number of reactions to return.
+        observable (str, optional): The observable label.
+
+    Returns:
+        Tuple[List[str], List[int]]: The species labels and the reaction indices, most sensitive first.
+    """
+    top = list()
+    for section, number in [('thermo', top_species), ('kinetics', top_reactions)]:
+        coefficients = sa_dict.get(section, None) or dict()
+        key = get_observable_key(coefficients, observable)
+        if key is None:
+            top.append(list())
+            continue
+        ranked = sorted(coefficients[key].items(), key=lambda item: get_max_sensitivity(item[1]), reverse=True)
+        top.append([label for label, values in ranked[:number] if get_max_sensitivity(values) > 0])
+    return top[0], [int(index) for index in top[1]]
+
+
+def get_simulation_profile_path(sa_path: Optional[str]) -> Optional[str]:
+    """
+    Get the path of the latest RMG simulation profile (``simulation_*.csv``) under a sensitivity analysis directory.
+
+    Args:
+        sa_path (str, optional): The SA directory.
+
+    Returns:
+        Optional[str]: The simulation profile path, ``None`` if not found.
+    """
+    if sa_path is None or not os.path.isdir(sa_path):
+        return None
+    profiles = [os.path.join(root, name) for root, _, names in os.walk(sa_path)
+                for name in names if name.startswith('simulation_') and name.endswith('.csv')]
+    return max(profiles, key=os.path.getmtime) if profiles else None
+
+
+def get_api_profile(profile_path: Optional[str], observable: str = OBSERVABLE) -> Optional[List[Tuple[float, float]]]:
+    """
+    Get the API loss curve from an RMG simulation profile.
+
+    Args:
+        profile_path (str, optional): The simulation profile path.
+        observable (str, optional): The API label.
+
+    Returns:
+        Optional[List[Tuple[float, float]]]: The time in s and the fraction of the API remaining,
+                                             ``None`` if the profile could not be read.
+    """
+    if profile_path is None or not os.path.isfile(profile_path):
+        return None
+    with open(profile_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        rows = [row for row in reader if row]
+    if header is None or not rows:
+        return None
+    column = get_observable_key({label: i for i, label in enumerate(header)}, observable)
+    if column is None:
+        return None
+    column = header.index(column)
+    initial = float(rows[0][column])
+    if initial <= 0:
+        return None
+    return [(float(row[0]), float(row[column]) / initial) for row in rows]
+
+
+def get_degradation_rate(profile_path: Optional[str], observable: str = OBSERVABLE) -> Optional[float]:
+    """
+    Get the average API degradation rate from an RMG simulation profile,
+    defined as the API conversion at the end of the simulation divided by the simulation time.
+
+    Args:
+        profile_path (str, optional): The simulation profile path.
+        observable (str, optional): The API label.
+
+    Returns:
+        Optional[float]: The degradation rate in 1/s, ``None`` if it could not be determined.
+    """
+    profile = get_api_profile(profile_path, observable)
+    if profile is None or len(profile) < 2 or profile[-1][0] <= 0:
+        return None
+    return (1 - profile[-1][1]) / profile[-1][0]
+
+
+def is_converged(rates: List[Optional[float]], tolerance: float) -> bool:
+    """
+    Determine whether the predicted degradation rate converged between the two last levels.
+
+    Args:
+        rates (List[Optional[float]]): The degradation rates predicted at each level so far.
+        tolerance (float): The relative tolerance.
+
+    Returns:
+        bool: Whether the rate converged.
+    """
+    if len(rates) < 2 or rates[-1] is None or rates[-2] is None:
+        return False
+    if rates[-2] == 0:
+        return rates[-1] == 0
+    return abs(rates[-1] - rates[-2]) / abs(rates[-2]) <= tolerance
+
+
+class AdaptiveEscalation(object):
+    """
+    Run a T3 object at escalating levels of theory, re-computing only the top contributors at each higher level.
+
+    Args:
+        t3_object (T3): The (APIOxy) T3 object of an API, its ``qm`` dictionary is updated per level.
+        levels (dict): Keys are model levels, values are dictionaries of ARC ``Level`` objects.
+        escalation (dict, optional): The escalation settings, see ``DEFAULT_ESCALATION``.
+
+    Attributes:
+        history (List[dict]): The ``level``, the ``degradation_rate`` and the number of escalated ``species``
+                              and ``reactions`` of each level run so far.
+    """
+
+    def __init__(self,
+                 t3_object,
+                 levels: dict,
+                 escalation: Optional[dict] = None,
+                 ):
+        self.t3_object = t3_object
+        self.levels = levels
+        self.settings = get_escalation_settings(escalation)
+        self.history = list()
+
+    def run(self) -> List[dict]:
+        """
+        Run the escalation.
+
+        Returns:
+            List[dict]: The escalation history.
+        """
+        levels = self.settings['levels']
+        self.t3_object.qm.update(self.levels[levels[0]])
+        self.t3_object.execute()
+        self.record(levels[0], species=len(self.t3_object.species), reactions=len(self.t3_object.reactions))
+        for level in levels[1:]:
+            if is_converged([entry['degradation_rate'] for entry in self.history], self.settings['tolerance']):
+                break
+            sa_dict = get_sa_dict(self.t3_object)
+            if sa_dict is None:
+                self.t3_object.logger.warning(f'No sensitivity analysis results, not escalating to level {level}')
+                break
+            species_labels, reaction_indices = get_top_contributors(sa_dict,
+                                                                    top_species=self.settings['top_species'],
+                                                                    top_reactions=self.settings['top_reactions'],
+                                                                    )
+            if not species_labels and not reaction_indices:
+                self.t3_object.logger.warning(f'No species or reactions are sensitive, '
+                                              f'not escalating to level {level}')
+                break
+            species, reactions = self.escalate(level, species_labels, reaction_indices)
+            self.record(level, species=species, reactions=reactions)
+        return self.history
+
+    def escalate(self,
+                 level,
+                 species_labels: List[str],
+                 reaction_indices: List[int],
+                 ) -> Tuple[int, int]:
+        """
+        Re-compute species and reactions at a higher level, then regenerate the model and repeat the SA.
+
+        Args:
+            level: The model level.
+            species_labels (List[str]): The RMG labels of the species to re-compute.
+            reaction_indices (List[int]): The RMG indices of the reactions to re-compute.
+
+        Returns:
+            Tuple[int, int]: The number of species and reactions sent to ARC.
+        """
+        t3_object = self.t3_object
+        reason = f'escalated to model level {level}'
+        t3_object.logger.info(f'\nEscalating {len(species_labels)} species and {len(reaction_indices)} reactions '
+                              f'to model level {level}')
+        species_keys = list()
+        for spc in getattr(t3_object, 'rmg_species', None) or list():
+            if spc.label in species_labels:
+                key = t3_object.add_species(species=spc, reasons=reason)
+                species_keys.append(key if key is not None else t3_object.get_species_key(species=spc))
+        reaction_keys = list()
+        for rxn in getattr(t3_object, 'rmg_reactions', None) or list():
+            if rxn.index in reaction_indices:
+                key = t3_object.add_reaction(reaction=rxn, reasons=reason)
+                reaction_keys.append(key if key is not None else t3_object.get_reaction_key(reaction=rxn))
+        for entries, keys in [(t3_object.species, species_keys), (t3_object.reactions, reaction_keys)]:
+            for key in keys:
+                if key is not None:
+                    entries[key]['converged'] = None
+        t3_object.qm.update(self.levels[level])
+        t3_object.iteration += 1
+        t3_object.set_paths()
+        t3_object.run_arc(arc_kwargs=t3_object.qm)
+        t3_object.process_arc_run()
+        t3_object.run_rmg(restart_rmg=False)
+        t3_object.sa_dict = None
+        t3_object.run_sa()
+        return (sum(key is not None for key in species_keys), sum(key is not None for key in reaction_keys))
+
+    def record(self, level, species: int, reactions: int):
+        """
+        Record the predicted degradation rate after running a level.
+
+        Args:
+            level: The model level.
+            species (int): The number of species computed at this level.
+            reactions (int): The number of reactions computed at this level.
+        """
+        sa_path = getattr(self.t3_object, 'paths', dict()).get('SA', None)
+        rate = get_degradation_rate(get_simulation_profile_path(sa_path))
+        self.history.append({'level': level,
+                             'iteration': getattr(self.t3_object, 'iteration', None),
+                             'degradation_rate': rate,
+                             'species': species,
+                             'reactions': reactions,
+                             })
+        self.t3_object.metrics.record_iteration(getattr(self.t3_object, 'iteration', None),
+                                                model_level=level, degradation_rate=rate)
+        self.t3_object.logger.info(f'Model level {level}: predicted API degradation rate '
+                                   f'{rate if rate is not None else "N/A"} 1/s')
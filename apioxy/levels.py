@@ -1,39 +1,57 @@
 """
 APIOxy levels module
 used for storing default levels of theory
+the levels are only built on first use, so importing APIOxy does not import ARC
 """
 
-from arc.level import Level
-
-
-# Not implementing the "ML" and "0" levels
-
-LEVELS = {1: {'sp_level': Level(method='b3lyp',
-                                basis='6-31g(d,p)',
-                                ),
-              'opt_level': Level(method='b3lyp',
-                                 basis='6-31g(d,p)',
-                                 ),
-              },
-          2: {'sp_level': Level(method='wB97xd',
-                                basis='def2TZVP',
-                                solvation_method='SMD',
-                                solvent='water',
-                                ),
-              'opt_level': Level(method='wB97xd',
-                                 basis='def2SVP',
-                                 ),
-              },
-          3: {'sp_level': Level(method='DLPNO',
-                                basis='def2TZVP',
-                                auxiliary_basis='def2TZVP/C',
-                                args={'keyword': {'dlpno_threshold': 'normalPNO'}},
-                                # solvation_method='COSMO/tzvpd-fine',
-                                solvation_method='SMD',
-                                solvent='water',
-                                ),
-              'opt_level': Level(method='wB97xd',
-                                 basis='def2SVP',
-                                 ),
-              },
-          }
+from functools import lru_cache
+
+
+# Not implementing the "ML" level, the "0" level (pre-screening by structure) is implemented in apioxy.prescreen,
+# and the "adaptive" level (escalating levels 1-3 for the top contributors) in apioxy.escalation
+
+@lru_cache(maxsize=None)
+def get_levels() -> dict:
+    """
+    Get the default levels of theory of the APIOxy model levels.
+
+    Returns:
+        dict: Keys are model levels, values are dictionaries of ARC ``Level`` objects.
+    """
+    from arc.level import Level
+
+    return {1: {'sp_level': Level(method='b3lyp',
+                                  basis='6-31g(d,p)',
+                                  ),
+                'opt_level': Level(method='b3lyp',
+                                   basis='6-31g(d,p)',
+                                   ),
+                },
+            2: {'sp_level': Level(method='wB97xd',
+                                  basis='def2TZVP',
+                                  solvation_method='SMD',
+                                  solvent='water',
+                                  ),
+                'opt_level': Level(method='wB97xd',
+                                   basis='def2SVP',
+                                   ),
+                },
+            3: {'sp_level': Level(method='DLPNO',
+                                  basis='def2TZVP',
+                                  auxiliary_basis='def2TZVP/C',
+                                  args={'keyword': {'dlpno_threshold': 'normalPNO'}},
+                                  # solvation_method='COSMO/tzvpd-fine',
+                                  solvation_method='SMD',
+                                  solvent='water',
+                                  ),
+                'opt_level': Level(method='wB97xd',
+                                   basis='def2SVP',
+                                   ),
+                },
+            }
+
+
+def __getattr__(name: str):
+    if name == 'LEVELS':
+        return get_levels()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
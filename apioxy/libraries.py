@@ -0,0 +1,195 @@
+"""
+APIOxy libraries module
+used for resolving RMG thermo and kinetics library names without walking the RMG database on every lookup
+
+The index lists the thermo libraries (``<name>.py`` files) and kinetics libraries (folders with a ``reactions.py`` file)
+together with the modification times of all library folders. Adding or removing a library changes the modification
+time of its parent folder, so the index is only rebuilt when one of these folders changed.
+The index is kept in memory per process and persisted to disk, so it is shared by all APIOxy objects
+(e.g., in a campaign) and by all processes on the same node or shared filesystem.
+"""
+
+import hashlib
+import json
+import os
+from typing import Optional
+
+from apioxy.common import CACHE_BASE_PATH
+
+
+_LIBRARY_INDICES = dict()
+
+
+def get_kinetics_lib_base_path(thermo_lib_base_path: str) -> str:
+    """
+    Get the RMG kinetics libraries folder which corresponds to an RMG thermo libraries folder.
+
+    Args:
+        thermo_lib_base_path (str): The path to the RMG thermo libraries folder.
+
+    Returns:
+        str: The path to the RMG kinetics libraries folder.
+    """
+    database_path = os.path.dirname(os.path.dirname(os.path.normpath(thermo_lib_base_path)))
+    return os.path.join(database_path, 'kinetics', 'libraries')
+
+
+class LibraryIndex(object):
+    """
+    An index of the RMG thermo and kinetics libraries.
+
+    Args:
+        thermo_lib_base_path (str): The path to the RMG thermo libraries folder.
+        kinetics_lib_base_path (str, optional): The path to the RMG kinetics libraries folder.
+        index_path (str, optional): The path of the persistent index file.
+
+    Attributes:
+        thermo_lib_base_path (str): The path to the RMG thermo libraries folder.
+        kinetics_lib_base_path (str): The path to the RMG kinetics libraries folder.
+        index_path (str): The path of the persistent index file.
+        thermo_libraries (set): The thermo library names, relative to the thermo libraries folder.
+        kinetics_libraries (set): The kinetics library names, relative to the kinetics libraries folder.
+        directories (Dict[str, int]): Keys are library folders, values are their modification times.
+    """
+
+    def __init__(self,
+                 thermo_lib_base_path: str,
+                 kinetics_lib_base_path: Optional[str] = None,
+                 index_path: Optional[str] = None,
+                 ):
+        self.thermo_lib_base_path = thermo_lib_base_path
+        self.kinetics_lib_base_path = kinetics_lib_base_path or get_kinetics_lib_base_path(thermo_lib_base_path)
+        paths_hash = hashlib.sha1(f'{self.thermo_lib_base_path}|{self.kinetics_lib_base_path}'.encode()).hexdigest()
+        self.index_path = index_path or os.path.join(CACHE_BASE_PATH, f'library_index_{paths_hash[:12]}.json')
+        self.thermo_libraries = set()
+        self.kinetics_libraries = set()
+        self.directories = dict()
+        if not self.load():
+            self.build()
+
+    def load(self) -> bool:
+        """
+        Load the persistent index if it exists and is up to date.
+
+        Returns:
+            bool: Whether the index was loaded.
+        """
+        if not os.path.isfile(self.index_path):
+            return False
+        try:
+            with open(self.index_path, 'r') as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return False
+        self.thermo_libraries = set(content['thermo_libraries'])
+        self.kinetics_libraries = set(content['kinetics_libraries'])
+        self.directories = content['directories']
+        return not self.is_stale()
+
+    def save(self):
+        """
+        Atomically save the persistent index.
+        """
+        if not os.path.isdir(os.path.dirname(self.index_path)):
+            os.makedirs(os.path.dirname(self.index_path))
+        tmp_path = f'{self.index_path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'thermo_libraries': sorted(self.thermo_libraries),
+                       'kinetics_libraries': sorted(self.kinetics_libraries),
+                       'directories': self.directories,
+                       }, f)
+        os.replace(tmp_path, self.index_path)
+
+    def build(self):
+        """
+        Build the index by walking the thermo and kinetics libraries folders.
+        """
+        self.thermo_libraries, self.kinetics_libraries, self.directories = set(), set(), dict()
+        for base_path, libraries in [(self.thermo_lib_base_path, self.thermo_libraries),
+                                     (self.kinetics_lib_base_path, self.kinetics_libraries)]:
+            for root, _, files in os.walk(base_path):
+                self.directories[root] = os.stat(root).st_mtime_ns
+                relative_root = os.path.relpath(root, base_path)
+                if base_path == self.thermo_lib_base_path:
+                    libraries.update(os.path.normpath(os.path.join(relative_root, file_name[:-3]))
+                                     for file_name in files if file_name.endswith('.py'))
+                elif 'reactions.py' in files and relative_root != '.':
+                    libraries.add(relative_root)
+        try:
+            self.save()
+        except OSError:
+            # the index can still be used in memory
+            pass
+
+    def is_stale(self) -> bool:
+        """
+        Check whether a library was added to or removed from the indexed folders since the index was built.
+
+        Returns:
+            bool: Whether the index should be rebuilt.
+        """
+        if not self.directories:
+            return True
+        for path, mtime in self.directories.items():
+            try:
+                if os.stat(path).st_mtime_ns != mtime:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def refresh(self):
+        """
+        Rebuild the index if it is stale.
+        """
+        if self.is_stale():
+            self.build()
+
+    def has_thermo_library(self, name: str) -> bool:
+        """
+        Check whether a thermo library exists.
+
+        Args:
+            name (str): The library name, or a path to a library file.
+
+        Returns:
+            bool: Whether the library exists.
+        """
+        if os.path.isabs(name):
+            return os.path.isfile(name)
+        self.refresh()
+        return os.path.normpath(name) in self.thermo_libraries
+
+    def has_kinetics_library(self, name: str) -> bool:
+        """
+        Check whether a kinetics library exists.
+
+        Args:
+            name (str): The library name, or a path to a library folder.
+
+        Returns:
+            bool: Whether the library exists.
+        """
+        if os.path.isabs(name):
+            return os.path.isdir(name)
+        self.refresh()
+        return os.path.normpath(name) in self.kinetics_libraries
+
+
+def get_library_index(thermo_lib_base_path: str,
+                      kinetics_lib_base_path: Optional[str] = None,
+                      ) -> LibraryIndex:
+    """
+    Get the library index of an RMG database, shared by all callers in the current process.
+
+    Args:
+        thermo_lib_base_path (str): The path to the RMG thermo libraries folder.
+        kinetics_lib_base_path (str, optional): The path to the RMG kinetics libraries folder.
+
+    Returns:
+        LibraryIndex: The library index.
+    """
+    key = (thermo_lib_base_path, kinetics_lib_base_path or get_kinetics_lib_base_path(thermo_lib_base_path))
+    if key not in _LIBRARY_INDICES:
+        _LIBRARY_INDICES[key] = LibraryIndex(*key)
+    return _LIBRARY_INDICES[key]
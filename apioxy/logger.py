@@ -8,7 +8,7 @@ import datetime
 import os
 import shutil
 import time
-from typing import Optional
+from typing import List, Optional
 
 from arc.common import get_git_branch, get_git_commit, time_lapse
 
@@ -88,6 +88,84 @@ class Logger(T3Logger):
             self.log('\n', level='always')
         self.log(f'Starting project {self.project}', level='always')
 
+    def log_api_summary(self, results: List[dict]):
+        """
+        Output a summary of the API job results to the log.
+
+        Args:
+            results (List[dict]): The API job results.
+        """
+        if not results:
+            return
+        completed = [result for result in results if result['status'] in ['completed', 'cached']]
+        self.log(f'\n\nAPI summary: {len(completed)} out of {len(results)} APIs completed successfully\n',
+                 level='always')
+        shared_qm_jobs = sum(result.get('shared_qm_jobs', 0) for result in results)
+        if shared_qm_jobs:
+            self.log(f'{shared_qm_jobs} QM calculations were shared between APIs instead of being repeated\n',
+                     level='always')
+        for result in results:
+            wall_time = f"{result['wall_time'] / 3600:.2f} hrs" if result.get('wall_time') is not None else 'N/A'
+            line = f"{result['index'] + 1:>4}. {result['label']:<30} {result['status']:<10} {wall_time:>12}"
+            if result['error'] is not None:
+                line += f"    ({result['error']})"
+            self.log(line, level='always')
+            phase_times = dict()
+            for phase in (result.get('metrics') or dict()).get('phases', list()):
+                phase_times[phase['phase']] = phase_times.get(phase['phase'], 0) + phase['wall_time']
+            if phase_times:
+                self.log('          ' + ', '.join(f'{phase}: {wall_time / 3600:.2f} hrs'
+                                                  for phase, wall_time in phase_times.items()), level='always')
+            metrics = result.get('metrics') or dict()
+            if metrics.get('peak_edge_species') is not None or metrics.get('peak_rmg_memory_mb') is not None:
+                rmg_memory = metrics.get('peak_rmg_memory_mb')
+                self.log(f"          peak edge species: {metrics.get('peak_edge_species') or 'N/A'}, "
+                         f"peak RMG memory: {f'{rmg_memory:.0f} MB' if rmg_memory is not None else 'N/A'}",
+                         level='always')
+            if result.get('escalation'):
+                self.log('          escalation: ' + ' -> '.join(
+                    f"level {entry['level']} ({entry['species']} spc, {entry['reactions']} rxn, "
+                    f"{entry['degradation_rate'] if entry['degradation_rate'] is not None else 'N/A'} 1/s)"
+                    for entry in result['escalation']), level='always')
+
+    def log_sweep_summary(self, results: List[dict]):
+        """
+        Output a summary of the reactor condition sweep to the log.
+
+        Args:
+            results (List[dict]): The condition results.
+        """
+        if not results:
+            return
+        self.log(f'\n\nSweep summary ({len(results)} API conditions):\n', level='always')
+        for result in results:
+            if result['status'] != 'completed':
+                self.log(f"{result['label']:<30} {result['condition']:<20} failed    ({result['error']})",
+                         level='always')
+                continue
+            rate = f"{result['degradation_rate']:.3e} 1/s" if result['degradation_rate'] is not None else 'N/A'
+            remaining = f"{result['profile'][-1][1]:.4f}" if result['profile'] else 'N/A'
+            self.log(f"{result['label']:<30} {result['condition']:<20} degradation rate: {rate:>14}, "
+                     f"API remaining: {remaining}", level='always')
+
+    def log_prescreen_ranking(self, ranking: List[dict]):
+        """
+        Output the pre-screen ranking of the APIs to the log.
+
+        Args:
+            ranking (List[dict]): The ranked pre-screen results.
+        """
+        self.log(f'\n\nAPI pre-screen ranking ({len(ranking)} APIs, most liable first):\n', level='always')
+        self.log(f"{'rank':>4}  {'label':<30} {'k_total (m^3/mol/s)':>20} {'min BDE (kJ/mol)':>17}  weakest site",
+                 level='always')
+        for result in ranking:
+            if result['error'] is not None:
+                self.log(f"{result['rank']:>4}. {result['label']:<30} ({result['error']})", level='always')
+                continue
+            min_bde = f"{result['min_bde']:.1f}" if result['min_bde'] is not None else 'N/A'
+            self.log(f"{result['rank']:>4}. {result['label']:<30} {result['k_total']:>20.3e} {min_bde:>17}  "
+                     f"{result['weakest_site']}", level='always')
+
     def log_footer(self):
         """
         Output a footer to the log.
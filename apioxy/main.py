@@ -2,29 +2,110 @@
 APIOxy's main module.
 """
 
+import copy
 import logging
 import os
 import time
-from typing import Optional
-
-from arc.common import save_yaml_file
+from typing import List, Optional, Tuple
+
+from apioxy.cache import ResultCache, get_job_key
+from apioxy.common import PROJECTS_BASE_PATH, VERSION, initialize_log, save_yaml_file
+from apioxy.constraints import get_adaptive_constraints_settings, get_initial_constraints
+from apioxy.escalation import get_escalation_settings
+from apioxy.levels import get_levels
+from apioxy.libraries import get_kinetics_lib_base_path, get_library_index
+from apioxy.manifest import Manifest, get_job_input_hash
+from apioxy.metrics import MetricsRecorder, save_metrics
+from apioxy.prescreen import PEROXYL_RADICALS, rank_apis, save_prescreen
+from apioxy.registry import QMJobRegistry
+from apioxy.runner import get_job_result, run_api_jobs
+from apioxy.seeds import SeedCatalog, get_seeds_settings, inject_seeds
+from apioxy.sweep import get_envelope_reactor, get_envelope_species, get_sweep_conditions, get_sweep_jobs, \
+    run_sweep_jobs, save_sweep
+from apioxy.zeneth import apply_zeneth_output, get_element_counts, get_zeneth_settings
+
+
+DEFAULT_DATABASE = {'thermo_libraries': ['API_soup',
+                                         'APIOxy',
+                                         'BurkeH2O2',
+                                         'thermo_DFT_CCSDTF12_BAC',
+                                         'DFT_QCI_thermo',
+                                         'primaryThermoLibrary',
+                                         'CBS_QB3_1dHR',
+                                         'CurranPentane'],
+                    'kinetics_libraries': ['API_soup',
+                                           'BurkeH2O2inN2',
+                                           'NOx2018',
+                                           'Klippenstein_Glarborg2016'],
+                    'kinetics_families': ['api', ],
+                    }
+
+
+def get_species_constraints(species_dict: dict) -> dict:
+    """
+    Get the RMG species constraints for an API, derived from its element counts.
 
-from t3 import T3
-from t3.common import get_rmg_species_from_a_species_dict
-from t3.main import RMG_THERMO_LIB_BASE_PATH
-from t3.schema import RMGSpecies
+    Args:
+        species_dict (dict): The dictionary representation of the API species.
 
-from apioxy.common import PROJECTS_BASE_PATH, VERSION, initialize_log
-from apioxy.levels import LEVELS
-from apioxy.logger import Logger
+    Returns:
+        dict: The RMG species constraints.
+    """
+    from t3.common import get_rmg_species_from_a_species_dict
+    from t3.schema import RMGSpecies
+
+    rmg_spc = get_rmg_species_from_a_species_dict(RMGSpecies(**species_dict).dict())
+
+    # Count the number of each element in the molecule
+    element_dict = {}
+    for atom in rmg_spc.molecule[0].vertices:
+        symbol = atom.element.symbol
+        element_dict[symbol] = element_dict.get(symbol, 0) + 1
+
+    species_constraints = {'allowed': ['input species', 'seed mechanisms', 'reaction libraries'],
+                           'max_C_atoms': element_dict['C'] + 2 if 'C' in element_dict else 0,
+                           'max_O_atoms': element_dict['O'] + 6 if 'O' in element_dict else 6,
+                           'max_N_atoms': element_dict['N'] if 'N' in element_dict else 0,
+                           'max_Si_atoms': element_dict['Si'] if 'Si' in element_dict else 0,
+                           'max_S_atoms': element_dict['S'] if 'S' in element_dict else 0,
+                           'max_heavy_atoms': sum(element_dict[element] for element in element_dict.keys()
+                                                  if element != 'H') + 10,
+                           'max_radical_electrons': 1,
+                           'max_singlet_carbenes': 0,
+                           'max_carbene_radicals': 0,
+                           'allow_singlet_O2': True,
+                           }
+    return species_constraints
+
+
+def get_api_project(index: int,
+                    label: str,
+                    number_of_apis: int,
+                    project: str,
+                    project_directory: str,
+                    ) -> Tuple[str, str]:
+    """
+    Get the T3 project name and directory of an API.
+    A single API runs in the APIOxy project directory, several APIs each run in their own sub-directory.
+
+    Args:
+        index (int): The API index.
+        label (str): The API label.
+        number_of_apis (int): The number of APIs in the APIOxy project.
+        project (str): The APIOxy project name.
+        project_directory (str): The APIOxy project directory.
+
+    Returns:
+        Tuple[str, str]: The T3 project name and directory.
+    """
+    if number_of_apis > 1:
+        return f'{index + 1}_{label}', os.path.join(project_directory, f'{index + 1}_{label}')
+    return project, project_directory
 
 
 class APIOxy(object):
     """
     The main APIOxy class.
-
-    Todo:
-        Use self.apioxy['zeneth_output_paths']
     """
 
     def __init__(self,
@@ -59,8 +140,13 @@ class APIOxy(object):
         self.qm = qm or dict()
         self.demo = demo
         self.verbose = verbose
+        self.manifest = None
+        self.jobs = dict()
+        self.metrics = MetricsRecorder(label=self.project)
 
         # initialize the logger
+        from apioxy.logger import Logger
+
         self.logger = Logger(project=self.project,
                              project_directory=self.project_directory,
                              verbose=self.verbose,
@@ -133,6 +219,9 @@ class APIOxy(object):
         Apply default settings where not specified.
         Also checks syntax of self.apioxy['api_structures'] using T3's schema.
         """
+        from t3.main import RMG_THERMO_LIB_BASE_PATH
+        from t3.schema import RMGSpecies
+
         # apioxy
         if 'model_level' not in self.apioxy:
             self.logger.warning('Setting model_level to custom')
@@ -148,6 +237,35 @@ class APIOxy(object):
         if 'run_in_parallel' not in self.apioxy:
             self.logger.debug('Not running in parallel.')
             self.apioxy['run_in_parallel'] = False
+        if 'max_workers' not in self.apioxy:
+            self.apioxy['max_workers'] = None
+        if 'share_qm_jobs' not in self.apioxy:
+            self.apioxy['share_qm_jobs'] = True
+        if 'prometheus_path' not in self.apioxy:
+            self.apioxy['prometheus_path'] = None
+        if self.apioxy['model_level'] == 0 and 'peroxyl_radicals' not in self.apioxy:
+            self.apioxy['peroxyl_radicals'] = copy.deepcopy(PEROXYL_RADICALS)
+        if self.apioxy['model_level'] == 'adaptive':
+            self.apioxy['escalation'] = get_escalation_settings(self.apioxy.get('escalation', None))
+        self.apioxy['seeds'] = get_seeds_settings(self.apioxy.get('seeds', None))
+        self.apioxy['zeneth'] = get_zeneth_settings(self.apioxy.get('zeneth', None))
+        self.apioxy['adaptive_constraints'] = \
+            get_adaptive_constraints_settings(self.apioxy.get('adaptive_constraints', False))
+        if 'sweep' not in self.apioxy:
+            self.apioxy['sweep'] = False
+        elif self.apioxy['sweep'] is True:
+            self.apioxy['sweep'] = dict()
+        if isinstance(self.apioxy['sweep'], dict) and self.apioxy['model_level'] == 0:
+            self.logger.warning('Model level 0 only pre-screens the APIs, not running the sweep.')
+            self.apioxy['sweep'] = False
+        if 'cache' not in self.apioxy:
+            self.apioxy['cache'] = False
+        elif self.apioxy['cache'] is True:
+            self.apioxy['cache'] = dict()
+        if isinstance(self.apioxy['cache'], dict):
+            self.apioxy['cache'] = {'path': self.apioxy['cache'].get('path', None),
+                                    'max_size': self.apioxy['cache'].get('max_size', 10.0),
+                                    }
         if 'zeneth_output_paths' not in self.apioxy:
             self.apioxy['zeneth_output_paths'] = [None] * len(self.apioxy['api_structures'])
             self.logger.warning('No Zeneth output files were given.')
@@ -169,27 +287,17 @@ class APIOxy(object):
 
         # rmg
         if 'database' not in self.rmg:
-            self.rmg['database'] = {'thermo_libraries': ['API_soup',
-                                                         'APIOxy',
-                                                         'BurkeH2O2',
-                                                         'thermo_DFT_CCSDTF12_BAC',
-                                                         'DFT_QCI_thermo',
-                                                         'primaryThermoLibrary',
-                                                         'CBS_QB3_1dHR',
-                                                         'CurranPentane'],
-                                    'kinetics_libraries': ['API_soup',
-                                                           'BurkeH2O2inN2',
-                                                           'NOx2018',
-                                                           'Klippenstein_Glarborg2016'],
-                                   'kinetics_families': ['api',],
-                                    }
-
-        rmg_thermo_libs = [subdir_tuple[0] for subdir_tuple in os.walk(RMG_THERMO_LIB_BASE_PATH)]
-        if self.t3['options']['library_name'] in rmg_thermo_libs:
-            # this library already exists, use it from the firts T3 iteration
-            self.rmg['database']['thermo_libraries'].append(self.t3['options']['library_name'])
-
-        # Todo: Do the same for kinetics libraries
+            self.rmg['database'] = copy.deepcopy(DEFAULT_DATABASE)
+
+        library_name = self.t3['options']['library_name']
+        library_index = get_library_index(RMG_THERMO_LIB_BASE_PATH)
+        if library_index.has_thermo_library(library_name) \
+                and library_name not in self.rmg['database']['thermo_libraries']:
+            # this library already exists, use it from the first T3 iteration
+            self.rmg['database']['thermo_libraries'].append(library_name)
+        if library_index.has_kinetics_library(library_name) \
+                and library_name not in self.rmg['database'].get('kinetics_libraries', list()):
+            self.rmg['database'].setdefault('kinetics_libraries', list()).append(library_name)
 
         if 'model' not in self.rmg:
             self.rmg['model'] = {'core_tolerance': [0.1, 0.05]}
@@ -200,76 +308,344 @@ class APIOxy(object):
                                     'T': 313,
                                     'termination_time': [72, 'hours'],
                                     }]
-        if 'species' not in self.rmg:
+        if 'species' not in self.rmg and self.apioxy['model_level'] != 0:
             raise ValueError('APIOxy cannot be executed without specifying the species mixture.')
+        if isinstance(self.apioxy['sweep'], dict):
+            # generate a single mechanism per API spanning all conditions, see run_sweep()
+            # conditions given explicitly are labeled and completed the same way as the reactors
+            self.apioxy['sweep']['conditions'] = get_sweep_conditions(
+                reactors=self.apioxy['sweep'].get('conditions', None) or self.rmg['reactors'],
+                species=self.rmg['species'])
+            self.rmg['reactors'] = [get_envelope_reactor(self.apioxy['sweep']['conditions'])]
+            self.rmg['species'] = get_envelope_species(self.rmg['species'], self.apioxy['sweep']['conditions'])
 
         # arc (qm)
         if 'adapter' not in self.qm:
             self.qm['adapter'] = 'ARC'
         if self.apioxy['model_level'] in [1, 2, 3]:
-            self.qm.update(LEVELS[self.apioxy['model_level']])
-
-    def set_species_constraints(self, species_dict):
+            self.qm.update(get_levels()[self.apioxy['model_level']])
+        elif self.apioxy['model_level'] == 'adaptive':
+            # start at the lowest level, the API jobs escalate the top contributors to the higher levels
+            self.qm.update(get_levels()[self.apioxy['escalation']['levels'][0]])
+
+    def set_species_constraints(self,
+                                species_dict: dict,
+                                rmg: Optional[dict] = None,
+                                ):
         """
         Set RMG species constraints for an API
 
         Args:
             species_dict (dict): THe dictionary representation of the API species.
+            rmg (dict, optional): The RMG dictionary to set the constraints in, ``self.rmg`` by default.
         """
-        rmg_spc = get_rmg_species_from_a_species_dict(RMGSpecies(**species_dict).dict())
-
-        # Count the number of each element in the molecule
-        element_dict = {}
-        for atom in rmg_spc.molecule[0].vertices:
-            symbol = atom.element.symbol
-            element_dict[symbol] = element_dict.get(symbol, 0) + 1
-
-        species_constraints = {'allowed': ['input species', 'seed mechanisms', 'reaction libraries'],
-                               'max_C_atoms': element_dict['C'] + 2 if 'C' in element_dict else 0,
-                               'max_O_atoms': element_dict['O'] + 6 if 'O' in element_dict else 6,
-                               'max_N_atoms': element_dict['N'] if 'N' in element_dict else 0,
-                               'max_Si_atoms': element_dict['Si'] if 'Si' in element_dict else 0,
-                               'max_S_atoms': element_dict['S'] if 'S' in element_dict else 0,
-                               'max_heavy_atoms': sum(element_dict[element] for element in element_dict.keys()
-                                                      if element != 'H') + 10,
-                               'max_radical_electrons': 1,
-                               'max_singlet_carbenes': 0,
-                               'max_carbene_radicals': 0,
-                               'allow_singlet_O2': True,
-                               }
-        self.rmg['species_constraints'] = species_constraints
+        rmg = rmg if rmg is not None else self.rmg
+        rmg['species_constraints'] = get_species_constraints(species_dict)
 
-    def execute(self):
+    def get_api_jobs(self) -> List[dict]:
         """
-        Execute APIOxy by calling T3 with the respective arguments.
+        Generate a T3 job per API.
+        Each job has its own deep copies of the rmg, t3, and qm dictionaries,
+        so jobs are fully isolated from each other and from this object.
 
-        Todo:
-            Make self.apioxy['run_in_parallel'] functional
+        Returns:
+            List[dict]: Entries are API jobs.
         """
-        self.write_apioxy_input_file()
+        jobs = list()
         for i, api_dict in enumerate(self.apioxy['api_structures']):
-            rmg = self.rmg.copy()
-            api_dict_copy = api_dict.copy()
+            rmg = copy.deepcopy(self.rmg)
+            api_dict_copy = copy.deepcopy(api_dict)
             if self.apioxy['model_level'] != 0:
                 # Rename the API so RMG won't H_abstract from the API (but only if level != 0)
                 api_dict_copy['label'] = 'API'
             if 'seed_all_rads' not in api_dict_copy:
                 api_dict_copy['seed_all_rads'] = ['radical', 'peroxyl']
-            self.set_species_constraints(api_dict_copy)
+            self.set_species_constraints(api_dict_copy, rmg=rmg)
             rmg['species'].append(api_dict_copy)
-            if len(self.apioxy['api_structures']) > 1:
-                project = f"{i + 1}_{api_dict['label']}"
-                project_directory = os.path.join(self.project_directory, f"{i + 1}_{api_dict['label']}")
-            else:
-                project = self.project
-                project_directory = self.project_directory
-            t3_object = T3(project=project,
-                           rmg=self.rmg,
-                           t3=self.t3,
-                           qm=self.qm,
-                           project_directory=project_directory,
-                           verbose=self.verbose,
-                           clean_dir=False,
-                           )
-            t3_object.execute()
+            degradants = list()
+            if self.apioxy['zeneth_output_paths'][i] is not None:
+                degradants = apply_zeneth_output(path=self.apioxy['zeneth_output_paths'][i],
+                                                 rmg=rmg,
+                                                 api_dict=api_dict_copy,
+                                                 settings=self.apioxy['zeneth'],
+                                                 )
+                self.logger.debug(f'Added {len(degradants)} Zeneth degradants to API {api_dict["label"]}')
+            adaptive_constraints = None
+            if self.apioxy['adaptive_constraints'] is not None:
+                # start from tight constraints, the heuristic (or Zeneth) constraints are the ceiling
+                adaptive_constraints = {'ceiling': rmg['species_constraints'],
+                                        'steps': self.apioxy['adaptive_constraints']['steps'],
+                                        'max_edge_growth': self.apioxy['adaptive_constraints']['max_edge_growth'],
+                                        }
+                rmg['species_constraints'] = get_initial_constraints(
+                    ceiling=rmg['species_constraints'],
+                    element_counts=[get_element_counts(spc) for spc in [api_dict_copy] + degradants],
+                    margins=self.apioxy['adaptive_constraints']['margins'],
+                )
+            project, project_directory = get_api_project(index=i,
+                                                         label=api_dict['label'],
+                                                         number_of_apis=len(self.apioxy['api_structures']),
+                                                         project=self.project,
+                                                         project_directory=self.project_directory,
+                                                         )
+            jobs.append({'index': i,
+                         'label': api_dict['label'],
+                         'project': project,
+                         'project_directory': project_directory,
+                         'rmg': rmg,
+                         't3': copy.deepcopy(self.t3),
+                         'qm': copy.deepcopy(self.qm),
+                         'verbose': self.verbose,
+                         'registry_path': self.project_directory if self.apioxy['share_qm_jobs'] else None,
+                         'escalation': copy.deepcopy(self.apioxy['escalation'])
+                         if self.apioxy['model_level'] == 'adaptive' else None,
+                         'adaptive_constraints': copy.deepcopy(adaptive_constraints),
+                         })
+            jobs[-1]['input_hash'] = get_job_input_hash(jobs[-1])
+        return jobs
+
+    def execute(self):
+        """
+        Execute APIOxy by calling T3 with the respective arguments.
+        If ``self.apioxy['run_in_parallel']`` is ``True``, each API is executed in its own worker process.
+        APIs recorded as completed in the project manifest are skipped, partially completed APIs are restarted first.
+        At model level 0 the APIs are only pre-screened and ranked by structure, see ``prescreen()``.
+
+        Returns:
+            List[dict]: The API job results.
+        """
+        if self.apioxy['model_level'] == 0:
+            return self.prescreen()
+        with self.metrics.phase('prepare'):
+            finished_results, jobs = self.prepare_jobs()
+        if self.apioxy['run_in_parallel'] and len(jobs) > 1:
+            self.logger.info(f'\nExecuting {len(jobs)} APIs in parallel '
+                             f'(max workers: {self.apioxy["max_workers"] or os.cpu_count()})')
+        with self.metrics.phase('run'):
+            results = run_api_jobs(jobs=jobs,
+                                   run_in_parallel=self.apioxy['run_in_parallel'],
+                                   max_workers=self.apioxy['max_workers'],
+                                   callback=self.process_job_result,
+                                   )
+        results = finished_results + results
+        if self.apioxy['sweep']:
+            with self.metrics.phase('sweep'):
+                self.run_sweep(results)
+        return self.finalize(results)
+
+    def prescreen(self) -> List[dict]:
+        """
+        Rank the APIs by their oxidative liability estimated from structure (model level 0),
+        without generating mechanisms. The ranking is saved to the project directory.
+
+        Returns:
+            List[dict]: The pre-screen results, most liable APIs first.
+        """
+        self.write_apioxy_input_file()
+        temperature = self.rmg['reactors'][0]['T']
+        temperature = temperature[0] if isinstance(temperature, list) else temperature
+        self.logger.info(f'\nPre-screening {len(self.apioxy["api_structures"])} APIs at {temperature} K')
+        with self.metrics.phase('prescreen'):
+            ranking = rank_apis(api_structures=self.apioxy['api_structures'],
+                                database=self.rmg['database'],
+                                T=temperature,
+                                peroxyl_radicals=self.apioxy['peroxyl_radicals'],
+                                max_workers=self.apioxy['max_workers'] if self.apioxy['run_in_parallel'] else 1,
+                                )
+        save_prescreen(project_directory=self.project_directory,
+                       ranking=ranking,
+                       api_structures=self.apioxy['api_structures'],
+                       T=temperature,
+                       )
+        self.save_metrics(list())
+        self.logger.log_prescreen_ranking(ranking)
         self.logger.log_footer()
+        return ranking
+
+    def run_sweep(self, results: List[dict]) -> List[dict]:
+        """
+        Simulate the mechanism generated for each API at each sweep condition, and run the sensitivity analyses.
+        The API loss curves of all APIs and conditions are saved to a single table in the project directory.
+
+        Args:
+            results (List[dict]): The API job results.
+
+        Returns:
+            List[dict]: The condition results.
+        """
+        sweep_jobs = get_sweep_jobs(jobs=self.get_api_jobs(),
+                                    results=results,
+                                    conditions=self.apioxy['sweep']['conditions'],
+                                    )
+        self.logger.info(f'\nSimulating {len(sweep_jobs)} API sweep conditions')
+        sweep_results = run_sweep_jobs(jobs=sweep_jobs,
+                                       max_workers=self.apioxy['max_workers'] if self.apioxy['run_in_parallel'] else 1,
+                                       )
+        save_sweep(project_directory=self.project_directory, results=sweep_results)
+        self.logger.log_sweep_summary(sweep_results)
+        return sweep_results
+
+    def prepare_jobs(self) -> Tuple[List[dict], List[dict]]:
+        """
+        Prepare the API jobs for execution.
+        APIs recorded as completed in the project manifest are skipped, partially completed APIs are ordered first,
+        and APIs with cached results are restored from the cache.
+
+        Returns:
+            Tuple[List[dict], List[dict]]: The results of APIs which need not be executed, and the jobs to execute.
+        """
+        self.write_apioxy_input_file()
+        jobs = self.get_api_jobs()
+        if self.apioxy['share_qm_jobs']:
+            # no QM calculation of this batch can be running at this point (e.g., if a previous run crashed)
+            QMJobRegistry(self.project_directory).release_running()
+        self.manifest = Manifest(self.project_directory)
+        completed_results, partial_jobs, pending_jobs = self.manifest.sort_jobs(jobs)
+        for result in completed_results:
+            self.logger.info(f'API {result["label"]} was already completed, not executing it again.')
+        if partial_jobs:
+            self.logger.info(f'Restarting {len(partial_jobs)} partially completed APIs: '
+                             f'{", ".join(job["label"] for job in partial_jobs)}')
+        cached_results, jobs = self.restore_cached_jobs(partial_jobs + pending_jobs)
+        self.jobs = {job['index']: job for job in jobs}
+        if self.apioxy['seeds']['use']:
+            self.inject_seeds(jobs)
+        return completed_results + cached_results, jobs
+
+    def get_seed_catalog(self) -> SeedCatalog:
+        """
+        Get the catalog of seed mechanisms from previous runs.
+
+        Returns:
+            SeedCatalog: The seed catalog.
+        """
+        return SeedCatalog(path=self.apioxy['seeds']['path'], max_entries=self.apioxy['seeds']['max_entries'])
+
+    def inject_seeds(self, jobs: List[dict]):
+        """
+        Warm-start API jobs from the most relevant seed mechanisms of previous runs.
+        This is done after the job input hashes and cache keys were computed, so they do not depend on the catalog.
+        The injected seeds are stored in each job under ``seeds``.
+
+        Args:
+            jobs (List[dict]): The API jobs to execute, their RMG databases are modified in place.
+        """
+        from t3.main import RMG_THERMO_LIB_BASE_PATH
+
+        catalog = self.get_seed_catalog()
+        for job in jobs:
+            try:
+                injected = inject_seeds(job=job,
+                                        catalog=catalog,
+                                        kinetics_lib_base_path=get_kinetics_lib_base_path(RMG_THERMO_LIB_BASE_PATH),
+                                        inject_as=self.apioxy['seeds']['inject_as'],
+                                        max_seeds=self.apioxy['seeds']['max_seeds'],
+                                        min_score=self.apioxy['seeds']['min_score'],
+                                        )
+            except Exception as e:
+                self.logger.warning(f'Could not select seed mechanisms for API {job["label"]}: {e}')
+                continue
+            if injected:
+                job['seeds'] = injected
+                self.logger.info(f'Warm-starting API {job["label"]} from the seed mechanisms of: '
+                                 + ', '.join(f'{seed["label"]} (relevance {seed["score"]})' for seed in injected))
+
+    def finalize(self, results: List[dict]) -> List[dict]:
+        """
+        Log a summary of the API job results and the log footer, and save the run metrics.
+
+        Args:
+            results (List[dict]): The API job results.
+
+        Returns:
+            List[dict]: The API job results, ordered as the APIs.
+        """
+        results = sorted(results, key=lambda r: r['index'])
+        self.save_metrics(results)
+        self.logger.log_api_summary(results)
+        self.logger.log_footer()
+        return results
+
+    def save_metrics(self, results: List[dict]):
+        """
+        Save the metrics of this batch and of each executed API to the project directory.
+
+        Args:
+            results (List[dict]): The API job results.
+        """
+        metrics = [dict(self.metrics.as_dict(), status='completed')]
+        metrics += [result['metrics'] for result in results if result.get('metrics')]
+        try:
+            save_metrics(project=self.project,
+                         project_directory=self.project_directory,
+                         metrics=metrics,
+                         prometheus_path=self.apioxy.get('prometheus_path'),
+                         )
+        except OSError as e:
+            self.logger.warning(f'Could not save the run metrics: {e}')
+
+    def get_cache(self) -> Optional[ResultCache]:
+        """
+        Get the result cache.
+
+        Returns:
+            Optional[ResultCache]: The result cache, ``None`` if caching is disabled.
+        """
+        if not self.apioxy['cache']:
+            return None
+        return ResultCache(path=self.apioxy['cache']['path'], max_size=self.apioxy['cache']['max_size'])
+
+    def restore_cached_jobs(self, jobs: List[dict]) -> Tuple[List[dict], List[dict]]:
+        """
+        Restore the outputs of API jobs which were already executed with identical inputs.
+        The cache key of each remaining job is stored in the job under ``cache_key``.
+
+        Args:
+            jobs (List[dict]): The API jobs.
+
+        Returns:
+            Tuple[List[dict], List[dict]]: The results of the restored jobs, and the jobs which should be executed.
+        """
+        cache = self.get_cache()
+        if cache is None:
+            return list(), jobs
+        cached_results, remaining_jobs = list(), list()
+        for job in jobs:
+            job['cache_key'] = get_job_key(job)
+            if cache.restore(key=job['cache_key'], project_directory=job['project_directory']):
+                self.logger.info(f'Restored the results of API {job["label"]} from the cache.')
+                result = get_job_result(job, status='cached')
+                self.manifest.record(result=result, input_hash=job['input_hash'])
+                cached_results.append(result)
+            else:
+                remaining_jobs.append(job)
+        return cached_results, remaining_jobs
+
+    def process_job_result(self, result: dict):
+        """
+        Log the result of an API job once it terminates, record it in the manifest,
+        and store the outputs of completed jobs in the cache.
+
+        Args:
+            result (dict): The API job result.
+        """
+        if self.manifest is not None:
+            self.manifest.record(result=result, input_hash=result['input_hash'])
+        if result['status'] == 'completed':
+            self.logger.info(f'API {result["label"]} completed successfully.')
+            cache = self.get_cache()
+            cache_key = result.get('cache_key')
+            if cache is not None and cache_key is not None:
+                cache.store(key=cache_key,
+                            project_directory=result['project_directory'],
+                            label=result['label'],
+                            seeds=self.jobs.get(result['index'], dict()).get('seeds'),
+                            )
+            if self.apioxy['seeds']['use'] and result['index'] in self.jobs:
+                try:
+                    self.get_seed_catalog().add(self.jobs[result['index']])
+                except Exception as e:
+                    self.logger.warning(f'Could not add the mechanism of API {result["label"]} '
+                                        f'to the seed catalog: {e}')
+        else:
+            self.logger.error(f'API {result["label"]} failed: {result["error"]}')
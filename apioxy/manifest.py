@@ -0,0 +1,114 @@
+"""
+APIOxy manifest module
+used for recording the completion status of the API jobs in a project, so an interrupted batch can be resumed
+"""
+
+import hashlib
+import json
+import os
+import time
+from typing import List, Tuple
+
+import yaml
+
+from apioxy.cache import get_last_iteration_directory
+from apioxy.common import read_yaml_file
+
+
+MANIFEST_FILE_NAME = 'apioxy_manifest.yml'
+
+
+def get_job_input_hash(job: dict) -> str:
+    """
+    Get a hash of the inputs of an API job, used to verify that a recorded job has the same inputs.
+
+    Args:
+        job (dict): The API job.
+
+    Returns:
+        str: The input hash.
+    """
+    content = {key: job[key] for key in ['label', 'rmg', 't3', 'qm']}
+    if job.get('escalation') is not None:
+        content['escalation'] = job['escalation']
+    if job.get('adaptive_constraints') is not None:
+        content['adaptive_constraints'] = job['adaptive_constraints']
+    return hashlib.sha256(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class Manifest(object):
+    """
+    A persistent per-project manifest of API job statuses.
+
+    Args:
+        project_directory (str): The APIOxy project directory.
+
+    Attributes:
+        path (str): The path to the manifest file.
+        content (dict): Keys are API job project names, values are the recorded job results.
+    """
+
+    def __init__(self, project_directory: str):
+        self.path = os.path.join(project_directory, MANIFEST_FILE_NAME)
+        self.content = dict()
+        if os.path.isfile(self.path):
+            self.content = read_yaml_file(self.path) or dict()
+
+    def save(self):
+        """
+        Atomically save the manifest, so it is never left partially written if the process is killed.
+        """
+        tmp_path = f'{self.path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(yaml.dump(data=self.content))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def record(self,
+               result: dict,
+               input_hash: str,
+               ):
+        """
+        Record the result of an API job and save the manifest.
+
+        Args:
+            result (dict): The API job result.
+            input_hash (str): The input hash of the API job.
+        """
+        self.content[result['project']] = {'index': result['index'],
+                                           'label': result['label'],
+                                           'project': result['project'],
+                                           'project_directory': result['project_directory'],
+                                           'status': result['status'],
+                                           'error': result['error'],
+                                           'wall_time': result.get('wall_time'),
+                                           'input_hash': input_hash,
+                                           'timestamp': time.time(),
+                                           }
+        self.save()
+
+    def sort_jobs(self, jobs: List[dict]) -> Tuple[List[dict], List[dict], List[dict]]:
+        """
+        Sort API jobs by their recorded status.
+        A job is only considered completed if it was recorded with identical inputs.
+
+        Args:
+            jobs (List[dict]): The API jobs.
+
+        Returns:
+            Tuple[List[dict], List[dict], List[dict]]:
+                The recorded results of completed jobs, partially completed jobs (which T3 could restart),
+                and pending jobs.
+        """
+        completed, partial, pending = list(), list(), list()
+        for job in jobs:
+            entry = self.content.get(job['project'])
+            if entry is not None and entry['input_hash'] == get_job_input_hash(job) \
+                    and entry['status'] in ['completed', 'cached']:
+                completed.append(dict(entry, index=job['index']))
+            elif get_last_iteration_directory(job['project_directory']) is not None:
+                partial.append(job)
+            else:
+                pending.append(job)
+        return completed, partial, pending
@@ -0,0 +1,321 @@
+"""
+APIOxy metrics module
+used for recording the wall time, CPU time and memory use of each API and of each T3 phase,
+and for writing them as machine-readable per-project metrics files
+
+The memory of a phase is recorded as the current resident set size of the process at the start and at the end
+of the phase. The lifetime peak RSS (of the process, or of its largest terminated child process) is also recorded,
+it is a high-water mark which never decreases, so it may have been reached in an earlier phase.
+"""
+
+import csv
+import json
+import os
+import re
+import resource
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+
+METRICS_JSON_FILE_NAME = 'apioxy_metrics.json'
+METRICS_CSV_FILE_NAME = 'apioxy_metrics.csv'
+CSV_FIELDS = ['project', 'label', 'phase', 'iteration', 'status', 'wall_time', 'cpu_time', 'rss_start_mb',
+              'rss_end_mb', 'lifetime_peak_rss_mb', 'peak_edge_species', 'peak_rmg_memory_mb']
+RMG_MEMORY_PATTERN = re.compile(r'memory used:\s*([0-9.]+)\s*(MB|GB)', re.IGNORECASE)
+PROC_STATUS_PATH = '/proc/self/status'
+
+
+def get_cpu_time() -> float:
+    """
+    Get the CPU time (user + system) of the current process and of its terminated child processes.
+
+    Returns:
+        float: The CPU time in seconds.
+    """
+    usage = [resource.getrusage(who) for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)]
+    return sum(u.ru_utime + u.ru_stime for u in usage)
+
+
+def get_lifetime_peak_rss() -> float:
+    """
+    Get the lifetime peak resident set size of the current process or of its largest terminated child process.
+
+    Returns:
+        float: The peak RSS in MB.
+    """
+    return max(resource.getrusage(who).ru_maxrss for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)) / 1024
+
+
+def get_current_rss() -> Optional[float]:
+    """
+    Get the current resident set size of the current process.
+
+    Returns:
+        Optional[float]: The RSS in MB, ``None`` if it is not available (``/proc`` is only available on Linux).
+    """
+    try:
+        with open(PROC_STATUS_PATH, 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def get_mechanism_size(chemkin_path: Optional[str]) -> Optional[dict]:
+    """
+    Get the number of species and reactions in a chemkin file without loading it.
+
+    Args:
+        chemkin_path (str): The path to the chemkin file.
+
+    Returns:
+        Optional[dict]: The ``species`` and ``reactions`` counts, ``None`` if the file does not exist.
+    """
+    if chemkin_path is None or not os.path.isfile(chemkin_path):
+        return None
+    species, reactions, block = 0, 0, None
+    with open(chemkin_path, 'r') as f:
+        for line in f:
+            line = line.split('!')[0].strip()
+            if not line:
+                continue
+            keyword = line.split()[0].upper()
+            if keyword in ('SPECIES', 'SPEC', 'REACTIONS', 'THERM', 'THERMO', 'ELEMENTS', 'ELEM'):
+                block = keyword[:4]
+                continue
+            if keyword == 'END':
+                block = None
+            elif block == 'SPEC':
+                species += len(line.split())
+            elif block == 'REAC' and '=' in line.split()[0]:
+                reactions += 1
+    return {'species': species, 'reactions': reactions}
+
+
+def get_rmg_memory(rmg_log_path: Optional[str]) -> Optional[float]:
+    """
+    Get the peak memory use RMG reported in its log file.
+
+    Args:
+        rmg_log_path (str): The path to the RMG log file.
+
+    Returns:
+        Optional[float]: The peak memory use in MB, ``None`` if not reported.
+    """
+    if rmg_log_path is None or not os.path.isfile(rmg_log_path):
+        return None
+    peak = None
+    with open(rmg_log_path, 'r', errors='replace') as f:
+        for line in f:
+            match = RMG_MEMORY_PATTERN.search(line)
+            if match is not None:
+                value = float(match.group(1)) * (1024 if match.group(2).upper() == 'GB' else 1)
+                peak = value if peak is None else max(peak, value)
+    return peak
+
+
+class MetricsRecorder(object):
+    """
+    Records the resources used by the phases of a run.
+
+    Args:
+        label (str): The label of the recorded run, e.g., the API label.
+
+    Attributes:
+        label (str): The label of the recorded run.
+        phases (List[dict]): The recorded phases with ``phase``, ``iteration``, ``status``, ``wall_time``,
+                             ``cpu_time``, ``rss_start_mb``, ``rss_end_mb`` and ``lifetime_peak_rss_mb`` keys.
+        iterations (dict): Keys are iteration numbers, values are dictionaries of per-iteration values,
+                           e.g., the mechanism size.
+        counters (dict): Keys are counter names, values are counts, e.g., of QM jobs.
+    """
+
+    def __init__(self, label: str):
+        self.label = label
+        self.phases = list()
+        self.iterations = dict()
+        self.counters = dict()
+        self.t0 = time.time()
+        self.cpu0 = get_cpu_time()
+
+    @contextmanager
+    def phase(self, name: str, iteration: Optional[int] = None):
+        """
+        A context manager recording the resources used by a phase.
+        A phase raising an exception is recorded with a 'failed' status, the exception is re-raised.
+
+        Args:
+            name (str): The phase name, e.g., 'rmg', 'arc', or 'sa'.
+            iteration (int, optional): The T3 iteration number.
+        """
+        t0, cpu0 = time.time(), get_cpu_time()
+        entry = {'phase': name, 'iteration': iteration, 'status': 'completed', 'rss_start_mb': get_current_rss()}
+        try:
+            yield entry
+        except BaseException:
+            entry['status'] = 'failed'
+            raise
+        finally:
+            entry['wall_time'] = time.time() - t0
+            entry['cpu_time'] = get_cpu_time() - cpu0
+            entry['rss_end_mb'] = get_current_rss()
+            entry['lifetime_peak_rss_mb'] = get_lifetime_peak_rss()
+            self.phases.append(entry)
+
+    def record_iteration(self, iteration: Optional[int], **values):
+        """
+        Record values of a T3 iteration.
+
+        Args:
+            iteration (int): The T3 iteration number.
+            values: The values to record.
+        """
+        self.iterations.setdefault(iteration if iteration is not None else 0, dict()).update(values)
+
+    def count(self, name: str, value: int = 1):
+        """
+        Increment a counter.
+
+        Args:
+            name (str): The counter name.
+            value (int, optional): The increment.
+        """
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def get_peak(self, name: str) -> Optional[float]:
+        """
+        Get the maximal value of a per-iteration value over all iterations.
+
+        Args:
+            name (str): The value name, e.g., 'edge_species'.
+
+        Returns:
+            Optional[float]: The maximal value, ``None`` if it was never recorded.
+        """
+        values = [values[name] for values in self.iterations.values() if values.get(name) is not None]
+        return max(values) if values else None
+
+    def as_dict(self) -> dict:
+        """
+        A dictionary representation of the recorded metrics.
+
+        Returns: dict
+        """
+        return {'label': self.label,
+                'wall_time': time.time() - self.t0,
+                'cpu_time': get_cpu_time() - self.cpu0,
+                'rss_end_mb': get_current_rss(),
+                'lifetime_peak_rss_mb': get_lifetime_peak_rss(),
+                'peak_edge_species': self.get_peak('edge_species'),
+                'peak_rmg_memory_mb': self.get_peak('rmg_memory_mb'),
+                'phases': self.phases,
+                'iterations': self.iterations,
+                'counters': self.counters,
+                }
+
+
+def get_metrics_rows(project: str, metrics: List[dict]) -> List[dict]:
+    """
+    Flatten recorded metrics into table rows, one per phase and one total row per run.
+
+    Args:
+        project (str): The project name.
+        metrics (List[dict]): Recorded metrics, as returned by ``MetricsRecorder.as_dict()``.
+
+    Returns:
+        List[dict]: Rows with the ``CSV_FIELDS`` keys.
+    """
+    rows = list()
+    for entry in metrics:
+        for phase in entry.get('phases', list()):
+            rows.append({'project': project, 'label': entry['label'], **phase})
+        rows.append({'project': project, 'label': entry['label'], 'phase': 'total', 'iteration': None,
+                     'status': entry.get('status'), 'wall_time': entry.get('wall_time'),
+                     'cpu_time': entry.get('cpu_time'), 'rss_end_mb': entry.get('rss_end_mb'),
+                     'lifetime_peak_rss_mb': entry.get('lifetime_peak_rss_mb'),
+                     'peak_edge_species': entry.get('peak_edge_species'),
+                     'peak_rmg_memory_mb': entry.get('peak_rmg_memory_mb')})
+    return rows
+
+
+def save_metrics(project: str,
+                 project_directory: str,
+                 metrics: List[dict],
+                 prometheus_path: Optional[str] = None,
+                 ):
+    """
+    Save run metrics as JSON and CSV files in the project directory,
+    and optionally as a Prometheus text file (e.g., for the node exporter's textfile collector).
+
+    Args:
+        project (str): The project name.
+        project_directory (str): The project directory.
+        metrics (List[dict]): Recorded metrics, as returned by ``MetricsRecorder.as_dict()``.
+        prometheus_path (str, optional): The path of the Prometheus text file.
+    """
+    with open(os.path.join(project_directory, METRICS_JSON_FILE_NAME), 'w') as f:
+        json.dump({'project': project, 'time': time.time(), 'metrics': metrics}, f, indent=2, default=str)
+    with open(os.path.join(project_directory, METRICS_CSV_FILE_NAME), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(get_metrics_rows(project, metrics))
+    if prometheus_path is not None:
+        save_prometheus_metrics(project, metrics, prometheus_path)
+
+
+def escape_label_value(value) -> str:
+    """
+    Escape a Prometheus label value.
+
+    Args:
+        value: The label value.
+
+    Returns:
+        str: The escaped value, to be enclosed in double quotes.
+    """
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def save_prometheus_metrics(project: str, metrics: List[dict], path: str):
+    """
+    Save run metrics in the Prometheus text exposition format, written atomically.
+
+    Args:
+        project (str): The project name.
+        metrics (List[dict]): Recorded metrics, as returned by ``MetricsRecorder.as_dict()``.
+        path (str): The path of the Prometheus text file, should end with '.prom'.
+    """
+    descriptions = {'wall_time': ('apioxy_phase_wall_seconds', 'Wall time of an APIOxy phase'),
+                    'cpu_time': ('apioxy_phase_cpu_seconds', 'CPU time of an APIOxy phase, including child processes'),
+                    'rss_start_mb': ('apioxy_phase_start_rss_megabytes', 'RSS at the start of an APIOxy phase'),
+                    'rss_end_mb': ('apioxy_phase_end_rss_megabytes', 'RSS at the end of an APIOxy phase'),
+                    'lifetime_peak_rss_mb': ('apioxy_lifetime_peak_rss_megabytes',
+                                             'Lifetime peak RSS of the process (or its largest terminated child) '
+                                             'at the end of an APIOxy phase'),
+                    'peak_edge_species': ('apioxy_peak_edge_species', 'Peak RMG edge size of an API'),
+                    'peak_rmg_memory_mb': ('apioxy_peak_rmg_memory_megabytes',
+                                           'Peak memory use RMG reported for an API'),
+                    }
+    rows = get_metrics_rows(project, metrics)
+    lines = list()
+    for key, (name, description) in descriptions.items():
+        lines += [f'# HELP {name} {description}', f'# TYPE {name} gauge']
+        for row in rows:
+            if row.get(key) is None:
+                continue
+            labels = {'project': project, 'api': row['label'], 'phase': row['phase'],
+                      'iteration': '' if row.get('iteration') is None else row['iteration']}
+            label_text = ','.join(f'{k}="{escape_label_value(v)}"' for k, v in labels.items())
+            lines.append(f'{name}{{{label_text}}} {row[key]}')
+    lines += ['# HELP apioxy_qm_jobs Number of QM jobs of an API', '# TYPE apioxy_qm_jobs gauge']
+    for entry in metrics:
+        for counter, value in entry.get('counters', dict()).items():
+            lines.append(f'apioxy_qm_jobs{{project="{escape_label_value(project)}",'
+                         f'api="{escape_label_value(entry["label"])}",kind="{escape_label_value(counter)}"}} {value}')
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    os.replace(tmp_path, path)
@@ -1,6 +1,10 @@
+import logging
+import os
 from argparse import ArgumentParser, Namespace
 from typing import List, Optional
 
+from apioxy.common import read_yaml_file
+
 
 def add_command_line_arguments(parser: ArgumentParser,
                                ) -> None:
@@ -11,11 +15,13 @@ def add_command_line_arguments(parser: ArgumentParser,
         parser: An ArgumentParser object.
     """
     # Positional arguments
-    parser.add_argument('file',
+    parser.add_argument('files',
                         metavar='FILE',
                         type=str,
-                        nargs=1,
-                        help='an APIOxy input file describing the job to execute',
+                        nargs='*',
+                        help='an APIOxy input file describing the job to execute. '
+                             'Several input files, directories of input files, or a campaign file '
+                             'are executed together as a campaign',
                         )
 
     # Optional arguments
@@ -34,6 +40,49 @@ def add_command_line_arguments(parser: ArgumentParser,
                        help='only print warnings and errors',
                        )
 
+    # Options for validating inputs without executing them
+    parser.add_argument('--dry-run',
+                        action='store_true',
+                        help='validate the input files and print the per-API job plan without executing T3',
+                        )
+
+    # Options for controlling the result cache
+    parser.add_argument('--clear-cache',
+                        action='store_true',
+                        help='invalidate all cached API results before executing',
+                        )
+
+    # Options for campaigns
+    parser.add_argument('-n',
+                        '--max-workers',
+                        type=int,
+                        default=None,
+                        help='the maximal number of worker processes when executing a campaign or a server',
+                        )
+    parser.add_argument('-p',
+                        '--campaign-directory',
+                        type=str,
+                        default=None,
+                        help='the directory of the campaign status and report files',
+                        )
+
+    # Options for the server mode
+    parser.add_argument('-s',
+                        '--server',
+                        action='store_true',
+                        help='run APIOxy as a server with a warm pool of worker processes, accepting jobs over HTTP',
+                        )
+    parser.add_argument('--host',
+                        type=str,
+                        default='127.0.0.1',
+                        help='the host the server listens on',
+                        )
+    parser.add_argument('--port',
+                        type=int,
+                        default=8750,
+                        help='the port the server listens on',
+                        )
+
 
 def parse_command_line_arguments(command_line_args: Optional[List[str]] = None,
                                  ) -> Namespace:
@@ -49,7 +98,35 @@ def parse_command_line_arguments(command_line_args: Optional[List[str]] = None,
     parser = ArgumentParser()
     add_command_line_arguments(parser)
     args = parser.parse_args(command_line_args)
-    # If multiple input files are provided, only use the first one
-    args.file = args.file[0]
+    if not args.files and not args.server:
+        parser.error('an input file is required unless running in server mode')
+    # The first input file, for backward compatibility when a single input file is given
+    args.file = args.files[0] if args.files else None
 
     return args
+
+
+def load_input_file(path: str,
+                    verbose: int = logging.INFO,
+                    ) -> dict:
+    """
+    Load an APIOxy input file into the arguments of the APIOxy class.
+
+    Args:
+        path (str): The path to the APIOxy input file.
+        verbose (int, optional): The logging level to use if not specified in the input file.
+
+    Returns:
+        dict: The APIOxy arguments.
+    """
+    input_file_directory = os.path.abspath(os.path.dirname(path))
+    input_dict = read_yaml_file(path=path, project_directory=input_file_directory)
+    if 'apioxy' not in input_dict:
+        raise ValueError(f'The "apioxy" block is missing in the input file {path}!')
+    if 'project' not in input_dict and 'project' not in input_dict['apioxy']:
+        raise ValueError(f'A project name must be provided in the input file {path}!')
+
+    # if project directory is not given in the input file, use the directory of the input file instead
+    input_dict['project_directory'] = input_dict['apioxy'].get('project_directory', None) or input_file_directory
+    input_dict['verbose'] = input_dict['verbose'] if 'verbose' in input_dict else verbose
+    return input_dict
@@ -0,0 +1,355 @@
+"""
+APIOxy preflight module
+used for validating APIOxy inputs in a single pass before anything is executed (``APIOxy.py --dry-run``)
+
+All APIs, mixture species, reactors and levels of theory are checked and all problems are reported together,
+so an input is fixed once instead of failing one error at a time in the queue.
+No project files are written: the per-API job plan is resolved the same way APIOxy resolves it when executing.
+Structures of large API lists are validated in parallel worker processes.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from apioxy.constraints import get_adaptive_constraints_settings
+from apioxy.main import DEFAULT_DATABASE, get_api_project, get_species_constraints
+from apioxy.parsing import load_input_file
+from apioxy.runner import get_number_of_workers
+from apioxy.sweep import get_envelope_reactor, get_sweep_conditions
+from apioxy.zeneth import parse_zeneth_output
+
+
+MODEL_LEVELS = ['custom', 0, 1, 2, 3, 'adaptive']
+PARALLEL_THRESHOLD = 16  # validate species in worker processes beyond this number
+TERMINATION_KEYS = ['termination_time', 'termination_conversion', 'termination_rate_ratio']
+
+
+def validate_species(species_dict: dict) -> Tuple[List[str], Optional[dict]]:
+    """
+    Validate a species dictionary against T3's schema and make sure its structure can be perceived.
+    This is a module-level function so it can be pickled and sent to a worker process.
+
+    Args:
+        species_dict (dict): The species dictionary.
+
+    Returns:
+        Tuple[List[str], Optional[dict]]: The problems found, and the RMG species constraints derived from the
+                                          species (``None`` if the species is invalid).
+    """
+    from t3.schema import RMGSpecies
+
+    label = species_dict.get('label', '<no label>') if isinstance(species_dict, dict) else '<not a dictionary>'
+    if not isinstance(species_dict, dict):
+        return [f'Species {label}: expected a dictionary, got {species_dict}'], None
+    try:
+        RMGSpecies(**species_dict)
+    except Exception as e:
+        return [f'Species {label}: {e}'.strip()], None
+    if not any(key in species_dict for key in ['smiles', 'inchi', 'adjlist']):
+        return list(), None
+    try:
+        return list(), get_species_constraints(species_dict)
+    except Exception as e:
+        return [f'Species {label}: could not perceive the structure ({e.__class__.__name__}: {e})'], None
+
+
+def validate_reactor(index: int, reactor: dict) -> List[str]:
+    """
+    Validate an RMG reactor dictionary.
+
+    Args:
+        index (int): The reactor index.
+        reactor (dict): The reactor dictionary.
+
+    Returns:
+        List[str]: The problems found.
+    """
+    if not isinstance(reactor, dict):
+        return [f'Reactor {index + 1}: expected a dictionary, got {reactor}']
+    problems = list()
+    if 'type' not in reactor:
+        problems.append(f'Reactor {index + 1}: the reactor type is missing')
+    temperatures = reactor.get('T', None)
+    if temperatures is None:
+        problems.append(f'Reactor {index + 1}: the temperature (T) is missing')
+    else:
+        values = temperatures if isinstance(temperatures, list) else [temperatures]
+        if not all(isinstance(t, (int, float)) and t > 0 for t in values):
+            problems.append(f'Reactor {index + 1}: T must be a positive number or a list of positive numbers, '
+                            f'got {temperatures}')
+    if not any(key in reactor for key in TERMINATION_KEYS):
+        problems.append(f'Reactor {index + 1}: no termination criterion, specify one of {", ".join(TERMINATION_KEYS)}')
+    return problems
+
+
+def validate_levels(qm: dict, model_level) -> List[str]:
+    """
+    Validate the levels of theory of a qm dictionary, as ARC would interpret them.
+
+    Args:
+        qm (dict): The qm dictionary.
+        model_level: The APIOxy model level.
+
+    Returns:
+        List[str]: The problems found.
+    """
+    from arc.level import Level
+
+    from apioxy.levels import get_levels
+
+    problems = list()
+    if model_level in get_levels():
+        # the model level levels of theory replace the ones in the input
+        return problems
+    for key, value in qm.items():
+        if not (key.endswith('_level') or key == 'level_of_theory') or value is None or isinstance(value, Level):
+            continue
+        try:
+            Level(repr=value)
+        except Exception as e:
+            problems.append(f'Level of theory {key} ({value}): {e}')
+    return problems
+
+
+def validate_libraries(database: dict) -> List[str]:
+    """
+    Check that the RMG libraries of a database dictionary exist.
+
+    Args:
+        database (dict): The RMG database dictionary.
+
+    Returns:
+        List[str]: Warnings for the missing libraries.
+    """
+    from t3.main import RMG_THERMO_LIB_BASE_PATH
+
+    from apioxy.libraries import get_library_index
+
+    library_index = get_library_index(RMG_THERMO_LIB_BASE_PATH)
+    warnings = [f'Thermo library {library} was not found in the RMG database'
+                for library in database.get('thermo_libraries', list())
+                if isinstance(library, str) and not library_index.has_thermo_library(library)]
+    warnings += [f'Kinetics library {library} was not found in the RMG database'
+                 for library in database.get('kinetics_libraries', list())
+                 if isinstance(library, str) and not library_index.has_kinetics_library(library)]
+    return warnings
+
+
+def validate_species_list(species_list: List[dict],
+                          max_workers: Optional[int] = None,
+                          ) -> List[Tuple[List[str], Optional[dict]]]:
+    """
+    Validate species dictionaries, in parallel worker processes for long lists.
+
+    Args:
+        species_list (List[dict]): The species dictionaries.
+        max_workers (int, optional): The maximal number of worker processes, ``None`` to use all available CPUs.
+
+    Returns:
+        List[Tuple[List[str], Optional[dict]]]: The ``validate_species`` output of each species.
+    """
+    if len(species_list) <= PARALLEL_THRESHOLD:
+        return [validate_species(species_dict) for species_dict in species_list]
+    workers = get_number_of_workers(max_workers, len(species_list))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate_species, species_list, chunksize=max(len(species_list) // (4 * workers), 1)))
+
+
+def preflight(input_dict: dict,
+              path: Optional[str] = None,
+              max_workers: Optional[int] = None,
+              ) -> dict:
+    """
+    Validate an APIOxy input and resolve its per-API job plan.
+
+    Args:
+        input_dict (dict): The APIOxy arguments, as returned by ``load_input_file()``.
+        path (str, optional): The path of the input file, used for reporting.
+        max_workers (int, optional): The maximal number of worker processes, ``None`` to use all available CPUs.
+
+    Returns:
+        dict: The preflight report with the ``path``, ``project``, ``problems``, ``warnings`` and ``jobs`` keys.
+    """
+    apioxy = input_dict.get('apioxy', None) or dict()
+    rmg = input_dict.get('rmg', None) or dict()
+    qm = input_dict.get('qm', None) or dict()
+    project = input_dict.get('project', None) or apioxy.get('project', None)
+    project_directory = input_dict.get('project_directory', None)
+    report = {'path': path, 'project': project, 'project_directory': project_directory,
+              'problems': list(), 'warnings': list(), 'jobs': list()}
+    problems, warnings = report['problems'], report['warnings']
+
+    # apioxy
+    model_level = apioxy.get('model_level', 'custom')
+    if model_level not in MODEL_LEVELS:
+        problems.append(f'Unsupported model_level {model_level}, supported levels are {MODEL_LEVELS}')
+    if model_level == 'adaptive':
+        escalation_levels = (apioxy.get('escalation', None) or dict()).get('levels', None)
+        if escalation_levels is not None and (not isinstance(escalation_levels, list)
+                                              or not all(level in [1, 2, 3] for level in escalation_levels)
+                                              or escalation_levels != sorted(set(escalation_levels))):
+            problems.append(f'The escalation levels must be an increasing list of model levels 1, 2 and 3, '
+                            f'got {escalation_levels}')
+    api_structures = apioxy.get('api_structures', None) or list()
+    if not isinstance(api_structures, list):
+        api_structures = [api_structures]
+    if not api_structures:
+        problems.append('No API structures were specified ("api_structures" under the "apioxy" block)')
+    labels = [api_dict.get('label', None) for api_dict in api_structures if isinstance(api_dict, dict)]
+    duplicates = sorted({label for label in labels if label is not None and labels.count(label) > 1})
+    if duplicates:
+        problems.append(f'Duplicate API labels: {", ".join(duplicates)}')
+    zeneth_output_paths = apioxy.get('zeneth_output_paths', None)
+    if zeneth_output_paths is not None:
+        if len(zeneth_output_paths) != len(api_structures):
+            problems.append(f'The length of zeneth_output_paths ({len(zeneth_output_paths)}) must be equal to '
+                            f'the length of api_structures ({len(api_structures)})')
+        for zeneth_path in zeneth_output_paths:
+            if zeneth_path is not None and not os.path.isfile(zeneth_path):
+                problems.append(f'Zeneth output file {zeneth_path} does not exist')
+            elif zeneth_path is not None:
+                try:
+                    if not parse_zeneth_output(zeneth_path):
+                        warnings.append(f'Zeneth output file {zeneth_path} has no degradants')
+                except (OSError, ValueError) as e:
+                    problems.append(f'Could not parse the Zeneth output file {zeneth_path}: {e}')
+    adaptive_constraints = get_adaptive_constraints_settings(apioxy.get('adaptive_constraints', False))
+    if adaptive_constraints is not None:
+        if not isinstance(adaptive_constraints['max_edge_growth'], (int, float)) \
+                or adaptive_constraints['max_edge_growth'] < 1:
+            problems.append(f"adaptive_constraints['max_edge_growth'] must be a number of at least 1, "
+                            f"got {adaptive_constraints['max_edge_growth']}")
+        for key in ['margins', 'steps']:
+            if any(not isinstance(value, int) or value < 0 for value in adaptive_constraints[key].values()):
+                problems.append(f"adaptive_constraints['{key}'] values must be non-negative integers, "
+                                f"got {adaptive_constraints[key]}")
+
+    # rmg
+    species = rmg.get('species', None) or list()
+    if not species and model_level != 0:
+        problems.append('No species mixture was specified ("species" under the "rmg" block)')
+    for i, reactor in enumerate(rmg.get('reactors', None) or list()):
+        problems.extend(validate_reactor(i, reactor))
+    sweep = apioxy.get('sweep', False)
+    if sweep and rmg.get('reactors', None):
+        try:
+            conditions = sweep.get('conditions', None) if isinstance(sweep, dict) else None
+            get_envelope_reactor(get_sweep_conditions(conditions or rmg.get('reactors', None) or list(), species))
+        except (KeyError, ValueError, TypeError) as e:
+            problems.append(f'Invalid sweep conditions ({e.__class__.__name__}: {e})')
+    try:
+        warnings.extend(validate_libraries(rmg.get('database', None) or DEFAULT_DATABASE))
+    except Exception as e:
+        warnings.append(f'Could not check the RMG libraries ({e.__class__.__name__}: {e})')
+
+    # qm
+    try:
+        problems.extend(validate_levels(qm, model_level))
+    except Exception as e:
+        problems.append(f'Could not validate the levels of theory ({e.__class__.__name__}: {e})')
+
+    # species and the per-API job plan
+    validated = validate_species_list(list(api_structures) + list(species), max_workers=max_workers)
+    for species_problems, _ in validated[len(api_structures):]:
+        problems.extend(species_problems)
+    levels = get_plan_levels(qm, model_level)
+    for i, (api_dict, (species_problems, constraints)) in enumerate(zip(api_structures, validated)):
+        problems.extend(f'API {i + 1}: {problem}' for problem in species_problems)
+        label = api_dict.get('label', f'API_{i + 1}') if isinstance(api_dict, dict) else f'API_{i + 1}'
+        api_project, api_project_directory = get_api_project(index=i,
+                                                             label=label,
+                                                             number_of_apis=len(api_structures),
+                                                             project=project,
+                                                             project_directory=project_directory,
+                                                             ) if project_directory is not None else (project, None)
+        report['jobs'].append({'index': i,
+                               'label': label,
+                               'project': api_project,
+                               'project_directory': api_project_directory,
+                               'species_constraints': constraints,
+                               'levels': levels,
+                               })
+    return report
+
+
+def get_plan_levels(qm: dict, model_level) -> dict:
+    """
+    Get a printable summary of the levels of theory an API job will use.
+
+    Args:
+        qm (dict): The qm dictionary.
+        model_level: The APIOxy model level.
+
+    Returns:
+        dict: Keys are level names, values are their string representations.
+    """
+    try:
+        from apioxy.levels import get_levels
+
+        levels = dict(get_levels().get(model_level, dict()))
+    except Exception:
+        levels = dict()
+    for key, value in qm.items():
+        if (key.endswith('_level') or key == 'level_of_theory') and key not in levels:
+            levels[key] = value
+    return {key: str(value) for key, value in levels.items()}
+
+
+def run_preflight(paths: List[str],
+                  max_workers: Optional[int] = None,
+                  ) -> List[dict]:
+    """
+    Run a preflight validation of APIOxy input files.
+
+    Args:
+        paths (List[str]): The input file paths.
+        max_workers (int, optional): The maximal number of worker processes, ``None`` to use all available CPUs.
+
+    Returns:
+        List[dict]: The preflight reports.
+    """
+    reports = list()
+    for path in paths:
+        try:
+            input_dict = load_input_file(path)
+        except Exception as e:
+            reports.append({'path': path, 'project': None, 'project_directory': None,
+                            'problems': [f'Could not load the input file ({e.__class__.__name__}: {e})'],
+                            'warnings': list(), 'jobs': list()})
+            continue
+        reports.append(preflight(input_dict, path=path, max_workers=max_workers))
+    return reports
+
+
+def format_report(report: dict) -> str:
+    """
+    Format a preflight report for printing.
+
+    Args:
+        report (dict): The preflight report.
+
+    Returns:
+        str: The formatted report.
+    """
+    lines = [f'{report["path"] or report["project"]}:']
+    if report['problems']:
+        lines.append(f'  {len(report["problems"])} problem(s):')
+        lines.extend(f'    - {problem}' for problem in report['problems'])
+    else:
+        lines.append('  no problems found')
+    if report['warnings']:
+        lines.append(f'  {len(report["warnings"])} warning(s):')
+        lines.extend(f'    - {warning}' for warning in report['warnings'])
+    if report['jobs']:
+        lines.append(f'  job plan ({len(report["jobs"])} APIs):')
+        for job in report['jobs']:
+            lines.append(f'    {job["index"] + 1:>4}. {job["label"]}: project {job["project"]} '
+                         f'in {job["project_directory"]}')
+            constraints = job['species_constraints']
+            if constraints is not None:
+                lines.append('          constraints: ' + ', '.join(f'{key}={value}' for key, value in constraints.items()
+                                                                  if key.startswith('max_')))
+            if job['levels']:
+                lines.append('          levels: ' + ', '.join(f'{key}={value}' for key, value in job['levels'].items()))
+    return '\n'.join(lines)
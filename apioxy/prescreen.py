@@ -0,0 +1,288 @@
+"""
+APIOxy prescreen module
+used for the structure-based pre-screening model level (``model_level: 0``)
+
+The oxidative liability of each API is estimated directly from its structure, without generating a mechanism:
+the bond dissociation enthalpies (BDEs) of all X-H bonds are estimated from RMG group additivity,
+and the rate coefficients of H abstraction by peroxyl radicals are estimated from the rate rules
+of the 'api' kinetics family. APIs are ranked by their total H-abstraction rate coefficient,
+so that only the APIs most liable to autoxidation are sent to full APIOxy runs.
+The RMG database is loaded once, and the APIs are screened in forked worker processes which share it.
+"""
+
+import csv
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from apioxy.common import save_yaml_file
+from apioxy.runner import get_number_of_workers
+
+
+ABSTRACTION_FAMILY = 'api'
+H_ATOM_ENTHALPY = 217998.0  # J/mol, the standard enthalpy of formation of the H atom at 298.15 K (ATcT)
+PEROXYL_RADICALS = [{'label': 'AIBN_OO', 'smiles': 'CC(C)(C#N)O[O]'}]
+PRESCREEN_CSV_FILE_NAME = 'apioxy_prescreen.csv'
+PRESCREEN_YAML_FILE_NAME = 'apioxy_prescreen.yml'
+CSV_FIELDS = ['rank', 'label', 'smiles', 'k_total', 'min_bde', 'weakest_site', 'sites', 'error']
+
+
+def get_molecule(species_dict: dict):
+    """
+    Get the RMG molecule of a species dictionary.
+
+    Args:
+        species_dict (dict): The species dictionary with a ``smiles``, ``inchi`` or ``adjlist`` key.
+
+    Returns:
+        Molecule: The RMG molecule.
+    """
+    from rmgpy.molecule import Molecule
+
+    if species_dict.get('smiles', None) is not None:
+        return Molecule(smiles=species_dict['smiles'])
+    if species_dict.get('inchi', None) is not None:
+        return Molecule(inchi=species_dict['inchi'])
+    if species_dict.get('adjlist', None) is not None:
+        return Molecule().from_adjacency_list(species_dict['adjlist'])
+    raise ValueError(f'Species {species_dict.get("label", None)} has no structure (smiles, inchi or adjlist).')
+
+
+def get_bond_sites(molecule) -> List[dict]:
+    """
+    Get the symmetry-unique X-H bond sites of a molecule.
+    Each H atom is removed in turn, and sites forming the same radical are merged.
+
+    Args:
+        molecule (Molecule): The RMG molecule.
+
+    Returns:
+        List[dict]: Entries have the ``site`` (e.g., 'C7-H'), ``radical`` (the radical Molecule),
+                    ``inchi_key`` (of the radical) and ``degeneracy`` (the number of equivalent H atoms) keys.
+    """
+    sites = dict()
+    for i, atom in enumerate(molecule.atoms):
+        if atom.is_hydrogen():
+            continue
+        for neighbor in atom.edges.keys():
+            if not neighbor.is_hydrogen():
+                continue
+            radical = molecule.copy(deep=True)
+            heavy_atom = radical.atoms[i]
+            h_atom = radical.atoms[molecule.atoms.index(neighbor)]
+            radical.remove_atom(h_atom)
+            heavy_atom.increment_radical()
+            radical.update_multiplicity()
+            radical.update_atomtypes()
+            inchi_key = radical.to_inchi_key()
+            if inchi_key in sites:
+                sites[inchi_key]['degeneracy'] += 1
+            else:
+                sites[inchi_key] = {'site': f'{atom.element.symbol}{i + 1}-H',
+                                    'radical': radical,
+                                    'inchi_key': inchi_key,
+                                    'degeneracy': 1,
+                                    }
+    return list(sites.values())
+
+
+def get_enthalpy(database, molecule) -> float:
+    """
+    Get the enthalpy of formation of a molecule at 298 K, from the thermo libraries or group additivity.
+
+    Args:
+        database (RMGDatabase): The loaded RMG database.
+        molecule (Molecule): The RMG molecule.
+
+    Returns:
+        float: The enthalpy of formation in J/mol.
+    """
+    from rmgpy.species import Species
+
+    species = Species(molecule=[molecule])
+    species.generate_resonance_structures()
+    return database.thermo.get_thermo_data(species).get_enthalpy(298)
+
+
+def get_abstraction_rates(database,
+                          molecule,
+                          peroxyl_radicals: List[dict],
+                          T: float,
+                          radical_keys: Iterable[str],
+                          ) -> dict:
+    """
+    Get the rate coefficients of H abstraction from a molecule by peroxyl radicals,
+    estimated from the rate rules of the 'api' kinetics family.
+    Only the API radical product of each reaction is accounted for, the other product is the hydroperoxide (ROOH).
+
+    Args:
+        database (RMGDatabase): The loaded RMG database.
+        molecule (Molecule): The RMG molecule of the API.
+        peroxyl_radicals (List[dict]): Species dictionaries of the peroxyl radicals.
+        T (float): The temperature in K.
+        radical_keys (Iterable[str]): InChIKeys of the API radicals, as returned by ``get_bond_sites()``.
+
+    Returns:
+        dict: Keys are InChIKeys of the API radicals formed, values are rate coefficients in m^3/(mol*s),
+              summed over the peroxyl radicals and including the reaction degeneracy.
+    """
+    from rmgpy.species import Species
+
+    family = database.kinetics.families[ABSTRACTION_FAMILY]
+    api = Species(molecule=[molecule])
+    api.generate_resonance_structures()
+    radical_keys = set(radical_keys)
+    rates = dict()
+    for peroxyl_dict in peroxyl_radicals:
+        peroxyl = Species(molecule=[get_molecule(peroxyl_dict)])
+        peroxyl.generate_resonance_structures()
+        reactions = database.kinetics.generate_reactions_from_families(reactants=[api, peroxyl],
+                                                                       only_families=[ABSTRACTION_FAMILY])
+        for rxn in reactions:
+            kinetics = family.get_kinetics(rxn,
+                                           template_labels=rxn.template,
+                                           degeneracy=rxn.degeneracy,
+                                           estimator='rate rules',
+                                           )[0][0]
+            k = kinetics.get_rate_coefficient(T)
+            for product in rxn.products:
+                inchi_key = (product.molecule[0] if hasattr(product, 'molecule') else product).to_inchi_key()
+                if inchi_key in radical_keys:
+                    rates[inchi_key] = rates.get(inchi_key, 0) + k
+    return rates
+
+
+def prescreen_api(species_dict: dict,
+                  T: float = 313.0,
+                  peroxyl_radicals: Optional[List[dict]] = None,
+                  ) -> dict:
+    """
+    Estimate the oxidative liability of an API from its structure.
+    Uses RMG's global database, which must be loaded in the calling process (or in the parent of a forked worker).
+    This is a module-level function so it can be pickled and sent to a worker process.
+
+    Args:
+        species_dict (dict): The API species dictionary.
+        T (float, optional): The temperature in K.
+        peroxyl_radicals (List[dict], optional): Species dictionaries of the abstracting peroxyl radicals,
+                                                 ``PEROXYL_RADICALS`` by default.
+
+    Returns:
+        dict: The API ``label`` and ``smiles``, the total H-abstraction rate coefficient ``k_total``
+              in m^3/(mol*s), the ``min_bde`` in kJ/mol and its ``weakest_site``, the per-site ``sites`` data,
+              and an ``error`` message if the API could not be screened.
+    """
+    import rmgpy.data.rmg
+
+    result = {'label': species_dict.get('label', None), 'smiles': species_dict.get('smiles', None),
+              'k_total': None, 'min_bde': None, 'weakest_site': None, 'sites': list(), 'error': None}
+    try:
+        database = rmgpy.data.rmg.database
+        molecule = get_molecule(species_dict)
+        result['smiles'] = result['smiles'] or molecule.to_smiles()
+        enthalpy = get_enthalpy(database, molecule)
+        sites = get_bond_sites(molecule)
+        rates = get_abstraction_rates(database, molecule, peroxyl_radicals or PEROXYL_RADICALS, T,
+                                      radical_keys=[site['inchi_key'] for site in sites])
+        for site in sites:
+            bde = (get_enthalpy(database, site['radical']) + H_ATOM_ENTHALPY - enthalpy) * 1e-3
+            result['sites'].append({'site': site['site'],
+                                    'radical': site['radical'].to_smiles(),
+                                    'degeneracy': site['degeneracy'],
+                                    'bde': round(bde, 1),
+                                    'k': rates.get(site['inchi_key'], 0.0),
+                                    })
+    except Exception as e:
+        result['error'] = f'{e.__class__.__name__}: {e}'
+        return result
+    result['sites'].sort(key=lambda site: site['bde'])
+    if result['sites']:
+        result['min_bde'] = result['sites'][0]['bde']
+        result['weakest_site'] = result['sites'][0]['site']
+    result['k_total'] = sum(site['k'] for site in result['sites'])
+    return result
+
+
+def rank_apis(api_structures: List[dict],
+              database: dict,
+              T: float = 313.0,
+              peroxyl_radicals: Optional[List[dict]] = None,
+              max_workers: Optional[int] = None,
+              ) -> List[dict]:
+    """
+    Pre-screen APIs and rank them by their oxidative liability.
+    The RMG database is loaded once, and the APIs are screened in worker processes forked after loading it.
+
+    Args:
+        api_structures (List[dict]): The API species dictionaries.
+        database (dict): The RMG database dictionary, must include the 'api' kinetics family.
+        T (float, optional): The temperature in K.
+        peroxyl_radicals (List[dict], optional): Species dictionaries of the abstracting peroxyl radicals.
+        max_workers (int, optional): The maximal number of worker processes, ``None`` to use all available CPUs.
+
+    Returns:
+        List[dict]: The ``prescreen_api`` results with a ``rank`` key, most liable APIs first.
+    """
+    from apioxy.database import load_rmg_database
+
+    load_rmg_database(database)
+    workers = get_number_of_workers(max_workers, len(api_structures))
+    args = ([api_dict for api_dict in api_structures],
+            [T] * len(api_structures),
+            [peroxyl_radicals] * len(api_structures))
+    if workers == 1:
+        results = list(map(prescreen_api, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('fork')) as executor:
+            results = list(executor.map(prescreen_api, *args,
+                                        chunksize=max(len(api_structures) // (4 * workers), 1)))
+    results.sort(key=get_ranking_key)
+    for rank, result in enumerate(results):
+        result['rank'] = rank + 1
+    return results
+
+
+def get_ranking_key(result: dict) -> Tuple[bool, float, float]:
+    """
+    Get the sorting key of a pre-screen result: the fastest H abstraction first, ties broken by the weakest bond,
+    and APIs which could not be screened last.
+
+    Args:
+        result (dict): The ``prescreen_api`` result.
+
+    Returns:
+        Tuple[bool, float, float]: The sorting key.
+    """
+    if result['error'] is not None or result['k_total'] is None:
+        return True, 0.0, 0.0
+    return False, -result['k_total'], result['min_bde'] if result['min_bde'] is not None else float('inf')
+
+
+def save_prescreen(project_directory: str,
+                   ranking: List[dict],
+                   api_structures: List[dict],
+                   T: float,
+                   ):
+    """
+    Save a pre-screen ranking as YAML and CSV files in the project directory.
+    The YAML file also lists the API structures in rank order, ready to be copied into a full APIOxy input.
+
+    Args:
+        project_directory (str): The project directory.
+        ranking (List[dict]): The ranked ``prescreen_api`` results.
+        api_structures (List[dict]): The API species dictionaries.
+        T (float): The temperature in K.
+    """
+    api_dicts = {api_dict.get('label', None): api_dict for api_dict in api_structures}
+    save_yaml_file(path=os.path.join(project_directory, PRESCREEN_YAML_FILE_NAME),
+                   content={'T': T,
+                            'ranking': ranking,
+                            'api_structures': [api_dicts[result['label']] for result in ranking
+                                               if result['error'] is None and result['label'] in api_dicts],
+                            })
+    with open(os.path.join(project_directory, PRESCREEN_CSV_FILE_NAME), 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        for result in ranking:
+            writer.writerow(dict(result, sites=len(result['sites'])))
@@ -0,0 +1,168 @@
+"""
+APIOxy QM job registry module
+used for sharing QM calculations between the APIs of a single APIOxy batch
+
+The registry is a YAML file in the batch project directory guarded by a lock file,
+so T3 jobs running in different worker processes can safely claim calculations.
+Each calculation is keyed by the canonical identity of the species (or reaction) and the level of theory.
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+from contextlib import contextmanager
+from typing import Optional
+
+from apioxy.common import read_yaml_file, save_yaml_file
+
+
+REGISTRY_FILE_NAME = 'qm_registry.yml'
+
+
+def get_species_identity(species) -> str:
+    """
+    Get a canonical identity of an RMG species which is independent of its label and resonance structure.
+
+    Args:
+        species (Species): An RMG Species object.
+
+    Returns:
+        str: The species identity.
+    """
+    molecule = species.molecule[0]
+    try:
+        identity = molecule.to_inchi_key()
+    except Exception:
+        identity = molecule.to_smiles()
+    return f'{identity}-{molecule.multiplicity}'
+
+
+def get_reaction_identity(reaction) -> str:
+    """
+    Get a canonical identity of an RMG reaction which is independent of its direction and of species labels.
+
+    Args:
+        reaction (Reaction): An RMG Reaction object.
+
+    Returns:
+        str: The reaction identity.
+    """
+    reactants = '+'.join(sorted(get_species_identity(spc) for spc in reaction.reactants))
+    products = '+'.join(sorted(get_species_identity(spc) for spc in reaction.products))
+    return '<=>'.join(sorted([reactants, products]))
+
+
+def get_level_identity(qm: dict) -> str:
+    """
+    Get an identity of the levels of theory requested in a qm dictionary.
+
+    Args:
+        qm (dict): The qm dictionary (ARC arguments).
+
+    Returns:
+        str: A short hash representing the levels of theory.
+    """
+    level_keys = ['level_of_theory', 'composite_method', 'conformer_level', 'opt_level', 'freq_level',
+                  'sp_level', 'scan_level', 'ts_guess_level', 'irc_level', 'orbitals_level', 'adaptive_levels',
+                  'bac_type', 'arkane_level_of_theory']
+    levels = {key: qm[key] for key in level_keys if key in qm and qm[key] is not None}
+    content = json.dumps(levels, sort_keys=True, default=str)
+    return hashlib.sha1(content.encode()).hexdigest()[:12]
+
+
+class QMJobRegistry(object):
+    """
+    A batch-level registry of QM calculations.
+
+    Args:
+        path (str): The directory in which the registry file is stored (typically the batch project directory).
+
+    Attributes:
+        path (str): The path to the registry file.
+        lock_path (str): The path to the lock file.
+    """
+
+    def __init__(self, path: str):
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        self.path = os.path.join(path, REGISTRY_FILE_NAME)
+        self.lock_path = self.path + '.lock'
+
+    @contextmanager
+    def _locked(self):
+        """
+        Hold an exclusive lock on the registry and yield its content, the content is saved on exit.
+        """
+        with open(self.lock_path, 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                content = read_yaml_file(self.path) if os.path.isfile(self.path) else dict()
+                content = content or dict()
+                yield content
+                save_yaml_file(path=self.path, content=content)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def claim(self,
+              key: str,
+              owner: str,
+              label: Optional[str] = None,
+              ) -> Optional[dict]:
+        """
+        Claim a calculation.
+        A calculation which failed for another owner (or was released) is claimed again.
+
+        Args:
+            key (str): The calculation key.
+            owner (str): The project claiming the calculation.
+            label (str, optional): The label of the species or reaction, for reference.
+
+        Returns:
+            Optional[dict]: ``None`` if the calculation was claimed by ``owner``,
+                            otherwise the existing registry entry (a calculation which is either running or completed).
+        """
+        with self._locked() as content:
+            entry = content.get(key)
+            if entry is not None and entry['owner'] != owner and entry['status'] in ['running', 'completed']:
+                return dict(entry)
+            content[key] = {'owner': owner, 'label': label, 'status': 'running'}
+        return None
+
+    def set_status(self,
+                   key: str,
+                   status: str,
+                   ):
+        """
+        Set the status of a claimed calculation.
+
+        Args:
+            key (str): The calculation key.
+            status (str): The status, either 'running', 'completed', or 'failed'.
+        """
+        with self._locked() as content:
+            if key in content:
+                content[key]['status'] = status
+
+    def get_status(self, key: str) -> Optional[str]:
+        """
+        Get the status of a calculation.
+
+        Args:
+            key (str): The calculation key.
+
+        Returns:
+            Optional[str]: The calculation status, ``None`` if it was never claimed.
+        """
+        with self._locked() as content:
+            return content[key]['status'] if key in content else None
+
+    def release_running(self):
+        """
+        Mark all running calculations as failed so they could be claimed again.
+        Should be called when a batch starts, since no calculation can be running at that point.
+        """
+        with self._locked() as content:
+            for entry in content.values():
+                if entry['status'] == 'running':
+                    entry['status'] = 'failed'
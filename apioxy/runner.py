@@ -0,0 +1,166 @@
+"""
+APIOxy runner module
+used for executing the T3 jobs of individual APIs, either serially or in a pool of worker processes
+"""
+
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, List, Optional
+
+from apioxy.metrics import MetricsRecorder
+
+
+def get_job_result(job: dict,
+                   status: str = 'completed',
+                   error: Optional[str] = None,
+                   ) -> dict:
+    """
+    Get an initial result dictionary for an API job.
+
+    Args:
+        job (dict): The API job.
+        status (str, optional): The job status.
+        error (str, optional): The error message if the job failed.
+
+    Returns:
+        dict: The job result.
+    """
+    return {'index': job['index'],
+            'label': job['label'],
+            'project': job['project'],
+            'project_directory': job['project_directory'],
+            'status': status,
+            'error': error,
+            'wall_time': None,
+            'shared_qm_jobs': 0,
+            'cache_key': job.get('cache_key'),
+            'input_hash': job.get('input_hash'),
+            'metrics': None,
+            'campaign_input': job.get('campaign_input'),
+            }
+
+
+def run_api_job(job: dict) -> dict:
+    """
+    Run a single API T3 job.
+    Exceptions are caught and reported in the returned result, so a failing API does not affect other APIs.
+    Jobs with an ``escalation`` key run at escalating levels of theory (see ``apioxy.escalation``),
+    jobs with an ``adaptive_constraints`` key relax their species constraints as needed (see ``apioxy.constraints``).
+    This is a module-level function so it can be pickled and sent to a worker process.
+
+    Args:
+        job (dict): The API job as generated by ``APIOxy.get_api_jobs()``.
+
+    Returns:
+        dict: The job result with the ``status`` ('completed' or 'failed'), ``error``, and ``wall_time`` keys.
+    """
+    from apioxy.escalation import AdaptiveEscalation
+    from apioxy.levels import get_levels
+    from apioxy.t3_job import APIOxyT3
+
+    t0 = time.time()
+    result = get_job_result(job)
+    t3_object = None
+    try:
+        t3_object = APIOxyT3(project=job['project'],
+                             rmg=job['rmg'],
+                             t3=job['t3'],
+                             qm=job['qm'],
+                             project_directory=job['project_directory'],
+                             verbose=job['verbose'],
+                             clean_dir=False,
+                             registry_path=job.get('registry_path'),
+                             adaptive_constraints=job.get('adaptive_constraints'),
+                             )
+        if job.get('escalation') is not None:
+            result['escalation'] = AdaptiveEscalation(t3_object=t3_object,
+                                                      levels=get_levels(),
+                                                      escalation=job['escalation'],
+                                                      ).run()
+        else:
+            t3_object.execute()
+        t3_object.check_constraint_limits()
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f'{e.__class__.__name__}: {e}'
+        result['traceback'] = traceback.format_exc()
+        if t3_object is not None:
+            t3_object.release_claims()
+    if t3_object is not None:
+        result['shared_qm_jobs'] = t3_object.shared_qm_jobs
+        result['metrics'] = t3_object.metrics.as_dict()
+    else:
+        result['metrics'] = MetricsRecorder(label=job['label']).as_dict()
+    result['wall_time'] = time.time() - t0
+    result['metrics'].update(label=job['label'], status=result['status'], wall_time=result['wall_time'],
+                             queue_wait=t0 - job['submitted_at'] if job.get('submitted_at') else None)
+    return result
+
+
+def get_number_of_workers(max_workers: Optional[int],
+                          number_of_jobs: int,
+                          ) -> int:
+    """
+    Determine the number of worker processes to use.
+
+    Args:
+        max_workers (int, optional): The maximal number of workers requested by the user.
+                                     ``None`` to use all available CPUs.
+        number_of_jobs (int): The number of jobs to run.
+
+    Returns:
+        int: The number of worker processes.
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(f'The number of workers must be a positive integer, got {max_workers}.')
+    return max(min(max_workers, number_of_jobs), 1)
+
+
+def run_api_jobs(jobs: List[dict],
+                 run_in_parallel: bool = False,
+                 max_workers: Optional[int] = None,
+                 job_runner: Callable[[dict], dict] = run_api_job,
+                 callback: Optional[Callable[[dict], None]] = None,
+                 ) -> List[dict]:
+    """
+    Run API T3 jobs, either serially in the current process or in a pool of worker processes.
+
+    Args:
+        jobs (List[dict]): The API jobs to run.
+        run_in_parallel (bool, optional): Whether to run each job in its own worker process.
+        max_workers (int, optional): The maximal number of worker processes, ``None`` to use all available CPUs.
+        job_runner (Callable, optional): The function used to run a single job, must be picklable.
+        callback (Callable, optional): A function called with each job result as soon as the job terminates.
+
+    Returns:
+        List[dict]: The job results, ordered as the jobs.
+    """
+    submitted_at = time.time()
+    for job in jobs:
+        job['submitted_at'] = submitted_at
+    results = list()
+    if not run_in_parallel or len(jobs) <= 1:
+        for job in jobs:
+            result = job_runner(job)
+            if callback is not None:
+                callback(result)
+            results.append(result)
+        return results
+
+    with ProcessPoolExecutor(max_workers=get_number_of_workers(max_workers, len(jobs))) as executor:
+        futures = {executor.submit(job_runner, job): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # the worker process itself crashed (e.g., was killed), the job runner could not report
+                result = get_job_result(job, status='failed', error=f'{e.__class__.__name__}: {e}')
+            if callback is not None:
+                callback(result)
+            results.append(result)
+    return sorted(results, key=lambda r: r['index'])
@@ -0,0 +1,334 @@
+"""
+APIOxy seeds module
+used for warm-starting RMG from mechanisms generated in previous APIOxy runs
+
+The seed mechanism RMG writes in the last T3 iteration of each completed API is stored in a local catalog,
+together with the identities of the initial mixture species, of the core species, the solvent, and the reactor phase.
+For a new API job, catalog seeds of the same phase and solvent are scored by the fraction of the job's mixture species
+(including the API) which are already in their core, and the best ones are installed in the RMG kinetics libraries
+folder and injected as kinetics libraries (or seed mechanisms) of the job. As kinetics libraries, seed reactions are
+only used between species the job's own model generates, unrelated seed species are not added to its core.
+Seeding is opt-in. Seeds are injected after the job input hash and cache key were computed, so neither resuming
+a project nor reusing cached results depends on the catalog content. The injected seeds are recorded with the job's
+cached results.
+"""
+
+import hashlib
+import os
+import shutil
+import time
+from typing import List, Optional
+
+from apioxy.cache import get_canonical_species, get_last_iteration_directory
+from apioxy.common import CACHE_BASE_PATH, read_yaml_file, save_yaml_file
+
+
+DEFAULT_SEEDS = {'use': False,
+                 'path': None,
+                 'inject_as': 'kinetics_libraries',
+                 'max_seeds': 2,
+                 'min_score': 0.5,
+                 'max_entries': 200,
+                 }
+ENTRY_FILE_NAME = 'entry.yml'
+SEED_FILES = ['reactions.py', 'dictionary.txt']
+SEED_LIBRARIES_FOLDER = 'APIOxy_seeds'  # the seeds folder under the RMG kinetics libraries folder
+SEEDS_BASE_PATH = os.path.join(CACHE_BASE_PATH, 'seeds')
+
+
+def get_seeds_settings(seeds) -> dict:
+    """
+    Get the seeds settings with defaults applied where not specified.
+
+    Args:
+        seeds: The seeds settings of the input, ``True``/``False`` to use or disable the defaults.
+               Seeds are used if settings are given as a dictionary, unless its ``use`` key is ``False``.
+
+    Returns:
+        dict: The seeds settings.
+    """
+    settings = dict(DEFAULT_SEEDS)
+    if isinstance(seeds, dict):
+        settings['use'] = True
+        settings.update({key: value for key, value in seeds.items() if value is not None})
+    elif seeds is not None:
+        settings['use'] = bool(seeds)
+    if settings['inject_as'] not in ['seed_mechanisms', 'kinetics_libraries']:
+        raise ValueError(f"seeds['inject_as'] must be either 'seed_mechanisms' or 'kinetics_libraries', "
+                         f"got {settings['inject_as']}")
+    return settings
+
+
+def get_phase(rmg: dict) -> str:
+    """
+    Get the phase of the reactors of an RMG dictionary.
+
+    Args:
+        rmg (dict): The RMG dictionary.
+
+    Returns:
+        str: Either 'liquid' or 'gas'.
+    """
+    reactors = rmg.get('reactors', None) or [dict()]
+    return 'liquid' if str(reactors[0].get('type', 'liquid')).startswith('liquid') else 'gas'
+
+
+def get_mixture_identities(rmg: dict) -> dict:
+    """
+    Get the identities of the initial mixture species of an RMG dictionary.
+
+    Args:
+        rmg (dict): The RMG dictionary.
+
+    Returns:
+        dict: The sorted ``species`` identities and the ``solvent`` identity (``None`` in the gas phase).
+    """
+    species, solvent = set(), None
+    for spc in rmg['species']:
+        identity = get_canonical_species(spc)['identity']
+        species.add(identity)
+        if spc.get('solvent', False):
+            solvent = identity
+    return {'species': sorted(species), 'solvent': solvent}
+
+
+def get_seed_directory(project_directory: str) -> Optional[str]:
+    """
+    Get the directory of the seed mechanism RMG wrote in the last T3 iteration of a project.
+
+    Args:
+        project_directory (str): The T3 project directory.
+
+    Returns:
+        Optional[str]: The seed directory, ``None`` if not found.
+    """
+    iteration = get_last_iteration_directory(project_directory)
+    if iteration is None:
+        return None
+    seed_path = os.path.join(project_directory, iteration, 'RMG', 'seed')
+    candidates = [os.path.join(seed_path, 'seed')]
+    if os.path.isdir(seed_path):
+        candidates += [os.path.join(seed_path, name) for name in sorted(os.listdir(seed_path))
+                       if not name.endswith('_edge')]
+    for candidate in candidates:
+        if all(os.path.isfile(os.path.join(candidate, file_name)) for file_name in SEED_FILES):
+            return candidate
+    return None
+
+
+def get_core_identities(seed_directory: str) -> List[str]:
+    """
+    Get the identities of the species of a seed mechanism.
+
+    Args:
+        seed_directory (str): The seed directory.
+
+    Returns:
+        List[str]: The sorted species identities.
+    """
+    from rmgpy.chemkin import load_species_dictionary
+
+    from apioxy.registry import get_species_identity
+
+    species_dict = load_species_dictionary(os.path.join(seed_directory, 'dictionary.txt'))
+    return sorted({get_species_identity(spc) for spc in species_dict.values()})
+
+
+def get_relevance(entry: dict, mixture: dict, phase: str) -> float:
+    """
+    Get the relevance of a catalog seed for a job: the fraction of the job's mixture species in the seed core.
+    Seeds of another phase or solvent are not relevant.
+
+    Args:
+        entry (dict): The catalog entry.
+        mixture (dict): The job's mixture identities, as returned by ``get_mixture_identities()``.
+        phase (str): The job's reactor phase.
+
+    Returns:
+        float: The relevance between 0 and 1.
+    """
+    if entry['phase'] != phase or entry['solvent'] != mixture['solvent'] or not mixture['species']:
+        return 0.0
+    core = set(entry['core']) | set(entry['species'])
+    return sum(identity in core for identity in mixture['species']) / len(mixture['species'])
+
+
+class SeedCatalog(object):
+    """
+    A persistent local catalog of seed mechanisms from completed API runs.
+
+    Args:
+        path (str, optional): The catalog directory, ``SEEDS_BASE_PATH`` by default.
+        max_entries (int, optional): The maximal number of seeds, least recently used seeds are evicted beyond it.
+
+    Attributes:
+        path (str): The catalog directory.
+        max_entries (int): The maximal number of seeds.
+    """
+
+    def __init__(self,
+                 path: Optional[str] = None,
+                 max_entries: int = 200,
+                 ):
+        self.path = path or SEEDS_BASE_PATH
+        self.max_entries = max_entries
+        if not os.path.isdir(self.path):
+            os.makedirs(self.path)
+
+    def get_entries(self) -> List[dict]:
+        """
+        Get the metadata of all catalog seeds.
+
+        Returns:
+            List[dict]: Entries are metadata dictionaries, each has a ``key`` key.
+        """
+        entries = list()
+        for key in os.listdir(self.path):
+            entry_path = os.path.join(self.path, key, ENTRY_FILE_NAME)
+            if os.path.isfile(entry_path):
+                entry = read_yaml_file(entry_path)
+                entry['key'] = key
+                entries.append(entry)
+        return entries
+
+    def add(self, job: dict) -> Optional[str]:
+        """
+        Add the seed mechanism of a completed API job to the catalog.
+
+        Args:
+            job (dict): The API job.
+
+        Returns:
+            Optional[str]: The seed key, ``None`` if the job has no seed mechanism.
+        """
+        seed_directory = get_seed_directory(job['project_directory'])
+        if seed_directory is None:
+            return None
+        key = hashlib.sha256(os.path.abspath(job['project_directory']).encode()).hexdigest()[:16]
+        mixture = get_mixture_identities(job['rmg'])
+        try:
+            core = get_core_identities(seed_directory)
+        except Exception:
+            core = list()
+        tmp_directory = os.path.join(self.path, f'.{key}.{os.getpid()}.tmp')
+        if os.path.isdir(tmp_directory):
+            shutil.rmtree(tmp_directory)
+        os.makedirs(tmp_directory)
+        for file_name in SEED_FILES:
+            shutil.copy(os.path.join(seed_directory, file_name), os.path.join(tmp_directory, file_name))
+        save_yaml_file(path=os.path.join(tmp_directory, ENTRY_FILE_NAME),
+                       content={'label': job['label'],
+                                'project_directory': os.path.abspath(job['project_directory']),
+                                'phase': get_phase(job['rmg']),
+                                'solvent': mixture['solvent'],
+                                'species': mixture['species'],
+                                'core': core,
+                                'created': time.time(),
+                                'last_used': time.time(),
+                                })
+        entry_directory = os.path.join(self.path, key)
+        if os.path.isdir(entry_directory):
+            shutil.rmtree(entry_directory)
+        os.rename(tmp_directory, entry_directory)
+        self.evict()
+        return key
+
+    def select(self,
+               job: dict,
+               max_seeds: int = 2,
+               min_score: float = 0.5,
+               ) -> List[dict]:
+        """
+        Select the most relevant seeds for an API job.
+        Seeds of the job's own project directory are never selected.
+
+        Args:
+            job (dict): The API job.
+            max_seeds (int, optional): The maximal number of seeds to select.
+            min_score (float, optional): The minimal relevance of a selected seed.
+
+        Returns:
+            List[dict]: The selected catalog entries with a ``score`` key, most relevant first.
+        """
+        mixture = get_mixture_identities(job['rmg'])
+        phase = get_phase(job['rmg'])
+        project_directory = os.path.abspath(job['project_directory'])
+        scored = list()
+        for entry in self.get_entries():
+            if entry['project_directory'] == project_directory:
+                continue
+            entry['score'] = get_relevance(entry, mixture, phase)
+            if entry['score'] >= min_score and entry['score'] > 0:
+                scored.append(entry)
+        scored.sort(key=lambda entry: (entry['score'], entry['created']), reverse=True)
+        return scored[:max_seeds]
+
+    def install(self,
+                entry: dict,
+                kinetics_lib_base_path: str,
+                ) -> str:
+        """
+        Install a catalog seed in the RMG kinetics libraries folder, so RMG can load it by name.
+
+        Args:
+            entry (dict): The catalog entry.
+            kinetics_lib_base_path (str): The path to the RMG kinetics libraries folder.
+
+        Returns:
+            str: The library name, relative to the kinetics libraries folder.
+        """
+        name = f'{SEED_LIBRARIES_FOLDER}/{entry["key"]}'
+        library_directory = os.path.join(kinetics_lib_base_path, SEED_LIBRARIES_FOLDER, entry['key'])
+        entry_directory = os.path.join(self.path, entry['key'])
+        if not os.path.isfile(os.path.join(library_directory, 'reactions.py')) \
+                or os.path.getmtime(os.path.join(library_directory, 'reactions.py')) \
+                < os.path.getmtime(os.path.join(entry_directory, 'reactions.py')):
+            os.makedirs(library_directory, exist_ok=True)
+            for file_name in SEED_FILES:
+                shutil.copy(os.path.join(entry_directory, file_name), os.path.join(library_directory, file_name))
+        entry_path = os.path.join(entry_directory, ENTRY_FILE_NAME)
+        content = read_yaml_file(entry_path)
+        content['last_used'] = time.time()
+        save_yaml_file(path=entry_path, content=content)
+        return name
+
+    def evict(self):
+        """
+        Evict the least recently used seeds until at most ``self.max_entries`` remain.
+        """
+        entries = sorted(self.get_entries(), key=lambda entry: entry['last_used'])
+        for entry in entries[:max(len(entries) - self.max_entries, 0)]:
+            shutil.rmtree(os.path.join(self.path, entry['key']), ignore_errors=True)
+
+
+def inject_seeds(job: dict,
+                 catalog: SeedCatalog,
+                 kinetics_lib_base_path: str,
+                 inject_as: str = 'kinetics_libraries',
+                 max_seeds: int = 2,
+                 min_score: float = 0.5,
+                 ) -> List[dict]:
+    """
+    Select the most relevant catalog seeds for an API job and add them to the job's RMG database.
+
+    Args:
+        job (dict): The API job, its ``rmg['database']`` is modified in place.
+        catalog (SeedCatalog): The seed catalog.
+        kinetics_lib_base_path (str): The path to the RMG kinetics libraries folder.
+        inject_as (str, optional): Either 'kinetics_libraries' or 'seed_mechanisms'.
+        max_seeds (int, optional): The maximal number of seeds to inject.
+        min_score (float, optional): The minimal relevance of an injected seed.
+
+    Returns:
+        List[dict]: The injected seeds, each with the ``label`` of its API, its ``score``, library ``name``,
+                    and the time it was ``created``.
+    """
+    injected = list()
+    for entry in catalog.select(job, max_seeds=max_seeds, min_score=min_score):
+        name = catalog.install(entry, kinetics_lib_base_path)
+        libraries = job['rmg']['database'].setdefault(inject_as, list())
+        if name not in libraries:
+            libraries.append(name)
+        injected.append({'label': entry['label'], 'score': round(entry['score'], 3), 'name': name,
+                         'created': entry['created']})
+    return injected
@@ -0,0 +1,268 @@
+"""
+APIOxy server module
+used for running APIOxy as a long-lived service with a warm pool of worker processes
+
+The server imports APIOxy, T3, ARC, and RMG once, and only then forks its worker processes,
+so submitted APIs start in a worker without paying the interpreter start-up and import time.
+Note that T3 still runs RMG in a separate process, which loads its own RMG database for each RMG run.
+Jobs are submitted over a local HTTP endpoint:
+
+    POST /jobs        submit an APIOxy job, the body is a JSON dictionary with the APIOxy arguments
+                      (the content of an input file), or with a ``path`` key pointing to an input file
+    GET  /jobs        list all jobs
+    GET  /jobs/<id>   get the status and results of a job
+    GET  /health      check that the server is running
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from apioxy.main import APIOxy
+from apioxy.parsing import load_input_file
+from apioxy.runner import get_job_result, get_number_of_workers, run_api_job
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8750
+
+
+def warm_up_worker(duration: float = 0.5) -> int:
+    """
+    A task used to spawn all worker processes when the server starts.
+
+    Args:
+        duration (float, optional): The time to keep the worker busy, so other warm-up tasks spawn new workers.
+
+    Returns:
+        int: The worker process ID.
+    """
+    time.sleep(duration)
+    return os.getpid()
+
+
+class APIOxyServer(object):
+    """
+    The APIOxy server class.
+
+    Args:
+        host (str, optional): The host to listen on, only the local host by default.
+        port (int, optional): The port to listen on.
+        max_workers (int, optional): The number of worker processes, ``None`` to use all available CPUs.
+        verbose (int, optional): The logging level of submitted jobs if not specified in their input.
+
+    Attributes:
+        host (str): The host the server listens on.
+        port (int): The port the server listens on.
+        max_workers (int): The number of worker processes.
+        verbose (int): The default logging level of submitted jobs.
+        executor (ProcessPoolExecutor): The warm pool of worker processes.
+        jobs (dict): Keys are job IDs, values are job status dictionaries.
+        futures (set): The futures of the API jobs which did not terminate yet.
+        lock (threading.Lock): A lock guarding ``jobs``.
+    """
+
+    def __init__(self,
+                 host: str = DEFAULT_HOST,
+                 port: int = DEFAULT_PORT,
+                 max_workers: Optional[int] = None,
+                 verbose: int = logging.INFO,
+                 ):
+        self.host = host
+        self.port = port
+        self.max_workers = get_number_of_workers(max_workers, os.cpu_count() or 1)
+        self.verbose = verbose
+        self.executor = None
+        self.jobs = dict()
+        self.futures = set()
+        self.lock = threading.Lock()
+
+    def start(self):
+        """
+        Import T3, ARC and RMG, fork the worker processes, and serve requests until interrupted.
+        """
+        t0 = time.time()
+        import apioxy.t3_job  # noqa: F401, imports T3, ARC and RMG before forking
+        print(f'Imported T3, ARC and RMG in {time.time() - t0:.1f} s')
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                            mp_context=multiprocessing.get_context('fork'))
+        pids = set(future.result() for future in [self.executor.submit(warm_up_worker)
+                                                  for _ in range(self.max_workers)])
+        print(f'Started {len(pids)} warm worker processes')
+        http_server = ThreadingHTTPServer((self.host, self.port), self.get_request_handler())
+        print(f'APIOxy server listening on http://{self.host}:{self.port}')
+        try:
+            http_server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            http_server.server_close()
+            with self.lock:
+                for future in list(self.futures):
+                    future.cancel()
+            self.executor.shutdown(wait=False)
+
+    def submit(self, input_dict: dict) -> str:
+        """
+        Submit an APIOxy job, each of its APIs is executed in a warm worker process.
+        Jobs of model level 0 (pre-screening) are rejected, since they have no T3 jobs.
+
+        Args:
+            input_dict (dict): The APIOxy arguments, or a dictionary with a ``path`` key pointing to an input file.
+
+        Returns:
+            str: The job ID.
+        """
+        if 'path' in input_dict:
+            input_dict = load_input_file(input_dict['path'], verbose=self.verbose)
+        input_dict.setdefault('verbose', self.verbose)
+        job_id = uuid.uuid4().hex[:12]
+        apioxy_object = APIOxy(**input_dict)
+        if apioxy_object.apioxy['model_level'] == 0:
+            raise ValueError('Model level 0 only pre-screens the APIs and has no T3 jobs to execute, '
+                             'run it with APIOxy.py instead of submitting it to the server.')
+        finished_results, api_jobs = apioxy_object.prepare_jobs()
+        with self.lock:
+            self.jobs[job_id] = {'id': job_id,
+                                 'project': apioxy_object.project,
+                                 'project_directory': apioxy_object.project_directory,
+                                 'status': 'running' if api_jobs else 'completed',
+                                 'submitted': time.time(),
+                                 'pending': len(api_jobs),
+                                 'results': finished_results,
+                                 'apioxy_object': apioxy_object,
+                                 }
+            if not api_jobs:
+                apioxy_object.finalize(finished_results)
+        for api_job in api_jobs:
+            api_job['submitted_at'] = time.time()
+            future = self.executor.submit(run_api_job, api_job)
+            with self.lock:
+                self.futures.add(future)
+            future.add_done_callback(lambda f, j=api_job: self.process_future(job_id, j, f))
+        return job_id
+
+    def process_future(self,
+                       job_id: str,
+                       api_job: dict,
+                       future: Future,
+                       ):
+        """
+        Process the result of an API job once its worker terminates.
+
+        Args:
+            job_id (str): The ID of the APIOxy job the API job belongs to.
+            api_job (dict): The API job.
+            future (Future): The future of the API job.
+        """
+        with self.lock:
+            self.futures.discard(future)
+        if future.cancelled():
+            return
+        try:
+            result = future.result()
+        except Exception as e:
+            result = get_job_result(api_job, status='failed', error=f'{e.__class__.__name__}: {e}')
+        with self.lock:
+            job = self.jobs[job_id]
+            job['apioxy_object'].process_job_result(result)
+            job['results'].append(result)
+            job['pending'] -= 1
+            if job['pending'] == 0:
+                job['apioxy_object'].finalize(job['results'])
+                job['status'] = 'completed' if all(r['status'] in ['completed', 'cached']
+                                                   for r in job['results']) else 'failed'
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """
+        Get a JSON-serializable representation of a job.
+
+        Args:
+            job_id (str): The job ID.
+
+        Returns:
+            Optional[dict]: The job representation, ``None`` if the job ID is unknown.
+        """
+        with self.lock:
+            if job_id not in self.jobs:
+                return None
+            job = {key: value for key, value in self.jobs[job_id].items() if key != 'apioxy_object'}
+            job['results'] = [{key: value for key, value in result.items() if key != 'traceback'}
+                              for result in job['results']]
+            return job
+
+    def get_request_handler(self):
+        """
+        Get an HTTP request handler class bound to this server.
+
+        Returns:
+            type: The request handler class.
+        """
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            """
+            The APIOxy server HTTP request handler.
+            """
+
+            def send_json(self, content, code: int = 200):
+                body = json.dumps(content, default=str).encode()
+                self.send_response(code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path == '/health':
+                    self.send_json({'status': 'ok', 'workers': server.max_workers})
+                elif self.path == '/jobs':
+                    self.send_json([server.get_job(job_id) for job_id in list(server.jobs.keys())])
+                elif self.path.startswith('/jobs/'):
+                    job = server.get_job(self.path.split('/')[-1])
+                    self.send_json(job if job is not None else {'error': 'unknown job'}, 200 if job else 404)
+                else:
+                    self.send_json({'error': 'not found'}, 404)
+
+            def do_POST(self):
+                if self.path != '/jobs':
+                    self.send_json({'error': 'not found'}, 404)
+                    return
+                try:
+                    input_dict = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                    job_id = server.submit(input_dict)
+                except Exception as e:
+                    self.send_json({'error': f'{e.__class__.__name__}: {e}',
+                                    'traceback': traceback.format_exc()}, 400)
+                    return
+                self.send_json({'id': job_id}, 202)
+
+            def log_message(self, format, *args):
+                pass
+
+        return RequestHandler
+
+
+def serve(host: str = DEFAULT_HOST,
+          port: int = DEFAULT_PORT,
+          max_workers: Optional[int] = None,
+          verbose: int = logging.INFO,
+          ):
+    """
+    Start an APIOxy server.
+
+    Args:
+        host (str, optional): The host to listen on.
+        port (int, optional): The port to listen on.
+        max_workers (int, optional): The number of worker processes, ``None`` to use all available CPUs.
+        verbose (int, optional): The default logging level of submitted jobs.
+    """
+    APIOxyServer(host=host, port=port, max_workers=max_workers, verbose=verbose).start()
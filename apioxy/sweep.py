@@ -0,0 +1,292 @@
+"""
+APIOxy sweep module
+used for running one API at several reactor conditions (e.g., temperatures and O2 headspace levels)
+
+Each reactor of ``rmg['reactors']`` is a condition, and may carry a ``label`` and a ``concentrations`` dictionary
+overriding the initial concentrations of mixture species (e.g., ``{'O2': 0}`` for a nitrogen headspace).
+The mechanism is generated once per API for an envelope reactor spanning all conditions,
+then only the reactor simulation and sensitivity analysis of each condition are run, in parallel worker processes.
+The API loss curves of all APIs and conditions are collected in a single table.
+"""
+
+import copy
+import csv
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from apioxy.cache import get_last_iteration_directory
+from apioxy.common import save_yaml_file
+from apioxy.escalation import get_api_profile, get_degradation_rate, get_sa_dict, get_simulation_profile_path, \
+    get_top_contributors
+from apioxy.runner import get_number_of_workers
+
+
+CONDITION_KEYS = ['label', 'concentrations']  # APIOxy-specific condition keys, not passed to T3
+SWEEP_CSV_FILE_NAME = 'apioxy_sweep.csv'
+SWEEP_YAML_FILE_NAME = 'apioxy_sweep.yml'
+TIME_UNITS = {'micro-s': 1e-6, 'ms': 1e-3, 's': 1.0, 'min': 60.0, 'hours': 3600.0, 'hrs': 3600.0, 'days': 86400.0}
+
+
+def get_time_in_seconds(value) -> float:
+    """
+    Get a termination time in seconds.
+
+    Args:
+        value: The termination time, either a number in seconds or a ``[value, unit]`` list.
+
+    Returns:
+        float: The time in seconds.
+    """
+    if isinstance(value, (list, tuple)):
+        return float(value[0]) * TIME_UNITS[value[1]]
+    return float(value)
+
+
+def get_condition_label(condition: dict) -> str:
+    """
+    Get the label of a sweep condition, e.g., '313K_O2_0'.
+
+    Args:
+        condition (dict): The condition (reactor) dictionary.
+
+    Returns:
+        str: The condition label.
+    """
+    if condition.get('label', None):
+        return condition['label']
+    temperature = condition['T'] if not isinstance(condition['T'], list) else '-'.join(str(t) for t in condition['T'])
+    label = f'{temperature}K'
+    for species_label, concentration in (condition.get('concentrations', None) or dict()).items():
+        label += f'_{species_label}_{concentration:g}'
+    return label
+
+
+def get_sweep_conditions(reactors: List[dict], species: List[dict]) -> List[dict]:
+    """
+    Get the labeled sweep conditions of RMG reactor dictionaries.
+    Species whose concentration is overridden in any condition get an explicit concentration in all conditions.
+
+    Args:
+        reactors (List[dict]): The RMG reactor dictionaries.
+        species (List[dict]): The mixture species dictionaries.
+
+    Returns:
+        List[dict]: The conditions, each with a unique ``label``.
+    """
+    conditions = [dict(copy.deepcopy(reactor), label=get_condition_label(reactor)) for reactor in reactors]
+    concentrations = {spc['label']: spc.get('concentration', 0) for spc in species}
+    varied = {label for condition in conditions for label in (condition.get('concentrations', None) or dict())}
+    unknown = sorted(varied - set(concentrations))
+    if unknown:
+        raise ValueError(f'Sweep conditions refer to species not in the mixture: {", ".join(unknown)}')
+    for condition in conditions:
+        condition['concentrations'] = dict({label: concentrations[label] for label in sorted(varied)},
+                                           **(condition.get('concentrations', None) or dict()))
+    labels = [condition['label'] for condition in conditions]
+    duplicates = sorted({label for label in labels if labels.count(label) > 1})
+    if duplicates:
+        raise ValueError(f'Sweep conditions must have unique labels, got duplicates: {", ".join(duplicates)}')
+    return conditions
+
+
+def get_envelope_reactor(conditions: List[dict]) -> dict:
+    """
+    Get a single RMG reactor spanning all sweep conditions, used to generate a mechanism valid at each of them.
+    Temperatures become a range, and the longest termination time and tightest other termination criteria are used.
+
+    Args:
+        conditions (List[dict]): The sweep conditions.
+
+    Returns:
+        dict: The envelope reactor.
+    """
+    types = {condition['type'] for condition in conditions}
+    if len(types) > 1:
+        raise ValueError(f'All sweep conditions must use the same reactor type, got: {", ".join(sorted(types))}')
+    reactor = {key: copy.deepcopy(value) for key, value in conditions[0].items() if key not in CONDITION_KEYS}
+    temperatures = [t for condition in conditions
+                    for t in (condition['T'] if isinstance(condition['T'], list) else [condition['T']])]
+    reactor['T'] = [min(temperatures), max(temperatures)] if min(temperatures) < max(temperatures) \
+        else temperatures[0]
+    times = [condition['termination_time'] for condition in conditions if 'termination_time' in condition]
+    if times:
+        reactor['termination_time'] = max(times, key=get_time_in_seconds)
+    ratios = [condition['termination_rate_ratio'] for condition in conditions if 'termination_rate_ratio' in condition]
+    if ratios:
+        reactor['termination_rate_ratio'] = min(ratios)
+    conversions = dict()
+    for condition in conditions:
+        for label, conversion in (condition.get('termination_conversion', None) or dict()).items():
+            conversions[label] = max(conversions.get(label, 0), conversion)
+    if conversions:
+        reactor['termination_conversion'] = conversions
+    return reactor
+
+
+def get_envelope_species(species: List[dict], conditions: List[dict]) -> List[dict]:
+    """
+    Get the mixture species with concentration ranges spanning the concentrations of all sweep conditions.
+
+    Args:
+        species (List[dict]): The mixture species dictionaries.
+        conditions (List[dict]): The sweep conditions.
+
+    Returns:
+        List[dict]: The mixture species dictionaries for the envelope reactor.
+    """
+    species = copy.deepcopy(species)
+    for spc in species:
+        values = [(condition.get('concentrations', None) or dict()).get(spc['label'], spc.get('concentration', 0))
+                  for condition in conditions]
+        if min(values) < max(values):
+            spc['concentration'] = [min(values), max(values)]
+    return species
+
+
+def get_condition_rmg(rmg: dict, condition: dict) -> dict:
+    """
+    Get the RMG dictionary of a single sweep condition.
+
+    Args:
+        rmg (dict): The RMG dictionary of an API job.
+        condition (dict): The sweep condition.
+
+    Returns:
+        dict: The RMG dictionary with the condition reactor and the condition species concentrations.
+    """
+    rmg = copy.deepcopy(rmg)
+    rmg['reactors'] = [{key: value for key, value in condition.items() if key not in CONDITION_KEYS}]
+    concentrations = condition.get('concentrations', None) or dict()
+    for spc in rmg['species']:
+        if spc['label'] in concentrations:
+            spc['concentration'] = concentrations[spc['label']]
+    return rmg
+
+
+def get_sweep_jobs(jobs: List[dict],
+                   results: List[dict],
+                   conditions: List[dict],
+                   ) -> List[dict]:
+    """
+    Get a simulation job per API and condition, for the APIs whose mechanism was generated.
+
+    Args:
+        jobs (List[dict]): The API jobs, as generated by ``APIOxy.get_api_jobs()``.
+        results (List[dict]): The API job results.
+        conditions (List[dict]): The sweep conditions.
+
+    Returns:
+        List[dict]: The sweep jobs.
+    """
+    statuses = {result['index']: result['status'] for result in results}
+    sweep_jobs = list()
+    for job in jobs:
+        if statuses.get(job['index'], None) not in ['completed', 'cached']:
+            continue
+        iteration = get_last_iteration_directory(job['project_directory'])
+        if iteration is None:
+            continue
+        chemkin_path = os.path.join(job['project_directory'], iteration, 'RMG', 'chemkin')
+        for condition in conditions:
+            sweep_jobs.append({'index': job['index'],
+                               'label': job['label'],
+                               'condition': condition['label'],
+                               'project': f'{job["project"]}_{condition["label"]}',
+                               'project_directory': os.path.join(job['project_directory'], 'sweep', condition['label']),
+                               'chem_annotated': os.path.join(chemkin_path, 'chem_annotated.inp'),
+                               'species_dict': os.path.join(chemkin_path, 'species_dictionary.txt'),
+                               'rmg': get_condition_rmg(job['rmg'], condition),
+                               't3': copy.deepcopy(job['t3']),
+                               'qm': copy.deepcopy(job['qm']),
+                               'T': condition['T'],
+                               'verbose': job['verbose'],
+                               })
+    return sweep_jobs
+
+
+def run_sweep_job(job: dict) -> dict:
+    """
+    Simulate a generated mechanism at a single condition and run a sensitivity analysis.
+    This is a module-level function so it can be pickled and sent to a worker process.
+
+    Args:
+        job (dict): The sweep job, as generated by ``get_sweep_jobs()``.
+
+    Returns:
+        dict: The condition result with the API loss ``profile``, its ``degradation_rate`` in 1/s,
+              the most sensitive ``reactions``, and the ``status`` and ``error`` keys.
+    """
+    from apioxy.t3_job import APIOxyT3
+
+    result = {key: job[key] for key in ['index', 'label', 'condition', 'T']}
+    result.update({'status': 'completed', 'error': None, 'degradation_rate': None, 'profile': None,
+                   'reactions': list()})
+    try:
+        t3_object = APIOxyT3(project=job['project'],
+                             rmg=job['rmg'],
+                             t3=job['t3'],
+                             qm=job['qm'],
+                             project_directory=job['project_directory'],
+                             verbose=job['verbose'],
+                             clean_dir=False,
+                             )
+        t3_object.iteration = 1
+        t3_object.set_paths()
+        t3_object.paths['chem annotated'] = job['chem_annotated']
+        t3_object.paths['species dict'] = job['species_dict']
+        t3_object.run_sa()
+        profile_path = get_simulation_profile_path(t3_object.paths.get('SA', None))
+        result['profile'] = get_api_profile(profile_path)
+        result['degradation_rate'] = get_degradation_rate(profile_path)
+        sa_dict = get_sa_dict(t3_object)
+        if sa_dict is not None:
+            result['reactions'] = get_top_contributors(sa_dict, top_species=0, top_reactions=5)[1]
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f'{e.__class__.__name__}: {e}'
+        result['traceback'] = traceback.format_exc()
+    return result
+
+
+def run_sweep_jobs(jobs: List[dict],
+                   max_workers: Optional[int] = None,
+                   ) -> List[dict]:
+    """
+    Run sweep jobs in parallel worker processes.
+
+    Args:
+        jobs (List[dict]): The sweep jobs.
+        max_workers (int, optional): The maximal number of worker processes, ``None`` to use all available CPUs.
+
+    Returns:
+        List[dict]: The condition results, ordered as the jobs.
+    """
+    if not jobs:
+        return list()
+    workers = get_number_of_workers(max_workers, len(jobs))
+    if workers == 1:
+        return [run_sweep_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(run_sweep_job, jobs))
+
+
+def save_sweep(project_directory: str, results: List[dict]):
+    """
+    Save the sweep results in the project directory: a summary YAML file,
+    and a single CSV table of the API loss curves of all APIs and conditions.
+
+    Args:
+        project_directory (str): The APIOxy project directory.
+        results (List[dict]): The condition results.
+    """
+    save_yaml_file(path=os.path.join(project_directory, SWEEP_YAML_FILE_NAME),
+                   content=[{key: value for key, value in result.items() if key not in ['profile', 'traceback']}
+                            for result in results])
+    with open(os.path.join(project_directory, SWEEP_CSV_FILE_NAME), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['api', 'condition', 'T', 'time (s)', 'api remaining'])
+        for result in results:
+            for t, remaining in result['profile'] or list():
+                writer.writerow([result['label'], result['condition'], result['T'], t, remaining])
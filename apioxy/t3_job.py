@@ -0,0 +1,225 @@
+"""
+APIOxy T3 job module
+used for running T3 for a single API as part of an APIOxy batch
+"""
+
+import os
+from typing import Optional
+
+from t3 import T3
+from t3.main import RMG_THERMO_LIB_BASE_PATH
+
+from apioxy.constraints import ConstraintTuner
+from apioxy.metrics import MetricsRecorder, get_mechanism_size, get_rmg_memory
+from apioxy.registry import QMJobRegistry, get_level_identity, get_reaction_identity, get_species_identity
+
+
+class APIOxyT3(T3):
+    """
+    A T3 object which is aware of the other APIs in its APIOxy batch.
+
+    Before spawning ARC, species and reactions are claimed in a batch-level QM job registry.
+    Calculations completed for another API of the batch are not sent to ARC again,
+    their results become available to this API through the shared thermo library (``library_name``).
+    Calculations still running for another API are left out of this ARC run and checked again after it:
+    if they completed meanwhile they are shared, otherwise they are claimed again in the next iteration
+    (and computed by this API if the other API failed).
+    The resources used by the RMG, ARC and sensitivity analysis phases of each iteration are recorded.
+    With adaptive species constraints, the constraints are relaxed after each RMG run where flux shows they matter,
+    and another iteration runs with the relaxed constraints (see ``apioxy.constraints``).
+
+    Args:
+        registry_path (str, optional): The directory of the batch QM job registry.
+                                       ``None`` to run without sharing QM calculations.
+        adaptive_constraints (dict, optional): The ``ceiling`` species constraints, relaxation ``steps``
+                                               and ``max_edge_growth``. ``None`` to keep the constraints fixed.
+        All other arguments are passed to T3.
+
+    Attributes:
+        registry (Optional[QMJobRegistry]): The batch QM job registry.
+        claimed (dict): Keys are registry keys claimed by this object, values are (section, key) tuples
+                        referring to ``self.species`` or ``self.reactions``.
+        deferred (dict): Keys are registry keys running for other APIs, left out of the current ARC run,
+                         values are (section, key) tuples.
+        shared_qm_jobs (int): The number of calculations skipped since they were shared by other APIs.
+        metrics (MetricsRecorder): The per-phase metrics of this API.
+        constraint_tuner (Optional[ConstraintTuner]): The adaptive species constraints tuner.
+    """
+
+    def __init__(self,
+                 registry_path: Optional[str] = None,
+                 adaptive_constraints: Optional[dict] = None,
+                 **kwargs,
+                 ):
+        self.metrics = MetricsRecorder(label=kwargs.get('project'))
+        super().__init__(**kwargs)
+        self.registry = QMJobRegistry(registry_path) if registry_path is not None else None
+        self.claimed = dict()
+        self.deferred = dict()
+        self.shared_qm_jobs = 0
+        self.constraint_tuner = None
+        if adaptive_constraints is not None:
+            self.constraint_tuner = ConstraintTuner(ceiling=adaptive_constraints['ceiling'],
+                                                    species_constraints=self.rmg['species_constraints'],
+                                                    steps=adaptive_constraints['steps'],
+                                                    max_edge_growth=adaptive_constraints['max_edge_growth'],
+                                                    )
+
+    def run_rmg(self, *args, **kwargs):
+        """
+        Run RMG, use the shared thermo library as soon as any API in the batch created it.
+        With adaptive species constraints, update the constraints for the next RMG run.
+        """
+        library_name = self.t3['options']['library_name']
+        thermo_libraries = self.rmg['database']['thermo_libraries']
+        if self.registry is not None and library_name not in thermo_libraries \
+                and os.path.isfile(os.path.join(RMG_THERMO_LIB_BASE_PATH, f'{library_name}.py')):
+            thermo_libraries.append(library_name)
+        iteration = getattr(self, 'iteration', None)
+        with self.metrics.phase('rmg', iteration=iteration):
+            result = super().run_rmg(*args, **kwargs)
+        paths = getattr(self, 'paths', dict())
+        core = get_mechanism_size(paths.get('chem annotated'))
+        if core is not None:
+            self.metrics.record_iteration(iteration, core_species=core['species'], core_reactions=core['reactions'])
+        edge, rmg_log_path = None, None
+        if paths.get('chem annotated') is not None:
+            edge = get_mechanism_size(os.path.join(os.path.dirname(paths['chem annotated']),
+                                                   'chem_edge_annotated.inp'))
+            if edge is not None:
+                self.metrics.record_iteration(iteration, edge_species=edge['species'],
+                                              edge_reactions=edge['reactions'])
+            rmg_log_path = os.path.join(os.path.dirname(os.path.dirname(paths['chem annotated'])), 'RMG.log')
+            rmg_memory = get_rmg_memory(rmg_log_path)
+            if rmg_memory is not None:
+                self.metrics.record_iteration(iteration, rmg_memory_mb=rmg_memory)
+        if self.constraint_tuner is not None:
+            self.rmg['species_constraints'] = self.constraint_tuner.update(
+                iteration=iteration,
+                rmg_log_path=rmg_log_path,
+                species_dictionary_path=paths.get('species dict'),
+                edge_species=edge['species'] if edge is not None else None,
+            )
+            relaxed = self.constraint_tuner.history[-1]['relaxed']
+            if relaxed:
+                self.logger.info(f'Relaxed species constraints where flux reached the bounds: '
+                                 f'{", ".join(f"{key}: {value}" for key, value in relaxed.items())}')
+                self.metrics.record_iteration(iteration, relaxed_constraints=relaxed)
+        return result
+
+    def run_arc(self, arc_kwargs: dict, *args, **kwargs):
+        """
+        Run ARC only for species and reactions not already claimed by other APIs in the batch.
+
+        Args:
+            arc_kwargs (dict): The ARC arguments.
+        """
+        if self.registry is not None:
+            level = get_level_identity(arc_kwargs)
+            for section, entries, get_identity in [('species', self.species, get_species_identity),
+                                                    ('reactions', self.reactions, get_reaction_identity)]:
+                for key, entry in entries.items():
+                    if entry['converged'] is not None:
+                        continue
+                    registry_key = f'{section}:{get_identity(entry["object"])}:{level}'
+                    existing = self.registry.claim(key=registry_key, owner=self.project, label=str(entry['object']))
+                    if existing is None:
+                        self.claimed[registry_key] = (section, key)
+                    elif existing['status'] == 'completed':
+                        # don't send this calculation to ARC, another API computed it into the shared library
+                        entry['converged'] = True
+                        self.count_shared(section, entry, owner=existing['owner'])
+                    else:
+                        # another API is computing it, leave it out of this ARC run and check it again afterwards
+                        entry['converged'] = True
+                        self.deferred[registry_key] = (section, key)
+                        self.logger.info(f'Not computing {section[:-1]} {entry["object"]} in this iteration, '
+                                         f'it is running by {existing["owner"]}')
+        for section in ['species', 'reactions']:
+            self.metrics.count(f'qm_{section}', sum(entry['converged'] is None
+                                                     for entry in getattr(self, section).values()))
+        with self.metrics.phase('arc', iteration=getattr(self, 'iteration', None)):
+            return super().run_arc(arc_kwargs, *args, **kwargs)
+
+    def process_arc_run(self, *args, **kwargs):
+        """
+        Process an ARC run and report the status of the claimed calculations to the batch registry.
+        Calculations deferred since they were running for other APIs are shared if they completed meanwhile,
+        otherwise they are marked as not converged, so the next iteration claims them again.
+        """
+        result = super().process_arc_run(*args, **kwargs)
+        if self.registry is not None:
+            for registry_key, (section, key) in list(self.claimed.items()):
+                converged = getattr(self, section)[key]['converged']
+                if converged is not None:
+                    self.registry.set_status(registry_key, 'completed' if converged else 'failed')
+                    del self.claimed[registry_key]
+            for registry_key, (section, key) in list(self.deferred.items()):
+                entry = getattr(self, section)[key]
+                if self.registry.get_status(registry_key) == 'completed':
+                    self.count_shared(section, entry, owner=None)
+                else:
+                    entry['converged'] = None
+                del self.deferred[registry_key]
+        return result
+
+    def determine_species_and_reactions_to_calculate(self, *args, **kwargs) -> bool:
+        """
+        Determine whether additional calculations are required,
+        including calculations of other APIs which did not complete yet.
+        Another iteration is also required if species constraints were relaxed after the last RMG run.
+
+        Returns:
+            bool: Whether additional calculations are required.
+        """
+        additional_calcs_required = super().determine_species_and_reactions_to_calculate(*args, **kwargs)
+        if self.constraint_tuner is not None and self.constraint_tuner.is_pending():
+            self.logger.info('Running another iteration with the relaxed species constraints.')
+            return True
+        return additional_calcs_required or any(entry['converged'] is None
+                                                for section in ['species', 'reactions']
+                                                for entry in getattr(self, section).values())
+
+    def check_constraint_limits(self):
+        """
+        Report the final model as constraint-limited if species constraints were relaxed after the last RMG run,
+        i.e., if no T3 iteration was left to use them.
+        """
+        if self.constraint_tuner is not None and self.constraint_tuner.is_pending():
+            relaxed = self.constraint_tuner.history[-1]['relaxed']
+            self.logger.warning(f'The final model is limited by the species constraints: flux reached the bounds in '
+                                f'the last RMG run, but no T3 iteration was left to use the relaxed bounds '
+                                f'({", ".join(f"{key}: {value}" for key, value in relaxed.items())}). '
+                                f'Consider increasing max_T3_iterations.')
+            self.metrics.record_iteration(getattr(self, 'iteration', None), constraint_limited=True)
+
+    def count_shared(self, section: str, entry: dict, owner: Optional[str]):
+        """
+        Count a calculation which was not computed by this API since another API of the batch computed it.
+
+        Args:
+            section (str): Either 'species' or 'reactions'.
+            entry (dict): The T3 species or reaction entry.
+            owner (str, optional): The project which computed it.
+        """
+        self.shared_qm_jobs += 1
+        self.logger.info(f'Not computing {section[:-1]} {entry["object"]}, '
+                         f'it was computed by {owner or "another API"}')
+        self.metrics.count(f'shared_{section}')
+
+    def release_claims(self):
+        """
+        Mark the calculations claimed by this API which did not complete as failed, so other APIs claim them.
+        Called if this API's T3 run fails.
+        """
+        if self.registry is not None:
+            for registry_key in self.claimed.keys():
+                self.registry.set_status(registry_key, 'failed')
+            self.claimed = dict()
+
+    def run_sa(self, *args, **kwargs):
+        """
+        Run a sensitivity analysis and record the resources it used.
+        """
+        with self.metrics.phase('sa', iteration=getattr(self, 'iteration', None)):
+            return super().run_sa(*args, **kwargs)
@@ -0,0 +1,240 @@
+"""
+APIOxy Zeneth module
+used for focusing mechanism generation with the degradants predicted by Zeneth
+
+Zeneth degradation predictions are read from their CSV (or tab-delimited) export. Column names vary between Zeneth
+versions and export settings, so columns are identified by keywords (e.g., any column with "smiles" in its name).
+The predicted degradants become targeted inputs of the API job:
+    - seed species: the degradants are added to the mixture at zero concentration, so RMG explores their chemistry
+    - targets: the most likely degradants are sensitivity analysis observables, so T3 refines their formation chemistry
+    - species constraints: the element bounds are tightened to the region spanned by the API and its degradants
+"""
+
+import csv
+from typing import List, Optional
+
+
+DEFAULT_ZENETH = {'min_likelihood': 'plausible',
+                  'max_species': 20,
+                  'max_observables': 5,
+                  }
+# Zeneth likelihood levels, most likely first
+LIKELIHOODS = ['certain', 'probable', 'plausible', 'equivocal', 'doubted', 'improbable', 'impossible']
+# Margins added to the largest element counts of the API and its degradants, e.g., for peroxyl radical intermediates
+CONSTRAINT_MARGINS = {'C': 0, 'O': 2, 'N': 0, 'S': 0, 'Si': 0, 'heavy': 2}
+PARENT_KEYWORDS = ['parent', 'precursor', 'reactant', 'starting']  # SMILES columns which are not of the degradant
+COLUMN_KEYWORDS = {'smiles': ['smiles'],
+                   'name': ['degradant', 'name', 'id'],
+                   'likelihood': ['likelihood'],
+                   'transformation': ['transformation', 'reaction', 'pathway'],
+                   'step': ['step', 'generation', 'depth', 'level'],
+                   }
+
+
+def get_zeneth_settings(zeneth: Optional[dict]) -> dict:
+    """
+    Get the Zeneth settings with defaults applied where not specified.
+
+    Args:
+        zeneth (dict, optional): The Zeneth settings of the input.
+
+    Returns:
+        dict: The Zeneth settings.
+    """
+    settings = dict(DEFAULT_ZENETH)
+    settings.update({key: value for key, value in (zeneth or dict()).items() if value is not None})
+    settings['min_likelihood'] = str(settings['min_likelihood']).lower()
+    if settings['min_likelihood'] not in LIKELIHOODS:
+        raise ValueError(f"The minimal Zeneth likelihood must be one of {LIKELIHOODS}, "
+                         f"got {settings['min_likelihood']}")
+    return settings
+
+
+def get_columns(header: List[str]) -> dict:
+    """
+    Identify the columns of a Zeneth export by keywords.
+
+    Args:
+        header (List[str]): The column names.
+
+    Returns:
+        dict: Keys are the ``COLUMN_KEYWORDS`` keys, values are column indices (``None`` if not found).
+    """
+    names = [name.strip().lower() for name in header]
+    smiles_columns = [i for i, name in enumerate(names) if 'smiles' in name]
+    columns = {'smiles': next((i for i in smiles_columns
+                               if not any(keyword in names[i] for keyword in PARENT_KEYWORDS)), None)}
+    for key, keywords in COLUMN_KEYWORDS.items():
+        if key == 'smiles':
+            continue
+        columns[key] = next((i for keyword in keywords for i, name in enumerate(names)
+                             if keyword in name and i not in columns.values() and i not in smiles_columns), None)
+    return columns
+
+
+def parse_zeneth_output(path: str) -> List[dict]:
+    """
+    Parse the predicted degradants of a Zeneth CSV (or tab-delimited) export.
+
+    Args:
+        path (str): The path to the Zeneth export file.
+
+    Returns:
+        List[dict]: Entries have the ``name``, ``smiles``, ``likelihood`` (lower case, ``None`` if not given),
+                    ``transformation`` and ``step`` keys, ordered as in the file.
+    """
+    with open(path, 'r', newline='', encoding='utf-8-sig') as f:
+        content = f.read()
+    try:
+        dialect = csv.Sniffer().sniff(content.split('\n', 1)[0], delimiters=',;\t')
+    except csv.Error:
+        dialect = csv.excel
+    rows = [row for row in csv.reader(content.splitlines(), dialect) if any(cell.strip() for cell in row)]
+    if not rows:
+        return list()
+    columns = get_columns(rows[0])
+    if columns['smiles'] is None:
+        raise ValueError(f'Could not find a SMILES column in the Zeneth output file {path}, got: {rows[0]}')
+
+    def get_cell(row: List[str], key: str) -> Optional[str]:
+        index = columns[key]
+        return row[index].strip() or None if index is not None and index < len(row) else None
+
+    degradants = list()
+    for i, row in enumerate(rows[1:]):
+        smiles = get_cell(row, 'smiles')
+        if smiles is None:
+            continue
+        likelihood = get_cell(row, 'likelihood')
+        step = get_cell(row, 'step')
+        degradants.append({'name': get_cell(row, 'name') or f'degradant_{i + 1}',
+                           'smiles': smiles,
+                           'likelihood': likelihood.lower() if likelihood is not None else None,
+                           'transformation': get_cell(row, 'transformation'),
+                           'step': int(step) if step is not None and step.isdigit() else None,
+                           })
+    return degradants
+
+
+def select_degradants(degradants: List[dict],
+                      min_likelihood: str = 'plausible',
+                      max_species: int = 20,
+                      exclude: Optional[List[str]] = None,
+                      ) -> List[dict]:
+    """
+    Select the unique degradants at least as likely as a threshold, most likely and earliest in the pathway first.
+    Degradants without a likelihood are considered at the threshold.
+
+    Args:
+        degradants (List[dict]): The parsed degradants.
+        min_likelihood (str, optional): The minimal likelihood.
+        max_species (int, optional): The maximal number of degradants to select.
+        exclude (List[str], optional): Species identities to exclude, e.g., of the API and the mixture species.
+
+    Returns:
+        List[dict]: The selected degradants, each with an ``identity`` key.
+    """
+    from apioxy.cache import get_canonical_species
+
+    threshold = LIKELIHOODS.index(min_likelihood)
+    identities = set(exclude or list())
+    selected = list()
+    for degradant in degradants:
+        rank = LIKELIHOODS.index(degradant['likelihood']) if degradant['likelihood'] in LIKELIHOODS else threshold
+        if rank > threshold:
+            continue
+        identity = get_canonical_species({'label': 'degradant', 'smiles': degradant['smiles']})['identity']
+        if identity in identities:
+            continue
+        identities.add(identity)
+        selected.append(dict(degradant, identity=identity, rank=rank))
+    selected.sort(key=lambda degradant: (degradant['rank'],
+                                         degradant['step'] if degradant['step'] is not None else float('inf')))
+    return selected[:max_species]
+
+
+def get_element_counts(species_dict: dict) -> dict:
+    """
+    Get the element counts of a species.
+
+    Args:
+        species_dict (dict): The species dictionary.
+
+    Returns:
+        dict: Keys are element symbols, values are counts.
+    """
+    from apioxy.prescreen import get_molecule
+
+    counts = dict()
+    for atom in get_molecule(species_dict).vertices:
+        counts[atom.element.symbol] = counts.get(atom.element.symbol, 0) + 1
+    return counts
+
+
+def tighten_species_constraints(species_constraints: dict,
+                                element_counts: List[dict],
+                                margins: Optional[dict] = None,
+                                ) -> dict:
+    """
+    Tighten species constraints to the elements spanned by the API and its degradants, plus margins.
+    Constraints are never relaxed.
+
+    Args:
+        species_constraints (dict): The RMG species constraints.
+        element_counts (List[dict]): The element counts of the API and its degradants.
+        margins (dict, optional): Keys are element symbols or 'heavy', values are the margins added to the largest
+                                  counts, ``CONSTRAINT_MARGINS`` by default.
+
+    Returns:
+        dict: The tightened RMG species constraints.
+    """
+    constraints = dict(species_constraints)
+    for element, margin in (margins or CONSTRAINT_MARGINS).items():
+        key = f'max_{element}_atoms'
+        if key not in constraints:
+            continue
+        if element == 'heavy':
+            bound = max(sum(value for symbol, value in counts.items() if symbol != 'H') for counts in element_counts)
+        else:
+            bound = max(counts.get(element, 0) for counts in element_counts)
+        constraints[key] = min(constraints[key], bound + margin)
+    return constraints
+
+
+def apply_zeneth_output(path: str,
+                        rmg: dict,
+                        api_dict: dict,
+                        settings: Optional[dict] = None,
+                        ) -> List[dict]:
+    """
+    Focus an API job with the degradants of a Zeneth output: add them as seed species, mark the most likely ones
+    as sensitivity analysis observables, and tighten the species constraints.
+
+    Args:
+        path (str): The path to the Zeneth export file.
+        rmg (dict): The RMG dictionary of the API job, modified in place.
+            Its species constraints must already be set, and its species must include the API.
+        api_dict (dict): The API species dictionary.
+        settings (dict, optional): The Zeneth settings, see ``DEFAULT_ZENETH``.
+
+    Returns:
+        List[dict]: The degradants added to the job.
+    """
+    from apioxy.cache import get_canonical_species
+
+    settings = settings or get_zeneth_settings(None)
+    exclude = [get_canonical_species(spc)['identity'] for spc in rmg['species']]
+    degradants = select_degradants(parse_zeneth_output(path),
+                                   min_likelihood=settings['min_likelihood'],
+                                   max_species=settings['max_species'],
+                                   exclude=exclude,
+                                   )
+    for i, degradant in enumerate(degradants):
+        species_dict = {'label': f'zeneth_{i + 1}', 'smiles': degradant['smiles'], 'concentration': 0}
+        if i < settings['max_observables']:
+            species_dict['observable'] = True
+        rmg['species'].append(species_dict)
+    if degradants:
+        element_counts = [get_element_counts(api_dict)] + [get_element_counts(degradant) for degradant in degradants]
+        rmg['species_constraints'] = tighten_species_constraints(rmg['species_constraints'], element_counts)
+    return degradants
@@ -0,0 +1,3 @@
+"""
+APIOxy benchmarks, see run_benchmarks.py
+"""
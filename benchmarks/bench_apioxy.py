@@ -0,0 +1,119 @@
+"""
+APIOxy orchestration benchmarks
+measures APIOxy construction, apply_default_settings, and the execute overhead for 1-500 APIs
+with the local T3 stand-in, so the time measured is APIOxy's own (input handling, jobs, manifest, cache, metrics)
+"""
+
+import copy
+import logging
+import os
+import shutil
+import tempfile
+from typing import List
+
+from benchmarks.common import Benchmark
+
+API_SIZES = [1, 10, 100, 500]
+QUICK_API_SIZES = [1, 10, 50]
+
+
+def get_input(number_of_apis: int) -> dict:
+    """
+    Get a deterministic APIOxy input with a number of APIs.
+
+    Args:
+        number_of_apis (int): The number of APIs.
+
+    Returns:
+        dict: The apioxy, rmg, t3 and qm input blocks.
+    """
+    api_structures = [{'label': f'api_{i}', 'smiles': 'C' * (i % 9 + 2) + 'O' * (i % 3) + 'N' * (i % 2)}
+                      for i in range(number_of_apis)]
+    return {'apioxy': {'project': 'benchmark',
+                       'model_level': 1,
+                       'api_structures': api_structures,
+                       'zeneth_output_paths': [None] * number_of_apis,
+                       'run_in_parallel': False,
+                       },
+            'rmg': {'species': [{'label': 'water', 'smiles': 'O', 'concentration': 55.0, 'solvent': True},
+                                {'label': 'O2', 'smiles': '[O][O]', 'concentration': 0.0003},
+                                {'label': 'AIBN', 'smiles': 'CC(C)(C#N)N=NC(C)(C)C#N', 'concentration': 0.001},
+                                ],
+                    },
+            't3': {'options': {'max_T3_iterations': 2}},
+            'qm': dict(),
+            }
+
+
+class APIOxyState(object):
+    """
+    A fresh temporary project for a benchmark repetition.
+    """
+
+    def __init__(self, number_of_apis: int, construct: bool = False):
+        import apioxy.libraries
+
+        self.path = tempfile.mkdtemp(prefix='apioxy_benchmark_')
+        # keep the library index of the stand-in database out of the repository's Cache folder
+        apioxy.libraries.CACHE_BASE_PATH = os.path.join(self.path, 'Cache')
+        apioxy.libraries._LIBRARY_INDICES.clear()
+        self.input = get_input(number_of_apis)
+        self.input['apioxy']['cache'] = {'path': os.path.join(self.path, 'Cache', 'results')}
+        self.input['apioxy']['seeds'] = {'path': os.path.join(self.path, 'Cache', 'seeds')}
+        self.apioxy_object = self.construct() if construct else None
+
+    def construct(self):
+        from apioxy.main import APIOxy
+
+        return APIOxy(project='benchmark',
+                      project_directory=os.path.join(self.path, 'benchmark'),
+                      apioxy=copy.deepcopy(self.input['apioxy']),
+                      rmg=copy.deepcopy(self.input['rmg']),
+                      t3=copy.deepcopy(self.input['t3']),
+                      qm=copy.deepcopy(self.input['qm']),
+                      verbose=logging.WARNING,
+                      )
+
+    def reset_settings(self):
+        """
+        Restore the raw input blocks, so apply_default_settings runs on unprocessed input again.
+        """
+        self.apioxy_object.apioxy = copy.deepcopy(self.input['apioxy'])
+        self.apioxy_object.rmg = copy.deepcopy(self.input['rmg'])
+        self.apioxy_object.t3 = copy.deepcopy(self.input['t3'])
+        self.apioxy_object.qm = copy.deepcopy(self.input['qm'])
+        return self
+
+    def remove(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def get_benchmarks(quick: bool = False) -> List[Benchmark]:
+    """
+    Get the APIOxy orchestration benchmarks.
+
+    Args:
+        quick (bool, optional): Whether to only use small problem sizes.
+
+    Returns:
+        List[Benchmark]: The benchmarks.
+    """
+    benchmarks = list()
+    for n in QUICK_API_SIZES if quick else API_SIZES:
+        repeat = 5 if n <= 100 else 3
+        benchmarks.append(Benchmark(name=f'apioxy.construct[{n}]',
+                                    setup=lambda n=n: APIOxyState(n),
+                                    run=lambda state: state.construct(),
+                                    repeat=repeat,
+                                    teardown=APIOxyState.remove))
+        benchmarks.append(Benchmark(name=f'apioxy.apply_default_settings[{n}]',
+                                    setup=lambda n=n: APIOxyState(n, construct=True).reset_settings(),
+                                    run=lambda state: state.apioxy_object.apply_default_settings(),
+                                    repeat=repeat,
+                                    teardown=APIOxyState.remove))
+        benchmarks.append(Benchmark(name=f'apioxy.execute[{n}]',
+                                    setup=lambda n=n: APIOxyState(n, construct=True),
+                                    run=lambda state: state.apioxy_object.execute(),
+                                    repeat=repeat,
+                                    teardown=APIOxyState.remove))
+    return benchmarks
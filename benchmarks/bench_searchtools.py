@@ -0,0 +1,173 @@
+"""
+searchtools benchmarks
+measures index construction and query latency on deterministic synthetic mechanisms of 1k-500k reactions
+"""
+
+import os
+import random
+import shutil
+import tempfile
+from typing import List, Tuple
+
+from benchmarks.common import Benchmark
+
+REACTION_SIZES = [1000, 10000, 100000, 500000]
+QUICK_REACTION_SIZES = [1000, 10000]
+QUERIES = 1000
+LIBRARIES = ['API_soup', 'BurkeH2O2inN2', 'NOx2018']
+
+
+def get_synthetic_mechanism(number_of_reactions: int, seed: int = 0) -> Tuple[list, list]:
+    """
+    Get a deterministic synthetic mechanism.
+    There is one species per five reactions, the 'API' species takes part in about 1% of the reactions,
+    and about 10% of the reactions come from kinetics libraries.
+
+    Args:
+        number_of_reactions (int): The number of reactions.
+        seed (int, optional): The random seed.
+
+    Returns:
+        Tuple[list, list]: The species and the reactions.
+    """
+    from rmgpy.kinetics import Arrhenius
+    from rmgpy.reaction import Reaction
+    from rmgpy.species import Species
+
+    rng = random.Random(seed)
+    number_of_species = max(number_of_reactions // 5, 10)
+    species = [Species(label='API', index=0).from_smiles('CC(C)Cc1ccc(C(C)C(=O)O)cc1')]
+    species += [Species(label=f'S({i})', index=i).from_smiles('C' * (i % 12 + 1) + 'O' * (i % 4))
+                for i in range(1, number_of_species)]
+    reactions = list()
+    for i in range(number_of_reactions):
+        if rng.random() < 0.01:
+            reactants = [species[0], rng.choice(species)]
+        else:
+            reactants = rng.sample(species, rng.choice([1, 2]))
+        products = rng.sample(species, rng.choice([1, 2]))
+        rxn = Reaction(index=i + 1,
+                       reactants=reactants,
+                       products=products,
+                       kinetics=Arrhenius(A=10 ** rng.uniform(6, 14), n=rng.uniform(-1, 3),
+                                          Ea=rng.uniform(0, 2e5), T0=1.0))
+        if rng.random() < 0.1:
+            rxn.library = rng.choice(LIBRARIES)
+        reactions.append(rxn)
+    return species, reactions
+
+
+class MechanismState(object):
+    """
+    A synthetic mechanism shared by the repetitions of the benchmarks of one size.
+    """
+    _cache = dict()
+
+    def __init__(self, number_of_reactions: int):
+        if number_of_reactions not in self._cache:
+            self._cache.clear()
+            self._cache[number_of_reactions] = get_synthetic_mechanism(number_of_reactions)
+        self.species, self.reactions = self._cache[number_of_reactions]
+        rng = random.Random(1)
+        self.labels = [rng.choice(self.species).label for _ in range(QUERIES)]
+        self.indices = [rng.randint(1, number_of_reactions) for _ in range(QUERIES)]
+        self.index = self.graph = self.table = self.path = None
+
+    def with_index(self):
+        from searchtools.index import MechanismIndex
+
+        self.index = MechanismIndex(species=self.species, reactions=self.reactions)
+        return self
+
+    def with_graph(self):
+        from searchtools.pathways import PathwayGraph
+
+        self.graph = PathwayGraph(self.reactions)
+        return self
+
+    def with_table_file(self):
+        from searchtools.table import MechanismTable
+
+        self.path = tempfile.mkdtemp(prefix='apioxy_benchmark_')
+        MechanismTable.from_mechanism(self.species, self.reactions).save(os.path.join(self.path, 'mechanism.bin'))
+        return self
+
+    def remove(self):
+        if self.path is not None:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+
+def run_species_queries(state: MechanismState):
+    for label in state.labels:
+        state.index.get_reactions_of_species(label)
+
+
+def run_reaction_queries(state: MechanismState):
+    for index in state.indices:
+        state.index.get_reaction(index)
+
+
+def run_kinetics(state: MechanismState):
+    from searchtools.kinetics import KineticsEvaluator
+
+    KineticsEvaluator(state.reactions).get_forward_rate_coefficients()
+
+
+def run_pathway_queries(state: MechanismState):
+    for label in state.labels[:10]:
+        state.graph.k_shortest_pathways(label, k=3)
+
+
+def run_table_queries(state: MechanismState):
+    from searchtools.table import MechanismTable
+
+    table = MechanismTable.load(os.path.join(state.path, 'mechanism.bin'))
+    for label in state.labels[:100]:
+        table.get_reaction_rows_of_species(label)
+
+
+def get_benchmarks(quick: bool = False) -> List[Benchmark]:
+    """
+    Get the searchtools benchmarks.
+
+    Args:
+        quick (bool, optional): Whether to only use small problem sizes.
+
+    Returns:
+        List[Benchmark]: The benchmarks.
+    """
+    benchmarks = list()
+    for n in QUICK_REACTION_SIZES if quick else REACTION_SIZES:
+        repeat = 5 if n <= 100000 else 3
+        benchmarks += [
+            Benchmark(name=f'searchtools.index_build[{n}]',
+                      setup=lambda n=n: MechanismState(n),
+                      run=lambda state: state.with_index(),
+                      repeat=repeat),
+            Benchmark(name=f'searchtools.reactions_of_species[{n}]',
+                      setup=lambda n=n: MechanismState(n).with_index(),
+                      run=run_species_queries,
+                      repeat=repeat),
+            Benchmark(name=f'searchtools.reaction_by_index[{n}]',
+                      setup=lambda n=n: MechanismState(n).with_index(),
+                      run=run_reaction_queries,
+                      repeat=repeat),
+            Benchmark(name=f'searchtools.forward_rates[{n}]',
+                      setup=lambda n=n: MechanismState(n),
+                      run=run_kinetics,
+                      repeat=repeat),
+            Benchmark(name=f'searchtools.pathway_graph_build[{n}]',
+                      setup=lambda n=n: MechanismState(n),
+                      run=lambda state: state.with_graph(),
+                      repeat=repeat),
+            Benchmark(name=f'searchtools.pathway_queries[{n}]',
+                      setup=lambda n=n: MechanismState(n).with_graph(),
+                      run=run_pathway_queries,
+                      repeat=repeat),
+            Benchmark(name=f'searchtools.table_load_and_query[{n}]',
+                      setup=lambda n=n: MechanismState(n).with_table_file(),
+                      run=run_table_queries,
+                      repeat=repeat,
+                      teardown=MechanismState.remove),
+        ]
+    return benchmarks
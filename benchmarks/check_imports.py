@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+Check the APIOxy start-up import budget.
+Importing the modules the command line needs to parse arguments and validate inputs must not import
+T3, ARC, RMG or Cantera, and must stay within a time budget.
+Runs in fresh interpreters with the installed packages (not the benchmark stand-ins) and exits non-zero on failure.
+
+Example:
+    python benchmarks/check_imports.py --budget 0.5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import REPO_PATH
+
+DEFAULT_BUDGET = 0.5  # seconds
+HEAVY_PACKAGES = ['t3', 'arc', 'rmgpy', 'cantera', 'IPython']
+STARTUP_MODULES = ['apioxy', 'apioxy.main', 'apioxy.campaign', 'apioxy.parsing', 'apioxy.cache']
+
+PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+for name in {modules!r}:
+    __import__(name)
+elapsed = time.perf_counter() - t0
+heavy = sorted({{name.split('.')[0] for name in sys.modules}} & set({heavy!r}))
+print(json.dumps({{'time': elapsed, 'heavy': heavy}}))
+"""
+
+
+def measure_startup(modules: List[str] = None, repeat: int = 5) -> dict:
+    """
+    Measure the import time of the start-up modules in fresh interpreters.
+
+    Args:
+        modules (List[str], optional): The modules to import, ``STARTUP_MODULES`` by default.
+        repeat (int, optional): The number of interpreters to start.
+
+    Returns:
+        dict: The best ``time`` in seconds and the ``heavy`` packages which were imported.
+    """
+    code = PROBE.format(modules=modules or STARTUP_MODULES, heavy=HEAVY_PACKAGES)
+    best = None
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-c', code], cwd=REPO_PATH, capture_output=True, text=True,
+                                check=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        if best is None or result['time'] < best['time']:
+            best = result
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='APIOxy start-up import budget check')
+    parser.add_argument('-b', '--budget', type=float, default=DEFAULT_BUDGET,
+                        help=f'the maximal import time of the start-up modules in seconds, default: {DEFAULT_BUDGET}')
+    args = parser.parse_args()
+
+    result = measure_startup()
+    print(f'Start-up modules imported in {result["time"]:.3f} s (budget: {args.budget:.3f} s)')
+    failed = False
+    if result['heavy']:
+        print(f'Start-up imported heavy packages: {", ".join(result["heavy"])}')
+        failed = True
+    if result['time'] > args.budget:
+        print('Start-up import time exceeds the budget')
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+APIOxy benchmarks common module
+used for setting up the local T3/ARC/RMG stand-ins and for timing benchmarks
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, NamedTuple, Optional
+
+BENCHMARKS_PATH = os.path.abspath(os.path.dirname(__file__))
+STUBS_PATH = os.path.join(BENCHMARKS_PATH, 'stubs')
+REPO_PATH = os.path.dirname(BENCHMARKS_PATH)
+RESULTS_PATH = os.path.join(BENCHMARKS_PATH, 'results')
+
+
+class Benchmark(NamedTuple):
+    """
+    A benchmark, ``run`` is timed on a fresh ``setup()`` state in each repetition.
+    """
+    name: str
+    setup: Callable[[], object]
+    run: Callable[[object], None]
+    repeat: int = 5
+    teardown: Optional[Callable[[object], None]] = None
+
+
+def use_stubs():
+    """
+    Make the local stand-ins of T3, ARC, RMG and IPython importable instead of the installed packages,
+    so benchmark results only depend on APIOxy's own code.
+    """
+    for name in list(sys.modules):
+        if name.split('.')[0] in ('t3', 'arc', 'rmgpy', 'IPython'):
+            del sys.modules[name]
+    if STUBS_PATH not in sys.path:
+        sys.path.insert(0, STUBS_PATH)
+    if REPO_PATH not in sys.path:
+        sys.path.insert(1, REPO_PATH)
+
+
+def time_benchmark(benchmark: Benchmark) -> Dict[str, float]:
+    """
+    Time a benchmark.
+
+    Args:
+        benchmark (Benchmark): The benchmark.
+
+    Returns:
+        Dict[str, float]: The ``min``, ``median`` and ``mean`` times in seconds, and the number of repetitions.
+    """
+    times = list()
+    for _ in range(benchmark.repeat):
+        state = benchmark.setup()
+        t0 = time.perf_counter()
+        benchmark.run(state)
+        times.append(time.perf_counter() - t0)
+        if benchmark.teardown is not None:
+            benchmark.teardown(state)
+    times.sort()
+    return {'min': times[0],
+            'median': times[len(times) // 2],
+            'mean': sum(times) / len(times),
+            'repeat': len(times),
+            }
+
+
+def get_git_commit() -> Dict[str, object]:
+    """
+    Get the git commit of the APIOxy repository.
+
+    Returns:
+        Dict[str, object]: The ``commit`` hash and whether the working tree is ``dirty``.
+    """
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_PATH, capture_output=True, text=True,
+                                check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_PATH,
+                                capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return {'commit': 'unknown', 'dirty': True}
+    return {'commit': commit, 'dirty': bool(status)}
+
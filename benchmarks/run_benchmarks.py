@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+Run the APIOxy benchmarks with the local T3/ARC/RMG stand-ins.
+Results are saved to benchmarks/results/<git commit>.json, so they can be compared across commits.
+Benchmarks which fail to import a package they need are reported as skipped.
+
+Examples:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --quick --filter apioxy.execute
+    python benchmarks/run_benchmarks.py --compare 1a2b3c4
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.check_imports import measure_startup
+from benchmarks.common import RESULTS_PATH, Benchmark, get_git_commit, time_benchmark, use_stubs
+
+
+def parse_command_line_arguments(command_line_args=None) -> argparse.Namespace:
+    """
+    Parse command-line arguments.
+    """
+    parser = argparse.ArgumentParser(description='APIOxy benchmarks')
+    parser.add_argument('-q', '--quick', action='store_true', default=False,
+                        help='only run small problem sizes')
+    parser.add_argument('-f', '--filter', type=str, default='*',
+                        help='only run benchmarks whose name matches this pattern, e.g. "searchtools.*"')
+    parser.add_argument('-o', '--output', type=str, default=None,
+                        help='the results file, default: benchmarks/results/<git commit>.json')
+    parser.add_argument('-c', '--compare', type=str, default=None,
+                        help='a results file or a git commit (prefix) to compare the results with')
+    parser.add_argument('-t', '--threshold', type=float, default=0.25,
+                        help='the relative slowdown of the median time reported as a regression, default: 0.25')
+    return parser.parse_args(command_line_args)
+
+
+def get_results_path(reference: str) -> str:
+    """
+    Get the path of a results file given as a path or as a git commit (prefix).
+    """
+    if os.path.isfile(reference):
+        return reference
+    if os.path.isdir(RESULTS_PATH):
+        matches = sorted(name for name in os.listdir(RESULTS_PATH) if name.startswith(reference))
+        if matches:
+            return os.path.join(RESULTS_PATH, matches[0])
+    raise ValueError(f'Could not find benchmark results for {reference}')
+
+
+def compare(results: dict, reference: dict, threshold: float) -> bool:
+    """
+    Print a comparison of benchmark results.
+
+    Returns:
+        bool: Whether any benchmark regressed beyond the threshold.
+    """
+    regressed = False
+    print(f'\nComparing with {reference["commit"][:10]}:')
+    for name, entry in results['results'].items():
+        if name not in reference['results']:
+            continue
+        ratio = entry['median'] / reference['results'][name]['median']
+        flag = ''
+        if ratio > 1 + threshold:
+            flag, regressed = '  REGRESSION', True
+        print(f'{name:<50} {reference["results"][name]["median"]:>12.6f} -> {entry["median"]:>12.6f} s'
+              f'  x{ratio:.2f}{flag}')
+    return regressed
+
+
+def main():
+    args = parse_command_line_arguments()
+    use_stubs()
+    from benchmarks import bench_apioxy, bench_searchtools
+
+    benchmarks = [Benchmark(name='startup.import_time',
+                            setup=lambda: None,
+                            run=lambda state: measure_startup(repeat=1))]
+    benchmarks += bench_apioxy.get_benchmarks(args.quick) + bench_searchtools.get_benchmarks(args.quick)
+    benchmarks = [b for b in benchmarks if fnmatch.fnmatch(b.name, args.filter)]
+
+    git = get_git_commit()
+    results = {'commit': git['commit'],
+               'dirty': git['dirty'],
+               'timestamp': time.time(),
+               'python': platform.python_version(),
+               'platform': platform.platform(),
+               'quick': args.quick,
+               'results': dict(),
+               'skipped': dict(),
+               }
+    for benchmark in benchmarks:
+        try:
+            results['results'][benchmark.name] = time_benchmark(benchmark)
+        except ImportError as e:
+            # a package this benchmark needs is missing, the other benchmarks still run
+            results['skipped'][benchmark.name] = f'{e.__class__.__name__}: {e}'
+            print(f'{benchmark.name:<50} skipped ({results["skipped"][benchmark.name]})')
+            continue
+        print(f'{benchmark.name:<50} {results["results"][benchmark.name]["median"]:>12.6f} s')
+
+    output = args.output or os.path.join(RESULTS_PATH, f'{git["commit"]}.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    if os.path.isfile(output):
+        # keep the results of benchmarks which were not run this time
+        with open(output, 'r') as f:
+            previous = json.load(f)
+        results['results'] = dict(previous.get('results', dict()), **results['results'])
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f'\nResults saved to {output}')
+
+    if args.compare is not None:
+        with open(get_results_path(args.compare), 'r') as f:
+            reference = json.load(f)
+        if compare(results, reference, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,3 @@
+"""
+A stand-in for IPython, used by the searchtools benchmarks.
+"""
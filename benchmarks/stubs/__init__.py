@@ -0,0 +1,5 @@
+"""
+Deterministic local stand-ins for the T3, ARC, RMG and IPython packages used by the benchmarks.
+They only implement the interfaces APIOxy and searchtools use, so benchmarks run offline on any machine
+and measure APIOxy's own overhead rather than the chemistry codes.
+"""
@@ -0,0 +1,3 @@
+"""
+A stand-in for ARC, used by the APIOxy benchmarks.
+"""
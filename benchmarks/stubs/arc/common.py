@@ -0,0 +1,48 @@
+"""
+A stand-in for arc.common.
+"""
+
+import os
+import time
+
+import yaml
+
+
+def read_yaml_file(path: str):
+    with open(path, 'r') as f:
+        return yaml.load(stream=f, Loader=yaml.FullLoader)
+
+
+def save_yaml_file(path: str, content):
+    if os.path.dirname(path) and not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'w') as f:
+        f.write(yaml.dump(data=content))
+
+
+def get_git_commit(path: str = None):
+    return '', ''
+
+
+def get_git_branch(path: str = None):
+    return ''
+
+
+def time_lapse(t0: float) -> str:
+    return time.strftime('%H:%M:%S', time.gmtime(time.time() - t0))
+
+
+def is_str_float(value) -> bool:
+    try:
+        float(value)
+        return True
+    except (ValueError, TypeError):
+        return False
+
+
+def is_str_int(value) -> bool:
+    try:
+        int(value)
+        return True
+    except (ValueError, TypeError):
+        return False
@@ -0,0 +1,14 @@
+"""
+A stand-in for arc.level.
+"""
+
+
+class Level(object):
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+
+    def as_dict(self) -> dict:
+        return dict(self.kwargs)
+
+    def __repr__(self) -> str:
+        return f'Level({", ".join(f"{k}={v!r}" for k, v in sorted(self.kwargs.items()))})'
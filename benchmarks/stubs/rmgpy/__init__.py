@@ -0,0 +1,8 @@
+"""
+A stand-in for RMG-Py, used by the APIOxy and searchtools benchmarks.
+"""
+
+import os
+import tempfile
+
+settings = {'database.directory': os.path.join(tempfile.gettempdir(), 'apioxy_benchmarks', 'RMG-database', 'input')}
@@ -0,0 +1,11 @@
+"""
+A stand-in for rmgpy.chemkin.
+"""
+
+
+def read_reactions_block(f, species_dict, read_comments=True):
+    raise NotImplementedError('Reading chemkin files is not part of the benchmark stand-in.')
+
+
+def load_chemkin_file(chemkin_path, dictionary_path):
+    raise NotImplementedError('Reading chemkin files is not part of the benchmark stand-in.')
@@ -0,0 +1,5 @@
+"""
+A stand-in for rmgpy.constants.
+"""
+
+R = 8.314462618
@@ -0,0 +1,3 @@
+"""
+A stand-in for rmgpy.data.
+"""
@@ -0,0 +1,137 @@
+"""
+A stand-in for rmgpy.kinetics.
+"""
+
+import math
+
+from rmgpy.constants import R
+
+
+class Quantity(object):
+    def __init__(self, value_si):
+        # (value, units) tuples are accepted as by rmgpy, the units are assumed to be SI
+        self.value_si = value_si[0] if isinstance(value_si, tuple) else value_si
+
+
+class Arrhenius(object):
+    def __init__(self, A=1.0, n=0.0, Ea=0.0, T0=1.0, comment=''):
+        self.A, self.n, self.Ea, self.T0 = Quantity(A), Quantity(n), Quantity(Ea), Quantity(T0)
+        self.comment = comment
+
+    def is_pressure_dependent(self) -> bool:
+        return False
+
+    def get_rate_coefficient(self, T: float, P: float = 0.0) -> float:
+        return self.A.value_si * (T / self.T0.value_si) ** self.n.value_si * math.exp(-self.Ea.value_si / (R * T))
+
+    def __repr__(self) -> str:
+        return f'Arrhenius(A={self.A.value_si!r}, n={self.n.value_si!r}, Ea={self.Ea.value_si!r}, T0={self.T0.value_si!r})'
+
+
+class MultiArrhenius(object):
+    def __init__(self, arrhenius=None, comment=''):
+        self.arrhenius = list(arrhenius or list())
+        self.comment = comment
+
+    def is_pressure_dependent(self) -> bool:
+        return False
+
+    def get_rate_coefficient(self, T: float, P: float = 0.0) -> float:
+        return sum(k.get_rate_coefficient(T) for k in self.arrhenius)
+
+
+class PDepArrhenius(object):
+    def __init__(self, pressures=None, arrhenius=None, highPlimit=None, comment=''):
+        self.pressures = Quantity(pressures or list())
+        self.pressures.value_si = list(self.pressures.value_si)
+        self.arrhenius = list(arrhenius or list())
+        self.comment = comment
+
+    def is_pressure_dependent(self) -> bool:
+        return True
+
+    def get_rate_coefficient(self, T: float, P: float = 0.0) -> float:
+        pressures = self.pressures.value_si
+        if P in pressures:
+            return self.arrhenius[pressures.index(P)].get_rate_coefficient(T)
+        low, high = 0, -1
+        for i, pressure in enumerate(pressures):
+            if pressure <= P:
+                low = i
+            if pressure > P:
+                high = i
+                break
+        P_low, P_high = pressures[low], pressures[high] if high >= 0 else 0.0
+        k_low = self.arrhenius[low].get_rate_coefficient(T)
+        if P_high == 0.0 or P_low == P_high:
+            return k_low
+        k_high = self.arrhenius[high].get_rate_coefficient(T)
+        if k_low == k_high == 0.0:
+            return 0.0
+        return 10 ** (math.log10(P / P_low) / math.log10(P_high / P_low)
+                      * math.log10(k_high / k_low) + math.log10(k_low))
+
+
+class MultiPDepArrhenius(object):
+    def __init__(self, arrhenius=None, comment=''):
+        self.arrhenius = list(arrhenius or list())
+        self.comment = comment
+
+    def is_pressure_dependent(self) -> bool:
+        return True
+
+    def get_rate_coefficient(self, T: float, P: float = 0.0) -> float:
+        return sum(k.get_rate_coefficient(T, P) for k in self.arrhenius)
+
+
+class Chebyshev(object):
+    def __init__(self, coeffs=None, kunits='s^-1', Tmin=300.0, Tmax=2000.0, Pmin=1e3, Pmax=1e7, comment=''):
+        self.coeffs = Quantity([list(row) for row in coeffs])
+        self.Tmin, self.Tmax, self.Pmin, self.Pmax = Quantity(Tmin), Quantity(Tmax), Quantity(Pmin), Quantity(Pmax)
+        self.kunits = kunits
+        self.degreeT, self.degreeP = len(self.coeffs.value_si), len(self.coeffs.value_si[0])
+        self.comment = comment
+
+    def is_pressure_dependent(self) -> bool:
+        return True
+
+    def get_rate_coefficient(self, T: float, P: float = 0.0) -> float:
+        T_min, T_max = self.Tmin.value_si, self.Tmax.value_si
+        P_min, P_max = self.Pmin.value_si, self.Pmax.value_si
+        T_red = (2.0 / T - 1.0 / T_min - 1.0 / T_max) / (1.0 / T_max - 1.0 / T_min)
+        P_red = (2.0 * math.log10(P) - math.log10(P_min) - math.log10(P_max)) / (math.log10(P_max) - math.log10(P_min))
+        k = 0.0
+        for t in range(self.degreeT):
+            for p in range(self.degreeP):
+                k += self.coeffs.value_si[t][p] * math.cos(t * math.acos(T_red)) * math.cos(p * math.acos(P_red))
+        return 10.0 ** k
+
+
+class ThirdBody(object):
+    def __init__(self, arrheniusLow=None, efficiencies=None, comment=''):
+        self.arrheniusLow = arrheniusLow
+        self.efficiencies = dict(efficiencies or dict())
+        self.comment = comment
+
+    def is_pressure_dependent(self) -> bool:
+        return True
+
+
+class Lindemann(object):
+    def __init__(self, arrheniusHigh=None, arrheniusLow=None, efficiencies=None, comment=''):
+        self.arrheniusHigh, self.arrheniusLow = arrheniusHigh, arrheniusLow
+        self.efficiencies = dict(efficiencies or dict())
+        self.comment = comment
+
+    def is_pressure_dependent(self) -> bool:
+        return True
+
+
+class Troe(Lindemann):
+    def __init__(self, arrheniusHigh=None, arrheniusLow=None, alpha=0.0, T3=None, T1=None, T2=None,
+                 efficiencies=None, comment=''):
+        super().__init__(arrheniusHigh=arrheniusHigh, arrheniusLow=arrheniusLow, efficiencies=efficiencies,
+                         comment=comment)
+        self.alpha = alpha
+        self.T3, self.T1 = Quantity(T3), Quantity(T1)
+        self.T2 = Quantity(T2) if T2 is not None else None
@@ -0,0 +1,56 @@
+"""
+A stand-in for rmgpy.molecule, molecules are represented by their element counts only.
+"""
+
+import hashlib
+import re
+
+
+class Element(object):
+    def __init__(self, symbol: str):
+        self.symbol = symbol
+
+
+class Atom(object):
+    def __init__(self, symbol: str):
+        self.element = Element(symbol)
+        self.edges = dict()
+
+    def is_hydrogen(self) -> bool:
+        return self.element.symbol == 'H'
+
+
+class Molecule(object):
+    def __init__(self, smiles: str = '', multiplicity: int = 1):
+        self.smiles = smiles
+        self.multiplicity = multiplicity
+        self.vertices = list()
+
+    def from_smiles(self, smiles: str) -> 'Molecule':
+        self.smiles = smiles
+        self.vertices = [Atom(symbol.capitalize()) for symbol in re.findall(r'Cl|Br|[BCNOSPFIcnosp]', smiles)]
+        heavy = len(self.vertices)
+        self.vertices += [Atom('H') for _ in range(max(2 * heavy + 2 - smiles.count('='), 0))]
+        self.multiplicity = 2 if '[' in smiles and 'H]' not in smiles else 1
+        return self
+
+    def from_adjacency_list(self, adjlist: str) -> 'Molecule':
+        return self.from_smiles(adjlist)
+
+    def get_formula(self) -> str:
+        counts = dict()
+        for atom in self.vertices:
+            counts[atom.element.symbol] = counts.get(atom.element.symbol, 0) + 1
+        return ''.join(f'{symbol}{count}' for symbol, count in sorted(counts.items()))
+
+    def to_smiles(self) -> str:
+        return self.smiles
+
+    def to_inchi_key(self) -> str:
+        return hashlib.sha1(self.smiles.encode()).hexdigest()[:27].upper()
+
+    def generate_resonance_structures(self) -> list:
+        return [self]
+
+    def is_isomorphic(self, other) -> bool:
+        return self.smiles == getattr(other, 'smiles', None)
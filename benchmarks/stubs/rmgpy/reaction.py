@@ -0,0 +1,21 @@
+"""
+A stand-in for rmgpy.reaction, reverse kinetics are derived from a fixed equilibrium constant.
+"""
+
+from rmgpy.kinetics import Arrhenius
+
+
+class Reaction(object):
+    def __init__(self, index: int = -1, reactants=None, products=None, kinetics=None, reversible: bool = True):
+        self.index = index
+        self.reactants = list(reactants or list())
+        self.products = list(products or list())
+        self.kinetics = kinetics
+        self.reversible = reversible
+
+    def generate_reverse_rate_coefficient(self):
+        k = self.kinetics
+        return Arrhenius(A=k.A.value_si * 1e-3, n=k.n.value_si, Ea=k.Ea.value_si + 4e4, T0=k.T0.value_si)
+
+    def __str__(self) -> str:
+        return f"{' + '.join(sp.label for sp in self.reactants)} <=> {' + '.join(sp.label for sp in self.products)}"
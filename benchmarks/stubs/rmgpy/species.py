@@ -0,0 +1,28 @@
+"""
+A stand-in for rmgpy.species.
+"""
+
+from rmgpy.molecule import Molecule
+
+
+class Species(object):
+    def __init__(self, label: str = '', index: int = -1, molecule=None):
+        self.label = label
+        self.index = index
+        self.molecule = molecule or list()
+
+    def from_smiles(self, smiles: str) -> 'Species':
+        self.molecule = [Molecule().from_smiles(smiles)]
+        return self
+
+    def from_adjacency_list(self, adjlist: str) -> 'Species':
+        return self.from_smiles(adjlist.strip())
+
+    def to_adjacency_list(self) -> str:
+        return self.molecule[0].smiles if self.molecule else ''
+
+    def is_isomorphic(self, other) -> bool:
+        return bool(self.molecule) and self.molecule[0].is_isomorphic(other)
+
+    def __repr__(self) -> str:
+        return self.label
@@ -0,0 +1,5 @@
+"""
+A stand-in for T3, used by the APIOxy benchmarks.
+"""
+
+from t3.main import T3
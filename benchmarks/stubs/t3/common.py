@@ -0,0 +1,11 @@
+"""
+A stand-in for t3.common.
+"""
+
+from rmgpy.species import Species
+
+
+def get_rmg_species_from_a_species_dict(species_dict: dict, raise_error: bool = False):
+    structure = species_dict.get('smiles') or species_dict.get('inchi') or species_dict.get('adjlist') or ''
+    species = Species(label=species_dict['label']).from_smiles(structure)
+    return species
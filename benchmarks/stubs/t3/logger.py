@@ -0,0 +1,24 @@
+"""
+A stand-in for t3.logger, messages are only written to the log file.
+"""
+
+
+class Logger(object):
+    def log(self, message: str, level: str = 'info'):
+        with open(self.log_file, 'a') as f:
+            f.write(f'{message}\n')
+
+    def log_args(self, schema: dict):
+        self.log(f'Using the following arguments: {schema}')
+
+    def debug(self, message: str):
+        self.log(message, level='debug')
+
+    def info(self, message: str):
+        self.log(message, level='info')
+
+    def warning(self, message: str):
+        self.log(f'Warning: {message}', level='warning')
+
+    def error(self, message: str):
+        self.log(f'Error: {message}', level='error')
@@ -0,0 +1,15 @@
+"""
+A stand-in for t3.schema.
+"""
+
+
+class RMGSpecies(object):
+    def __init__(self, **kwargs):
+        if 'label' not in kwargs:
+            raise ValueError('A species must have a label.')
+        if not any(key in kwargs for key in ['smiles', 'inchi', 'adjlist']):
+            raise ValueError(f'Species {kwargs["label"]} must have a structure.')
+        self.kwargs = kwargs
+
+    def dict(self) -> dict:
+        return dict(self.kwargs)
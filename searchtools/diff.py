@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+diff of two rmg mechanisms, e.g. of related APIs or of reruns at different model levels
+species are hashed by a canonical identity (InChIKey and multiplicity) which does not depend on labels,
+reactions by the sorted identities of their reactants and products, so the diff is a few dictionary passes
+instead of pairwise isomorphism checks
+"""
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from searchtools.kinetics import STABILITY_TEMPERATURES, KineticsEvaluator
+from searchtools.structure import get_inchi_key
+
+
+def get_species_identity(sp) -> str:
+    """
+    get a canonical identity of a species, independent of its label and resonance structure
+    :param sp: rmg species
+    :return: (str) the identity
+    """
+    mol = sp.molecule[0]
+    identity = get_inchi_key(mol)
+    if identity is None:
+        identity = mol.to_smiles()
+    return f'{identity}-{mol.multiplicity}'
+
+
+def get_reaction_identity(rxn, species_identities: Dict[str, str]) -> Tuple[tuple, bool]:
+    """
+    get a canonical identity of a reaction, independent of its direction and of species labels
+    :param rxn: rmg reaction
+    :param species_identities: (dict) species identities by label
+    :return: (tuple) the identity, and whether the reaction is written in the reverse of the canonical direction
+    """
+    reactants = tuple(sorted(species_identities[sp.label] for sp in rxn.reactants))
+    products = tuple(sorted(species_identities[sp.label] for sp in rxn.products))
+    if products < reactants:
+        return (products, reactants), True
+    return (reactants, products), False
+
+
+def _get_lists(species, reactions) -> Tuple[list, list]:
+    """
+    get the species and reaction lists of a mechanism given as lists, a MechanismIndex, a LazyMechanism or a MechanismTable
+    """
+    if hasattr(species, 'species_labels'):
+        species = species.get_species_batch(species.species_labels)
+    else:
+        species = getattr(species, 'species', species)
+    if hasattr(reactions, 'reaction_indices'):
+        reactions = reactions.get_reactions_batch(reactions.reaction_indices)
+    else:
+        reactions = getattr(reactions, 'reactions', reactions)
+    return [sp for sp in species if sp is not None], [rxn for rxn in reactions if rxn is not None]
+
+
+class MechanismSide(object):
+    """
+    one side of a mechanism diff: species and reactions hashed by identity, and their rate coefficients
+
+    :param species: (list) rmg species list, or a MechanismIndex, LazyMechanism or MechanismTable
+    :param reactions: (list) rmg reaction list, or a MechanismIndex, LazyMechanism or MechanismTable
+    """
+
+    def __init__(self, species, reactions):
+        self.species, self.reactions = _get_lists(species, reactions)
+        self.species_identities = {sp.label: get_species_identity(sp) for sp in self.species}
+        for rxn in self.reactions:
+            for sp in rxn.reactants + rxn.products:
+                if sp.label not in self.species_identities:
+                    self.species_identities[sp.label] = get_species_identity(sp)
+        self.species_by_identity = dict()  # type: Dict[str, str]
+        for label, identity in self.species_identities.items():
+            self.species_by_identity.setdefault(identity, label)
+        # duplicate reactions share an identity, their rate coefficients are summed
+        self.reactions_by_identity = dict()  # type: Dict[tuple, List[Tuple[int, bool]]]
+        for i, rxn in enumerate(self.reactions):
+            identity, flipped = get_reaction_identity(rxn, self.species_identities)
+            self.reactions_by_identity.setdefault(identity, list()).append((i, flipped))
+        self.evaluator = KineticsEvaluator(self.reactions)
+        self._kf = self._kr = None
+
+    def get_rate_coefficients(self, identity: tuple, T: np.ndarray) -> np.ndarray:
+        """
+        get the rate coefficients of a reaction in its canonical direction, summed over duplicates
+        :param identity: (tuple) the reaction identity
+        :param T: (np.ndarray) temperatures (K)
+        :return: (np.ndarray) rate coefficients in SI units
+        """
+        if self._kf is None:
+            self._kf = self.evaluator.get_forward_rate_coefficients(T)
+        k = np.zeros(len(T))
+        for i, flipped in self.reactions_by_identity[identity]:
+            if flipped:
+                if self._kr is None:
+                    self._kr = self.evaluator.get_reverse_rate_coefficients(T)
+                k = k + self._kr[i]
+            else:
+                k = k + self._kf[i]
+        return k
+
+    def get_reaction_label(self, identity: tuple) -> str:
+        """
+        get a readable equation of a reaction with the labels of this mechanism
+        :param identity: (tuple) the reaction identity
+        :return: (str) the equation
+        """
+        rxn = self.reactions[self.reactions_by_identity[identity][0][0]]
+        return str(rxn)
+
+
+def diff_mechanisms(spc_a, rxn_a, spc_b, rxn_b, T=STABILITY_TEMPERATURES, tolerance: float = 0.05) -> dict:
+    """
+    diff two mechanisms
+    :param spc_a: (list) rmg species list of the first mechanism (or a MechanismIndex, LazyMechanism or MechanismTable)
+    :param rxn_a: (list) rmg reaction list of the first mechanism
+    :param spc_b: (list) rmg species list of the second mechanism
+    :param rxn_b: (list) rmg reaction list of the second mechanism
+    :param T: temperatures (K) at which rate coefficients are compared
+    :param tolerance: (float) minimal |log10(k_b / k_a)| for a reaction to be reported as changed
+    :return: (dict) the diff report
+    """
+    T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+    a, b = MechanismSide(spc_a, rxn_a), MechanismSide(spc_b, rxn_b)
+
+    species_a, species_b = set(a.species_by_identity), set(b.species_by_identity)
+    report = {'temperatures': T.tolist(),
+              'species': {'added': sorted(b.species_by_identity[x] for x in species_b - species_a),
+                          'removed': sorted(a.species_by_identity[x] for x in species_a - species_b),
+                          'common': len(species_a & species_b),
+                          'renamed': sorted([a.species_by_identity[x], b.species_by_identity[x]]
+                                            for x in species_a & species_b
+                                            if a.species_by_identity[x] != b.species_by_identity[x]),
+                          },
+              }
+
+    reactions_a, reactions_b = set(a.reactions_by_identity), set(b.reactions_by_identity)
+    changed = list()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for identity in reactions_a & reactions_b:
+            log_ratio = np.log10(b.get_rate_coefficients(identity, T) / a.get_rate_coefficients(identity, T))
+            if not np.all(np.isfinite(log_ratio)) or np.max(np.abs(log_ratio)) >= tolerance:
+                changed.append({'reaction': b.get_reaction_label(identity),
+                                'reaction_a': a.get_reaction_label(identity),
+                                'log10_k_ratio': [float(x) if np.isfinite(x) else None for x in log_ratio],
+                                })
+    changed.sort(key=lambda x: -max((abs(r) for r in x['log10_k_ratio'] if r is not None), default=np.inf))
+    report['reactions'] = {'added': sorted(b.get_reaction_label(x) for x in reactions_b - reactions_a),
+                           'removed': sorted(a.get_reaction_label(x) for x in reactions_a - reactions_b),
+                           'common': len(reactions_a & reactions_b),
+                           'changed': changed,
+                           }
+    return report
+
+
+def save_diff_report(report: dict, path: str):
+    """
+    save a diff report as yaml (.yml, .yaml) or json (any other extension)
+    :param report: (dict) the report from diff_mechanisms
+    :param path: (str) the file path
+    """
+    with open(path, 'w') as f:
+        if os.path.splitext(path)[1].lower() in ('.yml', '.yaml'):
+            import yaml
+
+            yaml.safe_dump(report, f, default_flow_style=False, sort_keys=False)
+        else:
+            json.dump(report, f, indent=2)
+
+
+def display_diff(report: dict, max_reactions: Optional[int] = 20):
+    """
+    print a summary of a diff report
+    :param report: (dict) the report from diff_mechanisms
+    :param max_reactions: (int) maximal number of changed reactions to print
+    :return: None
+    """
+    for kind in ('species', 'reactions'):
+        entry = report[kind]
+        print(f"{kind}: {len(entry['added'])} added, {len(entry['removed'])} removed, {entry['common']} common")
+    for x in report['reactions']['changed'][:max_reactions]:
+        print('    ', x['reaction'], x['log10_k_ratio'])
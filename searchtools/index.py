@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+hash-based index of the species and reactions of an rmg mechanism
+"""
+from typing import Dict, Iterable, List, Optional
+
+
+class MechanismIndex(object):
+    """
+    an index of a loaded mechanism, built once from RMGsp,RMGrxn=load_chemkin_file(chemkin_file,dict_file)
+    all lookups are dictionary lookups instead of scans over the species or reaction lists
+
+    :param species: (list) rmg species list
+    :param reactions: (list) rmg reaction list
+    """
+
+    def __init__(self, species: Optional[list] = None, reactions: Optional[list] = None):
+        self.species = list(species) if species is not None else list()
+        self.reactions = list(reactions) if reactions is not None else list()
+        self.species_by_label = dict()  # type: Dict[str, object]
+        self.reactions_by_index = dict()  # type: Dict[int, object]
+        self.reactions_by_library = dict()  # type: Dict[str, List[object]]
+        self.reactions_by_species = dict()  # type: Dict[str, List[object]]
+        for sp in self.species:
+            # keep the last species with a given label, as a linear scan would
+            self.species_by_label[sp.label] = sp
+        for rxn in self.reactions:
+            self.reactions_by_index.setdefault(rxn.index, rxn)
+            library = getattr(rxn, 'library', None)
+            if library is not None:
+                self.reactions_by_library.setdefault(library, list()).append(rxn)
+            for label in {sp.label for sp in rxn.reactants + rxn.products}:
+                self.reactions_by_species.setdefault(label, list()).append(rxn)
+
+    def get_species(self, label: str):
+        """
+        get a species by label
+        :param label: (str) label of the species
+        :return: rmg species or None
+        """
+        return self.species_by_label.get(label)
+
+    def get_reaction(self, index: int):
+        """
+        get a reaction by chemkin reaction index
+        :param index: (int) chemkin reaction index
+        :return: rmg reaction or None
+        """
+        return self.reactions_by_index.get(index)
+
+    def get_reactions_of_species(self, label: str) -> list:
+        """
+        get all reactions a species participates in, as a reactant or a product
+        :param label: (str) label of the species
+        :return: (list) of reactions, ordered as in the mechanism
+        """
+        return list(self.reactions_by_species.get(label, list()))
+
+    def get_reactions_from_library(self, library: str) -> list:
+        """
+        get all the reactions from a specific library
+        :param library: (str) rmg library name
+        :return: (list) of reactions, ordered as in the mechanism
+        """
+        return list(self.reactions_by_library.get(library, list()))
+
+    def get_neighbors(self, label: str) -> set:
+        """
+        get the labels of all species sharing a reaction with a species
+        :param label: (str) label of the species
+        :return: (set) of species labels
+        """
+        neighbors = set()
+        for rxn in self.reactions_by_species.get(label, list()):
+            neighbors.update(sp.label for sp in rxn.reactants + rxn.products)
+        neighbors.discard(label)
+        return neighbors
+
+    def get_species_batch(self, labels: Iterable[str]) -> list:
+        """
+        get many species by label
+        :param labels: labels of the species
+        :return: (list) of rmg species (None for labels not found)
+        """
+        return [self.species_by_label.get(label) for label in labels]
+
+    def get_reactions_batch(self, indices: Iterable[int]) -> list:
+        """
+        get many reactions by chemkin reaction index
+        :param indices: chemkin reaction indices
+        :return: (list) of rmg reactions (None for indices not found)
+        """
+        return [self.reactions_by_index.get(index) for index in indices]
+
+
+_INDICES = dict()
+
+
+def get_mechanism_index(rmg_spc: Optional[list] = None, rmg_rxn: Optional[list] = None) -> MechanismIndex:
+    """
+    get the index of a mechanism, building it on the first query and reusing it later
+    the index is rebuilt if the lists were modified in length since it was built
+    :param rmg_spc: (list) rmg species list, a MechanismIndex, a LazyMechanism, or a MechanismTable
+    :param rmg_rxn: (list) rmg reaction list, a MechanismIndex, a LazyMechanism, or a MechanismTable
+    :return: MechanismIndex (or the given index, lazy mechanism or table)
+    """
+    for x in (rmg_spc, rmg_rxn):
+        # any object providing the index queries, e.g. a LazyMechanism or a MechanismTable
+        if isinstance(x, MechanismIndex) or hasattr(x, 'get_reactions_of_species'):
+            return x
+    key = (id(rmg_spc), id(rmg_rxn))
+    sizes = (len(rmg_spc) if rmg_spc is not None else 0, len(rmg_rxn) if rmg_rxn is not None else 0)
+    cached = _INDICES.get(key)
+    if cached is not None and cached[0] is rmg_spc and cached[1] is rmg_rxn and cached[2] == sizes:
+        return cached[3]
+    index = MechanismIndex(species=rmg_spc, reactions=rmg_rxn)
+    if len(_INDICES) >= 8:
+        _INDICES.pop(next(iter(_INDICES)))
+    _INDICES[key] = (rmg_spc, rmg_rxn, sizes, index)
+    return index
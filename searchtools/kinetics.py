@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+vectorized rate coefficient evaluation for the reactions of an rmg mechanism
+Arrhenius, MultiArrhenius, PDepArrhenius, MultiPDepArrhenius and Chebyshev parameters are packed once into numpy arrays,
+so k(T) of all reactions over a temperature grid is evaluated in a single vectorized call
+other kinetics types (e.g., Troe and Lindemann falloff) fall back to rmg's own evaluation per reaction
+"""
+from typing import List, Optional
+
+import numpy as np
+from rmgpy.constants import R
+from rmgpy.kinetics import Arrhenius, Chebyshev, MultiArrhenius, MultiPDepArrhenius, PDepArrhenius
+
+# temperatures (K) of a typical stability testing protocol: 25, 30, 40, 50 and 60 C
+STABILITY_TEMPERATURES = np.array([25.0, 30.0, 40.0, 50.0, 60.0]) + 273.15
+
+
+def get_arrhenius_components(kinetics) -> Optional[list]:
+    """
+    get the Arrhenius expressions a kinetics object is the sum of
+    :param kinetics: rmg kinetics object
+    :return: (list) of Arrhenius objects, or None if the kinetics is not an Arrhenius or a MultiArrhenius of Arrhenius
+    """
+    if type(kinetics) is Arrhenius:
+        return [kinetics]
+    if type(kinetics) is MultiArrhenius and all(type(k) is Arrhenius for k in kinetics.arrhenius):
+        return list(kinetics.arrhenius)
+    return None
+
+
+def get_pdep_blocks(kinetics) -> Optional[list]:
+    """
+    get the PDepArrhenius expressions a kinetics object is the sum of, with the Arrhenius expressions of each pressure
+    :param kinetics: rmg kinetics object
+    :return: (list) of (pressures, list of Arrhenius component lists) tuples, pressures in Pa sorted ascending,
+             or None if the kinetics is not a PDepArrhenius or a MultiPDepArrhenius of packable PDepArrhenius
+    """
+    if type(kinetics) is PDepArrhenius:
+        pdep_list = [kinetics]
+    elif type(kinetics) is MultiPDepArrhenius and all(type(k) is PDepArrhenius for k in kinetics.arrhenius):
+        pdep_list = list(kinetics.arrhenius)
+    else:
+        return None
+    blocks = list()
+    for pdep in pdep_list:
+        pressures = np.asarray(pdep.pressures.value_si, dtype=np.float64)
+        levels = [get_arrhenius_components(k) for k in pdep.arrhenius]
+        if not len(pressures) or any(level is None for level in levels):
+            return None
+        order = np.argsort(pressures, kind='stable')
+        blocks.append((pressures[order], [levels[i] for i in order]))
+    return blocks
+
+
+class ArrheniusSet(object):
+    """
+    Arrhenius expressions packed into numpy arrays, each expression is owned by a row of the evaluated matrix
+    """
+
+    def __init__(self):
+        self.owners, self.A, self.n, self.Ea, self.T0 = list(), list(), list(), list(), list()
+
+    def add(self, owner: int, components: list):
+        """
+        add the Arrhenius expressions of an owner, their rate coefficients are summed
+        :param owner: (int) the owner row
+        :param components: (list) of Arrhenius objects
+        """
+        for k in components:
+            self.owners.append(owner)
+            self.A.append(k.A.value_si)
+            self.n.append(k.n.value_si)
+            self.Ea.append(k.Ea.value_si)
+            self.T0.append(k.T0.value_si)
+
+    def pack(self):
+        """
+        convert the collected parameters into numpy arrays
+        """
+        self.owners = np.array(self.owners, dtype=np.int64)
+        for name in ['A', 'n', 'Ea', 'T0']:
+            setattr(self, name, np.array(getattr(self, name), dtype=np.float64))
+
+    def evaluate(self, T: np.ndarray, k: np.ndarray):
+        """
+        add the rate coefficients of the expressions to the rows of their owners
+        :param T: (np.ndarray) temperatures (K)
+        :param k: (np.ndarray) owners x temperatures matrix, modified in place
+        """
+        if len(self.owners):
+            components = self.A[:, None] * (T[None, :] / self.T0[:, None]) ** self.n[:, None] \
+                * np.exp(-self.Ea[:, None] / (R * T[None, :]))
+            np.add.at(k, self.owners, components)
+
+
+def get_chebyshev_polynomials(x: np.ndarray, degree: int) -> np.ndarray:
+    """
+    evaluate the Chebyshev polynomials of the first kind
+    :param x: (np.ndarray) reduced temperatures or pressures, any shape
+    :param degree: (int) the number of polynomials
+    :return: (np.ndarray) of shape x.shape[:1] + (degree,) + x.shape[1:]
+    """
+    polynomials = [np.ones_like(x), x]
+    for _ in range(2, degree):
+        polynomials.append(2 * x * polynomials[-1] - polynomials[-2])
+    return np.stack(polynomials[:degree], axis=1)
+
+
+class PackedKinetics(object):
+    """
+    kinetics of many reactions packed into numpy arrays
+
+    :param kinetics_list: (list) rmg kinetics objects (None for reactions without kinetics)
+    """
+
+    def __init__(self, kinetics_list: list):
+        self.kinetics_list = list(kinetics_list)
+        self.arrhenius = ArrheniusSet()  # pressure independent expressions, owned by reactions
+        self.levels = ArrheniusSet()  # expressions of the pressure levels of PDepArrhenius, owned by levels
+        level_pressures, block_owners, block_offsets = list(), list(), [0]
+        cheb_owners, cheb_ranges, cheb_coeffs = list(), list(), list()
+        self.fallback = list()  # indices of reactions evaluated by rmg
+        for i, kinetics in enumerate(self.kinetics_list):
+            components = get_arrhenius_components(kinetics)
+            blocks = get_pdep_blocks(kinetics) if components is None else None
+            if components is not None:
+                self.arrhenius.add(i, components)
+            elif blocks is not None:
+                for pressures, levels in blocks:
+                    for pressure, level in zip(pressures, levels):
+                        self.levels.add(len(level_pressures), level)
+                        level_pressures.append(pressure)
+                    block_owners.append(i)
+                    block_offsets.append(len(level_pressures))
+            elif type(kinetics) is Chebyshev:
+                cheb_owners.append(i)
+                cheb_ranges.append([kinetics.Tmin.value_si, kinetics.Tmax.value_si,
+                                    kinetics.Pmin.value_si, kinetics.Pmax.value_si])
+                cheb_coeffs.append(np.asarray(kinetics.coeffs.value_si, dtype=np.float64))
+            elif kinetics is not None:
+                self.fallback.append(i)
+        self.arrhenius.pack()
+        self.levels.pack()
+        self.level_pressures = np.array(level_pressures, dtype=np.float64)
+        self.block_owners = np.array(block_owners, dtype=np.int64)
+        self.block_offsets = np.array(block_offsets, dtype=np.int64)
+        self.cheb_owners = np.array(cheb_owners, dtype=np.int64)
+        self.cheb_ranges = np.array(cheb_ranges, dtype=np.float64).reshape(-1, 4)
+        degree_t = max((c.shape[0] for c in cheb_coeffs), default=0)
+        degree_p = max((c.shape[1] for c in cheb_coeffs), default=0)
+        self.cheb_coeffs = np.zeros((len(cheb_coeffs), degree_t, degree_p))
+        for j, coeffs in enumerate(cheb_coeffs):
+            # zero padding, the extra polynomials do not contribute
+            self.cheb_coeffs[j, :coeffs.shape[0], :coeffs.shape[1]] = coeffs
+        self.packed = np.unique(np.concatenate([self.arrhenius.owners, self.block_owners, self.cheb_owners]))
+
+    def get_pdep_rate_coefficients(self, T: np.ndarray, P: float) -> np.ndarray:
+        """
+        evaluate the PDepArrhenius blocks, interpolating log k linearly in log P between the adjacent pressures
+        pressures outside of the range of a block use its nearest pressure, as rmg does
+        :param T: (np.ndarray) temperatures (K)
+        :param P: (float) pressure (Pa)
+        :return: (np.ndarray) blocks x temperatures matrix
+        """
+        k_levels = np.zeros((len(self.level_pressures), len(T)))
+        self.levels.evaluate(T, k_levels)
+        low, high, fraction = list(), list(), list()
+        for start, end in zip(self.block_offsets[:-1], self.block_offsets[1:]):
+            pressures = self.level_pressures[start:end]
+            i = int(np.searchsorted(pressures, P, side='right')) - 1  # the last pressure <= P
+            if i < 0 or i == len(pressures) - 1 or pressures[i] == P:
+                i = max(i, 0)
+                low.append(start + i), high.append(start + i), fraction.append(0.0)
+            else:
+                low.append(start + i), high.append(start + i + 1)
+                fraction.append(np.log10(P / pressures[i]) / np.log10(pressures[i + 1] / pressures[i]))
+        k_low, k_high = k_levels[low], k_levels[high]
+        fraction = np.array(fraction)[:, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            k = k_low * (k_high / k_low) ** fraction
+        k[(k_low == 0) & (k_high == 0)] = 0.0
+        return k
+
+    def get_chebyshev_rate_coefficients(self, T: np.ndarray, P: float) -> np.ndarray:
+        """
+        evaluate the Chebyshev expressions
+        :param T: (np.ndarray) temperatures (K)
+        :param P: (float) pressure (Pa)
+        :return: (np.ndarray) Chebyshev reactions x temperatures matrix
+        """
+        T_min, T_max, P_min, P_max = self.cheb_ranges.T
+        T_reduced = (2.0 / T[None, :] - 1.0 / T_min[:, None] - 1.0 / T_max[:, None]) \
+            / (1.0 / T_max[:, None] - 1.0 / T_min[:, None])
+        P_reduced = (2.0 * np.log10(P) - np.log10(P_min) - np.log10(P_max)) / (np.log10(P_max) - np.log10(P_min))
+        log_k = np.einsum('ctp,ctn,cp->cn', self.cheb_coeffs,
+                          get_chebyshev_polynomials(T_reduced, self.cheb_coeffs.shape[1]),
+                          get_chebyshev_polynomials(P_reduced, self.cheb_coeffs.shape[2]))
+        return 10.0 ** log_k
+
+    def get_rate_coefficients(self, T, P: float = 1e5) -> np.ndarray:
+        """
+        evaluate the rate coefficients
+        :param T: temperatures (K), a float or an array
+        :param P: (float) pressure (Pa), only used by pressure dependent kinetics
+        :return: (np.ndarray) reactions x temperatures matrix of rate coefficients in SI units (nan if unavailable)
+        """
+        T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+        k = np.full((len(self.kinetics_list), len(T)), np.nan)
+        k[self.packed] = 0.0
+        self.arrhenius.evaluate(T, k)
+        if len(self.block_owners):
+            np.add.at(k, self.block_owners, self.get_pdep_rate_coefficients(T, P))
+        if len(self.cheb_owners):
+            np.add.at(k, self.cheb_owners, self.get_chebyshev_rate_coefficients(T, P))
+        for i in self.fallback:
+            kinetics = self.kinetics_list[i]
+            for j, t in enumerate(T):
+                try:
+                    k[i, j] = kinetics.get_rate_coefficient(t, P) if kinetics.is_pressure_dependent() \
+                        else kinetics.get_rate_coefficient(t)
+                except Exception:
+                    pass
+        return k
+
+
+class KineticsEvaluator(object):
+    """
+    batched forward and reverse kinetics of a list of rmg reactions
+    derived reverse kinetics are generated once and cached
+    note that diffusion limits of liquid phase reactions are not applied
+
+    :param reactions: (list) rmg reaction list, or a MechanismIndex
+    """
+
+    def __init__(self, reactions):
+        self.reactions = list(getattr(reactions, 'reactions', reactions))
+        self.forward = PackedKinetics([getattr(rxn, 'kinetics', None) for rxn in self.reactions])
+        self._reverse_kinetics = None  # type: Optional[List]
+        self._reverse = None  # type: Optional[PackedKinetics]
+
+    @property
+    def reverse_kinetics(self) -> list:
+        """
+        the reverse kinetics of all reactions, generated on the first access
+        :return: (list) of rmg kinetics objects (None where they could not be generated)
+        """
+        if self._reverse_kinetics is None:
+            self._reverse_kinetics = list()
+            for rxn in self.reactions:
+                try:
+                    self._reverse_kinetics.append(rxn.generate_reverse_rate_coefficient())
+                except Exception:
+                    self._reverse_kinetics.append(None)
+        return self._reverse_kinetics
+
+    def get_forward_rate_coefficients(self, T=STABILITY_TEMPERATURES, P: float = 1e5) -> np.ndarray:
+        """
+        evaluate the forward rate coefficients of all reactions
+        :param T: temperatures (K), a float or an array
+        :param P: (float) pressure (Pa), only used by pressure dependent kinetics
+        :return: (np.ndarray) reactions x temperatures matrix in SI units
+        """
+        return self.forward.get_rate_coefficients(T, P)
+
+    def get_reverse_rate_coefficients(self, T=STABILITY_TEMPERATURES, P: float = 1e5) -> np.ndarray:
+        """
+        evaluate the reverse rate coefficients of all reactions
+        :param T: temperatures (K), a float or an array
+        :param P: (float) pressure (Pa), only used by pressure dependent kinetics
+        :return: (np.ndarray) reactions x temperatures matrix in SI units
+        """
+        if self._reverse is None:
+            self._reverse = PackedKinetics(self.reverse_kinetics)
+        return self._reverse.get_rate_coefficients(T, P)
@@ -0,0 +1,369 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+lazy reader of chemkin (chem_annotated.inp) and species dictionary (species_dictionary.txt) files
+the files are streamed once to record the byte offsets of every species and reaction entry,
+rmg objects are only built for the entries a query touches
+the offset index is cached next to the chemkin file and reused as long as both files are unchanged
+"""
+import io
+import json
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+from rmgpy.chemkin import read_reactions_block
+from rmgpy.species import Species
+
+INDEX_CACHE_SUFFIX = '.offsets.json'
+INDEX_VERSION = 2
+BLOCK_SIZE = 1000
+# auxiliary keywords of a chemkin reaction entry, other 'label/value/' tokens are collider efficiencies
+AUXILIARY_KEYWORDS = ('LOW', 'HIGH', 'TROE', 'SRI', 'PLOG', 'CHEB', 'TCHEB', 'PCHEB', 'REV', 'DUPLICATE', 'DUP',
+                      'FORD', 'RORD', 'UNITS')
+
+_chemkin_index_pattern = re.compile(r'Reaction index: Chemkin #(\d+)')
+_library_pattern = re.compile(r'Library reaction: (\S+)')
+_efficiency_pattern = re.compile(r'(\S+?)\s*/\s*[-+\d.eEdD]+\s*/')
+
+
+def split_species_labels(side: str) -> List[str]:
+    """
+    split one side of a chemkin reaction equation into species labels
+    :param side: (str) e.g. 'A(1)+B(2)(+M)'
+    :return: (list) of species labels, third bodies excluded
+    """
+    side = re.sub(r'\(\+[^()]*\)$', '', side.strip())
+    labels, depth, current = list(), 0, ''
+    for char in side:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char == '+' and depth == 0 and current:
+            labels.append(current)
+            current = ''
+        else:
+            current += char
+    if current:
+        labels.append(current)
+    return [label for label in labels if label.upper() != 'M']
+
+
+def parse_equation(line: str) -> Tuple[List[str], List[str]]:
+    """
+    get the reactant and product labels of a chemkin reaction line
+    :param line: (str) the reaction line, e.g. 'A(1)+B(2)<=>C(3)   1.0e+13 0.0 10.0'
+    :return: (tuple) reactant labels, product labels
+    """
+    equation = line.split()[0]
+    for arrow in ('<=>', '=>', '='):
+        if arrow in equation:
+            reactants, products = equation.split(arrow, 1)
+            return split_species_labels(reactants), split_species_labels(products)
+    return list(), list()
+
+
+def parse_colliders(lines: List[str]) -> List[str]:
+    """
+    get the labels of the species given collider efficiencies in the auxiliary lines of a chemkin reaction entry
+    :param lines: (list) the entry lines following the reaction line, comments excluded
+    :return: (list) of species labels, e.g. ['H2O(5)', 'N2'] for 'H2O(5)/6.0/ N2/0.7/'
+    """
+    colliders = list()
+    for line in lines:
+        line = line.split('!')[0]
+        if line.strip().upper().startswith(AUXILIARY_KEYWORDS):
+            continue
+        for label in _efficiency_pattern.findall(line):
+            if label not in colliders:
+                colliders.append(label)
+    return colliders
+
+
+def get_files_signature(*paths: str) -> List[str]:
+    """
+    get a signature of files, changed whenever a file is modified
+    :param paths: file paths
+    :return: (list) of 'size:mtime' strings
+    """
+    signature = list()
+    for path in paths:
+        stat = os.stat(path)
+        signature.append(f'{stat.st_size}:{stat.st_mtime_ns}')
+    return signature
+
+
+class LazyMechanism(object):
+    """
+    a mechanism which builds rmg species and reactions on demand
+
+    :param chemkin_path: (str) path to the chemkin file, e.g. chem_annotated.inp
+    :param dictionary_path: (str) path to the rmg species dictionary, e.g. species_dictionary.txt
+    :param use_cache: (bool) whether to reuse and save the offset index next to the chemkin file
+    """
+
+    def __init__(self, chemkin_path: str, dictionary_path: str, use_cache: bool = True):
+        self.chemkin_path = chemkin_path
+        self.dictionary_path = dictionary_path
+        self.index_path = chemkin_path + INDEX_CACHE_SUFFIX
+        self.species_offsets = dict()  # type: Dict[str, Tuple[int, int]]
+        self.reaction_entries = list()  # type: List[dict]
+        self.reactions_header = 'REACTIONS'
+        self._species = dict()
+        self._reactions = dict()
+        if not use_cache or not self.load_index():
+            self.build_index()
+            if use_cache:
+                self.save_index()
+        self.reaction_positions = {entry['index']: i for i, entry in enumerate(self.reaction_entries)}
+        self.reactions_by_species = dict()  # type: Dict[str, List[int]]
+        self.reactions_by_library = dict()  # type: Dict[str, List[int]]
+        for entry in self.reaction_entries:
+            for label in set(entry['reactants'] + entry['products']):
+                self.reactions_by_species.setdefault(label, list()).append(entry['index'])
+            if entry['library'] is not None:
+                self.reactions_by_library.setdefault(entry['library'], list()).append(entry['index'])
+
+    def __len__(self) -> int:
+        """
+        the number of species in the species dictionary, as for the species list the mechanism stands for
+        """
+        return len(self.species_offsets)
+
+    @property
+    def species_labels(self) -> List[str]:
+        """
+        the labels of all species in the species dictionary
+        """
+        return list(self.species_offsets.keys())
+
+    @property
+    def reaction_indices(self) -> List[int]:
+        """
+        the chemkin indices of all reactions
+        """
+        return [entry['index'] for entry in self.reaction_entries]
+
+    def load_index(self) -> bool:
+        """
+        load the cached offset index if it matches the current files
+        :return: (bool) whether the index was loaded
+        """
+        if not os.path.isfile(self.index_path):
+            return False
+        try:
+            with open(self.index_path, 'r') as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if content.get('version') != INDEX_VERSION \
+                or content.get('signature') != get_files_signature(self.chemkin_path, self.dictionary_path):
+            return False
+        self.species_offsets = {label: tuple(offsets) for label, offsets in content['species'].items()}
+        self.reaction_entries = content['reactions']
+        self.reactions_header = content['reactions_header']
+        return True
+
+    def save_index(self):
+        """
+        save the offset index next to the chemkin file, silently skipped if the folder is read-only
+        """
+        content = {'version': INDEX_VERSION,
+                   'signature': get_files_signature(self.chemkin_path, self.dictionary_path),
+                   'species': self.species_offsets,
+                   'reactions': self.reaction_entries,
+                   'reactions_header': self.reactions_header,
+                   }
+        tmp_path = f'{self.index_path}.{os.getpid()}.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(content, f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            pass
+
+    def build_index(self):
+        """
+        stream the species dictionary and the chemkin reactions block and record the entry offsets
+        """
+        self.species_offsets = dict()
+        for offset, text in self._iter_blocks(self.dictionary_path):
+            label = text.decode().strip().splitlines()[0].strip()
+            self.species_offsets[label] = (offset, len(text))
+
+        self.reaction_entries = list()
+        counter = 0
+        for offset, text in self._iter_blocks(self.chemkin_path, start='REACTIONS', end='END'):
+            lines = text.decode().splitlines()
+            reaction_lines = [line for line in lines if line.strip() and not line.strip().startswith('!')]
+            if not reaction_lines or reaction_lines[0].strip().upper().startswith(('DUPLICATE', 'END')):
+                continue
+            counter += 1
+            comments = '\n'.join(line for line in lines if line.strip().startswith('!'))
+            index_match = _chemkin_index_pattern.search(comments)
+            library_match = _library_pattern.search(comments)
+            reactants, products = parse_equation(reaction_lines[0])
+            self.reaction_entries.append({'index': int(index_match.group(1)) if index_match else counter,
+                                          'offset': offset,
+                                          'length': len(text),
+                                          'reactants': reactants,
+                                          'products': products,
+                                          'colliders': parse_colliders(reaction_lines[1:]),
+                                          'library': library_match.group(1) if library_match else None,
+                                          })
+
+    def _iter_blocks(self, path: str, start: Optional[str] = None, end: Optional[str] = None):
+        """
+        stream a file and yield blank line separated blocks with their byte offsets
+        :param path: (str) the file path
+        :param start: (str) only yield blocks after a line starting with this keyword
+        :param end: (str) stop at a line starting with this keyword (after start)
+        :return: generator of (offset, bytes) tuples
+        """
+        with open(path, 'rb') as f:
+            offset, active = 0, start is None
+            block, block_offset = b'', None
+            for line in f:
+                line_offset, offset = offset, offset + len(line)
+                stripped = line.strip()
+                if not active:
+                    if stripped.upper().startswith(start.encode()):
+                        self.reactions_header = line.decode().strip()
+                        active = True
+                    continue
+                if end is not None and stripped.upper() == end.encode():
+                    break
+                if not stripped:
+                    if block.strip():
+                        yield block_offset, block
+                    block, block_offset = b'', None
+                    continue
+                if block_offset is None:
+                    block_offset = line_offset
+                block += line
+            if block.strip():
+                yield block_offset, block
+
+    def _read(self, path: str, offset: int, length: int) -> str:
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            return f.read(length).decode()
+
+    def get_species(self, label: str) -> Optional[Species]:
+        """
+        get a species by label, built from the species dictionary on the first access
+        :param label: (str) label of the species
+        :return: rmg species or None
+        """
+        if label not in self._species:
+            if label not in self.species_offsets:
+                return None
+            species = Species().from_adjacency_list(self._read(self.dictionary_path, *self.species_offsets[label]))
+            species.label = label
+            self._species[label] = species
+        return self._species[label]
+
+    def get_reaction_text(self, index: int) -> Optional[str]:
+        """
+        get the chemkin text of a reaction
+        :param index: (int) chemkin reaction index
+        :return: (str) the reaction entry including its comments
+        """
+        if index not in self.reaction_positions:
+            return None
+        entry = self.reaction_entries[self.reaction_positions[index]]
+        return self._read(self.chemkin_path, entry['offset'], entry['length'])
+
+    def _build_reaction(self, entry: dict):
+        """
+        build a reaction from its chemkin text
+        :param entry: (dict) the offset index entry of the reaction
+        :return: rmg reaction or None
+        """
+        text = self._read(self.chemkin_path, entry['offset'], entry['length'])
+        # third-body and falloff reactions also refer to the species given collider efficiencies
+        labels = entry['reactants'] + entry['products'] + [label for label in entry['colliders']
+                                                           if label in self.species_offsets]
+        species_dict = {label: self.get_species(label) for label in labels}
+        reactions = read_reactions_block(io.StringIO(f'{self.reactions_header}\n{text}\nEND\n'),
+                                         species_dict, read_comments=True)
+        if not reactions:
+            return None
+        reaction = reactions[0]
+        reaction.index = entry['index']
+        if entry['library'] is not None and not hasattr(reaction, 'library'):
+            reaction.library = entry['library']
+        return reaction
+
+    def get_reaction(self, index: int):
+        """
+        get a reaction by chemkin reaction index, built on the first access
+        :param index: (int) chemkin reaction index
+        :return: rmg reaction or None
+        """
+        if index not in self._reactions:
+            if index not in self.reaction_positions:
+                return None
+            reaction = self._build_reaction(self.reaction_entries[self.reaction_positions[index]])
+            if reaction is None:
+                return None
+            self._reactions[index] = reaction
+        return self._reactions[index]
+
+    def iter_species_blocks(self, block_size: int = BLOCK_SIZE):
+        """
+        iterate over all species in blocks, the species are built (and kept) block by block
+        :param block_size: (int) the number of species in a block
+        :return: generator of lists of rmg species
+        """
+        labels = self.species_labels
+        for start in range(0, len(labels), block_size):
+            yield [sp for sp in self.get_species_batch(labels[start:start + block_size]) if sp is not None]
+
+    def iter_reaction_blocks(self, block_size: int = BLOCK_SIZE):
+        """
+        iterate over all reactions in blocks,
+        reactions not accessed before are built for their block only and are not kept afterwards
+        :param block_size: (int) the number of reactions in a block
+        :return: generator of lists of rmg reactions
+        """
+        for start in range(0, len(self.reaction_entries), block_size):
+            block = list()
+            for entry in self.reaction_entries[start:start + block_size]:
+                reaction = self._reactions.get(entry['index']) or self._build_reaction(entry)
+                if reaction is not None:
+                    block.append(reaction)
+            yield block
+
+    def get_reactions_of_species(self, label: str) -> list:
+        """
+        get all reactions a species participates in, only these reactions are built
+        :param label: (str) label of the species
+        :return: (list) of reactions
+        """
+        return [self.get_reaction(index) for index in self.reactions_by_species.get(label, list())]
+
+    def get_reactions_from_library(self, library: str) -> list:
+        """
+        get all the reactions from a specific library, only these reactions are built
+        :param library: (str) rmg library name
+        :return: (list) of reactions
+        """
+        return [self.get_reaction(index) for index in self.reactions_by_library.get(library, list())]
+
+    def get_species_batch(self, labels) -> list:
+        """
+        get many species by label
+        :param labels: labels of the species
+        :return: (list) of rmg species (None for labels not found)
+        """
+        return [self.get_species(label) for label in labels]
+
+    def get_reactions_batch(self, indices) -> list:
+        """
+        get many reactions by chemkin reaction index
+        :param indices: chemkin reaction indices
+        :return: (list) of rmg reactions (None for indices not found)
+        """
+        return [self.get_reaction(index) for index in indices]
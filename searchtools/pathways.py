@@ -0,0 +1,204 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+degradation pathway search over the species/reaction graph of an rmg mechanism
+each reaction contributes edges from every reactant to every product (and back, using the reverse rate)
+an edge is weighted by the fraction of the consumption of its source species going through that reaction,
+using the rate (or the flux, if concentrations are given) at the reactor temperature
+the edge cost is -ln(fraction), so the cheapest pathway is the one carrying the largest fraction of the source
+"""
+import heapq
+import math
+import operator
+from functools import reduce
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from searchtools.kinetics import KineticsEvaluator
+
+# Edge: (cost, target label, edge id), where edge id is (reaction position, direction, source label, target label)
+Edge = Tuple[float, str, Tuple[int, int, str, str]]
+
+
+class PathwayGraph(object):
+    """
+    a weighted species graph of a mechanism, built once and queried many times
+
+    :param reactions: (list) rmg reaction list, a MechanismIndex, a LazyMechanism, or a MechanismTable
+    :param t: (float) reactor temperature (K)
+    :param concentrations: (dict) optional species concentrations by label, used to weight by flux instead of rate
+    :param exclude: species labels not used as pathway intermediates (e.g. solvent, O2)
+    :param p: (float) pressure (Pa), only used by pressure dependent kinetics
+    """
+
+    def __init__(self, reactions, t: float = 313.0, concentrations: Optional[Dict[str, float]] = None,
+                 exclude: Iterable[str] = (), p: float = 1e5):
+        self.t = t
+        self.exclude = set(exclude)
+        self.mechanism = None
+        if hasattr(reactions, 'iter_reaction_blocks'):
+            # a LazyMechanism, the kinetics are evaluated block by block and only the reaction indices are kept
+            self.mechanism = reactions
+            blocks = reactions.iter_reaction_blocks()
+        elif hasattr(reactions, 'reaction_indices'):
+            # a MechanismTable, the graph needs the kinetics of every reaction
+            blocks = [[rxn for rxn in reactions.get_reactions_batch(reactions.reaction_indices) if rxn is not None]]
+        else:
+            blocks = [reactions]
+        self.reactions = list()  # rmg reactions, or chemkin reaction indices of a LazyMechanism
+
+        # rates of every reaction direction, and the total consumption rate of every species
+        rates = list()  # (reaction position, direction, reactant labels, product labels, rate)
+        consumption = dict()  # type: Dict[str, float]
+        for block in blocks:
+            evaluator = KineticsEvaluator(block)
+            kf = np.nan_to_num(evaluator.get_forward_rate_coefficients(t, p)[:, 0])
+            kr = np.nan_to_num(evaluator.get_reverse_rate_coefficients(t, p)[:, 0])
+            for j, rxn in enumerate(evaluator.reactions):
+                i = len(self.reactions)
+                self.reactions.append(rxn if self.mechanism is None else rxn.index)
+                reactants = [sp.label for sp in rxn.reactants]
+                products = [sp.label for sp in rxn.products]
+                for direction, k, sources, targets in [(1, kf[j], reactants, products),
+                                                       (-1, kr[j], products, reactants)]:
+                    rate = k
+                    if concentrations is not None:
+                        rate *= reduce(operator.mul, (concentrations.get(label, 0.0) for label in sources), 1.0)
+                    if rate <= 0:
+                        continue
+                    rates.append((i, direction, sources, targets, rate))
+                    for label in set(sources):
+                        consumption[label] = consumption.get(label, 0.0) + rate
+
+        self.adjacency = dict()  # type: Dict[str, List[Edge]]
+        for i, direction, sources, targets, rate in rates:
+            for source in set(sources):
+                cost = -math.log(rate / consumption[source])
+                for target in set(targets):
+                    if target != source:
+                        self.adjacency.setdefault(source, list()).append(
+                            (max(cost, 0.0), target, (i, direction, source, target)))
+
+    def _dijkstra(self, source: str, target: str, removed_edges: set = frozenset(),
+                  removed_nodes: set = frozenset()) -> Optional[Tuple[float, list]]:
+        """
+        find the cheapest pathway between two species
+        :return: (tuple) cost, list of edge ids; None if the target is unreachable
+        """
+        best = {source: 0.0}
+        previous = dict()
+        heap = [(0.0, source)]
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if node == target:
+                edges = list()
+                while node != source:
+                    edge_id = previous[node]
+                    edges.append(edge_id)
+                    node = edge_id[2]
+                return cost, edges[::-1]
+            if cost > best.get(node, math.inf):
+                continue
+            if node != source and node in self.exclude:
+                continue
+            for edge_cost, neighbor, edge_id in self.adjacency.get(node, list()):
+                if neighbor in removed_nodes or edge_id in removed_edges:
+                    continue
+                new_cost = cost + edge_cost
+                if new_cost < best.get(neighbor, math.inf):
+                    best[neighbor] = new_cost
+                    previous[neighbor] = edge_id
+                    heapq.heappush(heap, (new_cost, neighbor))
+        return None
+
+    def get_reaction(self, position: int):
+        """
+        get a reaction of the graph, reactions of a LazyMechanism are built again on demand
+        :param position: (int) the position of the reaction in the graph
+        :return: rmg reaction
+        """
+        if self.mechanism is not None:
+            return self.mechanism.get_reaction(self.reactions[position])
+        return self.reactions[position]
+
+    def _edge_cost(self, edge_id) -> float:
+        for edge_cost, _, candidate in self.adjacency[edge_id[2]]:
+            if candidate == edge_id:
+                return edge_cost
+        return math.inf
+
+    def _to_pathway(self, cost: float, edges: list) -> dict:
+        species = [edges[0][2]] + [edge_id[3] for edge_id in edges] if edges else list()
+        return {'species': species,
+                'reactions': [self.get_reaction(edge_id[0]) for edge_id in edges],
+                'directions': [edge_id[1] for edge_id in edges],
+                'cost': cost,
+                'fraction': math.exp(-cost),
+                }
+
+    def shortest_pathway(self, target: str, source: str = 'API') -> Optional[dict]:
+        """
+        find the pathway carrying the largest fraction of the source species to a target species
+        :param target: (str) label of the target (e.g. a degradant)
+        :param source: (str) label of the source species, 'API' by default (the API label when model_level != 0)
+        :return: (dict) with 'species', 'reactions', 'directions', 'cost' and 'fraction' keys, or None
+        """
+        result = self._dijkstra(source, target)
+        return self._to_pathway(*result) if result is not None else None
+
+    def k_shortest_pathways(self, target: str, source: str = 'API', k: int = 5) -> List[dict]:
+        """
+        find the k pathways carrying the largest fractions of the source species to a target species (Yen's algorithm)
+        :param target: (str) label of the target (e.g. a degradant)
+        :param source: (str) label of the source species, 'API' by default
+        :param k: (int) number of pathways
+        :return: (list) of pathway dicts, best first
+        """
+        first = self._dijkstra(source, target)
+        if first is None:
+            return list()
+        accepted = [first]
+        candidates, seen = list(), {tuple(first[1])}
+        while len(accepted) < k:
+            last_edges = accepted[-1][1]
+            for i in range(len(last_edges)):
+                spur_node = last_edges[i][2]
+                root_edges = last_edges[:i]
+                removed_edges = {edges[i] for _, edges in accepted if len(edges) > i and edges[:i] == root_edges}
+                removed_nodes = {edge_id[2] for edge_id in root_edges}
+                spur = self._dijkstra(spur_node, target, removed_edges, removed_nodes)
+                if spur is None:
+                    continue
+                edges = root_edges + spur[1]
+                if tuple(edges) not in seen:
+                    seen.add(tuple(edges))
+                    cost = sum(self._edge_cost(edge_id) for edge_id in root_edges) + spur[0]
+                    heapq.heappush(candidates, (cost, len(seen), edges))
+            if not candidates:
+                break
+            cost, _, edges = heapq.heappop(candidates)
+            accepted.append((cost, edges))
+        return [self._to_pathway(cost, edges) for cost, edges in accepted]
+
+    def top_flux_pathways(self, targets: Iterable[str], source: str = 'API', k: int = 3) -> Dict[str, List[dict]]:
+        """
+        find the top pathways from the source species to each of several targets
+        :param targets: labels of the targets
+        :param source: (str) label of the source species, 'API' by default
+        :param k: (int) number of pathways per target
+        :return: (dict) keys are target labels, values are lists of pathway dicts
+        """
+        return {target: self.k_shortest_pathways(target, source=source, k=k) for target in targets}
+
+
+def display_pathways(pathways: List[dict]):
+    """
+    print pathways
+    :param pathways: list of pathway dicts
+    :return: None
+    """
+    for i, pathway in enumerate(pathways):
+        print(f"{i + 1}. fraction {pathway['fraction']:.3e}: {' -> '.join(pathway['species'])}")
+        for rxn, direction in zip(pathway['reactions'], pathway['directions']):
+            print('    ', rxn.index, rxn if direction == 1 else f'{rxn} (reverse)')
@@ -6,71 +6,79 @@ search species and reactions in rmg mechanism
 from IPython.display import display
 from rmgpy.molecule import Molecule
 
+from searchtools.index import get_mechanism_index
+from searchtools.kinetics import KineticsEvaluator
+from searchtools.pathways import PathwayGraph, display_pathways
+from searchtools.structure import get_resonance_structures, get_structure_index
+
 def find_species_by_label(rmg_spc: list,label: str) -> Molecule:
     """
     find species by label and returns rmg molecules
-    :param rmg_spc: (list) rmg species list form RMGsp,RMGrxn=load_chemkin_file(chemkin_file,dict_file)
-    :param label: (str) label of the species
-    :return: rmg molecules
+    :param rmg_spc: (list) rmg species list form RMGsp,RMGrxn=load_chemkin_file(chemkin_file,dict_file), or a MechanismIndex
+    :param label: (str) label of the species, or a list of labels for a batched query
+    :return: rmg molecules (a list for a batched query)
     """
+    index = get_mechanism_index(rmg_spc=rmg_spc)
+    if isinstance(label, (list, tuple, set)):
+        return [find_species_by_label(index, x) for x in label]
 
-    mol = None
-    for sp in rmg_spc:
-        if label == sp.label:
-            print(sp.label,sp.molecule)
-            display(sp)
-            mol =sp
+    mol = index.get_species(label)
     if mol is None:
         print ("couldn't find the species")
     else:
+        print(mol.label,mol.molecule)
+        display(mol)
         return mol
 
 def find_species_by_smiles(rmg_spc: list, smiles: str) -> Molecule:
     """
     for list of rmg species find species by smiles
-    :param rmg_spc: list of rmg species list
-    :param smiles: (str) species as smiles
-    :return: rmg species
+    only species passing a structure fingerprint prefilter are checked for isomorphism
+    :param rmg_spc: list of rmg species list, a MechanismIndex, or a StructureIndex
+    :param smiles: (str) species as smiles, or a list of smiles for a batched query
+    :return: rmg species (a list for a batched query)
     """
+    index = get_structure_index(rmg_spc)
+    if isinstance(smiles, (list, tuple, set)):
+        return [find_species_by_smiles(index, x) for x in smiles]
 
-    sp1=Molecule().from_smiles(smiles)
-    display(sp1)
-    mol = None
-    res=sp1.generate_resonance_structures()
-    for i,x in enumerate(rmg_spc):
-        for s in res:
-            if x.is_isomorphic(s):
-                print(x.molecule)
-                print(x.thermo.comment)
-                mol = x
+    display(get_resonance_structures(smiles)[0])
+    mol = index.find(smiles)
     if mol is None:
         print ("couldn't find the species")
     else:
+        print(mol.molecule)
+        print(mol.thermo.comment)
         return mol
 
 def find_reactions_by_label(rmg_rxn: list, label: str) -> list:
     """
     for given species find all the reactions involved in
     RMGrxn: is from RMGsp,RMGrxn=load_chemkin_file(chemkin_file,dict_file) or list of RMG reactions
-    :param rmg_rxn: (list) rmg reaction list
-    :param label: (str) label of the species
-    :return: list of reactions
+    :param rmg_rxn: (list) rmg reaction list, or a MechanismIndex
+    :param label: (str) label of the species, or a list of labels for a batched query
+    :return: list of reactions (a list of lists for a batched query)
     """
+    index = get_mechanism_index(rmg_rxn=rmg_rxn)
+    if isinstance(label, (list, tuple, set)):
+        return [find_reactions_by_label(index, x) for x in label]
 
-    x1 = []
-    for rxn in rmg_rxn:
-        if label in [x.label for x in rxn.reactants + rxn.products]:
-            x1.append(rxn)
-            print(rxn.index, [y.label for y in rxn.reactants], "->", [y.label for y in rxn.products])
+    x1 = index.get_reactions_of_species(label)
+    for rxn in x1:
+        print(rxn.index, [y.label for y in rxn.reactants], "->", [y.label for y in rxn.products])
     return x1
 
 def display_reactions(rxn_list:list, t = 313.0):
     """
     print list of reactions
+    forward and reverse rates of all reactions are evaluated in a single vectorized call
     :param rxn_list: list of rmg reactions
     :return: None
     """
-    for react in rxn_list:
+    evaluator = KineticsEvaluator(rxn_list)
+    kf = evaluator.get_forward_rate_coefficients(t)[:, 0]
+    kr = evaluator.get_reverse_rate_coefficients(t)[:, 0]
+    for i, react in enumerate(evaluator.reactions):
         print(react.index, react)
         display(react)
         if hasattr(react, 'library'):
@@ -79,49 +87,82 @@ def display_reactions(rxn_list:list, t = 313.0):
             print("reaction object has no library attribute")
         print('---forward kinetic---')
         print(react.kinetics)
-        kf = react.get_rate_coefficient(t)
-        print(f'forward rate at {t}: {kf}')
+        print(f'forward rate at {t}: {kf[i]}')
         print('---reverse kinetic---')
-        print(react.generate_reverse_rate_coefficient())
-        kr = react.generate_reverse_rate_coefficient().get_rate_coefficient(t)
-        print(f'reverse rate at {t}: {kr}')
+        print(evaluator.reverse_kinetics[i])
+        print(f'reverse rate at {t}: {kr[i]}')
         print('-----------------------------------------------------\n')
 
 def find_reaction_by_index(rxn:list,num:int)-> object:
     """
     find reactions by chemkin reaction index
-    :param rxn: (list) rmg reaction list
-    :param num: (int) chemkin reaction index
-    :return: rmg reaction
+    :param rxn: (list) rmg reaction list, or a MechanismIndex
+    :param num: (int) chemkin reaction index, or a list of indices for a batched query
+    :return: rmg reaction (a list for a batched query)
     """
-    #x1 = []
-    for react in rxn:
-        if react.index==num:
-            #x1.append(react)
-            display(react)
-            if hasattr(react, 'library'):
-                print(react.library)
-            else:
-                print("reaction object has no library attribute")
-            print(react.kinetics,"\n")
-            return react
+    index = get_mechanism_index(rmg_rxn=rxn)
+    if isinstance(num, (list, tuple, set)):
+        return [find_reaction_by_index(index, x) for x in num]
+
+    react = index.get_reaction(num)
+    if react is not None:
+        display(react)
+        if hasattr(react, 'library'):
+            print(react.library)
+        else:
+            print("reaction object has no library attribute")
+        print(react.kinetics,"\n")
+        return react
 
 def find_all_reaction_from_library(rxn:list,lib: str)->list:
     """
     find all the reactions form a specific library
-    :param rxn: RMG reaction list
-    :param lib: (str) rmg library name
-    :return: (list) of reactions
+    :param rxn: RMG reaction list, or a MechanismIndex
+    :param lib: (str) rmg library name, or a list of library names for a batched query
+    :return: (list) of reactions (a list of lists for a batched query)
     """
-    i=1
-    x1=[]
-    for react in rxn:
-        if hasattr(react, 'library'):
-            if react.library==lib:
-                x1.append(react)
-                print(i,react)
-                display(react)
-                print(react.kinetics,"\n")
-                i=i+1
-
-    return x1
\ No newline at end of file
+    index = get_mechanism_index(rmg_rxn=rxn)
+    if isinstance(lib, (list, tuple, set)):
+        return [find_all_reaction_from_library(index, x) for x in lib]
+
+    x1 = index.get_reactions_from_library(lib)
+    for i, react in enumerate(x1):
+        print(i + 1,react)
+        display(react)
+        print(react.kinetics,"\n")
+
+    return x1
+
+_PATHWAY_GRAPHS = dict()
+
+def find_pathways(rxn, target: str, source: str = 'API', k: int = 5, t = 313.0, exclude = (),
+                  concentrations = None) -> list:
+    """
+    find the degradation pathways carrying the largest fractions of the source species to a target species
+    the weighted graph is built on the first query and reused for later queries on the same mechanism
+    without concentrations edges are weighted by rate coefficients, so unimolecular and bimolecular steps are compared
+    in different units; pass the species concentrations to weight edges by rates, k times the reactant concentrations
+    :param rxn: RMG reaction list, a MechanismIndex, or a LazyMechanism
+    :param target: (str) label of the target species, or a list of labels for a batched query
+    :param source: (str) label of the source species, 'API' when model_level != 0
+    :param k: (int) number of pathways
+    :param t: (float) reactor temperature (K)
+    :param exclude: species labels not used as pathway intermediates (e.g. solvent, O2)
+    :param concentrations: (dict) species concentrations by label (mol/m^3), species not given are taken as absent
+    :return: (list) of pathway dicts (a list of lists for a batched query)
+    """
+    key = (id(rxn), t, tuple(sorted(exclude)),
+           tuple(sorted(concentrations.items())) if concentrations is not None else None)
+    cached = _PATHWAY_GRAPHS.get(key)
+    if cached is None or cached[0] is not rxn:
+        if len(_PATHWAY_GRAPHS) >= 8:
+            _PATHWAY_GRAPHS.pop(next(iter(_PATHWAY_GRAPHS)))
+        cached = _PATHWAY_GRAPHS[key] = (rxn, PathwayGraph(rxn, t=t, concentrations=concentrations, exclude=exclude))
+    graph = cached[1]
+    if isinstance(target, (list, tuple, set)):
+        return [find_pathways(rxn, x, source=source, k=k, t=t, exclude=exclude, concentrations=concentrations)
+                for x in target]
+
+    pathways = graph.k_shortest_pathways(target, source=source, k=k)
+    display_pathways(pathways)
+    return pathways
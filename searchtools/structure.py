@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+structure-based index of the species of an rmg mechanism
+species are bucketed by a cheap graph fingerprint (formula, multiplicity and heavy atom connectivity),
+which does not depend on the resonance structure, so full isomorphism checks only run on a few candidates
+"""
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from rmgpy.molecule import Molecule
+
+from searchtools.index import MechanismIndex
+
+
+def get_fingerprint(mol: Molecule) -> Tuple:
+    """
+    get a cheap graph fingerprint of a molecule which is identical for all its resonance structures
+    :param mol: rmg molecule
+    :return: (tuple) the fingerprint
+    """
+    connectivity = sorted((atom.element.symbol, len(atom.edges)) for atom in mol.vertices if not atom.is_hydrogen())
+    return mol.get_formula(), mol.multiplicity, tuple(connectivity)
+
+
+def get_inchi_key(mol: Molecule) -> Optional[str]:
+    """
+    get the InChIKey of a molecule
+    :param mol: rmg molecule
+    :return: (str) the InChIKey, or None if it could not be generated
+    """
+    try:
+        return mol.to_inchi_key()
+    except Exception:
+        return None
+
+
+@lru_cache(maxsize=4096)
+def get_resonance_structures(smiles: str) -> Tuple[Molecule, ...]:
+    """
+    get the resonance structures of a species given as smiles, memoized per smiles
+    :param smiles: (str) species as smiles
+    :return: (tuple) of rmg molecules
+    """
+    mol = Molecule().from_smiles(smiles)
+    return tuple(mol.generate_resonance_structures())
+
+
+class StructureIndex(object):
+    """
+    an index of the species of a mechanism by structure
+
+    :param species: (list) rmg species list form RMGsp,RMGrxn=load_chemkin_file(chemkin_file,dict_file),
+                    or a LazyMechanism
+    """
+
+    def __init__(self, species: list):
+        if hasattr(species, 'iter_species_blocks'):
+            # a LazyMechanism, its species are built block by block
+            species = [sp for block in species.iter_species_blocks() for sp in block]
+        self.species = list(species)
+        self.by_fingerprint = dict()  # type: Dict[Tuple, List[object]]
+        self.inchi_keys = dict()  # type: Dict[int, Optional[str]]
+        for sp in self.species:
+            self.by_fingerprint.setdefault(get_fingerprint(sp.molecule[0]), list()).append(sp)
+
+    def get_species_inchi_key(self, sp) -> Optional[str]:
+        """
+        get the InChIKey of a species in the index, memoized
+        :param sp: rmg species
+        :return: (str) the InChIKey
+        """
+        if id(sp) not in self.inchi_keys:
+            self.inchi_keys[id(sp)] = get_inchi_key(sp.molecule[0])
+        return self.inchi_keys[id(sp)]
+
+    def get_candidates(self, mol: Molecule) -> list:
+        """
+        get the species which pass the prefilter for a molecule,
+        species with the same InChIKey as the molecule are ordered first
+        :param mol: rmg molecule
+        :return: (list) of rmg species
+        """
+        candidates = self.by_fingerprint.get(get_fingerprint(mol), list())
+        if len(candidates) > 1:
+            inchi_key = get_inchi_key(mol)
+            candidates = sorted(candidates, key=lambda sp: self.get_species_inchi_key(sp) != inchi_key)
+        return candidates
+
+    def find(self, smiles: str):
+        """
+        find a species by smiles
+        :param smiles: (str) species as smiles
+        :return: rmg species, or None if not found
+        """
+        res = get_resonance_structures(smiles)
+        for sp in self.get_candidates(res[0]):
+            for s in res:
+                if sp.is_isomorphic(s):
+                    return sp
+        return None
+
+    def find_batch(self, smiles_list: Iterable[str]) -> list:
+        """
+        find many species by smiles
+        :param smiles_list: species as smiles
+        :return: (list) of rmg species (None for smiles not found)
+        """
+        return [self.find(smiles) for smiles in smiles_list]
+
+
+_INDICES = dict()
+
+
+def get_structure_index(rmg_spc) -> StructureIndex:
+    """
+    get the structure index of a species list, building it on the first query and reusing it later
+    :param rmg_spc: (list) rmg species list, a MechanismIndex, a LazyMechanism, or a StructureIndex
+    :return: StructureIndex
+    """
+    if isinstance(rmg_spc, StructureIndex):
+        return rmg_spc
+    if isinstance(rmg_spc, MechanismIndex):
+        rmg_spc = rmg_spc.species
+    cached = _INDICES.get(id(rmg_spc))
+    if cached is not None and cached[0] is rmg_spc and cached[1] == len(rmg_spc):
+        return cached[2]
+    index = StructureIndex(rmg_spc)
+    if len(_INDICES) >= 8:
+        _INDICES.pop(next(iter(_INDICES)))
+    _INDICES[id(rmg_spc)] = (rmg_spc, len(rmg_spc), index)
+    return index
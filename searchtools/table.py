@@ -0,0 +1,604 @@
+#!/usr/bin/env python
+# encoding: utf-8
+"""
+compact read-only table of an rmg mechanism
+species and reactions are stored as numpy structured arrays, all strings are interned in a single pool
+the table round-trips to one binary file which is memory mapped on loading,
+so several mechanisms can be kept side by side and only the pages a query touches are read
+full rmg species and reactions are only built on demand
+"""
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+MAGIC = b'APIOXYMT'
+TABLE_VERSION = 2
+ALIGNMENT = 64
+MAX_REACTANTS = 3  # reactants (or products) per reaction row, padded with -1
+
+# kinetics types of the packed parameters, KINETICS_OTHER kinetics types are not stored
+KINETICS_OTHER, KINETICS_NONE, KINETICS_ARRHENIUS, KINETICS_MULTI_ARRHENIUS, KINETICS_PDEP_ARRHENIUS = range(-1, 4)
+KINETICS_MULTI_PDEP_ARRHENIUS, KINETICS_CHEBYSHEV, KINETICS_THIRD_BODY, KINETICS_LINDEMANN, KINETICS_TROE = range(4, 9)
+KINETICS_CLASSES = {KINETICS_ARRHENIUS: 'Arrhenius',
+                    KINETICS_MULTI_ARRHENIUS: 'MultiArrhenius',
+                    KINETICS_PDEP_ARRHENIUS: 'PDepArrhenius',
+                    KINETICS_MULTI_PDEP_ARRHENIUS: 'MultiPDepArrhenius',
+                    KINETICS_CHEBYSHEV: 'Chebyshev',
+                    KINETICS_THIRD_BODY: 'ThirdBody',
+                    KINETICS_LINDEMANN: 'Lindemann',
+                    KINETICS_TROE: 'Troe',
+                    }
+KINETICS_TYPES = {name: kinetics_type for kinetics_type, name in KINETICS_CLASSES.items()}
+
+# the kinetics parameters of each reaction are a float64 sequence of the 'kinetics' array, in SI units:
+# Arrhenius: A, n, Ea, T0
+# MultiArrhenius and MultiPDepArrhenius: count, then the type and parameters of each component
+# PDepArrhenius: count, pressures, then the type and parameters of the kinetics at each pressure
+# Chebyshev: kunits string id, degreeT, degreeP, Tmin, Tmax, Pmin, Pmax, coefficients (row major)
+# ThirdBody: type and parameters of the low pressure limit, efficiencies
+# Lindemann: type and parameters of the high and of the low pressure limits, efficiencies
+# Troe: as Lindemann with alpha, T3, T1 and T2 (nan if None) before the efficiencies
+# efficiencies: count, then (smiles string id, efficiency) pairs
+
+SPECIES_DTYPE = np.dtype([('index', np.int32),
+                          ('label', np.int32),
+                          ('formula', np.int32),
+                          ('smiles', np.int32),
+                          ('inchi_key', np.int32),
+                          ('adjacency_list', np.int32),
+                          ('multiplicity', np.int8),
+                          ])
+
+REACTION_DTYPE = np.dtype([('index', np.int32),
+                           ('reactants', np.int32, (MAX_REACTANTS,)),
+                           ('products', np.int32, (MAX_REACTANTS,)),
+                           ('library', np.int32),
+                           ('family', np.int32),
+                           ('reversible', np.bool_),
+                           ('kinetics_type', np.int8),
+                           ('kinetics_offset', np.int64),
+                           ('kinetics_comment', np.int32),
+                           ])
+STRUCTURED_DTYPES = {'species': SPECIES_DTYPE, 'reactions': REACTION_DTYPE}
+
+
+class StringPool(object):
+    """
+    interned strings, each distinct string is stored once and referred to by an integer id (-1 for None)
+    """
+
+    def __init__(self):
+        self.strings = list()  # type: List[str]
+        self.ids = dict()  # type: Dict[str, int]
+
+    def add(self, string: Optional[str]) -> int:
+        """
+        intern a string
+        :param string: (str) the string, or None
+        :return: (int) the string id
+        """
+        if string is None:
+            return -1
+        if string not in self.ids:
+            self.ids[string] = len(self.strings)
+            self.strings.append(string)
+        return self.ids[string]
+
+    def to_arrays(self):
+        """
+        pack the pool into a utf-8 blob and an offset array
+        :return: (tuple) blob (uint8 array), offsets (int64 array)
+        """
+        encoded = [string.encode() for string in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(x) for x in encoded])
+        return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def _get_species_row(sp, pool: StringPool) -> tuple:
+    mol = sp.molecule[0]
+    smiles = inchi_key = None
+    try:
+        smiles = mol.to_smiles()
+        inchi_key = mol.to_inchi_key()
+    except Exception:
+        pass
+    index = getattr(sp, 'index', None)
+    return (index if index is not None else -1,
+            pool.add(sp.label),
+            pool.add(mol.get_formula()),
+            pool.add(smiles),
+            pool.add(inchi_key),
+            pool.add(sp.to_adjacency_list()),
+            mol.multiplicity,
+            )
+
+
+def get_rate_units(order: int) -> str:
+    """
+    get the SI units of a rate coefficient
+    :param order: (int) the reaction order
+    :return: (str) the units
+    """
+    if order == 1:
+        return 's^-1'
+    if order == 2:
+        return 'm^3/(mol*s)'
+    return f'm^{3 * (order - 1)}/(mol^{order - 1}*s)'
+
+
+def _pack_kinetics(kinetics, pool: StringPool, params: list) -> int:
+    """
+    append the parameters of a kinetics object to a parameter list
+    :param kinetics: rmg kinetics object, or None
+    :param pool: (StringPool) the string pool
+    :param params: (list) the parameters, appended in place
+    :return: (int) the kinetics type, KINETICS_OTHER (and nothing is appended) if the kinetics could not be packed
+    """
+    start = len(params)
+    try:
+        kinetics_type = _pack_kinetics_parameters(kinetics, pool, params)
+    except (AttributeError, TypeError, ValueError):
+        kinetics_type = KINETICS_OTHER
+    if kinetics_type == KINETICS_OTHER:
+        del params[start:]
+    return kinetics_type
+
+
+def _pack_kinetics_parameters(kinetics, pool: StringPool, params: list) -> int:
+    if kinetics is None:
+        return KINETICS_NONE
+    kinetics_type = KINETICS_TYPES.get(type(kinetics).__name__, KINETICS_OTHER)
+
+    def pack_component(component):
+        params.append(0.0)
+        position = len(params) - 1
+        params[position] = _pack_kinetics_parameters(component, pool, params)
+        if params[position] in (KINETICS_OTHER, KINETICS_NONE):
+            raise ValueError(f'Cannot pack {component!r}')
+
+    def pack_efficiencies():
+        efficiencies = getattr(kinetics, 'efficiencies', None) or dict()
+        params.append(len(efficiencies))
+        for molecule, efficiency in efficiencies.items():
+            params.extend([pool.add(molecule if isinstance(molecule, str) else molecule.to_smiles()), efficiency])
+
+    if kinetics_type == KINETICS_ARRHENIUS:
+        params.extend([kinetics.A.value_si, kinetics.n.value_si, kinetics.Ea.value_si, kinetics.T0.value_si])
+    elif kinetics_type in (KINETICS_MULTI_ARRHENIUS, KINETICS_MULTI_PDEP_ARRHENIUS):
+        params.append(len(kinetics.arrhenius))
+        for component in kinetics.arrhenius:
+            pack_component(component)
+    elif kinetics_type == KINETICS_PDEP_ARRHENIUS:
+        pressures = [float(pressure) for pressure in kinetics.pressures.value_si]
+        if len(pressures) != len(kinetics.arrhenius):
+            raise ValueError(f'Cannot pack {kinetics!r}')
+        params.append(len(pressures))
+        params.extend(pressures)
+        for component in kinetics.arrhenius:
+            pack_component(component)
+    elif kinetics_type == KINETICS_CHEBYSHEV:
+        coeffs = np.asarray(kinetics.coeffs.value_si, dtype=np.float64)
+        params.extend([pool.add(kinetics.kunits), coeffs.shape[0], coeffs.shape[1],
+                       kinetics.Tmin.value_si, kinetics.Tmax.value_si, kinetics.Pmin.value_si, kinetics.Pmax.value_si])
+        params.extend(coeffs.ravel().tolist())
+    elif kinetics_type == KINETICS_THIRD_BODY:
+        pack_component(kinetics.arrheniusLow)
+        pack_efficiencies()
+    elif kinetics_type in (KINETICS_LINDEMANN, KINETICS_TROE):
+        pack_component(kinetics.arrheniusHigh)
+        pack_component(kinetics.arrheniusLow)
+        if kinetics_type == KINETICS_TROE:
+            params.extend([getattr(kinetics.alpha, 'value_si', kinetics.alpha), kinetics.T3.value_si,
+                           kinetics.T1.value_si, kinetics.T2.value_si if kinetics.T2 is not None else np.nan])
+        pack_efficiencies()
+    return kinetics_type
+
+
+def _get_species_reactions(reactions: np.ndarray, number_of_species: int) -> tuple:
+    """
+    index the reaction rows of each species in compressed sparse rows
+    :param reactions: (np.ndarray) reaction rows of REACTION_DTYPE
+    :param number_of_species: (int) the number of species rows
+    :return: (tuple) offsets (int64 array of number_of_species + 1), reaction rows (int32 array, ordered per species)
+    """
+    participants = np.concatenate([reactions['reactants'], reactions['products']], axis=1)
+    rows = np.repeat(np.arange(len(reactions), dtype=np.int64), participants.shape[1])
+    species = participants.ravel().astype(np.int64)
+    stride = max(len(reactions), 1)
+    pairs = np.unique(species[species >= 0] * stride + rows[species >= 0])
+    offsets = np.zeros(number_of_species + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(pairs // stride, minlength=number_of_species))
+    return offsets, (pairs % stride).astype(np.int32)
+
+
+def _get_reaction_row(rxn, species_ids: Dict[str, int], pool: StringPool, params: list) -> tuple:
+    reactants, products = [-1] * MAX_REACTANTS, [-1] * MAX_REACTANTS
+    for row, side in ((reactants, rxn.reactants), (products, rxn.products)):
+        if len(side) > MAX_REACTANTS:
+            raise ValueError(f'Reaction {rxn} has more than {MAX_REACTANTS} reactants or products')
+        for i, sp in enumerate(side):
+            row[i] = species_ids[sp.label]
+    kinetics = getattr(rxn, 'kinetics', None)
+    kinetics_offset = len(params)
+    family = getattr(rxn, 'family', None)
+    return (rxn.index if rxn.index is not None else -1,
+            reactants,
+            products,
+            pool.add(getattr(rxn, 'library', None)),
+            pool.add(family if isinstance(family, str) else None),
+            bool(getattr(rxn, 'reversible', True)),
+            _pack_kinetics(kinetics, pool, params),
+            kinetics_offset,
+            pool.add(getattr(kinetics, 'comment', None) or None),
+            )
+
+
+class MechanismTable(object):
+    """
+    a compact, read-only mechanism
+    build it with MechanismTable.from_mechanism(RMGsp, RMGrxn), save it and load it back with MechanismTable.load(path)
+
+    :param species: (np.ndarray) species rows of SPECIES_DTYPE
+    :param reactions: (np.ndarray) reaction rows of REACTION_DTYPE
+    :param blob: (np.ndarray) the utf-8 string pool
+    :param offsets: (np.ndarray) the string offsets in the blob
+    :param kinetics: (np.ndarray) the packed kinetics parameters of all reactions
+    :param species_reaction_offsets: (np.ndarray) the offsets of the reaction rows of each species
+    :param species_reaction_rows: (np.ndarray) the reaction rows of all species, ordered per species
+    """
+
+    def __init__(self,
+                 species: np.ndarray,
+                 reactions: np.ndarray,
+                 blob: np.ndarray,
+                 offsets: np.ndarray,
+                 kinetics: np.ndarray,
+                 species_reaction_offsets: np.ndarray,
+                 species_reaction_rows: np.ndarray,
+                 ):
+        self.species = species
+        self.reactions = reactions
+        self.blob = blob
+        self.offsets = offsets
+        self.kinetics = kinetics
+        self.species_reaction_offsets = species_reaction_offsets
+        self.species_reaction_rows = species_reaction_rows
+        self._species_rows = None  # type: Optional[Dict[str, int]]
+        self._reaction_rows = None  # type: Optional[Dict[int, int]]
+        self._species = dict()
+        self._reactions = dict()
+
+    @classmethod
+    def from_mechanism(cls, species: list, reactions) -> 'MechanismTable':
+        """
+        build a table from a loaded mechanism
+        :param species: (list) rmg species list
+        :param reactions: (list) rmg reaction list, or a MechanismIndex
+        :return: MechanismTable
+        """
+        pool, params = StringPool(), list()
+        species_rows = [_get_species_row(sp, pool) for sp in species]
+        species_ids = {sp.label: i for i, sp in enumerate(species)}
+        reaction_rows = np.array([_get_reaction_row(rxn, species_ids, pool, params)
+                                  for rxn in getattr(reactions, 'reactions', reactions)], dtype=REACTION_DTYPE)
+        species_reaction_offsets, species_reaction_rows = _get_species_reactions(reaction_rows, len(species_rows))
+        blob, offsets = pool.to_arrays()
+        return cls(species=np.array(species_rows, dtype=SPECIES_DTYPE),
+                   reactions=reaction_rows,
+                   blob=blob,
+                   offsets=offsets,
+                   kinetics=np.array(params, dtype=np.float64),
+                   species_reaction_offsets=species_reaction_offsets,
+                   species_reaction_rows=species_reaction_rows)
+
+    @classmethod
+    def from_chemkin(cls, chemkin_path: str, dictionary_path: str) -> 'MechanismTable':
+        """
+        build a table from chemkin and species dictionary files
+        :param chemkin_path: (str) path to the chemkin file, e.g. chem_annotated.inp
+        :param dictionary_path: (str) path to the rmg species dictionary, e.g. species_dictionary.txt
+        :return: MechanismTable
+        """
+        from rmgpy.chemkin import load_chemkin_file
+
+        species, reactions = load_chemkin_file(chemkin_path, dictionary_path)
+        return cls.from_mechanism(species, reactions)
+
+    def save(self, path: str):
+        """
+        save the table to a binary file, written atomically
+        :param path: (str) the file path
+        """
+        arrays = {'species': self.species, 'reactions': self.reactions, 'blob': self.blob, 'offsets': self.offsets,
+                  'kinetics': self.kinetics, 'species_reaction_offsets': self.species_reaction_offsets,
+                  'species_reaction_rows': self.species_reaction_rows}
+        header, position = {'version': TABLE_VERSION, 'arrays': dict()}, 0
+        for name, array in arrays.items():
+            header['arrays'][name] = {'offset': position, 'shape': list(array.shape)}
+            if name not in STRUCTURED_DTYPES:
+                header['arrays'][name]['dtype'] = array.dtype.str
+            position += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+        encoded = json.dumps(header).encode()
+        data_start = -(-(len(MAGIC) + 8 + len(encoded)) // ALIGNMENT) * ALIGNMENT
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(MAGIC + np.uint64(len(encoded)).tobytes() + encoded)
+            for name, array in arrays.items():
+                f.seek(data_start + header['arrays'][name]['offset'])
+                f.write(np.ascontiguousarray(array).tobytes())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> 'MechanismTable':
+        """
+        load a table from a binary file
+        :param path: (str) the file path
+        :param mmap: (bool) whether to memory map the arrays (read-only) instead of reading them into memory
+        :return: MechanismTable
+        """
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f'{path} is not a mechanism table file')
+            length = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = json.loads(f.read(length).decode())
+        if header.get('version') != TABLE_VERSION:
+            raise ValueError(f'Unsupported mechanism table version {header.get("version")} in {path}')
+        data_start = -(-(len(MAGIC) + 8 + length) // ALIGNMENT) * ALIGNMENT
+        arrays = dict()
+        with open(path, 'rb') as f:
+            for name, entry in header['arrays'].items():
+                dtype = STRUCTURED_DTYPES.get(name) or np.dtype(entry['dtype'])
+                shape = tuple(entry['shape'])
+                if not int(np.prod(shape)):
+                    arrays[name] = np.zeros(shape, dtype=dtype)
+                elif mmap:
+                    arrays[name] = np.memmap(path, dtype=dtype, mode='r', offset=data_start + entry['offset'],
+                                             shape=shape)
+                else:
+                    f.seek(data_start + entry['offset'])
+                    arrays[name] = np.fromfile(f, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+        return cls(**arrays)
+
+    def get_string(self, string_id: int) -> Optional[str]:
+        """
+        get an interned string
+        :param string_id: (int) the string id
+        :return: (str) the string, or None for -1
+        """
+        if string_id < 0:
+            return None
+        return self.blob[self.offsets[string_id]:self.offsets[string_id + 1]].tobytes().decode()
+
+    @property
+    def species_labels(self) -> List[str]:
+        """
+        the labels of all species
+        """
+        return [self.get_string(i) for i in self.species['label']]
+
+    @property
+    def reaction_indices(self) -> List[int]:
+        """
+        the chemkin indices of all reactions
+        """
+        return self.reactions['index'].tolist()
+
+    def get_species_row(self, label: str) -> Optional[int]:
+        """
+        get the row of a species
+        :param label: (str) label of the species
+        :return: (int) the row, or None if not found
+        """
+        if self._species_rows is None:
+            self._species_rows = {label: i for i, label in enumerate(self.species_labels)}
+        return self._species_rows.get(label)
+
+    def get_reaction_row(self, index: int) -> Optional[int]:
+        """
+        get the row of a reaction
+        :param index: (int) chemkin reaction index
+        :return: (int) the row, or None if not found
+        """
+        if self._reaction_rows is None:
+            self._reaction_rows = dict()
+            for i, rxn_index in enumerate(self.reaction_indices):
+                self._reaction_rows.setdefault(rxn_index, i)
+        return self._reaction_rows.get(index)
+
+    def get_species_info(self, label: str) -> Optional[dict]:
+        """
+        get the stored fields of a species without building an rmg species
+        :param label: (str) label of the species
+        :return: (dict) with 'label', 'formula', 'smiles', 'inchi_key' and 'multiplicity' keys, or None
+        """
+        row = self.get_species_row(label)
+        if row is None:
+            return None
+        entry = self.species[row]
+        return {'label': label,
+                'formula': self.get_string(entry['formula']),
+                'smiles': self.get_string(entry['smiles']),
+                'inchi_key': self.get_string(entry['inchi_key']),
+                'multiplicity': int(entry['multiplicity']),
+                }
+
+    def get_species(self, label: str):
+        """
+        get a species by label, built from the stored adjacency list on the first access
+        :param label: (str) label of the species
+        :return: rmg species or None
+        """
+        if label not in self._species:
+            row = self.get_species_row(label)
+            if row is None:
+                return None
+            from rmgpy.species import Species
+
+            species = Species().from_adjacency_list(self.get_string(self.species[row]['adjacency_list']))
+            species.label = label
+            species.index = int(self.species[row]['index'])
+            self._species[label] = species
+        return self._species[label]
+
+    def get_reaction(self, index: int):
+        """
+        get a reaction by chemkin reaction index, built on the first access
+        :param index: (int) chemkin reaction index
+        :return: rmg reaction or None
+        """
+        if index not in self._reactions:
+            row = self.get_reaction_row(index)
+            if row is None:
+                return None
+            from rmgpy.reaction import Reaction
+
+            entry = self.reactions[row]
+            kinetics = None
+            if entry['kinetics_type'] > KINETICS_NONE:
+                order = int((entry['reactants'] >= 0).sum())
+                kinetics = self._unpack_kinetics(int(entry['kinetics_type']), int(entry['kinetics_offset']), order)[0]
+                comment = self.get_string(entry['kinetics_comment'])
+                if comment is not None:
+                    kinetics.comment = comment
+            reaction = Reaction(index=index,
+                                reactants=[self.get_species(self.get_string(self.species[i]['label']))
+                                           for i in entry['reactants'] if i >= 0],
+                                products=[self.get_species(self.get_string(self.species[i]['label']))
+                                          for i in entry['products'] if i >= 0],
+                                kinetics=kinetics,
+                                reversible=bool(entry['reversible']),
+                                )
+            library = self.get_string(entry['library'])
+            if library is not None:
+                reaction.library = library
+            family = self.get_string(entry['family'])
+            if family is not None:
+                reaction.family = family
+            self._reactions[index] = reaction
+        return self._reactions[index]
+
+    def _unpack_kinetics(self, kinetics_type: int, position: int, order: int) -> tuple:
+        """
+        rebuild an rmg kinetics object from its packed parameters
+        :param kinetics_type: (int) the kinetics type
+        :param position: (int) the position of the parameters in the kinetics array
+        :param order: (int) the reaction order, which determines the units of the rate coefficients
+        :return: (tuple) the rmg kinetics object and the position following its parameters
+        """
+        import rmgpy.kinetics
+
+        params = self.kinetics
+        kinetics_class = getattr(rmgpy.kinetics, KINETICS_CLASSES[kinetics_type])
+
+        def unpack_component(position, order):
+            return self._unpack_kinetics(int(params[position]), position + 1, order)
+
+        def unpack_efficiencies(position):
+            count = int(params[position])
+            pairs = params[position + 1:position + 1 + 2 * count].reshape(count, 2)
+            return {self.get_string(int(i)): float(efficiency) for i, efficiency in pairs}, position + 1 + 2 * count
+
+        if kinetics_type == KINETICS_ARRHENIUS:
+            A, n, Ea, T0 = params[position:position + 4].tolist()
+            return kinetics_class(A=(A, get_rate_units(order)), n=n, Ea=(Ea, 'J/mol'), T0=(T0, 'K')), position + 4
+        if kinetics_type in (KINETICS_MULTI_ARRHENIUS, KINETICS_MULTI_PDEP_ARRHENIUS, KINETICS_PDEP_ARRHENIUS):
+            count, position = int(params[position]), position + 1
+            pressures = None
+            if kinetics_type == KINETICS_PDEP_ARRHENIUS:
+                pressures, position = params[position:position + count].tolist(), position + count
+            components = list()
+            for _ in range(count):
+                component, position = unpack_component(position, order)
+                components.append(component)
+            if pressures is not None:
+                return kinetics_class(pressures=(pressures, 'Pa'), arrhenius=components), position
+            return kinetics_class(arrhenius=components), position
+        if kinetics_type == KINETICS_CHEBYSHEV:
+            kunits, degree_t, degree_p, T_min, T_max, P_min, P_max = params[position:position + 7].tolist()
+            position += 7
+            size = int(degree_t) * int(degree_p)
+            coeffs = np.array(params[position:position + size]).reshape(int(degree_t), int(degree_p))
+            return kinetics_class(coeffs=coeffs, kunits=self.get_string(int(kunits)), Tmin=(T_min, 'K'),
+                                  Tmax=(T_max, 'K'), Pmin=(P_min, 'Pa'), Pmax=(P_max, 'Pa')), position + size
+        if kinetics_type == KINETICS_THIRD_BODY:
+            low, position = unpack_component(position, order + 1)
+            efficiencies, position = unpack_efficiencies(position)
+            return kinetics_class(arrheniusLow=low, efficiencies=efficiencies), position
+        high, position = unpack_component(position, order)
+        low, position = unpack_component(position, order + 1)
+        if kinetics_type == KINETICS_LINDEMANN:
+            efficiencies, position = unpack_efficiencies(position)
+            return kinetics_class(arrheniusHigh=high, arrheniusLow=low, efficiencies=efficiencies), position
+        alpha, T3, T1, T2 = params[position:position + 4].tolist()
+        efficiencies, position = unpack_efficiencies(position + 4)
+        return kinetics_class(arrheniusHigh=high, arrheniusLow=low, alpha=alpha, T3=(T3, 'K'), T1=(T1, 'K'),
+                              T2=(T2, 'K') if not np.isnan(T2) else None, efficiencies=efficiencies), position
+
+    def get_reaction_rows_of_species(self, label: str) -> np.ndarray:
+        """
+        get the rows of all reactions a species participates in, as a reactant or a product
+        :param label: (str) label of the species
+        :return: (np.ndarray) of reaction rows, ordered as in the mechanism
+        """
+        row = self.get_species_row(label)
+        if row is None:
+            return np.zeros(0, dtype=np.int64)
+        start, end = self.species_reaction_offsets[row], self.species_reaction_offsets[row + 1]
+        return self.species_reaction_rows[start:end].astype(np.int64)
+
+    def get_reactions_of_species(self, label: str) -> list:
+        """
+        get all reactions a species participates in, only these reactions are built
+        :param label: (str) label of the species
+        :return: (list) of reactions
+        """
+        indices = self.reactions['index'][self.get_reaction_rows_of_species(label)]
+        return [self.get_reaction(int(index)) for index in indices]
+
+    def get_reactions_from_library(self, library: str) -> list:
+        """
+        get all the reactions from a specific library, only these reactions are built
+        :param library: (str) rmg library name
+        :return: (list) of reactions
+        """
+        pool_ids = [i for i in np.unique(self.reactions['library']) if i >= 0 and self.get_string(i) == library]
+        if not pool_ids:
+            return list()
+        indices = self.reactions['index'][self.reactions['library'] == pool_ids[0]]
+        return [self.get_reaction(int(index)) for index in indices]
+
+    def get_species_batch(self, labels: Iterable[str]) -> list:
+        """
+        get many species by label
+        :param labels: labels of the species
+        :return: (list) of rmg species (None for labels not found)
+        """
+        return [self.get_species(label) for label in labels]
+
+    def get_reactions_batch(self, indices: Iterable[int]) -> list:
+        """
+        get many reactions by chemkin reaction index
+        :param indices: chemkin reaction indices
+        :return: (list) of rmg reactions (None for indices not found)
+        """
+        return [self.get_reaction(index) for index in indices]
+
+    def get_rate_coefficients(self, T, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        evaluate the forward rate coefficients of Arrhenius reactions directly from the packed parameters
+        :param T: temperatures (K), a float or an array
+        :param rows: (np.ndarray) reaction rows, all reactions by default
+        :return: (np.ndarray) reactions x temperatures matrix in SI units (nan for other kinetics types)
+        """
+        from rmgpy.constants import R
+
+        T = np.atleast_1d(np.asarray(T, dtype=np.float64))
+        entries = self.reactions if rows is None else self.reactions[rows]
+        arrhenius = entries['kinetics_type'] == KINETICS_ARRHENIUS
+        A, n, Ea, T0 = self.kinetics[entries['kinetics_offset'][arrhenius][:, None] + np.arange(4)].T
+        k = np.full((len(entries), len(T)), np.nan)
+        k[arrhenius] = A[:, None] * (T[None, :] / T0[:, None]) ** n[:, None] * np.exp(-Ea[:, None] / (R * T[None, :]))
+        return k
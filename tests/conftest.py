@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy test configuration
+The local stand-ins of T3, ARC and RMG (see ``benchmarks/stubs``) are used if T3 is not installed,
+so the tests of APIOxy's own functions also run without the full T3 environment.
+"""
+
+import importlib.util
+
+import pytest
+
+from benchmarks.common import use_stubs
+
+
+if importlib.util.find_spec('t3') is None:
+    use_stubs()
+
+
+@pytest.fixture
+def library_cache(tmp_path, monkeypatch):
+    """Keep the library index out of the repository's Cache folder"""
+    import apioxy.libraries
+
+    monkeypatch.setattr(apioxy.libraries, 'CACHE_BASE_PATH', str(tmp_path / 'Cache'))
+    apioxy.libraries._LIBRARY_INDICES.clear()
+    return str(tmp_path / 'Cache')
+
+
+@pytest.fixture
+def make_apioxy(tmp_path, library_cache):
+    """Get a function constructing an APIOxy object of two APIs, keyword arguments update the apioxy block"""
+    import logging
+
+    from apioxy.main import APIOxy
+
+    def make(project_directory=None, t3=None, **kwargs):
+        apioxy = {'project': 'test_apioxy',
+                  'model_level': 1,
+                  'api_structures': [{'label': 'ibuprofen', 'smiles': 'CC(C)Cc1ccc(C(C)C(=O)O)cc1'},
+                                     {'label': 'paracetamol', 'smiles': 'CC(=O)Nc1ccc(O)cc1'}],
+                  }
+        apioxy.update(kwargs)
+        return APIOxy(project_directory=project_directory or str(tmp_path / 'test_apioxy'),
+                      apioxy=apioxy,
+                      rmg={'species': [{'label': 'water', 'smiles': 'O', 'concentration': 55.0, 'solvent': True},
+                                       {'label': 'O2', 'smiles': '[O][O]', 'concentration': 0.0003}]},
+                      t3=t3 or {'options': {'max_T3_iterations': 2}},
+                      verbose=logging.WARNING,
+                      )
+
+    return make
+
+
+# label, smiles of the species of the ``mechanism`` fixture
+MECHANISM_SPECIES = [('API', 'CCO'),
+                     ('O2', '[O][O]'),
+                     ('R', 'C[CH]O'),
+                     ('HO2', '[O]O'),
+                     ('ROO', 'CC(O)O[O]'),
+                     ('ROOH', 'CC(O)OO'),
+                     ('P', 'CC=O'),
+                     ('H2O2', 'OO'),
+                     ]
+# chemkin index, reactants, products, A (SI units), Ea (J/mol), library of the reactions of the ``mechanism`` fixture
+MECHANISM_REACTIONS = [(1, ['API', 'O2'], ['R', 'HO2'], 1e2, 8e4, None),
+                       (2, ['R', 'O2'], ['ROO'], 1e6, 0.0, 'API_soup'),
+                       (3, ['ROO', 'API'], ['ROOH', 'R'], 1e3, 5e4, None),
+                       (4, ['ROOH'], ['P', 'H2O2'], 1e13, 1.2e5, None),
+                       (5, ['R', 'HO2'], ['ROOH'], 1e7, 0.0, 'API_soup'),
+                       (6, ['ROO'], ['P', 'HO2'], 1e12, 9e4, None),
+                       ]
+
+
+@pytest.fixture
+def mechanism():
+    """Get the species and reactions of a small API oxidation mechanism, as loaded from a chemkin file"""
+    from rmgpy.kinetics import Arrhenius
+    from rmgpy.reaction import Reaction
+    from rmgpy.species import Species
+
+    species = [Species(label=label, index=i + 1).from_smiles(smiles)
+               for i, (label, smiles) in enumerate(MECHANISM_SPECIES)]
+    species_dict = {sp.label: sp for sp in species}
+    reactions = list()
+    for index, reactants, products, A, Ea, library in MECHANISM_REACTIONS:
+        units = 's^-1' if len(reactants) == 1 else 'm^3/(mol*s)'
+        rxn = Reaction(index=index,
+                       reactants=[species_dict[label] for label in reactants],
+                       products=[species_dict[label] for label in products],
+                       kinetics=Arrhenius(A=(A, units), n=0.0, Ea=(Ea, 'J/mol'), T0=(1, 'K')),
+                       )
+        if library is not None:
+            rxn.library = library
+        reactions.append(rxn)
+    return species, reactions
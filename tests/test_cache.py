@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the result cache module
+"""
+
+import copy
+import os
+import time
+
+import pytest
+
+from apioxy.cache import ResultCache, get_database_version, get_job_key, get_last_iteration_directory
+
+
+def get_job() -> dict:
+    """Get a minimal API job"""
+    return {'rmg': {'species': [{'label': 'API', 'smiles': 'CC(C)Cc1ccc(C(C)C(=O)O)cc1', 'concentration': 1},
+                                {'label': 'O2', 'smiles': '[O][O]', 'concentration': 0.01}],
+                    'database': {'thermo_libraries': ['primaryThermoLibrary', 'APIOxy_QM'],
+                                 'kinetics_libraries': ['BurkeH2O2inN2']},
+                    'reactors': [{'type': 'gas batch constant T P', 'T': 313, 'P': 1}],
+                    },
+            't3': {'options': {'library_name': 'APIOxy_QM', 'max_T3_iterations': 3}},
+            'qm': {'adapter': 'ARC', 'level_of_theory': 'b3lyp/6-31g(d,p)'},
+            }
+
+
+@pytest.fixture
+def thermo_libraries(tmp_path, monkeypatch):
+    """Point the RMG database at a temporary directory with two thermo libraries"""
+    import t3.main
+
+    path = tmp_path / 'RMG-database' / 'input' / 'thermo' / 'libraries'
+    path.mkdir(parents=True)
+    for library in ['primaryThermoLibrary', 'APIOxy_QM']:
+        (path / f'{library}.py').write_text(f'name = "{library}"\n')
+    monkeypatch.setattr(t3.main, 'RMG_THERMO_LIB_BASE_PATH', str(path))
+    return path
+
+
+def write_iteration(project_directory: str, iteration: int):
+    """Write the outputs of a T3 iteration"""
+    chemkin_path = os.path.join(project_directory, f'iteration_{iteration}', 'RMG', 'chemkin')
+    os.makedirs(chemkin_path)
+    with open(os.path.join(chemkin_path, 'chem_annotated.inp'), 'w') as f:
+        f.write(f'! iteration {iteration}\n')
+
+
+def test_get_job_key(thermo_libraries):
+    """Test that the cache key of an API job only changes with its inputs"""
+    job = get_job()
+    key = get_job_key(job)
+    assert len(key) == 64
+    assert get_job_key(get_job()) == key
+
+    # the order of the species does not matter
+    reordered = get_job()
+    reordered['rmg']['species'].reverse()
+    assert get_job_key(reordered) == key
+
+    changed = get_job()
+    changed['rmg']['reactors'][0]['T'] = 333
+    assert get_job_key(changed) != key
+
+    changed = get_job()
+    changed['qm']['level_of_theory'] = 'wb97xd/def2tzvp'
+    assert get_job_key(changed) != key
+
+    # the job is not modified
+    assert job == get_job()
+    assert get_job_key(copy.deepcopy(job)) == key
+
+
+def test_get_database_version(thermo_libraries):
+    """Test that library updates change the database version, except for the excluded QM library"""
+    database = get_job()['rmg']['database']
+    version = get_database_version(database, exclude=['APIOxy_QM'])
+    assert str(thermo_libraries / 'primaryThermoLibrary.py') in version
+    assert str(thermo_libraries / 'APIOxy_QM.py') not in version
+
+    key = get_job_key(get_job())
+    (thermo_libraries / 'APIOxy_QM.py').write_text('name = "APIOxy_QM"\nentries = 1\n')
+    assert get_job_key(get_job()) == key
+    (thermo_libraries / 'primaryThermoLibrary.py').write_text('name = "primaryThermoLibrary"\nentries = 1\n')
+    assert get_job_key(get_job()) != key
+
+
+def test_result_cache(tmp_path):
+    """Test storing, restoring, evicting and invalidating cached results"""
+    project_directory = str(tmp_path / 'project')
+    assert get_last_iteration_directory(project_directory) is None
+    write_iteration(project_directory, 1)
+    write_iteration(project_directory, 2)
+    assert get_last_iteration_directory(project_directory) == 'iteration_2'
+
+    cache = ResultCache(path=str(tmp_path / 'cache'))
+    assert not cache.has('a')
+    assert not cache.store('a', str(tmp_path / 'empty_project'))
+    assert cache.store('a', project_directory, label='ibuprofen')
+    assert cache.has('a')
+    assert [(entry['key'], entry['label']) for entry in cache.get_entries()] == [('a', 'ibuprofen')]
+
+    restored_directory = str(tmp_path / 'restored')
+    assert cache.restore('a', restored_directory)
+    with open(os.path.join(restored_directory, 'iteration_2', 'RMG', 'chemkin', 'chem_annotated.inp')) as f:
+        assert f.read() == '! iteration 2\n'
+    assert not os.path.isdir(os.path.join(restored_directory, 'iteration_1'))
+    assert not cache.restore('b', restored_directory)
+
+    # the least recently used entry is evicted first
+    time.sleep(0.01)
+    assert cache.store('b', project_directory)
+    time.sleep(0.01)
+    cache.restore('a', restored_directory)
+    cache.max_size = max(entry['size'] for entry in cache.get_entries())
+    cache.evict()
+    assert cache.has('a') and not cache.has('b')
+
+    cache.invalidate('a')
+    assert not cache.has('a')
+    cache.store('c', project_directory)
+    cache.invalidate()
+    assert cache.get_entries() == list()
+
+
+def test_cache_settings(make_apioxy):
+    """Test that caching is opt-in"""
+    assert make_apioxy().apioxy['cache'] is False
+    assert make_apioxy(cache=True).apioxy['cache'] == {'path': None, 'max_size': 10.0}
+    assert make_apioxy(cache={'path': '/tmp/results'}).apioxy['cache'] == {'path': '/tmp/results', 'max_size': 10.0}
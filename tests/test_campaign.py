@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the campaign module
+"""
+
+import os
+
+import pytest
+
+from apioxy.cache import ResultCache
+from apioxy.campaign import (CAMPAIGN_STATUS_FILE_NAME, Campaign, clear_input_caches, get_campaign_inputs,
+                             get_input_project_directory, is_campaign_file, is_input_file)
+from apioxy.common import read_yaml_file, save_yaml_file
+
+
+def write_input(path: str, project: str, smiles: str = 'CC(=O)Nc1ccc(O)cc1', **kwargs) -> str:
+    """Write an APIOxy input file of a single API"""
+    apioxy = {'project': project, 'model_level': 1, 'api_structures': [{'label': project, 'smiles': smiles}]}
+    apioxy.update(kwargs)
+    save_yaml_file(path=path, content={'apioxy': apioxy,
+                                       'rmg': {'species': [{'label': 'O2', 'smiles': '[O][O]',
+                                                            'concentration': 0.0003}]},
+                                       't3': {'options': {'max_T3_iterations': 2}},
+                                       })
+    return path
+
+
+def test_get_input_project_directory():
+    """Test the project directory assignment of campaign inputs"""
+    campaign_directory = os.path.join(os.sep, 'tmp', 'campaign')
+    input_dict = {'project': 'ibuprofen', 'apioxy': {'project': 'ibuprofen'}}
+    used_directories = list()
+    for expected in ['ibuprofen', 'ibuprofen_2', 'ibuprofen_3']:
+        project_directory = get_input_project_directory(input_dict, campaign_directory, used_directories)
+        assert project_directory == os.path.join(campaign_directory, expected)
+        used_directories.append(project_directory)
+
+    input_dict = {'apioxy': {'project': 'naproxen'}}
+    assert get_input_project_directory(input_dict, campaign_directory, used_directories) == \
+        os.path.join(campaign_directory, 'naproxen')
+
+    input_dict = {'project': 'ibuprofen', 'apioxy': {'project': 'ibuprofen', 'project_directory': 'relative/path'}}
+    assert get_input_project_directory(input_dict, campaign_directory, used_directories) == \
+        os.path.abspath('relative/path')
+
+
+def test_get_campaign_inputs(tmp_path):
+    """Test collecting campaign inputs from input files, directories and campaign files"""
+    inputs_directory = tmp_path / 'inputs'
+    inputs_directory.mkdir()
+    b_path = write_input(str(inputs_directory / 'b.yml'), 'b')
+    a_path = write_input(str(inputs_directory / 'a.yaml'), 'a')
+    (inputs_directory / 'notes.txt').write_text('not an input')
+    save_yaml_file(path=str(inputs_directory / 'other.yml'), content={'rmg': dict()})
+    single_path = write_input(str(tmp_path / 'single.yml'), 'single')
+    campaign_path = str(tmp_path / 'campaign.yml')
+    save_yaml_file(path=campaign_path, content={'campaign': {'max_workers': 4,
+                                                             'inputs': ['single.yml',
+                                                                        {'path': 'inputs', 'priority': 10}]}})
+    assert is_input_file(a_path) and not is_input_file(campaign_path)
+    assert is_campaign_file(campaign_path) and not is_campaign_file(a_path)
+
+    settings, inputs = get_campaign_inputs([str(inputs_directory)])
+    assert settings == dict()
+    assert inputs == [{'path': a_path, 'priority': None}, {'path': b_path, 'priority': None}]
+
+    settings, inputs = get_campaign_inputs([campaign_path])
+    assert settings == {'max_workers': 4, 'project_directory': str(tmp_path)}
+    assert inputs == [{'path': single_path, 'priority': 0}, {'path': a_path, 'priority': 10},
+                      {'path': b_path, 'priority': 10}]
+
+    with pytest.raises(ValueError):
+        get_campaign_inputs([str(tmp_path / 'missing')])
+
+
+def test_clear_input_caches(tmp_path):
+    """Test invalidating the result cache configured by each campaign input"""
+    paths = [write_input(str(tmp_path / 'a.yml'), 'a', cache={'path': str(tmp_path / 'cache_a')}),
+             write_input(str(tmp_path / 'b.yml'), 'b', cache={'path': str(tmp_path / 'cache_b')}),
+             write_input(str(tmp_path / 'c.yml'), 'c', cache={'path': str(tmp_path / 'cache_a')}),
+             str(tmp_path / 'missing.yml'),
+             ]
+    for name in ['cache_a', 'cache_b', 'cache_other']:
+        os.makedirs(str(tmp_path / name / 'key'))
+    assert clear_input_caches(paths) == [str(tmp_path / 'cache_a'), str(tmp_path / 'cache_b')]
+    assert ResultCache(path=str(tmp_path / 'cache_a')).get_entries() == list()
+    assert not os.listdir(str(tmp_path / 'cache_a')) and not os.listdir(str(tmp_path / 'cache_b'))
+    assert os.listdir(str(tmp_path / 'cache_other')) == ['key']
+
+
+def test_campaign(tmp_path, library_cache):
+    """Test executing the APIs of several inputs in one campaign"""
+    paths = [write_input(str(tmp_path / 'a.yml'), 'a'),
+             write_input(str(tmp_path / 'b.yml'), 'b', smiles='CC(C)Cc1ccc(C(C)C(=O)O)cc1', priority=5),
+             str(tmp_path / 'missing.yml'),
+             ]
+    campaign = Campaign(inputs=[{'path': path, 'priority': None} for path in paths],
+                        project_directory=str(tmp_path / 'campaign'), max_workers=2)
+    jobs = campaign.get_jobs()
+    assert [job['label'] for job in jobs] == ['b', 'a']
+    assert campaign.project_directories[:2] == [str(tmp_path / 'campaign' / 'a'), str(tmp_path / 'campaign' / 'b')]
+
+    campaign = Campaign(inputs=[{'path': path, 'priority': None} for path in paths],
+                        project_directory=str(tmp_path / 'campaign'), max_workers=2)
+    results = campaign.execute()
+    assert sorted((result['label'], result['status']) for result in results) == [('a', 'completed'),
+                                                                                 ('b', 'completed')]
+    status = read_yaml_file(str(tmp_path / 'campaign' / CAMPAIGN_STATUS_FILE_NAME))
+    assert status['inputs'] == 3
+    assert status['apis'] == 2
+    assert status['counts'] == {'completed': 2, 'failed': 1}
+    assert [entry['status'] for entry in status['jobs']] == ['completed', 'completed', 'failed']
@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the start-up import budget
+"""
+
+from benchmarks.check_imports import DEFAULT_BUDGET, measure_startup
+
+
+def test_startup_imports():
+    """Test that the start-up modules import no heavy package and are imported within the budget"""
+    result = measure_startup(repeat=3)
+    assert result['heavy'] == list()
+    assert result['time'] < DEFAULT_BUDGET
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the constraints module
+"""
+
+from apioxy import constraints
+from apioxy.constraints import (ConstraintTuner, get_adaptive_constraints_settings, get_bound_elements,
+                                get_core_additions, get_initial_constraints)
+
+
+CEILING = {'max_C_atoms': 16, 'max_O_atoms': 8, 'max_heavy_atoms': 24, 'max_radical_electrons': 2}
+INITIAL = {'max_C_atoms': 13, 'max_O_atoms': 4, 'max_heavy_atoms': 17, 'max_radical_electrons': 2}
+STEPS = {'C': 1, 'O': 2, 'heavy': 2}
+
+
+def test_get_adaptive_constraints_settings():
+    """Test the adaptive constraints settings defaults"""
+    assert get_adaptive_constraints_settings(False) is None
+    assert get_adaptive_constraints_settings(True) == constraints.DEFAULT_ADAPTIVE_CONSTRAINTS
+    settings = get_adaptive_constraints_settings({'steps': {'O': 4}, 'max_edge_growth': 2.0})
+    assert settings['steps'] == dict(constraints.DEFAULT_ADAPTIVE_CONSTRAINTS['steps'], O=4)
+    assert settings['max_edge_growth'] == 2.0
+    assert constraints.DEFAULT_ADAPTIVE_CONSTRAINTS['steps']['O'] == 2
+
+
+def test_get_core_additions(tmp_path):
+    """Test reading the species RMG moved to the core from its log"""
+    assert get_core_additions(None) == list()
+    assert get_core_additions(str(tmp_path / 'missing.log')) == list()
+    rmg_log_path = tmp_path / 'RMG.log'
+    rmg_log_path.write_text('Adding species S(11) to model core\n'
+                            'Adding reaction library reactions to model edge\n'
+                            'At time 1.0 s, species S(10) at rate ratio 2.0 exceeded the minimum rate for moving '
+                            'to model core\n'
+                            'Adding species S(10) to model core\n')
+    assert get_core_additions(str(rmg_log_path)) == ['S(11)', 'S(10)']
+
+
+def test_get_initial_constraints():
+    """Test the tight initial species constraints of the adaptive mode"""
+    margins = constraints.DEFAULT_ADAPTIVE_CONSTRAINTS['margins']
+    assert get_initial_constraints(CEILING, [{'C': 13, 'H': 18, 'O': 2}], margins=margins) == INITIAL
+    # the initial constraints never exceed the ceiling
+    assert get_initial_constraints(CEILING, [{'C': 30, 'O': 8}], margins=margins) == CEILING
+
+
+def test_get_bound_elements():
+    """Test finding the elements whose bound is reached"""
+    assert get_bound_elements(INITIAL, [{'C': 10, 'H': 12, 'O': 4}]) == ['O']
+    assert get_bound_elements(INITIAL, [{'C': 13, 'H': 12, 'O': 4}]) == ['C', 'O', 'heavy']
+    assert get_bound_elements(INITIAL, [{'C': 2, 'H': 6, 'O': 1}, {'C': 12, 'O': 1}]) == list()
+    assert get_bound_elements(INITIAL, list()) == list()
+
+
+def test_constraint_tuner(tmp_path, monkeypatch):
+    """Test relaxing species constraints where flux reaches the bounds"""
+    element_counts = {'S(10)': {'C': 13, 'H': 20, 'O': 3},
+                      'S(11)': {'C': 10, 'H': 10, 'O': 4},
+                      'S(12)': {'C': 20, 'O': 10},
+                      }
+    monkeypatch.setattr(constraints, 'get_species_element_counts',
+                        lambda path, labels: [element_counts[label] for label in labels if label in element_counts])
+    species_dictionary_path = tmp_path / 'species_dictionary.txt'
+    species_dictionary_path.write_text('')
+    rmg_log_path = tmp_path / 'RMG.log'
+
+    tuner = ConstraintTuner(ceiling=CEILING, species_constraints=INITIAL, steps=STEPS, max_edge_growth=3.0)
+    assert not tuner.is_pending()
+
+    rmg_log_path.write_text('Adding species S(11) to model core\n')
+    species_constraints = tuner.update(iteration=1, rmg_log_path=str(rmg_log_path),
+                                       species_dictionary_path=str(species_dictionary_path), edge_species=100)
+    assert species_constraints == dict(INITIAL, max_O_atoms=6)
+    assert tuner.history[-1]['relaxed'] == {'max_O_atoms': 6}
+    assert tuner.is_pending()
+
+    # no species reached the relaxed bounds
+    species_constraints = tuner.update(iteration=2, rmg_log_path=str(rmg_log_path),
+                                       species_dictionary_path=str(species_dictionary_path), edge_species=150)
+    assert species_constraints == dict(INITIAL, max_O_atoms=6)
+    assert not tuner.is_pending()
+
+    # the edge grows too fast to relax the bounds
+    rmg_log_path.write_text('Adding species S(10) to model core\n')
+    species_constraints = tuner.update(iteration=3, rmg_log_path=str(rmg_log_path),
+                                       species_dictionary_path=str(species_dictionary_path), edge_species=1000)
+    assert tuner.history[-1]['bound'] == ['C']
+    assert species_constraints == dict(INITIAL, max_O_atoms=6)
+    assert not tuner.is_pending()
+
+    # bounds are relaxed up to the ceiling
+    rmg_log_path.write_text('species S(12) at 1.0 s exceeded the minimum rate for moving to model core\n')
+    for iteration in range(4, 9):
+        species_constraints = tuner.update(iteration=iteration, rmg_log_path=str(rmg_log_path),
+                                           species_dictionary_path=str(species_dictionary_path), edge_species=1000)
+    assert species_constraints == CEILING
+    assert not tuner.is_pending()
+    assert tuner.species_constraints == species_constraints
+    assert INITIAL['max_O_atoms'] == 4
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the database module
+"""
+
+import os
+import stat
+
+import pytest
+
+import apioxy.database
+from apioxy.database import get_database_snapshot_key, load_rmg_database
+
+
+DATABASE = {'thermo_libraries': ['primaryThermoLibrary'],
+            'kinetics_libraries': ['BurkeH2O2inN2'],
+            'kinetics_families': ['H_Abstraction'],
+            }
+
+
+@pytest.fixture
+def rmg_database(tmp_path, monkeypatch, library_cache):
+    """Point the database module at a temporary RMG database with a library and a family"""
+    path = tmp_path / 'RMG-database' / 'input'
+    thermo_path = path / 'thermo' / 'libraries'
+    kinetics_path = path / 'kinetics' / 'libraries'
+    families_path = path / 'kinetics' / 'families'
+    for directory in [thermo_path, kinetics_path / 'BurkeH2O2inN2', families_path / 'H_Abstraction']:
+        directory.mkdir(parents=True)
+    (thermo_path / 'primaryThermoLibrary.py').write_text('name = "primaryThermoLibrary"\n')
+    (kinetics_path / 'BurkeH2O2inN2' / 'reactions.py').write_text('name = "BurkeH2O2inN2"\n')
+    (families_path / 'H_Abstraction' / 'groups.py').write_text('name = "H_Abstraction"\n')
+    monkeypatch.setattr(apioxy.database, 'RMG_DATABASE_PATH', str(path))
+    monkeypatch.setattr(apioxy.database, 'RMG_THERMO_LIB_BASE_PATH', str(thermo_path))
+    monkeypatch.setattr(apioxy.database, 'RMG_KINETICS_LIB_BASE_PATH', str(kinetics_path))
+    monkeypatch.setattr(apioxy.database, 'RMG_KINETICS_FAMILIES_BASE_PATH', str(families_path))
+    monkeypatch.setattr(apioxy.database, '_DATABASE_TREE_SIGNATURES', dict())
+    return path
+
+
+def test_get_database_snapshot_key(rmg_database):
+    """Test that the snapshot key follows the libraries, and that the families tree is only walked once"""
+    key = get_database_snapshot_key(DATABASE)
+    assert get_database_snapshot_key(DATABASE) == key
+    assert get_database_snapshot_key({**DATABASE, 'kinetics_families': ['R_Recombination']}) != key
+
+    # library files are checked on every call
+    library_file = rmg_database / 'thermo' / 'libraries' / 'primaryThermoLibrary.py'
+    library_file.write_text('name = "primaryThermoLibrary"\nentries = 1\n')
+    library_key = get_database_snapshot_key(DATABASE)
+    assert library_key != key
+
+    # the families tree signature is kept for the process
+    (rmg_database / 'kinetics' / 'families' / 'H_Abstraction' / 'groups.py').write_text('entries = 2\n')
+    assert get_database_snapshot_key(DATABASE) == library_key
+    apioxy.database._DATABASE_TREE_SIGNATURES.clear()
+    assert get_database_snapshot_key(DATABASE) != library_key
+
+
+def test_load_rmg_database_snapshot(rmg_database, tmp_path, monkeypatch):
+    """Test that a loaded database is stored as an owner-only snapshot and loaded from it later"""
+    snapshot_path = str(tmp_path / 'snapshots')
+    rmg_db = load_rmg_database(DATABASE, snapshot_path=snapshot_path)
+    snapshot_file = os.path.join(snapshot_path, f'{get_database_snapshot_key(DATABASE)}.pkl')
+    assert os.path.isfile(snapshot_file)
+    assert stat.S_IMODE(os.stat(snapshot_file).st_mode) == 0o600
+    assert stat.S_IMODE(os.stat(snapshot_path).st_mode) == 0o700
+
+    def load_from_files(database):
+        raise AssertionError('the database should be loaded from the snapshot')
+
+    monkeypatch.setattr(apioxy.database, 'load_rmg_database_from_files', load_from_files)
+    loaded = load_rmg_database(DATABASE, snapshot_path=snapshot_path)
+    assert type(loaded) is type(rmg_db)
+    assert loaded is not rmg_db
+    assert apioxy.database.rmgpy.data.rmg.database is loaded
+
+
+def test_load_rmg_database_untrusted_snapshot(rmg_database, tmp_path, monkeypatch):
+    """Test that a snapshot writable by others is not loaded"""
+    snapshot_path = str(tmp_path / 'snapshots')
+    load_rmg_database(DATABASE, snapshot_path=snapshot_path)
+    snapshot_file = os.path.join(snapshot_path, f'{get_database_snapshot_key(DATABASE)}.pkl')
+    os.chmod(snapshot_file, 0o666)
+    loads = list()
+
+    def load_from_files(database):
+        loads.append(database)
+        return apioxy.database.RMGDatabase()
+
+    monkeypatch.setattr(apioxy.database, 'load_rmg_database_from_files', load_from_files)
+    load_rmg_database(DATABASE, snapshot_path=snapshot_path)
+    assert loads == [DATABASE]
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the escalation module
+"""
+
+import logging
+import os
+
+from apioxy.escalation import AdaptiveEscalation, get_degradation_rate, get_top_contributors, is_converged
+from apioxy.metrics import MetricsRecorder
+
+
+LEVELS = {1: {'level_of_theory': 'level_1'},
+          2: {'level_of_theory': 'level_2'},
+          3: {'level_of_theory': 'level_3'},
+          4: {'level_of_theory': 'level_4'},
+          }
+SA_DICT = {'kinetics': {'API(1)': {'5': [0.0, -0.4], '7': [0.0, 0.1], '9': [0.0, 0.0]}},
+           'thermo': {'API(1)': {'S(3)': [0.0, 0.2]}},
+           }
+
+
+def write_profile(path: str, rate: float, time: float = 1e5):
+    """Write an RMG simulation profile in which the API degrades at a constant average rate"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(f'Time (s),API(1),O2(2)\n0.0,1.0,0.01\n{time / 2},{1 - rate * time / 2},0.01\n'
+                f'{time},{1 - rate * time},0.01\n')
+
+
+class EscalatingT3(object):
+    """A T3 stand-in whose SA predicts a given API degradation rate at each level of theory"""
+
+    def __init__(self, project_directory: str, rates: dict):
+        self.project_directory = project_directory
+        self.rates = rates
+        self.qm = dict()
+        self.species, self.reactions = dict(), dict()
+        self.iteration = 0
+        self.paths = dict()
+        self.sa_dict = None
+        self.logger = logging.getLogger('test_escalation')
+        self.metrics = MetricsRecorder(label='API')
+        self.arc_levels = list()
+
+    def set_paths(self):
+        self.paths = {'SA': os.path.join(self.project_directory, f'iteration_{self.iteration}', 'SA')}
+
+    def execute(self):
+        self.iteration = 1
+        self.set_paths()
+        self.run_sa()
+
+    def run_arc(self, arc_kwargs: dict):
+        self.arc_levels.append(arc_kwargs['level_of_theory'])
+
+    def process_arc_run(self):
+        pass
+
+    def run_rmg(self, restart_rmg: bool = False):
+        pass
+
+    def run_sa(self):
+        self.sa_dict = SA_DICT
+        write_profile(os.path.join(self.paths['SA'], 'solver', 'simulation_1_10.csv'),
+                      rate=self.rates[self.qm['level_of_theory']])
+
+
+def test_get_degradation_rate(tmp_path):
+    """Test getting the average API degradation rate from a simulation profile"""
+    path = str(tmp_path / 'simulation_1_10.csv')
+    write_profile(path, rate=2e-7)
+    assert abs(get_degradation_rate(path) - 2e-7) < 1e-15
+    assert get_degradation_rate(path, observable='water') is None
+    assert get_degradation_rate(str(tmp_path / 'missing.csv')) is None
+
+
+def test_get_top_contributors():
+    """Test ranking species and reactions by the sensitivity of the API concentration"""
+    assert get_top_contributors(SA_DICT, top_species=5, top_reactions=5) == (['S(3)'], [5, 7])
+    assert get_top_contributors(SA_DICT, top_species=0, top_reactions=1) == (list(), [5])
+    assert get_top_contributors(SA_DICT, top_species=5, top_reactions=5, observable='O2') == (list(), list())
+
+
+def test_is_converged():
+    """Test the convergence of the degradation rate between the two last levels"""
+    assert not is_converged([1e-6], tolerance=0.05)
+    assert not is_converged([1e-6, None], tolerance=0.05)
+    assert not is_converged([1e-6, 1.1e-6], tolerance=0.05)
+    assert is_converged([2e-6, 1e-6, 1.04e-6], tolerance=0.05)
+    assert is_converged([0.0, 0.0], tolerance=0.05)
+    assert not is_converged([0.0, 1e-9], tolerance=0.05)
+
+
+def test_escalation_convergence(tmp_path):
+    """Test that the escalation stops once the degradation rate converged"""
+    rates = {'level_1': 1e-6, 'level_2': 2e-6, 'level_3': 2.05e-6, 'level_4': 3e-6}
+    t3_object = EscalatingT3(str(tmp_path), rates=rates)
+    history = AdaptiveEscalation(t3_object=t3_object, levels=LEVELS,
+                                 escalation={'levels': [1, 2, 3, 4], 'tolerance': 0.05}).run()
+    assert [entry['level'] for entry in history] == [1, 2, 3]
+    assert [entry['iteration'] for entry in history] == [1, 2, 3]
+    assert [round(entry['degradation_rate'] * 1e6, 6) for entry in history] == [1.0, 2.0, 2.05]
+    assert t3_object.arc_levels == ['level_2', 'level_3']
+
+    # without convergence, all levels run
+    rates = {'level_1': 1e-6, 'level_2': 2e-6, 'level_3': 4e-6, 'level_4': 8e-6}
+    t3_object = EscalatingT3(str(tmp_path / 'not_converged'), rates=rates)
+    history = AdaptiveEscalation(t3_object=t3_object, levels=LEVELS,
+                                 escalation={'levels': [1, 2, 3, 4], 'tolerance': 0.05}).run()
+    assert [entry['level'] for entry in history] == [1, 2, 3, 4]
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy functional tests
+"""
+
+import os
+
+from apioxy.manifest import MANIFEST_FILE_NAME
+
+
+def test_execute(make_apioxy):
+    """Test executing the APIs of a project"""
+    apioxy_object = make_apioxy()
+    results = apioxy_object.execute()
+    assert [(result['label'], result['status']) for result in results] == \
+        [('ibuprofen', 'completed'), ('paracetamol', 'completed')]
+    assert os.path.isfile(os.path.join(apioxy_object.project_directory, MANIFEST_FILE_NAME))
+    for result in results:
+        assert os.path.isdir(result['project_directory'])
+        assert result['metrics']['status'] == 'completed'
+
+
+def test_execute_in_parallel(make_apioxy):
+    """Test executing the APIs of a project in worker processes"""
+    results = make_apioxy(run_in_parallel=True, max_workers=2).execute()
+    assert [(result['label'], result['status']) for result in results] == \
+        [('ibuprofen', 'completed'), ('paracetamol', 'completed')]
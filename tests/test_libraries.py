@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the libraries module
+"""
+
+import os
+
+import pytest
+
+from apioxy.libraries import LibraryIndex, get_kinetics_lib_base_path, get_library_index
+
+
+@pytest.fixture
+def libraries(tmp_path):
+    """Get the thermo libraries folder of a temporary RMG database with thermo and kinetics libraries"""
+    thermo_path = tmp_path / 'RMG-database' / 'input' / 'thermo' / 'libraries'
+    kinetics_path = tmp_path / 'RMG-database' / 'input' / 'kinetics' / 'libraries'
+    (thermo_path / 'Lai_Hexylbenzene').mkdir(parents=True)
+    (kinetics_path / 'BurkeH2O2inN2').mkdir(parents=True)
+    (kinetics_path / 'Empty').mkdir()
+    (thermo_path / 'primaryThermoLibrary.py').write_text('name = "primaryThermoLibrary"\n')
+    (thermo_path / 'Lai_Hexylbenzene' / 'lai.py').write_text('name = "lai"\n')
+    (kinetics_path / 'BurkeH2O2inN2' / 'reactions.py').write_text('name = "BurkeH2O2inN2"\n')
+    return str(thermo_path)
+
+
+def test_get_kinetics_lib_base_path():
+    """Test getting the kinetics libraries folder of a thermo libraries folder"""
+    assert get_kinetics_lib_base_path('/rmg/input/thermo/libraries/') == '/rmg/input/kinetics/libraries'
+
+
+def test_library_index(libraries, library_cache):
+    """Test looking up thermo and kinetics libraries by name and by path"""
+    index = LibraryIndex(libraries)
+    assert index.thermo_libraries == {'primaryThermoLibrary', os.path.join('Lai_Hexylbenzene', 'lai')}
+    assert index.kinetics_libraries == {'BurkeH2O2inN2'}
+    assert index.has_thermo_library('primaryThermoLibrary')
+    assert index.has_thermo_library('Lai_Hexylbenzene/lai')
+    assert not index.has_thermo_library('APIOxy_QM')
+    assert index.has_kinetics_library('BurkeH2O2inN2')
+    assert not index.has_kinetics_library('Empty')
+    assert index.has_thermo_library(os.path.join(libraries, 'primaryThermoLibrary.py'))
+    assert not index.has_kinetics_library(os.path.join(libraries, 'missing'))
+    assert os.path.isfile(index.index_path)
+    assert index.index_path.startswith(library_cache)
+
+
+def test_library_index_persistence(libraries, library_cache, monkeypatch):
+    """Test that a saved index is loaded without walking the libraries, and rebuilt once a library is added"""
+    LibraryIndex(libraries)
+
+    def build(self):
+        raise AssertionError('the index should be loaded from disk')
+
+    with monkeypatch.context() as m:
+        m.setattr(LibraryIndex, 'build', build)
+        index = LibraryIndex(libraries)
+    assert index.has_thermo_library('primaryThermoLibrary')
+
+    with open(os.path.join(libraries, 'APIOxy_QM.py'), 'w') as f:
+        f.write('name = "APIOxy_QM"\n')
+    assert index.is_stale()
+    assert index.has_thermo_library('APIOxy_QM')
+    assert not index.is_stale()
+    assert LibraryIndex(libraries).has_thermo_library('APIOxy_QM')
+
+
+def test_get_library_index(libraries, library_cache):
+    """Test that the library index is shared within the process"""
+    index = get_library_index(libraries)
+    assert get_library_index(libraries) is index
+    assert get_library_index(libraries, get_kinetics_lib_base_path(libraries)) is index
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the main module
+"""
+
+import os
+
+import pytest
+
+from apioxy.main import get_api_project, get_species_constraints
+
+
+def test_get_species_constraints():
+    """Test the RMG species constraints derived from the element counts of an API"""
+    species_constraints = get_species_constraints({'label': 'paracetamol', 'smiles': 'CC(=O)Nc1ccc(O)cc1'})
+    assert species_constraints['max_C_atoms'] == 10
+    assert species_constraints['max_O_atoms'] == 8
+    assert species_constraints['max_N_atoms'] == 1
+    assert species_constraints['max_S_atoms'] == 0
+    assert species_constraints['max_heavy_atoms'] == 21
+    assert species_constraints['max_radical_electrons'] == 1
+
+
+def test_get_api_project():
+    """Test the T3 project name and directory of an API"""
+    assert get_api_project(index=0, label='ibuprofen', number_of_apis=1, project='batch',
+                           project_directory='/projects/batch') == ('batch', '/projects/batch')
+    assert get_api_project(index=1, label='naproxen', number_of_apis=3, project='batch',
+                           project_directory='/projects/batch') == ('2_naproxen', '/projects/batch/2_naproxen')
+
+
+def test_apply_default_settings(make_apioxy):
+    """Test the default settings"""
+    apioxy_object = make_apioxy()
+    assert apioxy_object.apioxy['run_in_parallel'] is False
+    assert apioxy_object.apioxy['max_workers'] is None
+    assert apioxy_object.apioxy['zeneth_output_paths'] == [None, None]
+    assert apioxy_object.t3['options']['library_name'] == 'APIOxy'
+    assert apioxy_object.qm['adapter'] == 'ARC'
+
+    with pytest.raises(ValueError):
+        make_apioxy(api_structures=list())
+    with pytest.raises(ValueError):
+        make_apioxy(zeneth_output_paths=[None])
+
+
+def test_get_api_jobs(make_apioxy):
+    """Test generating isolated T3 jobs per API"""
+    apioxy_object = make_apioxy()
+    jobs = apioxy_object.get_api_jobs()
+    assert [job['project'] for job in jobs] == ['1_ibuprofen', '2_paracetamol']
+    assert [job['project_directory'] for job in jobs] == \
+        [os.path.join(apioxy_object.project_directory, project) for project in ['1_ibuprofen', '2_paracetamol']]
+    assert [job['rmg']['species'][-1]['label'] for job in jobs] == ['API', 'API']
+    assert jobs[0]['rmg']['species_constraints']['max_N_atoms'] == 0
+    assert jobs[1]['rmg']['species_constraints']['max_N_atoms'] == 1
+    assert jobs[0]['rmg'] is not jobs[1]['rmg'] and jobs[0]['qm'] is not apioxy_object.qm
+    assert len(apioxy_object.rmg['species']) == 2
+    assert jobs[0]['input_hash'] != jobs[1]['input_hash']
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the manifest module
+"""
+
+import os
+
+from apioxy.manifest import Manifest, get_job_input_hash
+
+
+def get_job(tmp_path, index: int) -> dict:
+    """Get a minimal API job"""
+    project = f'api_{index}'
+    return {'index': index,
+            'label': f'API_{index}',
+            'project': project,
+            'project_directory': str(tmp_path / project),
+            'rmg': {'species': [{'label': 'API', 'smiles': 'C' * (index + 1)}]},
+            't3': {'options': {'max_T3_iterations': 3}},
+            'qm': dict(),
+            }
+
+
+def get_result(job: dict, status: str) -> dict:
+    """Get the result of an API job"""
+    return {'index': job['index'], 'label': job['label'], 'project': job['project'],
+            'project_directory': job['project_directory'], 'status': status, 'error': None, 'wall_time': 1.0}
+
+
+def test_sort_jobs(tmp_path):
+    """Test sorting API jobs by their recorded status"""
+    jobs = [get_job(tmp_path, index) for index in range(6)]
+    manifest = Manifest(str(tmp_path))
+    manifest.record(get_result(jobs[0], 'completed'), get_job_input_hash(jobs[0]))
+    manifest.record(get_result(jobs[1], 'cached'), get_job_input_hash(jobs[1]))
+    manifest.record(get_result(jobs[2], 'failed'), get_job_input_hash(jobs[2]))
+    # recorded as completed, but with different inputs
+    manifest.record(get_result(jobs[3], 'completed'), get_job_input_hash(get_job(tmp_path, 10)))
+    os.makedirs(os.path.join(jobs[4]['project_directory'], 'iteration_1'))
+
+    # the manifest is read back from the project directory
+    jobs[0]['index'] = 7
+    completed, partial, pending = Manifest(str(tmp_path)).sort_jobs(jobs)
+    assert [(entry['project'], entry['index'], entry['status']) for entry in completed] == \
+        [('api_0', 7, 'completed'), ('api_1', 1, 'cached')]
+    assert [job['project'] for job in partial] == ['api_4']
+    assert [job['project'] for job in pending] == ['api_2', 'api_3', 'api_5']
+
+
+def test_resume(make_apioxy):
+    """Test resuming a project without running completed APIs again"""
+    results = make_apioxy().execute()
+    assert [result['status'] for result in results] == ['completed', 'completed']
+
+    apioxy_object = make_apioxy()
+    finished_results, jobs = apioxy_object.prepare_jobs()
+    assert [result['label'] for result in finished_results] == ['ibuprofen', 'paracetamol']
+    assert jobs == list()
+
+    # an API whose inputs changed runs again
+    apioxy_object = make_apioxy(api_structures=[{'label': 'ibuprofen', 'smiles': 'CC(C)Cc1ccc(C(C)C(=O)O)cc1'},
+                                                {'label': 'paracetamol', 'smiles': 'CC(=O)Nc1ccc(OC)cc1'}])
+    finished_results, jobs = apioxy_object.prepare_jobs()
+    assert [result['label'] for result in finished_results] == ['ibuprofen']
+    assert [job['label'] for job in jobs] == ['paracetamol']
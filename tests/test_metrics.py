@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the metrics module
+"""
+
+import csv
+import json
+import os
+
+import pytest
+
+from apioxy.metrics import (METRICS_CSV_FILE_NAME,
+                            METRICS_JSON_FILE_NAME,
+                            MetricsRecorder,
+                            escape_label_value,
+                            get_mechanism_size,
+                            get_rmg_memory,
+                            save_metrics,
+                            )
+
+
+def get_metrics() -> list:
+    """Get the metrics of a run with two phases, one of which failed"""
+    recorder = MetricsRecorder(label='API "1"\\a')
+    with recorder.phase('rmg', iteration=1):
+        pass
+    with pytest.raises(RuntimeError):
+        with recorder.phase('arc', iteration=1):
+            raise RuntimeError('ARC crashed')
+    recorder.record_iteration(1, edge_species=120, rmg_memory_mb=512.0)
+    recorder.record_iteration(2, edge_species=80)
+    recorder.count('thermo', 3)
+    recorder.count('thermo')
+    return [{**recorder.as_dict(), 'status': 'failed'}]
+
+
+def test_metrics_recorder():
+    """Test recording phases, per-iteration values and counters"""
+    metrics = get_metrics()[0]
+    assert [(phase['phase'], phase['iteration'], phase['status']) for phase in metrics['phases']] \
+        == [('rmg', 1, 'completed'), ('arc', 1, 'failed')]
+    assert all(phase['wall_time'] >= 0 and phase['cpu_time'] >= 0 for phase in metrics['phases'])
+    assert metrics['peak_edge_species'] == 120
+    assert metrics['peak_rmg_memory_mb'] == 512.0
+    assert metrics['counters'] == {'thermo': 4}
+    assert MetricsRecorder('API').get_peak('edge_species') is None
+
+
+def test_get_mechanism_size(tmp_path):
+    """Test counting the species and reactions of a chemkin file"""
+    path = tmp_path / 'chem_annotated.inp'
+    path.write_text('ELEMENTS H C O END\n\nSPECIES\n    O2(1)  API(2) ! the API\n    R(3)\nEND\n\n'
+                    'REACTIONS    KCAL/MOLE   MOLES\n! Reaction index: Chemkin #1\nAPI(2)+O2(1)<=>R(3) 1.0 0.0 1.0\n'
+                    'DUPLICATE\nAPI(2)+O2(1)<=>R(3) 2.0 0.0 1.0\nDUPLICATE\nR(3)(+M)<=>API(2)(+M) 1.0 0.0 1.0\n'
+                    '    LOW/ 1.0 0.0 0.0 /\nEND\n')
+    assert get_mechanism_size(str(path)) == {'species': 3, 'reactions': 3}
+    assert get_mechanism_size(str(tmp_path / 'missing.inp')) is None
+    assert get_mechanism_size(None) is None
+
+
+def test_get_rmg_memory(tmp_path):
+    """Test getting the peak memory use RMG reported"""
+    path = tmp_path / 'RMG.log'
+    path.write_text('Memory used: 812.50 MB\nmemory used: 1.5 GB\nMemory used: 900.00 MB\n')
+    assert get_rmg_memory(str(path)) == 1536.0
+    assert get_rmg_memory(str(tmp_path / 'missing.log')) is None
+
+
+def test_escape_label_value():
+    """Test escaping Prometheus label values"""
+    assert escape_label_value('S(12)') == 'S(12)'
+    assert escape_label_value('a "b"\\c\nd') == 'a \\"b\\"\\\\c\\nd'
+    assert escape_label_value(3) == '3'
+
+
+def test_save_metrics(tmp_path):
+    """Test saving metrics as JSON, CSV and Prometheus text files"""
+    metrics = get_metrics()
+    prometheus_path = str(tmp_path / 'apioxy.prom')
+    save_metrics('project "x"', str(tmp_path), metrics, prometheus_path=prometheus_path)
+
+    with open(os.path.join(tmp_path, METRICS_JSON_FILE_NAME)) as f:
+        assert json.load(f)['metrics'][0]['label'] == 'API "1"\\a'
+    with open(os.path.join(tmp_path, METRICS_CSV_FILE_NAME)) as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['phase'], row['status']) for row in rows] == [('rmg', 'completed'), ('arc', 'failed'),
+                                                               ('total', 'failed')]
+    assert rows[-1]['peak_edge_species'] == '120'
+
+    with open(prometheus_path) as f:
+        lines = f.read().splitlines()
+    assert '# TYPE apioxy_phase_wall_seconds gauge' in lines
+    labels = 'project="project \\"x\\"",api="API \\"1\\"\\\\a"'
+    assert any(line.startswith(f'apioxy_phase_wall_seconds{{{labels},phase="rmg",iteration="1"}} ')
+               for line in lines)
+    assert f'apioxy_peak_edge_species{{{labels},phase="total",iteration=""}} 120' in lines
+    assert f'apioxy_qm_jobs{{{labels},kind="thermo"}} 4' in lines
+    assert not os.path.isfile(f'{prometheus_path}.{os.getpid()}.tmp')
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the preflight module
+"""
+
+import os
+
+from apioxy.preflight import format_report, preflight, run_preflight, validate_reactor
+
+
+def get_input(tmp_path) -> dict:
+    """Get a valid APIOxy input of two APIs"""
+    return {'project': 'test_preflight',
+            'project_directory': str(tmp_path / 'test_preflight'),
+            'apioxy': {'model_level': 1,
+                       'api_structures': [{'label': 'ibuprofen', 'smiles': 'CC(C)Cc1ccc(C(C)C(=O)O)cc1'},
+                                          {'label': 'paracetamol', 'smiles': 'CC(=O)Nc1ccc(O)cc1'}]},
+            'rmg': {'species': [{'label': 'water', 'smiles': 'O', 'concentration': 55.0, 'solvent': True},
+                                {'label': 'O2', 'smiles': '[O][O]', 'concentration': 0.0003}],
+                    'reactors': [{'type': 'liquid batch constant T V', 'T': 313, 'termination_time': [5, 'days']}]},
+            }
+
+
+def test_validate_reactor():
+    """Test validating reactors"""
+    assert validate_reactor(0, {'type': 'gas batch constant T P', 'T': [300, 400], 'termination_conversion': {}}) \
+        == list()
+    assert validate_reactor(1, {'T': -3}) == ['Reactor 2: the reactor type is missing',
+                                              'Reactor 2: T must be a positive number or a list of positive numbers, '
+                                              'got -3',
+                                              'Reactor 2: no termination criterion, specify one of termination_time, '
+                                              'termination_conversion, termination_rate_ratio']
+    assert validate_reactor(0, 'reactor') == ['Reactor 1: expected a dictionary, got reactor']
+
+
+def test_preflight(tmp_path, library_cache):
+    """Test that a valid input has no problems and gets a job plan without writing project files"""
+    report = preflight(get_input(tmp_path), path='input.yml')
+    assert report['problems'] == list()
+    assert [(job['label'], job['project']) for job in report['jobs']] \
+        == [('ibuprofen', '1_ibuprofen'), ('paracetamol', '2_paracetamol')]
+    assert report['jobs'][1]['project_directory'] == os.path.join(str(tmp_path), 'test_preflight', '2_paracetamol')
+    assert report['jobs'][0]['species_constraints']['max_C_atoms'] > 0
+    assert not os.path.exists(tmp_path / 'test_preflight')
+    assert 'no problems found' in format_report(report)
+
+
+def test_preflight_lists_all_problems(tmp_path, library_cache):
+    """Test that all problems of an input are reported together"""
+    input_dict = get_input(tmp_path)
+    input_dict['apioxy']['api_structures'].append({'label': 'ibuprofen'})
+    input_dict['apioxy']['zeneth_output_paths'] = [str(tmp_path / 'missing.csv')]
+    input_dict['rmg']['species'].append({'smiles': 'N#N'})
+    input_dict['rmg']['reactors'].append({'type': 'liquid batch constant T V'})
+    input_dict['qm'] = {'level_of_theory': 'b3lyp/6-31g(d,p)'}
+    report = preflight(input_dict)
+    problems = report['problems']
+    assert problems[0] == 'Duplicate API labels: ibuprofen'
+    assert problems[1].startswith('The length of zeneth_output_paths (1)')
+    assert problems[2] == f'Zeneth output file {tmp_path / "missing.csv"} does not exist'
+    assert problems[3:5] == ['Reactor 2: the temperature (T) is missing',
+                             'Reactor 2: no termination criterion, specify one of termination_time, '
+                             'termination_conversion, termination_rate_ratio']
+    assert problems[5].startswith('Species <no label>: ')
+    assert problems[6].startswith('API 3: Species ibuprofen: ')
+    assert len(problems) == 7
+    assert len(report['jobs']) == 3
+    assert '7 problem(s):' in format_report(report)
+
+    input_dict['apioxy']['model_level'] = 5
+    assert preflight(input_dict)['problems'][0] == \
+        "Unsupported model_level 5, supported levels are ['custom', 0, 1, 2, 3, 'adaptive']"
+
+
+def test_run_preflight(tmp_path, library_cache):
+    """Test that an input file which cannot be loaded is reported"""
+    path = str(tmp_path / 'missing.yml')
+    reports = run_preflight([path])
+    assert reports[0]['path'] == path
+    assert reports[0]['problems'][0].startswith('Could not load the input file')
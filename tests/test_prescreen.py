@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the prescreen module
+"""
+
+import csv
+import os
+from types import SimpleNamespace
+
+import yaml
+from rmgpy.molecule import Molecule
+
+import apioxy.database
+import apioxy.prescreen
+from apioxy.prescreen import (PRESCREEN_CSV_FILE_NAME,
+                              PRESCREEN_YAML_FILE_NAME,
+                              get_abstraction_rates,
+                              get_ranking_key,
+                              rank_apis,
+                              save_prescreen,
+                              )
+
+
+API_STRUCTURES = [{'label': 'ibuprofen', 'smiles': 'CC(C)Cc1ccc(C(C)C(=O)O)cc1'},
+                  {'label': 'paracetamol', 'smiles': 'CC(=O)Nc1ccc(O)cc1'},
+                  {'label': 'broken', 'smiles': 'C1CC'}]
+
+
+class ConstantKinetics(object):
+    """Kinetics of a constant rate coefficient"""
+
+    def __init__(self, k: float):
+        self.k = k
+
+    def get_rate_coefficient(self, T: float) -> float:
+        return self.k
+
+
+def get_database(reactions: list):
+    """Get a stand-in of the RMG database whose 'api' family generates the given reactions"""
+    family = SimpleNamespace(get_kinetics=lambda rxn, **kwargs: [[ConstantKinetics(rxn.k)]])
+    kinetics = SimpleNamespace(families={'api': family},
+                               generate_reactions_from_families=lambda reactants, only_families: reactions)
+    return SimpleNamespace(kinetics=kinetics)
+
+
+def test_get_abstraction_rates(monkeypatch):
+    """Test that H abstraction rates are summed per API radical, and the hydroperoxide product is not counted"""
+    import rmgpy.species
+
+    monkeypatch.setattr(rmgpy.species.Species, 'generate_resonance_structures', lambda self: None, raising=False)
+    radicals = [Molecule(smiles='CC(C)[CH]c1ccc(C(C)C(=O)O)cc1'), Molecule(smiles='C[C](C)Cc1ccc(C(C)C(=O)O)cc1')]
+    hydroperoxide = Molecule(smiles='CC(C)(C#N)OO')
+    reactions = [SimpleNamespace(products=[radicals[0], hydroperoxide], k=10.0, template=None, degeneracy=2),
+                 SimpleNamespace(products=[hydroperoxide, radicals[1]], k=1.0, template=None, degeneracy=1),
+                 SimpleNamespace(products=[radicals[0], hydroperoxide], k=5.0, template=None, degeneracy=1)]
+    radical_keys = [radical.to_inchi_key() for radical in radicals]
+    rates = get_abstraction_rates(get_database(reactions),
+                                  Molecule(smiles=API_STRUCTURES[0]['smiles']),
+                                  peroxyl_radicals=apioxy.prescreen.PEROXYL_RADICALS,
+                                  T=313.0,
+                                  radical_keys=radical_keys)
+    assert rates == {radical_keys[0]: 15.0, radical_keys[1]: 1.0}
+
+
+def test_get_ranking_key():
+    """Test that APIs are ranked by their total rate coefficient, then by their weakest bond"""
+    results = [{'label': 'a', 'k_total': 1.0, 'min_bde': 350.0, 'error': None},
+               {'label': 'b', 'k_total': None, 'min_bde': None, 'error': 'ValueError: no structure'},
+               {'label': 'c', 'k_total': 1.0, 'min_bde': 340.0, 'error': None},
+               {'label': 'd', 'k_total': 5.0, 'min_bde': 360.0, 'error': None}]
+    assert [result['label'] for result in sorted(results, key=get_ranking_key)] == ['d', 'c', 'a', 'b']
+
+
+def test_rank_apis(monkeypatch):
+    """Test that the database is loaded once and the APIs are ranked"""
+    loads = list()
+    k_totals = {'ibuprofen': 2.0, 'paracetamol': 8.0}
+
+    def prescreen_api(species_dict, T, peroxyl_radicals):
+        label = species_dict['label']
+        return {'label': label, 'smiles': species_dict['smiles'], 'k_total': k_totals.get(label), 'min_bde': 350.0,
+                'weakest_site': 'C1-H', 'sites': list(), 'error': None if label in k_totals else 'ValueError: ring'}
+
+    monkeypatch.setattr(apioxy.database, 'load_rmg_database', loads.append)
+    monkeypatch.setattr(apioxy.prescreen, 'prescreen_api', prescreen_api)
+    ranking = rank_apis(API_STRUCTURES, database={'kinetics_families': ['api']}, max_workers=1)
+    assert loads == [{'kinetics_families': ['api']}]
+    assert [(result['rank'], result['label']) for result in ranking] == [(1, 'paracetamol'), (2, 'ibuprofen'),
+                                                                         (3, 'broken')]
+
+
+def test_save_prescreen(tmp_path):
+    """Test saving a pre-screen ranking, only screened APIs are listed as structures"""
+    ranking = [{'rank': 1, 'label': 'paracetamol', 'smiles': 'CC(=O)Nc1ccc(O)cc1', 'k_total': 8.0, 'min_bde': 350.0,
+                'weakest_site': 'O9-H', 'sites': [{'site': 'O9-H'}, {'site': 'N4-H'}], 'error': None},
+               {'rank': 2, 'label': 'broken', 'smiles': 'C1CC', 'k_total': None, 'min_bde': None,
+                'weakest_site': None, 'sites': list(), 'error': 'ValueError: ring'}]
+    save_prescreen(project_directory=str(tmp_path), ranking=ranking, api_structures=API_STRUCTURES, T=313.0)
+    with open(os.path.join(tmp_path, PRESCREEN_YAML_FILE_NAME)) as f:
+        content = yaml.safe_load(f)
+    assert content['T'] == 313.0
+    assert content['api_structures'] == [API_STRUCTURES[1]]
+    with open(os.path.join(tmp_path, PRESCREEN_CSV_FILE_NAME)) as f:
+        rows = list(csv.DictReader(f))
+    assert [(row['rank'], row['label'], row['sites']) for row in rows] == [('1', 'paracetamol', '2'),
+                                                                           ('2', 'broken', '0')]
+    assert rows[1]['error'] == 'ValueError: ring'
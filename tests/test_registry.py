@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the QM job registry module
+"""
+
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
+
+from apioxy.registry import QMJobRegistry, get_level_identity, get_reaction_identity, get_species_identity
+
+
+def test_claim(tmp_path):
+    """Test claiming calculations in the QM job registry"""
+    registry = QMJobRegistry(str(tmp_path / 'batch'))
+    assert registry.claim(key='species:A', owner='api_1', label='A') is None
+    assert registry.get_status('species:A') == 'running'
+
+    # a calculation running for another owner is not claimed, the claiming owner may claim it again
+    existing = registry.claim(key='species:A', owner='api_2')
+    assert existing == {'owner': 'api_1', 'label': 'A', 'status': 'running'}
+    assert registry.claim(key='species:A', owner='api_1', label='A') is None
+
+    registry.set_status('species:A', 'completed')
+    assert registry.claim(key='species:A', owner='api_2')['status'] == 'completed'
+
+    # a failed calculation is claimed again by another owner
+    registry.set_status('species:A', 'failed')
+    assert registry.claim(key='species:A', owner='api_2') is None
+    assert registry.claim(key='species:A', owner='api_1')['owner'] == 'api_2'
+
+    # running calculations are released when a batch starts
+    registry.release_running()
+    assert registry.get_status('species:A') == 'failed'
+    assert registry.claim(key='species:A', owner='api_1') is None
+
+    assert QMJobRegistry(str(tmp_path / 'batch')).get_status('species:A') == 'running'
+    assert registry.get_status('species:B') is None
+
+
+def test_identities():
+    """Test that calculation identities do not depend on labels, reaction direction or unrelated qm keys"""
+    ethanol, ethanol_2 = Species(label='EtOH').from_smiles('CCO'), Species(label='S(12)').from_smiles('CCO')
+    oh, water = Species(label='OH').from_smiles('[OH]'), Species(label='H2O').from_smiles('O')
+    radical = Species(label='R').from_smiles('C[CH]O')
+    assert get_species_identity(ethanol) == get_species_identity(ethanol_2)
+    assert get_species_identity(ethanol) != get_species_identity(radical)
+    assert get_reaction_identity(Reaction(reactants=[ethanol, oh], products=[radical, water])) == \
+        get_reaction_identity(Reaction(reactants=[water, radical], products=[oh, ethanol_2]))
+
+    level = {'level_of_theory': 'wb97xd/def2tzvp', 'job_types': {'rotors': True}}
+    assert get_level_identity(level) == get_level_identity({'level_of_theory': 'wb97xd/def2tzvp'})
+    assert get_level_identity(level) != get_level_identity({'level_of_theory': 'b3lyp/6-31g(d,p)'})
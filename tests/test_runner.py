@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the runner module
+"""
+
+import os
+
+import pytest
+
+from apioxy.runner import get_job_result, get_number_of_workers, run_api_jobs
+
+
+def get_jobs(number_of_jobs: int) -> list:
+    """Get minimal API jobs"""
+    return [{'index': i, 'label': f'API_{i}', 'project': f'api_{i}', 'project_directory': f'/tmp/api_{i}'}
+            for i in range(number_of_jobs)]
+
+
+def run_job(job: dict) -> dict:
+    """A job runner reporting the process it ran in, fails the job of index 1"""
+    result = get_job_result(job, status='failed' if job['index'] == 1 else 'completed')
+    result['pid'] = os.getpid()
+    return result
+
+
+def crash(job: dict) -> dict:
+    """A job runner which crashes the worker process of the job of index 0"""
+    if job['index'] == 0:
+        os._exit(1)
+    return get_job_result(job)
+
+
+def test_get_number_of_workers():
+    """Test determining the number of worker processes"""
+    assert get_number_of_workers(4, 10) == 4
+    assert get_number_of_workers(8, 3) == 3
+    assert get_number_of_workers(4, 0) == 1
+    assert get_number_of_workers(None, 1) == 1
+    for max_workers in [0, -1, 2.5]:
+        with pytest.raises(ValueError):
+            get_number_of_workers(max_workers, 4)
+
+
+def test_run_api_jobs_serially():
+    """Test running API jobs in the current process"""
+    reported = list()
+    results = run_api_jobs(get_jobs(3), run_in_parallel=False, job_runner=run_job, callback=reported.append)
+    assert [result['status'] for result in results] == ['completed', 'failed', 'completed']
+    assert {result['pid'] for result in results} == {os.getpid()}
+    assert [result['index'] for result in reported] == [0, 1, 2]
+
+
+def test_run_api_jobs_in_parallel():
+    """Test running API jobs in a pool of worker processes, results are ordered as the jobs"""
+    reported = list()
+    results = run_api_jobs(get_jobs(4), run_in_parallel=True, max_workers=2, job_runner=run_job,
+                           callback=reported.append)
+    assert [result['index'] for result in results] == [0, 1, 2, 3]
+    assert [result['status'] for result in results] == ['completed', 'failed', 'completed', 'completed']
+    assert os.getpid() not in {result['pid'] for result in results}
+    assert sorted(result['index'] for result in reported) == [0, 1, 2, 3]
+
+
+def test_run_api_jobs_worker_crash():
+    """Test that a crashed worker process is reported as a failed job"""
+    results = run_api_jobs(get_jobs(2), run_in_parallel=True, max_workers=2, job_runner=crash)
+    assert results[0]['status'] == 'failed'
+    assert results[0]['error'] is not None
+    assert results[0]['project'] == 'api_0'
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the searchtools diff module
+"""
+
+import json
+
+import pytest
+from rmgpy.kinetics import Arrhenius
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
+
+from searchtools.diff import diff_mechanisms, get_reaction_identity, get_species_identity, save_diff_report
+from searchtools.table import MechanismTable
+
+
+@pytest.fixture
+def rerun(mechanism):
+    """
+    Get a rerun of the mechanism fixture with fresh species objects, where P is relabeled 'acetaldehyde',
+    reaction 6 is removed, reaction 3 is ten times faster, and a peroxyl recombination to a new species is added
+    """
+    species, reactions = mechanism
+    new_species = {sp.label: Species(label=sp.label, index=sp.index).from_smiles(sp.molecule[0].to_smiles())
+                   for sp in species}
+    new_species['P'].label = 'acetaldehyde'
+    new_species['ROOR'] = Species(label='ROOR', index=9).from_smiles('CC(O)OOC(C)O')
+    new_reactions = list()
+    for rxn in reactions:
+        if rxn.index == 6:
+            continue
+        A = rxn.kinetics.A.value_si * (10 if rxn.index == 3 else 1)
+        new_reactions.append(Reaction(index=rxn.index,
+                                      reactants=[new_species[sp.label] for sp in rxn.reactants],
+                                      products=[new_species[sp.label] for sp in rxn.products],
+                                      kinetics=Arrhenius(A=(A, 'm^3/(mol*s)' if len(rxn.reactants) == 2 else 's^-1'),
+                                                         n=0.0, Ea=(rxn.kinetics.Ea.value_si, 'J/mol'), T0=(1, 'K'))))
+    new_reactions.append(Reaction(index=7,
+                                  reactants=[new_species['ROO'], new_species['R']],
+                                  products=[new_species['ROOR']],
+                                  kinetics=Arrhenius(A=(1e6, 'm^3/(mol*s)'), n=0.0, Ea=(0.0, 'J/mol'), T0=(1, 'K'))))
+    return list(new_species.values()), new_reactions
+
+
+def test_diff_mechanisms(mechanism, rerun):
+    """Test the added, removed, renamed and changed species and reactions of two mechanisms"""
+    report = diff_mechanisms(*mechanism, *rerun, T=[313.0, 333.0])
+    assert report['temperatures'] == [313.0, 333.0]
+    assert report['species']['added'] == ['ROOR']
+    assert report['species']['removed'] == list()
+    assert report['species']['common'] == 8
+    assert report['species']['renamed'] == [['P', 'acetaldehyde']]
+
+    assert report['reactions']['added'] == [str(rerun[1][-1])]
+    assert report['reactions']['removed'] == [str(mechanism[1][5])]
+    assert report['reactions']['common'] == 5
+    assert len(report['reactions']['changed']) == 1
+    changed = report['reactions']['changed'][0]
+    assert changed['reaction_a'] == str(mechanism[1][2])
+    assert changed['log10_k_ratio'] == pytest.approx([1.0, 1.0])
+
+    # the same mechanism has no differences, also when given as a table
+    table = MechanismTable.from_mechanism(*mechanism)
+    report = diff_mechanisms(*mechanism, table, table)
+    assert report['species']['added'] == report['species']['removed'] == report['species']['renamed'] == list()
+    assert report['reactions']['added'] == report['reactions']['removed'] == report['reactions']['changed'] == list()
+    assert report['reactions']['common'] == 6
+
+
+def test_get_reaction_identity(mechanism):
+    """Test that reaction identities do not depend on the direction or on species labels"""
+    species, reactions = mechanism
+    identities = {sp.label: get_species_identity(sp) for sp in species}
+    flipped = Reaction(index=4, reactants=reactions[3].products, products=reactions[3].reactants)
+    identity, reverse = get_reaction_identity(reactions[3], identities)
+    assert get_reaction_identity(flipped, identities) == (identity, not reverse)
+    relabeled = dict(identities, acetaldehyde=identities['P'])
+    renamed = Reaction(index=4, reactants=reactions[3].reactants,
+                       products=[Species(label='acetaldehyde').from_smiles('CC=O'), reactions[3].products[1]])
+    assert get_reaction_identity(renamed, relabeled) == (identity, reverse)
+    assert get_species_identity(renamed.products[0]) == identities['P']
+
+
+def test_save_diff_report(mechanism, rerun, tmp_path):
+    """Test saving a diff report as json and as yaml"""
+    report = diff_mechanisms(*mechanism, *rerun)
+    save_diff_report(report, str(tmp_path / 'diff.json'))
+    with open(tmp_path / 'diff.json') as f:
+        assert json.load(f) == json.loads(json.dumps(report))
+    save_diff_report(report, str(tmp_path / 'diff.yml'))
+    assert 'renamed' in (tmp_path / 'diff.yml').read_text()
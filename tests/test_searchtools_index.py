@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the searchtools index module
+"""
+
+from searchtools.index import MechanismIndex, get_mechanism_index
+from searchtools.search import find_all_reaction_from_library, find_reaction_by_index, find_reactions_by_label
+
+
+def test_mechanism_index(mechanism):
+    """Test looking up species and reactions in an indexed mechanism"""
+    species, reactions = mechanism
+    index = MechanismIndex(species=species, reactions=reactions)
+    assert index.get_species('ROO') is species[4]
+    assert index.get_species('OH') is None
+    assert index.get_reaction(4) is reactions[3]
+    assert index.get_reaction(7) is None
+    assert [rxn.index for rxn in index.get_reactions_of_species('ROO')] == [2, 3, 6]
+    assert [rxn.index for rxn in index.get_reactions_of_species('HO2')] == [1, 5, 6]
+    assert index.get_reactions_of_species('OH') == list()
+    assert [rxn.index for rxn in index.get_reactions_from_library('API_soup')] == [2, 5]
+    assert index.get_neighbors('ROOH') == {'ROO', 'API', 'R', 'P', 'H2O2', 'HO2'}
+    assert [sp.label if sp is not None else None for sp in index.get_species_batch(['P', 'OH'])] == ['P', None]
+    assert [rxn.index if rxn is not None else None for rxn in index.get_reactions_batch([1, 9])] == [1, None]
+
+
+def test_get_mechanism_index(mechanism):
+    """Test that the index of a mechanism is reused until its lists change"""
+    species, reactions = mechanism
+    index = get_mechanism_index(rmg_spc=species, rmg_rxn=reactions)
+    assert get_mechanism_index(rmg_spc=species, rmg_rxn=reactions) is index
+    assert get_mechanism_index(rmg_rxn=index) is index
+
+    reactions.append(reactions[0])
+    rebuilt = get_mechanism_index(rmg_spc=species, rmg_rxn=reactions)
+    assert rebuilt is not index
+    assert len(rebuilt.get_reactions_of_species('API')) == 3
+
+
+def test_search_queries(mechanism):
+    """Test the search functions, including batched queries"""
+    _, reactions = mechanism
+    assert [rxn.index for rxn in find_reactions_by_label(reactions, 'R')] == [1, 2, 3, 5]
+    assert [len(x) for x in find_reactions_by_label(reactions, ['R', 'H2O2'])] == [4, 1]
+    assert find_reaction_by_index(reactions, 3) is reactions[2]
+    assert find_reaction_by_index(reactions, [6, 1]) == [reactions[5], reactions[0]]
+    assert find_all_reaction_from_library(reactions, 'API_soup') == [reactions[1], reactions[4]]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the searchtools kinetics module
+"""
+
+import numpy as np
+from rmgpy.kinetics import Arrhenius, Chebyshev, MultiArrhenius, MultiPDepArrhenius, PDepArrhenius
+
+from searchtools.kinetics import STABILITY_TEMPERATURES, KineticsEvaluator, PackedKinetics
+
+
+class ConstantKinetics(object):
+    """A kinetics type which is not packed, evaluated per reaction"""
+
+    def is_pressure_dependent(self) -> bool:
+        return False
+
+    def get_rate_coefficient(self, T: float) -> float:
+        return 42.0
+
+
+def get_arrhenius(A: float, n: float, Ea: float) -> Arrhenius:
+    """Get a unimolecular Arrhenius expression"""
+    return Arrhenius(A=(A, 's^-1'), n=n, Ea=(Ea, 'J/mol'), T0=(1, 'K'))
+
+
+def get_kinetics_list() -> list:
+    """Get kinetics of all packed types, an unpacked type, and a reaction without kinetics"""
+    pdep = PDepArrhenius(pressures=([1e4, 1e5, 1e6], 'Pa'),
+                         arrhenius=[get_arrhenius(1e10, 0.5, 8e4),
+                                    get_arrhenius(1e11, 0.2, 8.5e4),
+                                    get_arrhenius(1e12, 0.0, 9e4)])
+    return [get_arrhenius(1e13, 0.0, 1e5),
+            MultiArrhenius(arrhenius=[get_arrhenius(1e6, 1.5, 2e4), get_arrhenius(1e9, 0.0, 6e4)]),
+            pdep,
+            MultiPDepArrhenius(arrhenius=[pdep, PDepArrhenius(pressures=([1e4, 1e5], 'Pa'),
+                                                              arrhenius=[get_arrhenius(1e7, 0.0, 4e4),
+                                                                         get_arrhenius(1e8, 0.0, 5e4)])]),
+            Chebyshev(coeffs=np.array([[11.0, 0.5, -0.1], [-2.0, 0.3, 0.05], [0.2, -0.1, 0.01]]), kunits='s^-1',
+                      Tmin=(290, 'K'), Tmax=(2000, 'K'), Pmin=(1e2, 'Pa'), Pmax=(1e8, 'Pa')),
+            ConstantKinetics(),
+            None,
+            ]
+
+
+def test_packed_kinetics():
+    """Test that the vectorized rate coefficients match the per-reaction evaluation of every kinetics type"""
+    kinetics_list = get_kinetics_list()
+    packed = PackedKinetics(kinetics_list)
+    assert packed.fallback == [5]
+    for P in [1e3, 1e4, 3e4, 1e5, 5e6, 1e7]:
+        k = packed.get_rate_coefficients(STABILITY_TEMPERATURES, P)
+        assert k.shape == (len(kinetics_list), len(STABILITY_TEMPERATURES))
+        for i, kinetics in enumerate(kinetics_list[:-1]):
+            expected = [kinetics.get_rate_coefficient(T, P) if kinetics.is_pressure_dependent()
+                        else kinetics.get_rate_coefficient(T) for T in STABILITY_TEMPERATURES]
+            assert np.allclose(k[i], expected, rtol=1e-10), (i, P)
+        assert np.all(np.isnan(k[-1]))
+    assert packed.get_rate_coefficients(313.0).shape == (len(kinetics_list), 1)
+
+
+def test_kinetics_evaluator(mechanism):
+    """Test the forward and reverse rate coefficients of the reactions of a mechanism"""
+    _, reactions = mechanism
+    evaluator = KineticsEvaluator(reactions)
+    kf = evaluator.get_forward_rate_coefficients(313.0)
+    assert kf.shape == (len(reactions), 1)
+    assert np.allclose(kf[:, 0], [rxn.kinetics.get_rate_coefficient(313.0) for rxn in reactions])
+    kr = evaluator.get_reverse_rate_coefficients([313.0, 333.0])
+    assert kr.shape == (len(reactions), 2)
+    for i, kinetics in enumerate(evaluator.reverse_kinetics):
+        if kinetics is None:
+            assert np.all(np.isnan(kr[i]))
+        else:
+            assert np.allclose(kr[i], [kinetics.get_rate_coefficient(313.0), kinetics.get_rate_coefficient(333.0)])
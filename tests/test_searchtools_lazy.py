@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the searchtools lazy module
+"""
+
+import os
+
+import pytest
+from rmgpy.reaction import Reaction
+
+import searchtools.lazy
+from searchtools.index import get_mechanism_index
+from searchtools.lazy import LazyMechanism, parse_colliders, parse_equation, split_species_labels
+
+
+CHEMKIN = """ELEMENTS H D T C CI O OI N Ne Ar He Si S F Cl X END
+
+SPECIES
+    N2      O2      HO2     H2O2    OH      H2O
+END
+
+REACTIONS    KCAL/MOLE   MOLES
+
+! Reaction index: Chemkin #1; RMG #1
+! Library reaction: BurkeH2O2inN2
+HO2+HO2<=>O2+H2O2                                   1.930e+11 0.000     -1.409
+
+! Reaction index: Chemkin #2; RMG #2
+! Library reaction: BurkeH2O2inN2
+H2O2(+M)<=>OH+OH(+M)                                2.000e+12 0.900     48.749
+    H2O/7.650/ N2/1.500/ O2/1.200/ H2O2/7.700/
+    LOW/ 2.490e+24 -2.300 48.749 /
+    TROE/ 0.4300 1e-30 1e+30 /
+
+! Reaction index: Chemkin #3; RMG #3
+OH+H2O2<=>H2O+HO2                                   1.740e+12 0.000     0.318
+DUPLICATE
+
+! Reaction index: Chemkin #4; RMG #4
+OH+H2O2<=>H2O+HO2                                   7.590e+13 0.000     7.269
+DUPLICATE
+
+END
+"""
+
+SPECIES_DICTIONARY = """N2
+1 N u0 p1 c0 {2,T}
+2 N u0 p1 c0 {1,T}
+
+O2
+multiplicity 3
+1 O u1 p2 c0 {2,S}
+2 O u1 p2 c0 {1,S}
+
+HO2
+multiplicity 2
+1 O u0 p2 c0 {2,S} {3,S}
+2 O u1 p2 c0 {1,S}
+3 H u0 p0 c0 {1,S}
+
+H2O2
+1 O u0 p2 c0 {2,S} {3,S}
+2 O u0 p2 c0 {1,S} {4,S}
+3 H u0 p0 c0 {1,S}
+4 H u0 p0 c0 {2,S}
+
+OH
+multiplicity 2
+1 O u1 p2 c0 {2,S}
+2 H u0 p0 c0 {1,S}
+
+H2O
+1 O u0 p2 c0 {2,S} {3,S}
+2 H u0 p0 c0 {1,S}
+3 H u0 p0 c0 {1,S}
+"""
+
+
+@pytest.fixture
+def chemkin_files(tmp_path):
+    """Get the paths of a small chemkin file and of its species dictionary"""
+    chemkin_path, dictionary_path = tmp_path / 'chem_annotated.inp', tmp_path / 'species_dictionary.txt'
+    chemkin_path.write_text(CHEMKIN)
+    dictionary_path.write_text(SPECIES_DICTIONARY)
+    return str(chemkin_path), str(dictionary_path)
+
+
+@pytest.fixture
+def read_reactions(monkeypatch):
+    """Replace RMG's chemkin reactions parser, the species dictionaries it is given are recorded"""
+    species_dicts = list()
+
+    def read_reactions_block(f, species_dict, read_comments=True):
+        species_dicts.append(species_dict)
+        assert 'REACTIONS' in f.read()
+        return [Reaction()]
+
+    monkeypatch.setattr(searchtools.lazy, 'read_reactions_block', read_reactions_block)
+    return species_dicts
+
+
+def test_parse_equation():
+    """Test getting the species labels of chemkin reaction lines"""
+    assert split_species_labels('C(1)+OH(2)(+M)') == ['C(1)', 'OH(2)']
+    assert split_species_labels('H+O2+M') == ['H', 'O2']
+    assert parse_equation('S(12)+O2(3)<=>S(13)   1.0e+13 0.0 10.0') == (['S(12)', 'O2(3)'], ['S(13)'])
+    assert parse_equation('A=>B+C 1.0 0.0 0.0') == (['A'], ['B', 'C'])
+    assert parse_colliders(['H2O(5)/6.0/ N2/0.7/  ! comment A/1.0/', 'LOW/ 1.0 0.0 0.0 /', 'TROE/ 0.5 /']) \
+        == ['H2O(5)', 'N2']
+
+
+def test_lazy_mechanism_index(chemkin_files):
+    """Test indexing the species and reactions of chemkin files"""
+    mechanism = LazyMechanism(*chemkin_files)
+    assert len(mechanism) == 6
+    assert mechanism.species_labels == ['N2', 'O2', 'HO2', 'H2O2', 'OH', 'H2O']
+    assert mechanism.reaction_indices == [1, 2, 3, 4]
+    assert mechanism.reactions_by_species['H2O2'] == [1, 2, 3, 4]
+    assert mechanism.reactions_by_species['OH'] == [2, 3, 4]
+    assert 'N2' not in mechanism.reactions_by_species
+    assert mechanism.reactions_by_library == {'BurkeH2O2inN2': [1, 2]}
+    assert mechanism.reaction_entries[1]['colliders'] == ['H2O', 'N2', 'O2', 'H2O2']
+    assert mechanism.get_reaction_text(3).splitlines()[1].startswith('OH+H2O2<=>H2O+HO2')
+    assert mechanism.get_reaction_text(5) is None
+    assert mechanism.get_species('HO2').label == 'HO2'
+    assert mechanism.get_species('H') is None
+    assert get_mechanism_index(rmg_spc=mechanism) is mechanism
+
+
+def test_lazy_mechanism_cached_index(chemkin_files, monkeypatch):
+    """Test that the offset index is reused while the files are unchanged"""
+    LazyMechanism(*chemkin_files)
+    assert os.path.isfile(chemkin_files[0] + searchtools.lazy.INDEX_CACHE_SUFFIX)
+
+    def build_index(self):
+        raise AssertionError('the offset index should be loaded')
+
+    with monkeypatch.context() as m:
+        m.setattr(LazyMechanism, 'build_index', build_index)
+        assert LazyMechanism(*chemkin_files).reaction_indices == [1, 2, 3, 4]
+
+    with open(chemkin_files[0], 'w') as f:
+        f.write(CHEMKIN.replace('! Reaction index: Chemkin #4; RMG #4', '! Reaction index: Chemkin #7; RMG #7'))
+    assert LazyMechanism(*chemkin_files).reaction_indices == [1, 2, 3, 7]
+
+
+def test_lazy_mechanism_reactions(chemkin_files, read_reactions):
+    """Test that reactions are built on demand, with the collider species of third-body and falloff reactions"""
+    mechanism = LazyMechanism(*chemkin_files)
+    reaction = mechanism.get_reaction(2)
+    assert reaction.index == 2
+    assert reaction.library == 'BurkeH2O2inN2'
+    assert set(read_reactions[0]) == {'H2O2', 'OH', 'H2O', 'N2', 'O2'}
+    assert all(read_reactions[0][label].label == label for label in read_reactions[0])
+    assert mechanism.get_reaction(2) is reaction
+    assert len(read_reactions) == 1
+    assert mechanism.get_reaction(9) is None
+
+    # reactions built for a block are not kept
+    blocks = list(mechanism.iter_reaction_blocks(block_size=3))
+    assert [[rxn.index for rxn in block] for block in blocks] == [[1, 2, 3], [4]]
+    assert blocks[0][1] is reaction
+    assert mechanism.get_reaction(4) is not blocks[1][0]
+    assert [[sp.label for sp in block] for block in mechanism.iter_species_blocks(block_size=4)] \
+        == [['N2', 'O2', 'HO2', 'H2O2'], ['OH', 'H2O']]
+
+    assert [rxn.index for rxn in mechanism.get_reactions_of_species('OH')] == [2, 3, 4]
+    assert [rxn.index for rxn in mechanism.get_reactions_from_library('BurkeH2O2inN2')] == [1, 2]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the searchtools pathways module
+"""
+
+import pytest
+from rmgpy.kinetics import Arrhenius
+from rmgpy.reaction import Reaction
+from rmgpy.species import Species
+
+from searchtools.pathways import PathwayGraph
+
+
+# reactants, products, k (s^-1) of a toy graph, the fractions of API reaching D are
+# API-B-D 0.6 * 2/3 = 0.4, API-C-D 0.3, API-B-E-D 0.6 * 1/3 = 0.2, API-D 0.1
+TOY_REACTIONS = [(['API'], ['B'], 6.0),
+                 (['API'], ['C'], 3.0),
+                 (['API'], ['D'], 1.0),
+                 (['B'], ['D'], 2.0),
+                 (['B'], ['E'], 1.0),
+                 (['C'], ['D'], 1.0),
+                 (['E'], ['D'], 1.0),
+                 ]
+
+
+@pytest.fixture
+def toy_reactions():
+    """Get the reactions of the toy graph"""
+    species = {label: Species(label=label, index=i).from_smiles('C' * (i + 1))
+               for i, label in enumerate(['API', 'B', 'C', 'D', 'E'])}
+    return [Reaction(index=i + 1,
+                     reactants=[species[label] for label in reactants],
+                     products=[species[label] for label in products],
+                     kinetics=Arrhenius(A=(k, 's^-1'), n=0.0, Ea=(0.0, 'J/mol'), T0=(1, 'K')),
+                     reversible=False)
+            for i, (reactants, products, k) in enumerate(TOY_REACTIONS)]
+
+
+def test_k_shortest_pathways(toy_reactions):
+    """Test that Yen's algorithm returns the pathways ordered by the fraction of the source they carry"""
+    graph = PathwayGraph(toy_reactions)
+    pathways = graph.k_shortest_pathways('D', k=5)
+    assert [pathway['species'] for pathway in pathways] == [['API', 'B', 'D'],
+                                                            ['API', 'C', 'D'],
+                                                            ['API', 'B', 'E', 'D'],
+                                                            ['API', 'D']]
+    assert [pathway['fraction'] for pathway in pathways] == pytest.approx([0.4, 0.3, 0.2, 0.1], rel=1e-6)
+    assert [[rxn.index for rxn in pathway['reactions']] for pathway in pathways] == [[1, 4], [2, 6], [1, 5, 7], [3]]
+    assert all(direction == 1 for pathway in pathways for direction in pathway['directions'])
+    assert [pathway['species'] for pathway in graph.k_shortest_pathways('D', k=2)] \
+        == [['API', 'B', 'D'], ['API', 'C', 'D']]
+    assert graph.shortest_pathway('E')['fraction'] == pytest.approx(0.2, rel=1e-6)
+    assert graph.shortest_pathway('D', source='F') is None
+    assert graph.k_shortest_pathways('F') == list()
+    assert set(graph.top_flux_pathways(['D', 'E'], k=1)) == {'D', 'E'}
+
+
+def test_k_shortest_pathways_exclude(toy_reactions):
+    """Test that excluded species are not used as intermediates"""
+    graph = PathwayGraph(toy_reactions, exclude=['B'])
+    assert [pathway['species'] for pathway in graph.k_shortest_pathways('D', k=5)] \
+        == [['API', 'C', 'D'], ['API', 'D']]
+    assert graph.shortest_pathway('B')['species'] == ['API', 'B']
+
+
+def test_pathways_weighted_by_rates(mechanism):
+    """Test that bimolecular steps are weighted by the reactant concentrations when given"""
+    _, reactions = mechanism
+    concentrations = {'API': 1.0, 'O2': 1e-3, 'R': 1e-6, 'ROO': 1e-6, 'HO2': 1e-6, 'ROOH': 1e-6}
+    graph = PathwayGraph(reactions, concentrations=concentrations)
+    pathway = graph.shortest_pathway('P')
+    assert pathway['species'][0] == 'API'
+    assert pathway['species'][-1] == 'P'
+    assert 0 < pathway['fraction'] <= 1
+    # species without a concentration do not react
+    assert 'P' not in graph.adjacency
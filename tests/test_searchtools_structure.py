@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the searchtools structure module
+"""
+
+from rmgpy.molecule import Molecule
+from rmgpy.species import Species
+
+from searchtools.index import MechanismIndex
+from searchtools.structure import StructureIndex, get_fingerprint, get_structure_index
+
+
+def test_get_fingerprint():
+    """Test that isomers of different connectivity or multiplicity get different fingerprints"""
+    assert get_fingerprint(Molecule().from_smiles('CC(O)OO')) == get_fingerprint(Molecule().from_smiles('OOC(O)C'))
+    assert get_fingerprint(Molecule().from_smiles('CC(O)OO')) != get_fingerprint(Molecule().from_smiles('CC(O)O[O]'))
+
+
+def test_structure_index(mechanism):
+    """Test finding species by structure"""
+    species, _ = mechanism
+    dimethyl_ether = Species(label='DME', index=9).from_smiles('COC')
+    index = StructureIndex(species + [dimethyl_ether])
+    assert index.find('CC(O)OO') is species[5]
+    assert index.find('[O][O]') is species[1]
+    assert index.find('COC') is dimethyl_ether
+    assert index.find('CCO') is species[0]
+    assert index.find('CCCC') is None
+    assert index.find_batch(['CC=O', 'CCCC']) == [species[6], None]
+    assert index.get_candidates(Molecule().from_smiles('CCO'))[0] is species[0]
+
+
+def test_get_structure_index(mechanism):
+    """Test that the structure index of a species list is reused until the list changes"""
+    species, reactions = mechanism
+    index = get_structure_index(species)
+    assert get_structure_index(species) is index
+    assert get_structure_index(index) is index
+    assert get_structure_index(MechanismIndex(species=species, reactions=reactions)).species == species
+
+    species.append(Species(label='DME', index=9).from_smiles('COC'))
+    rebuilt = get_structure_index(species)
+    assert rebuilt is not index
+    assert rebuilt.find('COC') is species[-1]
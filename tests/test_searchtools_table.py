@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the searchtools table module
+"""
+
+import numpy as np
+import pytest
+from rmgpy.kinetics import Arrhenius, PDepArrhenius, Troe
+
+from searchtools.kinetics import KineticsEvaluator
+from searchtools.table import MechanismTable
+
+
+@pytest.fixture
+def table_path(mechanism, tmp_path):
+    """Save the table of the mechanism fixture, with pressure dependent and falloff kinetics"""
+    species, reactions = mechanism
+    arrhenius = [Arrhenius(A=(1e11, 's^-1'), n=0.5, Ea=(9e4, 'J/mol'), T0=(1, 'K')),
+                 Arrhenius(A=(1e12, 's^-1'), n=0.0, Ea=(9e4, 'J/mol'), T0=(1, 'K'))]
+    reactions[5].kinetics = PDepArrhenius(pressures=([1e4, 1e6], 'Pa'), arrhenius=arrhenius)
+    reactions[3].kinetics = Troe(arrheniusHigh=Arrhenius(A=(1e13, 's^-1'), n=0.0, Ea=(1.2e5, 'J/mol'), T0=(1, 'K')),
+                                 arrheniusLow=Arrhenius(A=(1e10, 'm^3/(mol*s)'), n=-1.0, Ea=(1.1e5, 'J/mol'),
+                                                        T0=(1, 'K')),
+                                 alpha=0.5, T3=(100, 'K'), T1=(2000, 'K'), efficiencies={'O': 6.0})
+    reactions[3].family = 'R_Recombination'
+    path = str(tmp_path / 'mechanism.bin')
+    MechanismTable.from_mechanism(species, reactions).save(path)
+    return path
+
+
+@pytest.mark.parametrize('mmap', [True, False])
+def test_table_round_trip(mechanism, table_path, mmap):
+    """Test that a saved table loads back the species, reactions and kinetics of the mechanism"""
+    species, reactions = mechanism
+    table = MechanismTable.load(table_path, mmap=mmap)
+    assert table.species_labels == [sp.label for sp in species]
+    assert table.reaction_indices == [rxn.index for rxn in reactions]
+    info = table.get_species_info('ROO')
+    assert info['smiles'] == species[4].molecule[0].to_smiles()
+    assert info['multiplicity'] == species[4].molecule[0].multiplicity
+    assert table.get_species_info('OH') is None
+    assert table.get_species('ROO').index == 5
+
+    assert table.get_reactions_of_species('ROO') == table.get_reactions_batch([2, 3, 6])
+    assert [rxn.index for rxn in table.get_reactions_from_library('API_soup')] == [2, 5]
+    assert table.get_reactions_from_library('NOx2018') == list()
+    assert table.get_reaction(7) is None
+    for rxn in reactions:
+        loaded = table.get_reaction(rxn.index)
+        assert [sp.label for sp in loaded.reactants] == [sp.label for sp in rxn.reactants]
+        assert [sp.label for sp in loaded.products] == [sp.label for sp in rxn.products]
+        assert getattr(loaded, 'library', None) == getattr(rxn, 'library', None)
+        assert type(loaded.kinetics) is type(rxn.kinetics)
+    assert table.get_reaction(4).family == 'R_Recombination'
+
+    troe = table.get_reaction(4).kinetics
+    assert troe.arrheniusLow.n.value_si == -1.0
+    assert troe.T2 is None
+    assert troe.efficiencies == {'O': 6.0}
+
+    T = np.array([298.0, 313.0, 333.0])
+    expected = KineticsEvaluator(reactions).get_forward_rate_coefficients(T)
+    loaded = KineticsEvaluator(table.get_reactions_batch(table.reaction_indices)).get_forward_rate_coefficients(T)
+    packed = [0, 1, 2, 4, 5]
+    assert np.allclose(loaded[packed], expected[packed], rtol=1e-12)
+    k = table.get_rate_coefficients(T)
+    assert np.allclose(k[[0, 1, 2, 4]], expected[[0, 1, 2, 4]], rtol=1e-12)
+    assert np.all(np.isnan(k[[3, 5]]))
+    assert np.allclose(table.get_rate_coefficients(313.0, rows=np.array([2])), expected[[2], 1:2])
+
+
+def test_table_load_invalid_file(tmp_path):
+    """Test that loading a file which is not a mechanism table raises"""
+    path = tmp_path / 'mechanism.bin'
+    path.write_bytes(b'not a table')
+    with pytest.raises(ValueError):
+        MechanismTable.load(str(path))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the seeds module
+"""
+
+import os
+
+import pytest
+
+from apioxy.cache import ResultCache, get_job_key
+from apioxy.seeds import SeedCatalog, get_mixture_identities, get_relevance, get_seeds_settings, inject_seeds
+
+
+@pytest.fixture
+def rmg_database(tmp_path, monkeypatch):
+    """Point the RMG database at a temporary directory"""
+    import t3.main
+
+    path = tmp_path / 'RMG-database' / 'input' / 'thermo' / 'libraries'
+    path.mkdir(parents=True)
+    monkeypatch.setattr(t3.main, 'RMG_THERMO_LIB_BASE_PATH', str(path))
+    return tmp_path / 'RMG-database' / 'input'
+
+
+def add_seed(catalog: SeedCatalog, project_directory: str, rmg: dict) -> str:
+    """Add the seed mechanism of a completed project of a given mixture to a catalog"""
+    seed_directory = os.path.join(project_directory, 'iteration_2', 'RMG', 'seed', 'seed')
+    os.makedirs(seed_directory)
+    for file_name in ['reactions.py', 'dictionary.txt']:
+        with open(os.path.join(seed_directory, file_name), 'w') as f:
+            f.write(f'# {os.path.basename(project_directory)}\n')
+    return catalog.add({'label': os.path.basename(project_directory), 'project_directory': project_directory,
+                        'rmg': rmg})
+
+
+def test_get_seeds_settings():
+    """Test that seeding is opt-in and validated"""
+    assert get_seeds_settings(None)['use'] is False
+    assert get_seeds_settings(True)['use'] is True
+    settings = get_seeds_settings({'max_seeds': 1})
+    assert settings['use'] is True and settings['max_seeds'] == 1 and settings['min_score'] == 0.5
+    assert get_seeds_settings({'use': False})['use'] is False
+    with pytest.raises(ValueError):
+        get_seeds_settings({'inject_as': 'thermo_libraries'})
+
+
+def test_get_relevance():
+    """Test scoring a seed by the fraction of the job mixture in its core"""
+    mixture = {'species': ['a', 'b', 'c', 'd'], 'solvent': 'a'}
+    entry = {'phase': 'liquid', 'solvent': 'a', 'species': ['a'], 'core': ['b', 'e']}
+    assert get_relevance(entry, mixture, phase='liquid') == 0.5
+    assert get_relevance(entry, mixture, phase='gas') == 0.0
+    assert get_relevance(dict(entry, solvent='e'), mixture, phase='liquid') == 0.0
+
+
+def test_inject_seeds(tmp_path, make_apioxy, rmg_database):
+    """Test selecting and installing the most relevant seeds of other projects"""
+    job = make_apioxy().get_api_jobs()[0]
+    catalog = SeedCatalog(path=str(tmp_path / 'seeds'))
+    assert get_mixture_identities(job['rmg'])['solvent'] is not None
+    own_key = add_seed(catalog, job['project_directory'], job['rmg'])
+    other_key = add_seed(catalog, str(tmp_path / 'other'), job['rmg'])
+    kinetics_lib_base_path = str(rmg_database / 'kinetics' / 'libraries')
+    injected = inject_seeds(job=job, catalog=catalog, kinetics_lib_base_path=kinetics_lib_base_path)
+    # the job's own seed is never selected
+    assert [(seed['label'], seed['score']) for seed in injected] == [('other', 1.0)]
+    assert own_key != other_key
+    assert job['rmg']['database']['kinetics_libraries'][-1] == f'APIOxy_seeds/{other_key}'
+    assert os.path.isfile(os.path.join(kinetics_lib_base_path, 'APIOxy_seeds', other_key, 'reactions.py'))
+
+
+def test_cache_seeded_jobs(tmp_path, make_apioxy, rmg_database):
+    """Test that the results of seeded APIs are restored although the seed catalog changed"""
+    settings = {'cache': {'path': str(tmp_path / 'cache')}, 'seeds': {'path': str(tmp_path / 'seeds')}}
+    catalog = SeedCatalog(path=settings['seeds']['path'])
+    rmg = make_apioxy().get_api_jobs()[0]['rmg']
+    add_seed(catalog, str(tmp_path / 'seed_1'), rmg)
+
+    apioxy_object = make_apioxy(**settings)
+    results = apioxy_object.execute()
+    assert [result['status'] for result in results] == ['completed', 'completed']
+    seeded = apioxy_object.jobs[0]
+    assert [seed['label'] for seed in seeded['seeds']] == ['seed_1']
+    # the cache key does not depend on the injected seeds
+    unseeded = make_apioxy(**settings).get_api_jobs()[0]
+    assert seeded['cache_key'] == get_job_key(unseeded)
+    entries = {entry['label']: entry for entry in ResultCache(path=settings['cache']['path']).get_entries()}
+    assert [seed['label'] for seed in entries['ibuprofen']['seeds']] == ['seed_1']
+
+    # a more recent seed is now the most relevant one
+    add_seed(catalog, str(tmp_path / 'seed_2'), rmg)
+    apioxy_object = make_apioxy(project_directory=str(tmp_path / 'rerun'), **settings)
+    finished_results, jobs = apioxy_object.prepare_jobs()
+    assert [(result['label'], result['status']) for result in finished_results] == \
+        [('ibuprofen', 'cached'), ('paracetamol', 'cached')]
+    assert jobs == list()
+    assert os.path.isfile(os.path.join(finished_results[0]['project_directory'],
+                                       'iteration_2', 'RMG', 'chemkin', 'chem_annotated.inp'))
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the server module
+"""
+
+import json
+import multiprocessing
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from apioxy.server import APIOxyServer
+
+
+@pytest.fixture
+def server(library_cache):
+    """An APIOxy server with warm workers listening on a free local port"""
+    apioxy_server = APIOxyServer(port=0, max_workers=2)
+    apioxy_server.executor = ProcessPoolExecutor(max_workers=apioxy_server.max_workers,
+                                                 mp_context=multiprocessing.get_context('fork'))
+    http_server = ThreadingHTTPServer(('127.0.0.1', 0), apioxy_server.get_request_handler())
+    apioxy_server.port = http_server.server_address[1]
+    thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+    thread.start()
+    yield apioxy_server
+    http_server.shutdown()
+    http_server.server_close()
+    apioxy_server.executor.shutdown(wait=True)
+
+
+def request(server: APIOxyServer, path: str, content: dict = None):
+    """Send a request to the server, returns the response code and the JSON content"""
+    data = json.dumps(content).encode() if content is not None else None
+    try:
+        with urllib.request.urlopen(urllib.request.Request(f'http://127.0.0.1:{server.port}{path}', data=data),
+                                    timeout=30) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def get_input(tmp_path, **kwargs) -> dict:
+    """Get the APIOxy arguments of a job of two APIs"""
+    apioxy = {'project': 'server_job',
+              'model_level': 1,
+              'api_structures': [{'label': 'ibuprofen', 'smiles': 'CC(C)Cc1ccc(C(C)C(=O)O)cc1'},
+                                 {'label': 'paracetamol', 'smiles': 'CC(=O)Nc1ccc(O)cc1'}],
+              }
+    apioxy.update(kwargs)
+    return {'project_directory': str(tmp_path / 'server_job'),
+            'apioxy': apioxy,
+            'rmg': {'species': [{'label': 'O2', 'smiles': '[O][O]', 'concentration': 0.0003}]},
+            't3': {'options': {'max_T3_iterations': 2}},
+            }
+
+
+def wait_for(server: APIOxyServer, job_id: str, timeout: float = 60) -> dict:
+    """Wait until a job terminates"""
+    t0 = time.time()
+    while time.time() - t0 < timeout:
+        code, job = request(server, f'/jobs/{job_id}')
+        assert code == 200
+        if job['status'] != 'running':
+            return job
+        time.sleep(0.1)
+    raise TimeoutError(f'Job {job_id} did not terminate within {timeout} s')
+
+
+def test_server(server, tmp_path):
+    """Test submitting a job to the server and following its status"""
+    assert request(server, '/health') == (200, {'status': 'ok', 'workers': server.max_workers})
+    assert request(server, '/jobs') == (200, list())
+    assert request(server, '/unknown')[0] == 404
+    assert request(server, '/jobs/unknown')[0] == 404
+
+    code, content = request(server, '/jobs', get_input(tmp_path))
+    assert code == 202
+    job = wait_for(server, content['id'])
+    assert job['status'] == 'completed'
+    assert job['pending'] == 0
+    assert sorted((result['label'], result['status']) for result in job['results']) == \
+        [('ibuprofen', 'completed'), ('paracetamol', 'completed')]
+    assert [entry['id'] for entry in request(server, '/jobs')[1]] == [content['id']]
+
+    # resubmitting the same job finds the completed APIs in the project manifest
+    code, content = request(server, '/jobs', get_input(tmp_path))
+    assert code == 202
+    job = wait_for(server, content['id'])
+    assert job['status'] == 'completed'
+    assert len(job['results']) == 2
+
+
+def test_server_rejects_invalid_jobs(server, tmp_path):
+    """Test that invalid jobs are rejected with an error"""
+    code, content = request(server, '/jobs', get_input(tmp_path, api_structures=list()))
+    assert code == 400
+    assert content['error'].startswith('ValueError')
+    code, content = request(server, '/jobs', get_input(tmp_path, model_level=0))
+    assert code == 400
+    assert content['error'].startswith('ValueError: Model level 0')
+    assert request(server, '/other', get_input(tmp_path))[0] == 404
+    assert request(server, '/jobs') == (200, list())
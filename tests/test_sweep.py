@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the sweep module
+"""
+
+import pytest
+
+from apioxy.sweep import get_envelope_reactor, get_envelope_species, get_sweep_conditions, get_time_in_seconds
+
+
+SPECIES = [{'label': 'API', 'smiles': 'CC(=O)Oc1ccccc1C(=O)O', 'concentration': 1},
+           {'label': 'O2', 'smiles': '[O][O]', 'concentration': 0.01},
+           {'label': 'water', 'smiles': 'O', 'concentration': 0.1, 'solvent': True},
+           ]
+REACTORS = [{'type': 'liquid batch constant T V', 'T': 313, 'termination_time': [3, 'days'],
+             'termination_conversion': {'API': 0.1}},
+            {'type': 'liquid batch constant T V', 'T': 333, 'termination_time': [12, 'hours'],
+             'concentrations': {'O2': 0.001}, 'termination_conversion': {'API': 0.2}},
+            {'type': 'liquid batch constant T V', 'T': [323, 343], 'termination_time': 3600,
+             'concentrations': {'O2': 0.1}, 'label': 'stress'},
+            ]
+
+
+def test_get_sweep_conditions():
+    """Test labeling sweep conditions and making the varied concentrations explicit"""
+    conditions = get_sweep_conditions(REACTORS, SPECIES)
+    assert [condition['label'] for condition in conditions] == ['313K', '333K_O2_0.001', 'stress']
+    assert [condition['concentrations'] for condition in conditions] == [{'O2': 0.01}, {'O2': 0.001}, {'O2': 0.1}]
+    assert 'concentrations' not in REACTORS[0]
+
+    with pytest.raises(ValueError):
+        get_sweep_conditions([dict(REACTORS[0], concentrations={'N2': 1})], SPECIES)
+    with pytest.raises(ValueError):
+        get_sweep_conditions([REACTORS[0], REACTORS[0]], SPECIES)
+
+
+def test_get_envelope_reactor():
+    """Test getting a single reactor spanning all sweep conditions"""
+    conditions = get_sweep_conditions(REACTORS, SPECIES)
+    reactor = get_envelope_reactor(conditions)
+    assert reactor == {'type': 'liquid batch constant T V',
+                       'T': [313, 343],
+                       'termination_time': [3, 'days'],
+                       'termination_conversion': {'API': 0.2},
+                       }
+    assert get_time_in_seconds(reactor['termination_time']) == 3 * 86400
+    assert get_envelope_reactor(conditions[:1])['T'] == 313
+
+    with pytest.raises(ValueError):
+        get_envelope_reactor([conditions[0], dict(conditions[1], type='gas batch constant T P')])
+
+
+def test_get_envelope_species():
+    """Test getting mixture species with concentration ranges spanning all sweep conditions"""
+    species = get_envelope_species(SPECIES, get_sweep_conditions(REACTORS, SPECIES))
+    assert [spc['concentration'] for spc in species] == [1, [0.001, 0.1], 0.1]
+    assert SPECIES[1]['concentration'] == 0.01
+
+
+def test_explicit_sweep_conditions(make_apioxy):
+    """Test that sweep conditions given explicitly are labeled and completed as the reactors are"""
+    conditions = [{'type': 'liquid batch constant T V', 'T': 313, 'termination_time': [3, 'days']},
+                  {'type': 'liquid batch constant T V', 'T': 333, 'termination_time': [12, 'hours'],
+                   'concentrations': {'O2': 0}}]
+    apioxy = make_apioxy(sweep={'conditions': conditions})
+    assert [condition['label'] for condition in apioxy.apioxy['sweep']['conditions']] == ['313K', '333K_O2_0']
+    assert [condition['concentrations'] for condition in apioxy.apioxy['sweep']['conditions']] \
+        == [{'O2': 0.0003}, {'O2': 0}]
+    assert apioxy.rmg['reactors'] == [{'type': 'liquid batch constant T V', 'T': [313, 333],
+                                       'termination_time': [3, 'days']}]
+    assert [spc['concentration'] for spc in apioxy.rmg['species']] == [55.0, [0, 0.0003]]
+
+    with pytest.raises(ValueError):
+        make_apioxy(sweep={'conditions': [dict(conditions[0], label='a'), dict(conditions[1], label='a')]})
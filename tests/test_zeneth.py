@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# encoding: utf-8
+
+"""
+APIOxy tests of the Zeneth module
+"""
+
+import pytest
+
+from apioxy import zeneth
+from apioxy.zeneth import (apply_zeneth_output, get_columns, get_zeneth_settings, parse_zeneth_output,
+                           select_degradants, tighten_species_constraints)
+
+
+ZENETH_OUTPUT = ('Parent SMILES,Degradant Name,Degradant SMILES,Likelihood,Step\n'
+                 'CC(C)Cc1ccc(C(C)C(=O)O)cc1,ketone,CC(C)C(=O)c1ccc(C(C)C(=O)O)cc1,probable,2\n'
+                 'CC(C)Cc1ccc(C(C)C(=O)O)cc1,alcohol,CC(C)(O)Cc1ccc(C(C)C(=O)O)cc1,certain,1\n'
+                 'CC(C)Cc1ccc(C(C)C(=O)O)cc1,hydroperoxide,CC(C)(OO)Cc1ccc(C(C)C(=O)O)cc1,probable,1\n'
+                 'CC(C)Cc1ccc(C(C)C(=O)O)cc1,unlikely,CC(C)Cc1ccc(C(C)O)cc1,improbable,1\n')
+
+
+def test_get_columns():
+    """Test identifying the columns of a Zeneth export by keywords"""
+    columns = get_columns(['Parent SMILES', 'Degradant ID', ' Degradant SMILES ', 'Likelihood', 'Transformation',
+                           'Step'])
+    assert columns == {'smiles': 2, 'name': 1, 'likelihood': 3, 'transformation': 4, 'step': 5}
+    assert get_columns(['Name', 'Likelihood'])['smiles'] is None
+
+
+def test_parse_zeneth_output(tmp_path):
+    """Test parsing comma and tab delimited Zeneth exports"""
+    path = tmp_path / 'zeneth.csv'
+    path.write_text('\ufeffParent SMILES,Degradant Name,Degradant SMILES,Likelihood,Transformation,Step\n'
+                    'CC(=O)O,acid_peroxide,CC(=O)OO,PROBABLE,Oxidation,1\n'
+                    ',,,,,\n'
+                    'CC(=O)O,,CC=O,,Decarboxylation,two\n'
+                    'CC(=O)O,no_structure,,plausible,Hydrolysis,1\n', encoding='utf-8')
+    assert parse_zeneth_output(str(path)) == [
+        {'name': 'acid_peroxide', 'smiles': 'CC(=O)OO', 'likelihood': 'probable', 'transformation': 'Oxidation',
+         'step': 1},
+        {'name': 'degradant_2', 'smiles': 'CC=O', 'likelihood': None, 'transformation': 'Decarboxylation',
+         'step': None},
+    ]
+
+    path = tmp_path / 'zeneth.txt'
+    path.write_text('SMILES\tLikelihood\nCO\tcertain\n', encoding='utf-8')
+    assert parse_zeneth_output(str(path)) == [
+        {'name': 'degradant_1', 'smiles': 'CO', 'likelihood': 'certain', 'transformation': None, 'step': None},
+    ]
+
+    path = tmp_path / 'no_smiles.csv'
+    path.write_text('Name,Likelihood\nacid,certain\n', encoding='utf-8')
+    with pytest.raises(ValueError):
+        parse_zeneth_output(str(path))
+
+    path = tmp_path / 'empty.csv'
+    path.write_text('', encoding='utf-8')
+    assert parse_zeneth_output(str(path)) == list()
+
+
+def test_get_zeneth_settings():
+    """Test the Zeneth settings defaults"""
+    assert get_zeneth_settings(None) == {'min_likelihood': 'plausible', 'max_species': 20, 'max_observables': 5}
+    assert get_zeneth_settings({'min_likelihood': 'Probable', 'max_species': None})['min_likelihood'] == 'probable'
+    with pytest.raises(ValueError):
+        get_zeneth_settings({'min_likelihood': 'likely'})
+
+
+def test_tighten_species_constraints():
+    """Test tightening species constraints to the elements of the API and its degradants"""
+    species_constraints = {'max_C_atoms': 20, 'max_O_atoms': 4, 'max_heavy_atoms': 30, 'max_radical_electrons': 2}
+    element_counts = [{'C': 13, 'H': 18, 'O': 2}, {'C': 12, 'H': 16, 'O': 3}]
+    assert tighten_species_constraints(species_constraints, element_counts) == \
+        {'max_C_atoms': 13, 'max_O_atoms': 4, 'max_heavy_atoms': 17, 'max_radical_electrons': 2}
+    assert tighten_species_constraints(species_constraints, element_counts, margins={'C': 1}) == \
+        dict(species_constraints, max_C_atoms=14)
+
+
+def test_select_degradants():
+    """Test selecting unique degradants by likelihood, then by their step in the pathway"""
+    degradants = [{'name': 'a', 'smiles': 'CC=O', 'likelihood': 'plausible', 'step': 2},
+                  {'name': 'b', 'smiles': 'CO', 'likelihood': 'probable', 'step': 3},
+                  {'name': 'c', 'smiles': 'CC(=O)O', 'likelihood': None, 'step': 1},
+                  {'name': 'd', 'smiles': 'CO', 'likelihood': 'certain', 'step': 1},
+                  {'name': 'e', 'smiles': 'OO', 'likelihood': 'equivocal', 'step': 1},
+                  {'name': 'f', 'smiles': 'C=O', 'likelihood': 'probable', 'step': None},
+                  ]
+    assert [degradant['name'] for degradant in select_degradants(degradants)] == ['b', 'f', 'c', 'a']
+    # degradants without a likelihood are considered at the threshold
+    assert [degradant['name'] for degradant in select_degradants(degradants, min_likelihood='probable')] == \
+        ['c', 'b', 'f']
+    assert [degradant['name'] for degradant in select_degradants(degradants, max_species=1)] == ['b']
+    exclude = [select_degradants(degradants)[0]['identity']]
+    assert [degradant['name'] for degradant in select_degradants(degradants, exclude=exclude)] == ['f', 'c', 'a']
+
+
+def test_apply_zeneth_output(tmp_path, monkeypatch):
+    """Test focusing an API job with the degradants of a Zeneth output"""
+    element_counts = {'CC(C)Cc1ccc(C(C)C(=O)O)cc1': {'C': 13, 'H': 18, 'O': 2},
+                      'CC(C)(O)Cc1ccc(C(C)C(=O)O)cc1': {'C': 13, 'H': 18, 'O': 3},
+                      'CC(C)(OO)Cc1ccc(C(C)C(=O)O)cc1': {'C': 13, 'H': 18, 'O': 4},
+                      'CC(C)C(=O)c1ccc(C(C)C(=O)O)cc1': {'C': 13, 'H': 16, 'O': 3},
+                      }
+    monkeypatch.setattr(zeneth, 'get_element_counts', lambda species_dict: element_counts[species_dict['smiles']])
+    path = tmp_path / 'zeneth.csv'
+    path.write_text(ZENETH_OUTPUT, encoding='utf-8')
+    api_dict = {'label': 'ibuprofen', 'smiles': 'CC(C)Cc1ccc(C(C)C(=O)O)cc1', 'concentration': 1}
+    rmg = {'species': [dict(api_dict), {'label': 'O2', 'smiles': '[O][O]', 'concentration': 0.0003}],
+           'species_constraints': {'max_C_atoms': 20, 'max_O_atoms': 10, 'max_heavy_atoms': 30,
+                                   'max_radical_electrons': 2},
+           }
+    settings = dict(get_zeneth_settings(None), max_observables=2)
+    degradants = apply_zeneth_output(str(path), rmg=rmg, api_dict=api_dict, settings=settings)
+    assert [degradant['name'] for degradant in degradants] == ['alcohol', 'hydroperoxide', 'ketone']
+    assert rmg['species'][2:] == [
+        {'label': 'zeneth_1', 'smiles': 'CC(C)(O)Cc1ccc(C(C)C(=O)O)cc1', 'concentration': 0, 'observable': True},
+        {'label': 'zeneth_2', 'smiles': 'CC(C)(OO)Cc1ccc(C(C)C(=O)O)cc1', 'concentration': 0, 'observable': True},
+        {'label': 'zeneth_3', 'smiles': 'CC(C)C(=O)c1ccc(C(C)C(=O)O)cc1', 'concentration': 0},
+    ]
+    assert rmg['species_constraints'] == {'max_C_atoms': 13, 'max_O_atoms': 6, 'max_heavy_atoms': 19,
+                                          'max_radical_electrons': 2}
+
+    # no degradant is selected, the job is not modified
+    species_constraints = dict(rmg['species_constraints'])
+    path.write_text(ZENETH_OUTPUT.splitlines()[0] + '\n', encoding='utf-8')
+    assert apply_zeneth_output(str(path), rmg=rmg, api_dict=api_dict) == list()
+    assert len(rmg['species']) == 5
+    assert rmg['species_constraints'] == species_constraints